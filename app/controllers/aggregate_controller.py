@@ -1,13 +1,53 @@
 """
 Step 3: Aggregate execution. Orchestrates persist base_data -> aggregate -> store snapshot -> UI update.
+
+Persist and aggregate run on a background executor (no PyQt here). Callbacks are
+handed to `dispatch`, which the UI supplies to marshal calls back to its own thread.
+A newer run() supersedes the running one: the stale job stops at the next stage
+boundary and its result is discarded. Context state (loading, dirty) is only touched
+on the UI side: the worker hands those updates to `dispatch` as well.
 """
 import logging
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from typing import Callable
 
 from app.domain.models import BaseData, ResultSnapshot
 from app.controllers.context import ScenarioContext
 from app.services.aggregate_service import AggregateService
 
+# 진행 단계 (on_progress(stage) 인자)
+STAGE_PERSIST = "persist"
+STAGE_AGGREGATE = "aggregate"
+STAGE_DONE = "done"
+
+
+def _call_now(fn: Callable[[], None]) -> None:
+    fn()
+
+
+class AggregateJob:
+    """One aggregate request. cancel() stops it at the next stage boundary."""
+
+    def __init__(self, generation: int, scenario_id: str, scenario_name: str, edit_generation: int = 0) -> None:
+        self.generation = generation
+        self.scenario_id = scenario_id
+        self.scenario_name = scenario_name
+        # 제출 시점의 컨텍스트 편집 세대 (그 뒤 편집이 있으면 저장 완료 후에도 dirty 유지)
+        self.edit_generation = edit_generation
+        self.stage: str | None = None
+        self.future: Future | None = None
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
 
 class AggregateController:
     """Run aggregate only after base data is persisted. No auto-run during edit."""
@@ -16,9 +56,38 @@ class AggregateController:
         self,
         context: ScenarioContext,
         aggregate_service: AggregateService,
+        executor: Executor | None = None,
+        dispatch: Callable[[Callable[[], None]], None] | None = None,
     ) -> None:
         self._ctx = context
         self._service = aggregate_service
+        # 작업은 한 번에 하나씩 (persist가 같은 시나리오 행을 쓰므로 순서 보장)
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="aggregate")
+        self._dispatch = dispatch or _call_now
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._current: AggregateJob | None = None
+        # 컨텍스트의 로딩 표시를 켠 작업 (UI 쪽에서만 읽고 씀)
+        self._loading_job: AggregateJob | None = None
+
+    @property
+    def current_job(self) -> AggregateJob | None:
+        return self._current
+
+    def is_running(self) -> bool:
+        job = self._current
+        return job is not None and not job.cancelled and job.stage != STAGE_DONE
+
+    def cancel(self) -> None:
+        """Cancel the running job (its callbacks will not be called)."""
+        with self._lock:
+            job, self._current = self._current, None
+        if job is not None:
+            job.cancel()
+            logging.info("집계 컨트롤러: 집계 취소 시나리오=%s", job.scenario_id)
+        if self._loading_job is not None:
+            self._loading_job = None
+            self._ctx.set_loading(False)
 
     def run(
         self,
@@ -27,36 +96,104 @@ class AggregateController:
         persist_base_data: Callable[[], bool],
         on_success: Callable[[ResultSnapshot], None],
         on_error: Callable[[str], None],
-    ) -> None:
+        on_progress: Callable[[str], None] | None = None,
+    ) -> AggregateJob | None:
         """
-        Execute step 3: persist base data, then run pure aggregate, store snapshot, call on_success.
-        persist_base_data() must return True if save succeeded.
+        Execute step 3 in the background: persist base data, run pure aggregate, store snapshot.
+        persist_base_data() runs on the worker and must return True if save succeeded.
+        on_success / on_error / on_progress are called through dispatch, only for the latest job.
+        Call from the UI side. Refused while the context is loading for another reason (scenario load).
         """
-        if self._ctx.is_loading:
+        if self._ctx.is_loading and self._loading_job is None:
             logging.warning("집계 컨트롤러: 로딩 중이라 생략")
             on_error("편집 중에는 집계할 수 없습니다.")
-            return
+            return None
         if not scenario_id:
             on_error("시나리오명을 입력하세요.")
-            return
+            return None
 
-        if not persist_base_data():
-            on_error("입력 데이터 저장에 실패했습니다.")
-            return
+        with self._lock:
+            self._generation += 1
+            job = AggregateJob(self._generation, scenario_id, scenario_name, self._ctx.edit_generation)
+            stale, self._current = self._current, job
+        if stale is not None:
+            stale.cancel()
+            logging.info("집계 컨트롤러: 이전 집계 대체 시나리오=%s", stale.scenario_id)
 
-        self._ctx.set_scenario(scenario_id, scenario_name)
-        self._ctx.set_dirty(False)
+        self._loading_job = job
         self._ctx.set_loading(True)
+        job.future = self._executor.submit(
+            self._work, job, persist_base_data, on_success, on_error, on_progress
+        )
+        return job
+
+    def _is_current(self, job: AggregateJob) -> bool:
+        # 세대 비교: 작업이 끝나 _current가 비워진 뒤 UI 쪽에서 전달될 때도 최신 여부를 판단할 수 있다
+        return not job.cancelled and job.generation == self._generation
+
+    def _deliver(self, job: AggregateJob, fn: Callable[[], None]) -> None:
+        """Call fn on the UI side if job is still the latest one."""
+        def deliver() -> None:
+            if self._is_current(job):
+                fn()
+        self._dispatch(deliver)
+
+    def _enter_stage(self, job, stage: str, on_progress) -> bool:
+        if not self._is_current(job):
+            logging.info("집계 컨트롤러: 대체/취소된 집계 중단 시나리오=%s 단계=%s", job.scenario_id, stage)
+            return False
+        job.stage = stage
+        if on_progress is not None:
+            self._deliver(job, lambda: on_progress(stage))
+        return True
+
+    def _finish(self, job: AggregateJob) -> None:
+        job.stage = STAGE_DONE
+        with self._lock:
+            latest = self._current is job
+            if latest:
+                self._current = None
+        if not latest:
+            return
+
+        def release_loading() -> None:
+            # 대체된 작업은 새 작업의 로딩 상태를 건드리지 않음
+            if self._loading_job is job:
+                self._loading_job = None
+                self._ctx.set_loading(False)
+        self._dispatch(release_loading)
+
+    def _work(self, job, persist_base_data, on_success, on_error, on_progress) -> None:
         try:
-            snapshot = self._service.aggregate(scenario_id)
+            if not self._enter_stage(job, STAGE_PERSIST, on_progress):
+                return
+            if not persist_base_data():
+                self._deliver(job, lambda: on_error("입력 데이터 저장에 실패했습니다."))
+                return
+
+            def mark_saved() -> None:
+                self._ctx.set_scenario(job.scenario_id, job.scenario_name)
+                # 집계 중 들어온 편집은 저장되지 않았으므로 dirty 유지
+                self._ctx.mark_clean_if_unchanged(job.edit_generation)
+            self._deliver(job, mark_saved)
+
+            if not self._enter_stage(job, STAGE_AGGREGATE, on_progress):
+                return
+            snapshot = self._service.aggregate(job.scenario_id)
             if snapshot is None:
-                on_error("집계 결과를 생성할 수 없습니다.")
+                self._deliver(job, lambda: on_error("집계 결과를 생성할 수 없습니다."))
                 return
-            self._ctx.set_result_snapshot(snapshot)
-            on_success(snapshot)
-            logging.info("집계 컨트롤러: 집계 완료 시나리오=%s", scenario_id)
+
+            def succeed() -> None:
+                self._ctx.set_result_snapshot(snapshot)
+                if on_progress is not None:
+                    on_progress(STAGE_DONE)
+                on_success(snapshot)
+                logging.info("집계 컨트롤러: 집계 완료 시나리오=%s", job.scenario_id)
+            self._deliver(job, succeed)
         except Exception as e:
             logging.exception("집계 컨트롤러: 집계 실패")
-            on_error(str(e))
+            message = str(e)
+            self._deliver(job, lambda: on_error(message))
         finally:
-            self._ctx.set_loading(False)
+            self._finish(job)
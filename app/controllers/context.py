@@ -20,6 +20,8 @@ class ScenarioContext:
         self.result_snapshot: ResultSnapshot | None = None
         self.is_loading: bool = False
         self.is_dirty: bool = False
+        # 편집 세대: 변경될 때마다 증가 (작업 시작 시 값과 비교해 그 사이 편집 여부 확인)
+        self.edit_generation: int = 0
         self._listeners: list[Callable[[], None]] = []
 
     @classmethod
@@ -36,6 +38,7 @@ class ScenarioContext:
     def set_base_data(self, data: BaseData) -> None:
         self.base_data = data
         self.is_dirty = True
+        self.edit_generation += 1
         self._notify()
 
     def set_result_snapshot(self, snapshot: ResultSnapshot | None) -> None:
@@ -51,9 +54,18 @@ class ScenarioContext:
         logging.debug("ScenarioContext: is_loading=%s", value)
 
     def set_dirty(self, value: bool) -> None:
+        if value:
+            self.edit_generation += 1
         self.is_dirty = value
         self._notify()
 
+    def mark_clean_if_unchanged(self, edit_generation: int) -> bool:
+        """Clear dirty only if nothing was edited since edit_generation was read."""
+        if self.edit_generation != edit_generation:
+            return False
+        self.set_dirty(False)
+        return True
+
     def clear_after_load(self) -> None:
         """Clear snapshot when switching scenario without aggregate."""
         self.result_snapshot = None
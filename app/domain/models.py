@@ -96,6 +96,7 @@ class ResultSnapshot:
             expense_rows=result.get("expense_rows") or [],
             job_breakdown=result.get("job_breakdown") or [],
             insurance_by_exp_code=result.get("insurance_by_exp_code") or {},
+            hash=result.get("input_hash"),
         )
 
 
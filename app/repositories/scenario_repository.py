@@ -2,13 +2,11 @@
 Persistence: scenario input, master data refs, and result snapshot.
 Wraps src.domain.scenario_input and result storage. No UI.
 """
-import json
 import logging
-from decimal import Decimal
-from typing import Any
 
 from app.domain.models import ResultSnapshot
 from src.domain.db import get_connection
+from src.domain.result.service import dump_result_json
 from src.domain.scenario_input.service import (
     get_scenario_input,
     list_scenario_ids,
@@ -44,24 +42,28 @@ class ScenarioRepository:
             conn.close()
 
     def save_snapshot(self, scenario_id: str, snapshot: ResultSnapshot) -> None:
-        """Persist result snapshot to calculation_result table."""
+        """Persist result snapshot to calculation_result table. Skipped when the stored input hash matches."""
         conn = get_connection()
         try:
-            payload = snapshot.to_dict()
-            def _json_default(obj: Any) -> Any:
-                if isinstance(obj, Decimal):
-                    return float(obj)
-                raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
-            json_str = json.dumps(payload, ensure_ascii=True, default=_json_default)
+            if snapshot.hash:
+                row = conn.execute(
+                    "SELECT input_hash FROM calculation_result WHERE scenario_id=?",
+                    (scenario_id,),
+                ).fetchone()
+                if row is not None and row[0] == snapshot.hash:
+                    logging.info("시나리오 저장소: 입력 해시 동일, 스냅샷 저장 생략 시나리오=%s", scenario_id)
+                    return
+            json_str = dump_result_json(snapshot.to_dict())
             conn.execute(
                 """
-                INSERT INTO calculation_result (scenario_id, result_json, updated_at)
-                VALUES (?, ?, datetime('now'))
+                INSERT INTO calculation_result (scenario_id, result_json, input_hash, updated_at)
+                VALUES (?, ?, ?, datetime('now'))
                 ON CONFLICT(scenario_id) DO UPDATE SET
                   result_json=excluded.result_json,
+                  input_hash=excluded.input_hash,
                   updated_at=datetime('now')
                 """,
-                (scenario_id, json_str),
+                (scenario_id, json_str, snapshot.hash),
             )
             conn.commit()
             logging.info("시나리오 저장소: 집계 스냅샷 저장 완료 시나리오=%s", scenario_id)
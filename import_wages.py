@@ -14,6 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from domain.db import get_connection
+from domain.migration_runner import run_migrations
 from utils.json_importer import import_wage_data_for_year
 
 logging.basicConfig(
@@ -39,6 +40,7 @@ def main():
     try:
         # 데이터베이스 연결
         conn = get_connection()
+        run_migrations(conn)
         
         # 임포트 실행
         import_wage_data_for_year(conn, year)
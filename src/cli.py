@@ -0,0 +1,276 @@
+"""
+헤드리스 배치 CLI (PyQt 미사용).
+
+    python -m src.cli aggregate --all --format csv --output totals.csv --jobs 0
+    python -m src.cli export S1 S2 --output-dir exports/
+    python -m src.cli verify --all --jobs 4
+
+- aggregate: 시나리오 집계(aggregate_portfolio, 바뀐 결과만 한 번에 저장) 후 요약을 JSON/CSV로 출력
+- export: 저장된 집계 결과를 auto_fm_fin.xlsx 양식으로 일괄 내보내기
+- verify: 저장된 결과를 캐시 없이 다시 계산한 값과 비교 (불일치·오류가 있으면 종료 코드 1)
+
+--jobs N (>1)이면 프로세스 풀에서 시나리오 단위로 나눠 처리한다 (0 = CPU 코어 수).
+작업 프로세스는 spawn으로 띄워 부모의 DB 연결 풀을 물려받지 않고 각자 연결한다.
+"""
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+
+from src.domain.db import get_connection
+from src.domain.masterdata.service import apply_seed_if_needed
+from src.domain.migration_runner import run_migrations
+from src.domain.result.portfolio import aggregate_portfolio
+from src.domain.result.service import calculate_result, get_result_snapshot
+from src.domain.scenario_input.service import get_scenario_input, list_scenarios
+from src.utils import tracing
+
+AGGREGATOR_FIELDS = (
+    "labor_total",
+    "fixed_expense_total",
+    "variable_expense_total",
+    "passthrough_expense_total",
+    "overhead_cost",
+    "profit",
+    "grand_total",
+)
+SUMMARY_FIELDS = ("scenario_id", "name", "status", *AGGREGATOR_FIELDS, "input_hash", "detail")
+
+# 요약 status 값 (STATUS_OK 외에는 실패로 보고 종료 코드 1)
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_UNKNOWN = "unknown"      # 없는 시나리오 ID
+STATUS_MISSING = "missing"      # 저장된 집계 결과 없음 (export/verify)
+STATUS_STALE = "stale"          # 저장 후 입력·마스터데이터가 바뀜 (입력 해시 다름)
+STATUS_MISMATCH = "mismatch"    # 입력 해시는 같은데 다시 계산한 값이 다름
+
+TEMPLATE_PATH = Path(__file__).resolve().parent / "auto_fm_fin.xlsx"
+
+
+def prepare_database() -> None:
+    """GUI 시작과 같은 DB 준비: 마이그레이션, 초기 마스터 데이터."""
+    run_migrations()
+    conn = get_connection()
+    try:
+        apply_seed_if_needed(conn)
+    finally:
+        conn.close()
+
+
+def _json_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _normalized(value):
+    """저장 형식(JSON)과 같은 값으로 맞춘다 (Decimal → float, 튜플 → 리스트)."""
+    return json.loads(json.dumps(value, ensure_ascii=True, default=_json_default))
+
+
+def _aggregator_values(aggregator) -> dict:
+    """Aggregator 객체 또는 저장된 dict → 요약 금액 dict."""
+    if isinstance(aggregator, dict):
+        return {name: aggregator.get(name) for name in AGGREGATOR_FIELDS}
+    return {name: getattr(aggregator, name) for name in AGGREGATOR_FIELDS}
+
+
+def _summary(scenario_id: str, name: str, status: str, **values) -> dict:
+    record = dict.fromkeys(SUMMARY_FIELDS)
+    record.update(scenario_id=scenario_id, name=name, status=status, detail="")
+    record.update(values)
+    return record
+
+
+def _result_summary(scenario_id: str, name: str, result: dict) -> dict:
+    return _summary(
+        scenario_id, name, STATUS_OK,
+        input_hash=result.get("input_hash"),
+        **_normalized(_aggregator_values(result["aggregator"])),
+    )
+
+
+def export_scenario(scenario_id: str, name: str, output_dir: str) -> dict:
+    """저장된 집계 결과를 <output_dir>/<scenario_id>.xlsx로 내보내기."""
+    conn = get_connection()
+    try:
+        snapshot = get_result_snapshot(scenario_id, conn)
+        if snapshot is None:
+            return _summary(scenario_id, name, STATUS_MISSING, detail="계산 결과가 없습니다. 먼저 집계를 실행하세요.")
+        # openpyxl은 내보내기에만 필요하므로 여기서 import
+        from src.domain.export.excel_exporter import ExcelExporter
+
+        canonical = get_scenario_input(scenario_id, conn)
+        path = Path(output_dir) / f"{scenario_id}.xlsx"
+        ExcelExporter(
+            template_path=TEMPLATE_PATH,
+            snapshot=snapshot,
+            overhead_rate=float(canonical.get("overhead_rate") or 9.0),
+            profit_rate=float(canonical.get("profit_rate") or 10.0),
+        ).export(path)
+        return _summary(
+            scenario_id, name, STATUS_OK,
+            input_hash=snapshot.get("input_hash"),
+            detail=str(path),
+            **_aggregator_values(snapshot.get("aggregator") or {}),
+        )
+    except Exception as exc:
+        logging.exception("CLI 내보내기 실패: 시나리오=%s", scenario_id)
+        return _summary(scenario_id, name, STATUS_ERROR, detail=str(exc))
+    finally:
+        conn.close()
+
+
+def verify_scenario(scenario_id: str, name: str) -> dict:
+    """저장된 결과 vs 캐시 없이 다시 계산한 결과 (DB 쓰기 없음). 다른 금액·행 목록을 detail에 적는다."""
+    conn = get_connection()
+    try:
+        stored = get_result_snapshot(scenario_id, conn)
+        if stored is None:
+            return _summary(scenario_id, name, STATUS_MISSING, detail="저장된 집계 결과 없음")
+        fresh = calculate_result(scenario_id, conn, persist=False, use_cache=False)
+        expected = _normalized(_aggregator_values(fresh["aggregator"]))
+        actual = _aggregator_values(stored.get("aggregator") or {})
+        diffs = [f"{key}: {actual[key]} != {expected[key]}" for key in AGGREGATOR_FIELDS if actual[key] != expected[key]]
+        for key in ("labor_rows", "expense_rows"):
+            if _normalized(stored.get(key) or []) != _normalized(fresh.get(key) or []):
+                diffs.append(f"{key} 다름")
+        if not diffs:
+            status = STATUS_OK
+        elif stored.get("input_hash") != fresh.get("input_hash"):
+            status = STATUS_STALE
+        else:
+            status = STATUS_MISMATCH
+        return _summary(
+            scenario_id, name, status,
+            input_hash=stored.get("input_hash"),
+            detail="; ".join(diffs),
+            **actual,
+        )
+    except Exception as exc:
+        logging.exception("CLI 검증 실패: 시나리오=%s", scenario_id)
+        return _summary(scenario_id, name, STATUS_ERROR, detail=str(exc))
+    finally:
+        conn.close()
+
+
+def resolve_scenarios(scenario_ids: list[str], all_scenarios: bool) -> tuple[list[tuple[str, str]], list[str]]:
+    """(처리할 (scenario_id, 이름) 목록, 없는 ID 목록). 순서는 인자 순서 (--all이면 ID 순)."""
+    conn = get_connection()
+    try:
+        known = dict(list_scenarios(conn))
+    finally:
+        conn.close()
+    if all_scenarios:
+        return list(known.items()), []
+    requested = list(dict.fromkeys(scenario_ids))
+    return (
+        [(sid, known[sid]) for sid in requested if sid in known],
+        [sid for sid in requested if sid not in known],
+    )
+
+
+def run_tasks(func, tasks: list[tuple], jobs: int) -> list[dict]:
+    """tasks 각각에 func(*task). jobs>1이면 프로세스 풀 (결과 순서는 tasks 순서)."""
+    if jobs <= 1 or len(tasks) <= 1:
+        return [func(*task) for task in tasks]
+    workers = min(jobs, len(tasks))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return list(pool.map(func, *zip(*tasks)))
+
+
+def write_summaries(records: list[dict], fmt: str, output: str | None) -> None:
+    stream = open(output, "w", encoding="utf-8", newline="") if output else sys.stdout
+    try:
+        if fmt == "csv":
+            writer = csv.DictWriter(stream, fieldnames=SUMMARY_FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+        else:
+            json.dump(records, stream, ensure_ascii=False, indent=2, default=_json_default)
+            stream.write("\n")
+    finally:
+        if output:
+            stream.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="시나리오 일괄 집계·내보내기·검증")
+    parser.add_argument("--db", help="DB 파일 경로 (기본: COSTCALC_DB_PATH 또는 앱 기본 경로)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="INFO 로그 출력")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(sub):
+        sub.add_argument("scenario_ids", nargs="*", metavar="SCENARIO_ID", help="시나리오 ID (여러 개 가능)")
+        sub.add_argument("--all", action="store_true", dest="all_scenarios", help="저장된 모든 시나리오")
+        sub.add_argument("--jobs", "-j", type=int, default=1, help="작업 프로세스 수 (0 = CPU 코어 수, 기본 1)")
+        sub.add_argument("--format", choices=("json", "csv"), default="json", help="요약 출력 형식")
+        sub.add_argument("--output", "-o", help="요약 출력 파일 (기본: 표준 출력)")
+
+    add_common(commands.add_parser("aggregate", help="집계 후 결과 저장·요약 출력"))
+    commands.choices["aggregate"].add_argument(
+        "--no-persist", action="store_true", help="집계 결과를 DB에 저장하지 않음",
+    )
+    add_common(commands.add_parser("export", help="저장된 결과를 Excel로 일괄 내보내기"))
+    commands.choices["export"].add_argument("--output-dir", help="Excel 저장 폴더 (기본: exports/)")
+    add_common(commands.add_parser("verify", help="저장된 결과를 다시 계산해 비교"))
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.scenario_ids and not args.all_scenarios:
+        parser.error("시나리오 ID를 지정하거나 --all을 사용하세요.")
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+    if args.db:
+        # spawn 작업 프로세스도 환경변수를 물려받아 같은 DB를 연다
+        os.environ["COSTCALC_DB_PATH"] = str(Path(args.db).resolve())
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    # COSTCALC_TRACE가 설정되면 단계별 소요 시간을 기록하고 끝에 p50/p95 요약을 표준 오류로 출력
+    tracing.configure_from_env()
+
+    prepare_database()
+    scenarios, unknown = resolve_scenarios(args.scenario_ids, args.all_scenarios)
+    if args.command == "aggregate":
+        portfolio = aggregate_portfolio([sid for sid, _ in scenarios], jobs=jobs, persist=not args.no_persist)
+        records = [
+            _result_summary(sid, name, portfolio.results[sid]) if sid in portfolio.results
+            else _summary(sid, name, STATUS_ERROR, detail=portfolio.errors.get(sid, ""))
+            for sid, name in scenarios
+        ]
+    elif args.command == "export":
+        if not TEMPLATE_PATH.exists():
+            print(f"템플릿 파일을 찾을 수 없습니다: {TEMPLATE_PATH}", file=sys.stderr)
+            return 1
+        if args.output_dir:
+            output_dir = Path(args.output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            from src.utils.path_helper import get_exports_dir
+            output_dir = get_exports_dir()
+        records = run_tasks(export_scenario, [(sid, name, str(output_dir)) for sid, name in scenarios], jobs)
+    else:
+        records = run_tasks(verify_scenario, scenarios, jobs)
+    records.extend(_summary(sid, sid, STATUS_UNKNOWN, detail="없는 시나리오") for sid in unknown)
+
+    write_summaries(records, args.format, args.output)
+    if tracing.is_enabled():
+        print(tracing.format_summary(), file=sys.stderr)
+    failed = [r for r in records if r["status"] != STATUS_OK]
+    logging.info("CLI %s 완료: %d건, 실패 %d건", args.command, len(records), len(failed))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Dict
 
-from src.domain.constants.rounding import drop_under_1_won
+from src.domain.constants.fixed_point import mul_floor
 from src.domain.constants.expense_groups import classify_expense
 from src.domain.calculator.expense_line import ExpenseLine, ExpenseSubLine
 
@@ -52,9 +52,7 @@ class ExpenseCostCalculator:
 
             # 안전관리비: 직접노무비 합계 × 설정의 지급요율 (세부 항목 무시)
             if item.exp_code == EXP_CODE_SAFETY and self.safety_management_rate and self.labor_total:
-                row_total = int(
-                    drop_under_1_won(Decimal(self.labor_total) * self.safety_management_rate)
-                )
+                row_total = mul_floor(self.labor_total, self.safety_management_rate)
                 lines.append(
                     ExpenseLine(
                         exp_code=item.exp_code,
@@ -100,7 +98,7 @@ class ExpenseCostCalculator:
                 if quantity == 0 and unit_price == 0:
                     continue
 
-                row_total = drop_under_1_won(quantity * Decimal(str(unit_price)))
+                row_total = mul_floor(quantity, unit_price)
 
                 lines.append(
                     ExpenseLine(
@@ -137,7 +135,7 @@ class ExpenseCostCalculator:
 
             qty = float(getattr(si, 'quantity', 0) if hasattr(si, 'quantity') else si.get('quantity', 0))
             price = int(getattr(si, 'unit_price', 0) if hasattr(si, 'unit_price') else si.get('unit_price', 0))
-            amount = drop_under_1_won(Decimal(str(qty)) * Decimal(str(price)))
+            amount = mul_floor(qty, price)
 
             def _attr(obj, name, default=''):
                 if hasattr(obj, name):
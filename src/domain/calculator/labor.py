@@ -1,14 +1,31 @@
 from decimal import Decimal
-from typing import Dict
 
 from src.domain.context.calc_context import CalcContext
 from src.domain.calculator.labor_job_line import LaborJobLine
-from src.domain.constants.rounding import drop_under_1_won
+from src.domain.calculator.labor_result import LaborResult
+from src.domain.calculator.labor_cache import PerPersonLaborCache, per_person_cache
+from src.domain.constants.fixed_point import FixedRate, to_ratio
 
 # 계산식 기준 상수
 STANDARD_MONTHLY_HOURS = Decimal("209")  # 통상 월 근로시간(209시간)
 BONUS_ANNUAL_RATE = Decimal("4.0")  # 상여금 400%
 MONTHS_PER_YEAR = Decimal("12")
+HOLIDAY_WORK_PREMIUM = Decimal("1.5")  # 휴일근로 150%
+
+# 정수 고정소수 요율 (floor(금액 × 요율)을 정수 연산으로)
+_BONUS_PER_MONTH = FixedRate.of(BONUS_ANNUAL_RATE, divisor=MONTHS_PER_YEAR)
+_PER_MONTH = FixedRate.of(1, divisor=MONTHS_PER_YEAR)
+_PER_MONTHLY_HOUR = FixedRate.of(1, divisor=STANDARD_MONTHLY_HOURS)
+_HOLIDAY_WORK_PREMIUM = FixedRate.of(HOLIDAY_WORK_PREMIUM)
+_INSURANCE_RATES = {
+    "industrial_accident": FixedRate.of(CalcContext.INDUSTRIAL_ACCIDENT_RATE),
+    "national_pension": FixedRate.of(CalcContext.NATIONAL_PENSION_RATE),
+    "employment_insurance": FixedRate.of(CalcContext.EMPLOYMENT_INSURANCE_RATE),
+    "health_insurance": FixedRate.of(CalcContext.HEALTH_INSURANCE_RATE),
+    "long_term_care": FixedRate.of(CalcContext.LONG_TERM_CARE_RATE),
+    "wage_bond": FixedRate.of(CalcContext.WAGE_BOND_RATE),
+    "asbestos_relief": FixedRate.of(CalcContext.ASBESTOS_RELIEF_RATE),
+}
 
 
 
@@ -17,10 +34,12 @@ class LaborCostCalculator:
     노무비 계산 전담 클래스
     """
 
-    def __init__(self, context: CalcContext):
+    def __init__(self, context: CalcContext, cache: PerPersonLaborCache | None = per_person_cache):
         self.context = context
+        # 1인 기준 결과 캐시 (None이면 매번 계산)
+        self._cache = cache
 
-    def calculate(self) -> Dict[str, int]:
+    def calculate(self) -> LaborResult:
         # 다인원일 경우: 1인 기준 계산 후 인원수만큼 합산
         total_headcount = sum(self.context.manpower.values())
         if len(self.context.manpower) > 1 or total_headcount != 1:
@@ -28,14 +47,13 @@ class LaborCostCalculator:
 
         # 1) 일급 합계 (단일 인원)
         daily_wage_total = self._calculate_daily_wage_total()
-        result = self._calculate_from_daily_wage_total(daily_wage_total)
+        result = self._per_person(daily_wage_total).copy()
         job_code = next(iter(self.context.manpower.keys()), "role")
-        job_line = self._build_job_line(job_code, 1, result)
-        result["job_lines"] = [job_line]
+        result.job_lines = [self._build_job_line(job_code, 1, result)]
         return result
 
-    def _calculate_aggregated_by_headcount(self) -> Dict[str, int]:
-        result = self._empty_result()
+    def _calculate_aggregated_by_headcount(self) -> LaborResult:
+        result = LaborResult()
         job_lines = []
 
         job_order = getattr(self.context, "job_order", None)
@@ -49,25 +67,47 @@ class LaborCostCalculator:
             if headcount == 0:
                 continue
             wage = self.context.wage_rate.get(job, Decimal("0"))
-            per_person = self._calculate_from_daily_wage_total(wage)
+            per_person = self._per_person(wage)
             scale = int(headcount)
-            self._accumulate_scaled(result, per_person, scale)
+            result.add(per_person, scale)
             job_lines.append(self._build_job_line(job, scale, per_person))
 
-        result["job_lines"] = job_lines
+        result.job_lines = job_lines
         return result
 
-    def _calculate_from_daily_wage_total(self, daily_wage_total: Decimal) -> Dict[str, int]:
+    def _per_person(self, daily_wage_total: Decimal) -> LaborResult:
+        """1인 기준 결과. 캐시된 결과는 공유되므로 호출 측에서 수정하지 않는다."""
+        if self._cache is None:
+            return self._calculate_from_daily_wage_total(daily_wage_total)
+        ctx = self.context
+        key = self._cache.make_key(
+            daily_wage_total,
+            ctx.monthly_workdays,
+            ctx.daily_work_hours,
+            getattr(ctx, "overtime_hours", Decimal("0")),
+            getattr(ctx, "holiday_work_days", Decimal("0")),
+            ctx.weekly_holiday_days,
+            ctx.annual_leave_days,
+        )
+        return self._cache.get_or_compute(
+            key, lambda: self._calculate_from_daily_wage_total(daily_wage_total)
+        )
+
+    def _calculate_from_daily_wage_total(self, daily_wage_total: Decimal) -> LaborResult:
+        # 모든 단계는 정수 고정소수 연산으로 1원 미만 버림 (Decimal 경로와 동일 결과)
+        ctx = self.context
+        md_n, md_d = to_ratio(daily_wage_total)
+        wd_n, wd_d = to_ratio(ctx.monthly_workdays)
+        wh_n, wh_d = to_ratio(ctx.daily_work_hours)
+        ot_n, ot_d = to_ratio(getattr(ctx, "overtime_hours", 0))
+        hd_n, hd_d = to_ratio(getattr(ctx, "holiday_work_days", 0))
+        al_n, al_d = to_ratio(ctx.annual_leave_days)
 
         # 2) 기본급(월) = 노임단가 분가 "해당 직종 M/D기본급(원/일) × 월 근무일수" (1원 미만 버림)
-        base_salary = drop_under_1_won(
-            daily_wage_total * self.context.monthly_workdays
-        )
+        base_salary = md_n * wd_n // (md_d * wd_d)
 
         # 3) 상여금(월) = 기본급 × 400% ÷ 12
-        bonus = drop_under_1_won(
-            base_salary * BONUS_ANNUAL_RATE / MONTHS_PER_YEAR
-        )
+        bonus = _BONUS_PER_MONTH.floor(base_salary)
 
         # 4) 통상시간급
         ordinary_hourly_wage = self._calculate_ordinary_hourly_wage(
@@ -76,35 +116,22 @@ class LaborCostCalculator:
         )
 
         # 5) 주휴수당 (모든 직급 0 적용)
-        weekly_allowance = drop_under_1_won(
-            ordinary_hourly_wage
-            * self.context.daily_work_hours
-            * self.context.weekly_holiday_days
-            * Decimal("0")
-        )
+        weekly_allowance = 0
 
-        # 6) 연차수당
-        annual_leave_allowance = drop_under_1_won(
-            ordinary_hourly_wage
-            * self.context.daily_work_hours
-            * self.context.annual_leave_days
-        )
+        # 6) 연차수당 = 통상시간급 × 1일근무시간 × 연차일수
+        annual_leave_allowance = ordinary_hourly_wage * wh_n * al_n // (wh_d * al_d)
 
         # 6-1) 연장수당 (시간 단위, 없으면 0)
-        overtime_hours = getattr(self.context, "overtime_hours", Decimal("0"))
-        overtime_allowance = drop_under_1_won(
-            ordinary_hourly_wage * overtime_hours
-        )
+        overtime_allowance = ordinary_hourly_wage * ot_n // ot_d
 
         # 6-2) 휴일근로수당 = 통상일급(통상시간급×8) × 휴일근로일수 × 150%
-        holiday_work_days = getattr(self.context, "holiday_work_days", Decimal("0"))
-        ordinary_daily_wage = ordinary_hourly_wage * self.context.daily_work_hours
-        holiday_work_allowance = drop_under_1_won(
-            ordinary_daily_wage * holiday_work_days * Decimal("1.5")
+        holiday_work_allowance = (
+            ordinary_hourly_wage * wh_n * hd_n * _HOLIDAY_WORK_PREMIUM.num
+            // (wh_d * hd_d * _HOLIDAY_WORK_PREMIUM.den)
         )
 
         # 7) 제수당 합계
-        allowance = drop_under_1_won(
+        allowance = (
             weekly_allowance
             + annual_leave_allowance
             + overtime_allowance
@@ -112,42 +139,24 @@ class LaborCostCalculator:
         )
 
         # 8) 퇴직급여충당금 = (기본급 + 제수당 + 상여금) ÷ 12
-        retirement = drop_under_1_won(
-            (base_salary + allowance + bonus) / MONTHS_PER_YEAR
-        )
+        retirement = _PER_MONTH.floor(base_salary + allowance + bonus)
 
         # 9) 인건비 소계
-        labor_subtotal = drop_under_1_won(
-            base_salary + allowance + bonus + retirement
-        )
+        labor_subtotal = base_salary + allowance + bonus + retirement
 
         # 10) 보험료 산정 기준
         insurance_base = base_salary + allowance + bonus
 
-        industrial_accident = drop_under_1_won(
-            insurance_base * CalcContext.INDUSTRIAL_ACCIDENT_RATE
-        )
-        national_pension = drop_under_1_won(
-            insurance_base * CalcContext.NATIONAL_PENSION_RATE
-        )
-        employment_insurance = drop_under_1_won(
-            insurance_base * CalcContext.EMPLOYMENT_INSURANCE_RATE
-        )
-        health_insurance = drop_under_1_won(
-            insurance_base * CalcContext.HEALTH_INSURANCE_RATE
-        )
+        industrial_accident = _INSURANCE_RATES["industrial_accident"].floor(insurance_base)
+        national_pension = _INSURANCE_RATES["national_pension"].floor(insurance_base)
+        employment_insurance = _INSURANCE_RATES["employment_insurance"].floor(insurance_base)
+        health_insurance = _INSURANCE_RATES["health_insurance"].floor(insurance_base)
         # 노인장기요양보험료 = 건강보험료 × 노인장기요양보험료율
-        long_term_care = drop_under_1_won(
-            health_insurance * CalcContext.LONG_TERM_CARE_RATE
-        )
-        wage_bond = drop_under_1_won(
-            insurance_base * CalcContext.WAGE_BOND_RATE
-        )
-        asbestos_relief = drop_under_1_won(
-            insurance_base * CalcContext.ASBESTOS_RELIEF_RATE
-        )
+        long_term_care = _INSURANCE_RATES["long_term_care"].floor(health_insurance)
+        wage_bond = _INSURANCE_RATES["wage_bond"].floor(insurance_base)
+        asbestos_relief = _INSURANCE_RATES["asbestos_relief"].floor(insurance_base)
 
-        insurance_total = drop_under_1_won(
+        insurance_total = (
             industrial_accident
             + national_pension
             + employment_insurance
@@ -158,152 +167,47 @@ class LaborCostCalculator:
         )
 
         # 11) 총합
-        total = drop_under_1_won(
-            labor_subtotal + insurance_total
-        )
-
-        return {
-            "base_salary": base_salary,
-            "weekly_allowance": weekly_allowance,
-            "annual_leave_allowance": annual_leave_allowance,
-            "allowance": allowance,
-            "bonus": bonus,
-            "retirement": retirement,
-            "labor_subtotal": labor_subtotal,
-            "industrial_accident": industrial_accident,
-            "national_pension": national_pension,
-            "employment_insurance": employment_insurance,
-            "health_insurance": health_insurance,
-            "long_term_care": long_term_care,
-            "wage_bond": wage_bond,
-            "asbestos_relief": asbestos_relief,
-            "insurance_total": insurance_total,
-            "total_labor_cost": total,
-            "allowances": {
-                "annual_leave_pay": annual_leave_allowance,
-                "overtime_pay": overtime_allowance,
-                "holiday_work_pay": holiday_work_allowance,
-                "total": allowance,
-            },
-            "bonus_monthly": bonus,
-            "retirement_reserve": retirement,
-            "insurance": {
-                "industrial_accident": industrial_accident,
-                "national_pension": national_pension,
-                "employment": employment_insurance,
-                "health": health_insurance,
-                "long_term_care": long_term_care,
-                "wage_bond": wage_bond,
-                "asbestos": asbestos_relief,
-                "total": insurance_total,
-            },
-        }
-
-    def _empty_result(self) -> Dict[str, int]:
-        return {
-            "base_salary": 0,
-            "weekly_allowance": 0,
-            "annual_leave_allowance": 0,
-            "allowance": 0,
-            "bonus": 0,
-            "retirement": 0,
-            "labor_subtotal": 0,
-            "industrial_accident": 0,
-            "national_pension": 0,
-            "employment_insurance": 0,
-            "health_insurance": 0,
-            "long_term_care": 0,
-            "wage_bond": 0,
-            "asbestos_relief": 0,
-            "insurance_total": 0,
-            "total_labor_cost": 0,
-            "allowances": {
-                "annual_leave_pay": 0,
-                "overtime_pay": 0,
-                "holiday_work_pay": 0,
-                "total": 0,
-            },
-            "bonus_monthly": 0,
-            "retirement_reserve": 0,
-            "insurance": {
-                "industrial_accident": 0,
-                "national_pension": 0,
-                "employment": 0,
-                "health": 0,
-                "long_term_care": 0,
-                "wage_bond": 0,
-                "asbestos": 0,
-                "total": 0,
-            },
-        }
-
-    def _accumulate_scaled(
-        self,
-        target: Dict[str, int],
-        source: Dict[str, int],
-        scale: int,
-    ) -> None:
-        for key in [
-            "base_salary",
-            "weekly_allowance",
-            "annual_leave_allowance",
-            "allowance",
-            "bonus",
-            "retirement",
-            "labor_subtotal",
-            "industrial_accident",
-            "national_pension",
-            "employment_insurance",
-            "health_insurance",
-            "long_term_care",
-            "wage_bond",
-            "asbestos_relief",
-            "insurance_total",
-            "total_labor_cost",
-            "bonus_monthly",
-            "retirement_reserve",
-        ]:
-            target[key] += source[key] * scale
-
-        for key in ["annual_leave_pay", "overtime_pay", "holiday_work_pay", "total"]:
-            target["allowances"][key] += source["allowances"][key] * scale
-
-        for key in [
-            "industrial_accident",
-            "national_pension",
-            "employment",
-            "health",
-            "long_term_care",
-            "wage_bond",
-            "asbestos",
-            "total",
-        ]:
-            target["insurance"][key] += source["insurance"][key] * scale
-
-    def _build_job_line(self, job_code: str, headcount: int, per_person: Dict[str, int]) -> LaborJobLine:
+        total = labor_subtotal + insurance_total
+
+        return LaborResult([
+            base_salary,
+            weekly_allowance,
+            annual_leave_allowance,
+            overtime_allowance,
+            holiday_work_allowance,
+            allowance,
+            bonus,
+            retirement,
+            labor_subtotal,
+            industrial_accident,
+            national_pension,
+            employment_insurance,
+            health_insurance,
+            long_term_care,
+            wage_bond,
+            asbestos_relief,
+            insurance_total,
+            total,
+        ])
+
+    def _build_job_line(self, job_code: str, headcount: int, per_person: LaborResult) -> LaborJobLine:
         job_name_map = getattr(self.context, "job_name_map", {})
         job_name = job_name_map.get(job_code, job_code)
         work_days = float(getattr(self.context, "monthly_workdays", Decimal("0")))
-        overtime = per_person["allowances"].get("overtime_pay", 0) * headcount
-        total = per_person["total_labor_cost"] * headcount
         return LaborJobLine(
             job_code=job_code,
             headcount=headcount,
             job_name=job_name,
             work_days=work_days,
-            base_wage=per_person["base_salary"] * headcount,
-            allowance=per_person["allowance"] * headcount,
-            overtime=overtime,
-            total=total,
-            base_salary=per_person["base_salary"] * headcount,
-            bonus=per_person["bonus"] * headcount,
-            allowances=per_person["allowance"] * headcount,
-            retirement=per_person["retirement"] * headcount,
-            labor_subtotal=per_person["labor_subtotal"] * headcount,
-            role_total=per_person["labor_subtotal"] * headcount,
+            base_salary=per_person.base_salary * headcount,
+            bonus=per_person.bonus * headcount,
+            allowance=per_person.allowance * headcount,
+            overtime=per_person.overtime_allowance * headcount,
+            retirement=per_person.retirement * headcount,
+            labor_subtotal=per_person.labor_subtotal * headcount,
+            total=per_person.total_labor_cost * headcount,
         )
 
-
     def _calculate_daily_wage_total(self) -> Decimal:
         """
         일급 합계 = 직무별(인원 × 일급) 합산
@@ -332,32 +236,25 @@ class LaborCostCalculator:
     def _calculate_ordinary_hourly_wage(
         self,
         daily_wage_total: Decimal,
-        bonus: Decimal,
-    ) -> Decimal:
+        bonus: int,
+    ) -> int:
         """
         통상시간급 = (md_basic ÷ 일 근무시간) + (상여금 ÷ 209)
         md_basic: M/D 기본급(원/일). 노무비 상세에서는 wages_master.json md_basic 사용.
         """
         # 시간급 = md_basic(원/일) ÷ 1일 근무시간 (즉시 절사)
         if self.context.daily_work_hours == 0:
-            hourly_wage = Decimal("0")
+            hourly_wage = 0
         else:
-            hourly_wage = Decimal(
-                drop_under_1_won(daily_wage_total / self.context.daily_work_hours)
-            )
+            md_n, md_d = to_ratio(daily_wage_total)
+            wh_n, wh_d = to_ratio(self.context.daily_work_hours)
+            hourly_wage = md_n * wh_d // (md_d * wh_n)
 
         # 상여 시간가산 = 상여금 ÷ 209시간 (즉시 절사)
-        if STANDARD_MONTHLY_HOURS == 0:
-            bonus_per_hour = Decimal("0")
-        else:
-            bonus_per_hour = Decimal(
-                drop_under_1_won(bonus / STANDARD_MONTHLY_HOURS)
-            )
+        bonus_per_hour = _PER_MONTHLY_HOUR.floor(bonus)
 
-        # 통상시간급 = 시간급 + 상여 시간가산 (즉시 절사)
-        return Decimal(
-            drop_under_1_won(hourly_wage + bonus_per_hour)
-        )
+        # 통상시간급 = 시간급 + 상여 시간가산
+        return hourly_wage + bonus_per_hour
 
     def _calculate_weekly_allowance(self, ordinary_hourly_wage: Decimal) -> Decimal:
         """
@@ -390,3 +287,4 @@ class LaborCostCalculator:
         """
         retirement_base = base_salary + allowance + bonus
         return retirement_base / MONTHS_PER_YEAR
+
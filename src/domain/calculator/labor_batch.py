@@ -0,0 +1,304 @@
+"""
+노무비 일괄(batch) 계산 엔진.
+
+LaborCostCalculator는 직무 1건씩 Decimal 연산으로 계산한다. 이 모듈은 여러 시나리오의
+모든 직무를 (md_basic, 근무일수, 근무시간, 연장시간, 휴일근로일수, 인원) 배열로 받아
+정수(원) 고정소수 연산 한 번으로 전 항목을 산출한다.
+
+- 입력 소수값은 INPUT_SCALE(10^4) 배율 정수로 변환 (소수 4자리까지 정확)
+- 1원 미만 버림은 정수 floor 나눗셈으로 처리 → Decimal 경로와 원 단위까지 일치
+- NumPy가 있으면 int64 배열로 한 번에 계산, 없으면 같은 커널을 행 단위로 실행
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional, Sequence
+
+from src.domain.context.calc_context import CalcContext
+from src.domain.calculator.labor import (
+    BONUS_ANNUAL_RATE,
+    HOLIDAY_WORK_PREMIUM,
+    MONTHS_PER_YEAR,
+    STANDARD_MONTHLY_HOURS,
+)
+from src.domain.constants.fixed_point import to_ratio
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore
+    _HAS_NUMPY = False
+
+
+# 근무일수·시간 입력의 고정소수 배율 (소수 4자리)
+INPUT_SCALE = 10_000
+
+DEFAULT_WEEKLY_HOLIDAY_DAYS = Decimal("4.33")
+DEFAULT_ANNUAL_LEAVE_DAYS = Decimal("1.25")
+
+# 보험 요율 키 (LaborCostCalculator 결과 키와 동일)
+INSURANCE_FIELDS = (
+    "industrial_accident",
+    "national_pension",
+    "employment_insurance",
+    "health_insurance",
+    "long_term_care",
+    "wage_bond",
+    "asbestos_relief",
+)
+
+DEFAULT_INSURANCE_RATES = {
+    "industrial_accident": CalcContext.INDUSTRIAL_ACCIDENT_RATE,
+    "national_pension": CalcContext.NATIONAL_PENSION_RATE,
+    "employment_insurance": CalcContext.EMPLOYMENT_INSURANCE_RATE,
+    "health_insurance": CalcContext.HEALTH_INSURANCE_RATE,
+    "long_term_care": CalcContext.LONG_TERM_CARE_RATE,
+    "wage_bond": CalcContext.WAGE_BOND_RATE,
+    "asbestos_relief": CalcContext.ASBESTOS_RELIEF_RATE,
+}
+
+# 일괄 계산 결과 컬럼 (모두 원 단위 정수)
+LABOR_BATCH_FIELDS = (
+    "base_salary",
+    "bonus",
+    "weekly_allowance",
+    "annual_leave_allowance",
+    "overtime_pay",
+    "holiday_work_pay",
+    "allowance",
+    "retirement",
+    "labor_subtotal",
+) + INSURANCE_FIELDS + (
+    "insurance_total",
+    "total_labor_cost",
+)
+
+
+def _scaled(value, scale: int = INPUT_SCALE) -> int:
+    """value × scale을 정수로 변환. 배율로 정확히 표현되지 않으면 ValueError."""
+    num, den = to_ratio(value)
+    scaled, rem = divmod(num * scale, den)
+    if rem:
+        raise ValueError(f"소수 {len(str(scale)) - 1}자리를 넘는 입력은 일괄 계산할 수 없습니다: {value!r}")
+    return scaled
+
+
+def _safe_floordiv(num, den):
+    """den이 0이면 0, 아니면 num // den. int와 NumPy 배열 모두 지원."""
+    return (num // (den + (den == 0))) * (den != 0)
+
+
+@dataclass(frozen=True)
+class _Params:
+    """계산 상수의 정수 비율 표현 (분자, 분모)."""
+    bonus: tuple[int, int]
+    months: tuple[int, int]
+    monthly_hours: tuple[int, int]
+    weekly_holiday: tuple[int, int]
+    annual_leave: tuple[int, int]
+    holiday_premium: tuple[int, int]
+    rates: dict = field(default_factory=dict)
+
+
+def _kernel(md, wd, wh, ot, hd, p: _Params) -> dict:
+    """1인 기준 노무비 전 항목. 입력은 INPUT_SCALE 배율 정수(또는 int64 배열)."""
+    s = INPUT_SCALE
+    bn, bd = p.bonus
+    mn, md_ = p.months
+    hn, hd_ = p.monthly_hours
+    wn, wd_ = p.weekly_holiday
+    an, ad = p.annual_leave
+    pn, pd = p.holiday_premium
+
+    # 기본급 = md_basic × 월 근무일수
+    base = md * wd // (s * s)
+    # 상여금 = 기본급 × 400% ÷ 12
+    bonus = base * bn * md_ // (bd * mn)
+    # 통상시간급 = (md_basic ÷ 일 근무시간) + (상여금 ÷ 209), 각각 즉시 절사
+    hourly = _safe_floordiv(md, wh)
+    bonus_per_hour = bonus * hd_ // hn
+    ordinary_hourly = hourly + bonus_per_hour
+    # 주휴수당 (모든 직급 0 적용)
+    weekly = ordinary_hourly * wh * wn * 0 // (s * wd_)
+    annual = ordinary_hourly * wh * an // (s * ad)
+    overtime = ordinary_hourly * ot // s
+    holiday = ordinary_hourly * wh * hd * pn // (s * s * pd)
+    allowance = weekly + annual + overtime + holiday
+
+    insurance_base = base + allowance + bonus
+    retirement = insurance_base * md_ // mn
+    subtotal = insurance_base + retirement
+
+    out = {
+        "base_salary": base,
+        "bonus": bonus,
+        "weekly_allowance": weekly,
+        "annual_leave_allowance": annual,
+        "overtime_pay": overtime,
+        "holiday_work_pay": holiday,
+        "allowance": allowance,
+        "retirement": retirement,
+        "labor_subtotal": subtotal,
+    }
+    insurance_total = 0
+    for key in INSURANCE_FIELDS:
+        rn, rd = p.rates[key]
+        if key == "long_term_care":
+            # 노인장기요양보험료 = 건강보험료 × 요율
+            amount = out["health_insurance"] * rn // rd
+        else:
+            amount = insurance_base * rn // rd
+        out[key] = amount
+        insurance_total = insurance_total + amount
+    out["insurance_total"] = insurance_total
+    out["total_labor_cost"] = subtotal + insurance_total
+    return out
+
+
+@dataclass
+class LaborBatchResult:
+    """
+    일괄 계산 결과. 컬럼(LABOR_BATCH_FIELDS)별 배열.
+    per_person: 1인 기준, totals: 인원수(정수 절사) 반영 금액.
+    NumPy 사용 시 int64 배열, 아니면 list[int].
+    """
+    per_person: dict
+    totals: dict
+    headcount: Sequence[int]
+
+    def __len__(self) -> int:
+        return len(self.headcount)
+
+    def row(self, index: int, per_person: bool = False) -> dict[str, int]:
+        source = self.per_person if per_person else self.totals
+        return {key: int(source[key][index]) for key in LABOR_BATCH_FIELDS}
+
+    def sum(self, key: str = "total_labor_cost") -> int:
+        values = self.totals[key]
+        if _is_array(values):
+            return int(values.sum())
+        return sum(values)
+
+    def group_totals(self, groups: Sequence[int], key: str = "total_labor_cost") -> dict[int, int]:
+        """groups[i](시나리오 번호 등)별 합계. 여러 시나리오를 한 번에 계산한 뒤 분리할 때 사용."""
+        values = self.totals[key]
+        if _is_array(values):
+            g = np.asarray(groups, dtype=np.int64)
+            uniq, inverse = np.unique(g, return_inverse=True)
+            acc = np.zeros(len(uniq), dtype=np.int64)
+            np.add.at(acc, inverse, values)
+            return {int(k): int(v) for k, v in zip(uniq, acc)}
+        out: dict[int, int] = {}
+        for g, v in zip(groups, values):
+            out[int(g)] = out.get(int(g), 0) + int(v)
+        return out
+
+
+def _is_array(value) -> bool:
+    return _HAS_NUMPY and isinstance(value, np.ndarray)
+
+
+class LaborBatchCalculator:
+    """
+    여러 직무·시나리오의 노무비를 한 번에 계산.
+    결과는 LaborCostCalculator(직무별 CalcContext)와 원 단위까지 동일.
+    """
+
+    def __init__(
+        self,
+        weekly_holiday_days: Decimal = DEFAULT_WEEKLY_HOLIDAY_DAYS,
+        annual_leave_days: Decimal = DEFAULT_ANNUAL_LEAVE_DAYS,
+        insurance_rates: Optional[dict] = None,
+    ):
+        rates = dict(DEFAULT_INSURANCE_RATES)
+        if insurance_rates:
+            for key, value in insurance_rates.items():
+                if key in rates and value is not None:
+                    rates[key] = value
+        self._params = _Params(
+            bonus=to_ratio(BONUS_ANNUAL_RATE),
+            months=to_ratio(MONTHS_PER_YEAR),
+            monthly_hours=to_ratio(STANDARD_MONTHLY_HOURS),
+            weekly_holiday=to_ratio(weekly_holiday_days),
+            annual_leave=to_ratio(annual_leave_days),
+            holiday_premium=to_ratio(HOLIDAY_WORK_PREMIUM),
+            rates={key: to_ratio(value) for key, value in rates.items()},
+        )
+
+    def calculate(
+        self,
+        md_basic: Sequence,
+        work_days: Sequence,
+        work_hours: Sequence,
+        overtime_hours: Sequence,
+        holiday_work_days: Sequence,
+        headcount: Sequence,
+        use_numpy: Optional[bool] = None,
+    ) -> LaborBatchResult:
+        """
+        모든 입력은 길이가 같은 시퀀스(list·tuple·NumPy 배열).
+        use_numpy=None이면 NumPy 설치 시 자동 사용.
+        """
+        columns = (md_basic, work_days, work_hours, overtime_hours, holiday_work_days, headcount)
+        n = len(md_basic)
+        if any(len(col) != n for col in columns):
+            raise ValueError("입력 배열 길이가 서로 다릅니다.")
+        if use_numpy is None:
+            use_numpy = _HAS_NUMPY
+        if use_numpy and not _HAS_NUMPY:
+            raise RuntimeError("NumPy가 설치되어 있지 않습니다.")
+        if use_numpy:
+            return self._calculate_numpy(*columns)
+        return self._calculate_python(*columns)
+
+    def _calculate_python(self, md_basic, work_days, work_hours, overtime_hours, holiday_work_days, headcount):
+        per_person = {key: [] for key in LABOR_BATCH_FIELDS}
+        totals = {key: [] for key in LABOR_BATCH_FIELDS}
+        heads: list[int] = []
+        for md, wd, wh, ot, hd, hc in zip(md_basic, work_days, work_hours, overtime_hours, holiday_work_days, headcount):
+            row = _kernel(_scaled(md), _scaled(wd), _scaled(wh), _scaled(ot), _scaled(hd), self._params)
+            scale = _headcount_scale(hc)
+            heads.append(scale)
+            for key in LABOR_BATCH_FIELDS:
+                per_person[key].append(row[key])
+                totals[key].append(row[key] * scale)
+        return LaborBatchResult(per_person=per_person, totals=totals, headcount=heads)
+
+    def _calculate_numpy(self, md_basic, work_days, work_hours, overtime_hours, holiday_work_days, headcount):
+        md = _to_scaled_array(md_basic)
+        wd = _to_scaled_array(work_days)
+        wh = _to_scaled_array(work_hours)
+        ot = _to_scaled_array(overtime_hours)
+        hd = _to_scaled_array(holiday_work_days)
+        heads = _to_headcount_array(headcount)
+        per_person = _kernel(md, wd, wh, ot, hd, self._params)
+        per_person = {key: np.asarray(per_person[key], dtype=np.int64) for key in LABOR_BATCH_FIELDS}
+        totals = {key: per_person[key] * heads for key in LABOR_BATCH_FIELDS}
+        return LaborBatchResult(per_person=per_person, totals=totals, headcount=heads)
+
+
+def _headcount_scale(value) -> int:
+    """LaborCostCalculator와 동일하게 인원수는 정수로 절사해 배수 적용."""
+    return int(value if isinstance(value, (int, Decimal)) else Decimal(str(value)))
+
+
+def _to_scaled_array(values):
+    """입력 배열 → INPUT_SCALE 배율 int64 배열."""
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind in "iu":
+            return values.astype(np.int64) * INPUT_SCALE
+        if values.dtype.kind == "f":
+            scaled = np.rint(values * INPUT_SCALE)
+            if np.any(np.abs(values * INPUT_SCALE - scaled) > 1e-6):
+                raise ValueError("소수 4자리를 넘는 입력은 일괄 계산할 수 없습니다.")
+            return scaled.astype(np.int64)
+    return np.fromiter((_scaled(v) for v in values), dtype=np.int64, count=len(values))
+
+
+def _to_headcount_array(values):
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind in "iu":
+            return values.astype(np.int64)
+        if values.dtype.kind == "f":
+            return np.trunc(values).astype(np.int64)
+    return np.fromiter((_headcount_scale(v) for v in values), dtype=np.int64, count=len(values))
@@ -0,0 +1,115 @@
+"""
+1인 기준 노무비 결과 캐시 (LRU).
+
+여러 직무코드가 같은 기술등급(= 같은 md_basic)을 쓰는 경우가 많아, 같은 일급·근무조건의
+1인 기준 결과를 재사용하고 인원수 배수만 적용한다.
+
+키: (일급, 근무일수, 근무시간, 연장시간, 휴일근로일수, 주휴일수, 연차일수, 설정 리비전)
+설정(config.json 요율) 저장·재로드 시 리비전이 바뀌면 캐시 전체를 비운다.
+단가 파일 재로드(WageManager.reload) 시에도 clear() 호출.
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple
+
+from src.domain import settings_manager
+
+
+DEFAULT_MAXSIZE = 2048
+
+
+class LaborCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class PerPersonLaborCache:
+    """1인 기준 계산 결과 LRU 캐시. 저장된 결과는 읽기 전용으로 취급한다."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revision = settings_manager.get_revision()
+
+    def make_key(
+        self,
+        wage_day,
+        work_days,
+        work_hours,
+        overtime_hours,
+        holiday_work_days,
+        weekly_holiday_days,
+        annual_leave_days,
+    ) -> tuple:
+        return (
+            wage_day,
+            work_days,
+            work_hours,
+            overtime_hours,
+            holiday_work_days,
+            weekly_holiday_days,
+            annual_leave_days,
+            settings_manager.get_revision(),
+        )
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], object]):
+        """key에 해당하는 결과 반환. 없으면 compute()로 계산해 저장."""
+        with self._lock:
+            self._check_revision()
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return value
+            self._misses += 1
+        value = compute()
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """캐시 비우기 (통계는 유지)."""
+        with self._lock:
+            self._data.clear()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> LaborCacheStats:
+        with self._lock:
+            return LaborCacheStats(self._hits, self._misses, len(self._data), self._maxsize)
+
+    def _check_revision(self) -> None:
+        revision = settings_manager.get_revision()
+        if revision != self._revision:
+            self._data.clear()
+            self._revision = revision
+
+
+# 프로세스 공용 캐시 (UI 갱신 간에도 유지)
+per_person_cache = PerPersonLaborCache()
+
+
+def clear_labor_cache() -> None:
+    per_person_cache.clear()
+
+
+def get_labor_cache_stats() -> LaborCacheStats:
+    return per_person_cache.stats()
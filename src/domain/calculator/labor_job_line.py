@@ -1,19 +1,29 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class LaborJobLine:
     job_code: str
     headcount: int
     job_name: str
     work_days: float
-    base_wage: int
-    allowance: int
-    overtime: int
-    total: int
     base_salary: int
     bonus: int
-    allowances: int
+    allowance: int
+    overtime: int
     retirement: int
     labor_subtotal: int
-    role_total: int
+    total: int
+
+    # 같은 값을 다른 이름으로 쓰는 기존 소비자용 별칭
+    @property
+    def base_wage(self) -> int:
+        return self.base_salary
+
+    @property
+    def allowances(self) -> int:
+        return self.allowance
+
+    @property
+    def role_total(self) -> int:
+        return self.labor_subtotal
@@ -0,0 +1,223 @@
+"""
+노무비 계산 결과 (고정 길이 정수 벡터).
+
+기존 결과 dict(약 20개 키 + allowances/insurance 중첩 dict)를 정수 리스트 하나로 보관하고,
+인원수 배수(scale)·합산(add)을 벡터 단위로 처리한다.
+기존 UI·JSON 소비자를 위해 읽기 전용 Mapping 인터페이스를 유지한다.
+  - result["base_salary"], result.get("insurance_total") 등 평면 키는 그대로
+  - result["allowances"], result["insurance"]는 접근 시점에 만드는 dict 뷰
+  - result["job_lines"]는 job_lines가 지정된 경우에만 존재
+"""
+from collections.abc import Mapping
+from typing import Iterator
+
+# 벡터 필드 순서 (인덱스 고정)
+LABOR_RESULT_FIELDS = (
+    "base_salary",
+    "weekly_allowance",
+    "annual_leave_allowance",
+    "overtime_allowance",
+    "holiday_work_allowance",
+    "allowance",
+    "bonus",
+    "retirement",
+    "labor_subtotal",
+    "industrial_accident",
+    "national_pension",
+    "employment_insurance",
+    "health_insurance",
+    "long_term_care",
+    "wage_bond",
+    "asbestos_relief",
+    "insurance_total",
+    "total_labor_cost",
+)
+_FIELD_INDEX = {name: i for i, name in enumerate(LABOR_RESULT_FIELDS)}
+_FIELD_COUNT = len(LABOR_RESULT_FIELDS)
+
+# 기존 결과 dict의 평면 키 → 필드 (bonus_monthly, retirement_reserve는 별칭)
+_FLAT_KEYS = {
+    "base_salary": "base_salary",
+    "weekly_allowance": "weekly_allowance",
+    "annual_leave_allowance": "annual_leave_allowance",
+    "allowance": "allowance",
+    "bonus": "bonus",
+    "retirement": "retirement",
+    "labor_subtotal": "labor_subtotal",
+    "industrial_accident": "industrial_accident",
+    "national_pension": "national_pension",
+    "employment_insurance": "employment_insurance",
+    "health_insurance": "health_insurance",
+    "long_term_care": "long_term_care",
+    "wage_bond": "wage_bond",
+    "asbestos_relief": "asbestos_relief",
+    "insurance_total": "insurance_total",
+    "total_labor_cost": "total_labor_cost",
+    "bonus_monthly": "bonus",
+    "retirement_reserve": "retirement",
+}
+_FLAT_INDEX = {key: _FIELD_INDEX[field] for key, field in _FLAT_KEYS.items()}
+
+# 중첩 dict 뷰: 뷰 키 → 필드
+ALLOWANCE_VIEW_KEYS = {
+    "annual_leave_pay": "annual_leave_allowance",
+    "overtime_pay": "overtime_allowance",
+    "holiday_work_pay": "holiday_work_allowance",
+    "total": "allowance",
+}
+INSURANCE_VIEW_KEYS = {
+    "industrial_accident": "industrial_accident",
+    "national_pension": "national_pension",
+    "employment": "employment_insurance",
+    "health": "health_insurance",
+    "long_term_care": "long_term_care",
+    "wage_bond": "wage_bond",
+    "asbestos": "asbestos_relief",
+    "total": "insurance_total",
+}
+_ALLOWANCE_VIEW = tuple((key, _FIELD_INDEX[field]) for key, field in ALLOWANCE_VIEW_KEYS.items())
+_INSURANCE_VIEW = tuple((key, _FIELD_INDEX[field]) for key, field in INSURANCE_VIEW_KEYS.items())
+_VIEWS = {"allowances": _ALLOWANCE_VIEW, "insurance": _INSURANCE_VIEW}
+
+# 기존 dict와 같은 키 순서
+_KEY_ORDER = (
+    "base_salary",
+    "weekly_allowance",
+    "annual_leave_allowance",
+    "allowance",
+    "bonus",
+    "retirement",
+    "labor_subtotal",
+    "industrial_accident",
+    "national_pension",
+    "employment_insurance",
+    "health_insurance",
+    "long_term_care",
+    "wage_bond",
+    "asbestos_relief",
+    "insurance_total",
+    "total_labor_cost",
+    "allowances",
+    "bonus_monthly",
+    "retirement_reserve",
+    "insurance",
+)
+
+
+class LaborResult(Mapping):
+    """
+    노무비 결과 벡터. values는 LABOR_RESULT_FIELDS 순서의 정수 리스트이며 그대로 소유한다.
+    캐시에 저장된 1인 결과는 공유되므로 add() 같은 제자리 연산 전에는 copy()로 복사한다.
+    """
+
+    __slots__ = ("_v", "job_lines", "_views")
+
+    def __init__(self, values: list | None = None, job_lines: list | None = None):
+        if values is None:
+            values = [0] * _FIELD_COUNT
+        elif len(values) != _FIELD_COUNT:
+            raise ValueError(f"LaborResult는 {_FIELD_COUNT}개 값이 필요합니다: {len(values)}")
+        self._v = values
+        self.job_lines = job_lines
+        self._views = None
+
+    # ---- 벡터 연산 ----
+
+    def copy(self) -> "LaborResult":
+        job_lines = list(self.job_lines) if self.job_lines is not None else None
+        return LaborResult(self._v[:], job_lines)
+
+    def scaled(self, factor: int) -> "LaborResult":
+        """factor배 결과 (새 객체, job_lines 없음)."""
+        return LaborResult([x * factor for x in self._v])
+
+    def add(self, other: "LaborResult", scale: int = 1) -> "LaborResult":
+        """self += other × scale (제자리). self 반환."""
+        if scale == 1:
+            self._v = [a + b for a, b in zip(self._v, other._v)]
+        else:
+            self._v = [a + b * scale for a, b in zip(self._v, other._v)]
+        self._views = None
+        return self
+
+    def __add__(self, other):
+        if not isinstance(other, LaborResult):
+            return NotImplemented
+        return LaborResult([a + b for a, b in zip(self._v, other._v)])
+
+    def __mul__(self, factor):
+        if not isinstance(factor, int):
+            return NotImplemented
+        return self.scaled(factor)
+
+    __rmul__ = __mul__
+
+    # ---- Mapping (기존 dict 소비자 호환) ----
+
+    def __getitem__(self, key):
+        index = _FLAT_INDEX.get(key)
+        if index is not None:
+            return self._v[index]
+        view = _VIEWS.get(key)
+        if view is not None:
+            return self._view(key, view)
+        if key == "job_lines" and self.job_lines is not None:
+            return self.job_lines
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _KEY_ORDER
+        if self.job_lines is not None:
+            yield "job_lines"
+
+    def __len__(self) -> int:
+        return len(_KEY_ORDER) + (self.job_lines is not None)
+
+    def __contains__(self, key) -> bool:
+        if key in _FLAT_INDEX or key in _VIEWS:
+            return True
+        return key == "job_lines" and self.job_lines is not None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value}" for name, value in zip(LABOR_RESULT_FIELDS, self._v))
+        return f"LaborResult({fields})"
+
+    def _view(self, key: str, view: tuple) -> dict:
+        # 뷰 dict는 결과 객체당 한 번만 만든다 (벡터가 바뀌면 다시 생성)
+        views = self._views
+        if views is None:
+            views = self._views = {}
+        cached = views.get(key)
+        if cached is None:
+            values = self._v
+            cached = views[key] = {name: values[index] for name, index in view}
+        return cached
+
+    def allowances_dict(self) -> dict:
+        return {name: self._v[index] for name, index in _ALLOWANCE_VIEW}
+
+    def insurance_dict(self) -> dict:
+        return {name: self._v[index] for name, index in _INSURANCE_VIEW}
+
+    def to_dict(self) -> dict:
+        """기존 형식의 평범한 dict (JSON 직렬화용). job_lines는 포함하지 않는다."""
+        values = self._v
+        result = {}
+        for key in _KEY_ORDER:
+            index = _FLAT_INDEX.get(key)
+            if index is not None:
+                result[key] = values[index]
+            elif key == "allowances":
+                result[key] = self.allowances_dict()
+            else:
+                result[key] = self.insurance_dict()
+        return result
+
+
+def _field_property(index: int):
+    return property(lambda self: self._v[index])
+
+
+for _index, _name in enumerate(LABOR_RESULT_FIELDS):
+    setattr(LaborResult, _name, _field_property(_index))
+del _index, _name
@@ -1,20 +1,20 @@
+import heapq
+from dataclasses import dataclass
+
+# 집계 항목 키 → 표시명 (비교 벡터 앞부분 고정 순서)
+TOTAL_LABELS = {
+    "labor_total": "노무비 합계",
+    "fixed_expense_total": "고정경비 합계",
+    "variable_expense_total": "변동경비 합계",
+    "passthrough_expense_total": "대행비 합계",
+    "overhead_cost": "일반관리비",
+    "profit": "이윤",
+}
+
+
 def build_breakdown(agg, labor_rows: list[dict]) -> tuple[dict, dict]:
-    values = {
-        "labor_total": agg.labor_total,
-        "fixed_expense_total": agg.fixed_expense_total,
-        "variable_expense_total": agg.variable_expense_total,
-        "passthrough_expense_total": agg.passthrough_expense_total,
-        "overhead_cost": agg.overhead_cost,
-        "profit": agg.profit,
-    }
-    labels = {
-        "labor_total": "노무비 합계",
-        "fixed_expense_total": "고정경비 합계",
-        "variable_expense_total": "변동경비 합계",
-        "passthrough_expense_total": "대행비 합계",
-        "overhead_cost": "일반관리비",
-        "profit": "이윤",
-    }
+    values = {key: getattr(agg, key) for key in TOTAL_LABELS}
+    labels = dict(TOTAL_LABELS)
 
     for line in labor_rows:
         job_code = line.get("job_code", "")
@@ -29,21 +29,84 @@ def build_breakdown(agg, labor_rows: list[dict]) -> tuple[dict, dict]:
 
 
 def get_top_drivers(values_a: dict, values_b: dict, labels: dict, n: int = 3) -> list[dict]:
-    keys = set(values_a.keys()) | set(values_b.keys())
+    """A→B 절대증감 상위 n개 (증감 0 제외). 키 합집합을 한 번 훑는 힙 top-k."""
     rows = []
-    for key in keys:
+    for key in dict.fromkeys([*values_a, *values_b]):
         a_val = values_a.get(key, 0)
         b_val = values_b.get(key, 0)
         delta = b_val - a_val
-        rows.append(
-            {
-                "key": key,
-                "label": labels.get(key, key),
-                "a": a_val,
-                "b": b_val,
-                "delta": delta,
-                "abs_delta": abs(delta),
-            }
+        if delta:
+            rows.append(
+                {
+                    "key": key,
+                    "label": labels.get(key, key),
+                    "a": a_val,
+                    "b": b_val,
+                    "delta": delta,
+                    "abs_delta": abs(delta),
+                }
+            )
+    return heapq.nlargest(n, rows, key=lambda x: x["abs_delta"])
+
+
+@dataclass(frozen=True)
+class BreakdownMatrix:
+    """
+    N개 시나리오의 비교 벡터. keys 순서로 정렬된 값 벡터를 시나리오마다 하나씩 가진다.
+    한 시나리오에만 있는 키(직종)는 나머지 시나리오에서 0.
+    """
+    scenario_ids: tuple[str, ...]
+    keys: tuple[str, ...]
+    labels: dict
+    vectors: tuple[tuple, ...]
+
+    def column(self, key: str) -> tuple:
+        """키 1개의 시나리오별 값."""
+        i = self.keys.index(key)
+        return tuple(vector[i] for vector in self.vectors)
+
+    def values_of(self, scenario_id: str) -> dict:
+        return dict(zip(self.keys, self.vectors[self.scenario_ids.index(scenario_id)]))
+
+    def deltas(self, base: int = 0) -> tuple[tuple, ...]:
+        """기준 시나리오(base) 대비 증감 벡터."""
+        base_vector = self.vectors[base]
+        return tuple(
+            tuple(v - b for v, b in zip(vector, base_vector))
+            for vector in self.vectors
         )
-    rows.sort(key=lambda x: x["abs_delta"], reverse=True)
-    return [r for r in rows if r["abs_delta"] > 0][:n]
+
+
+def build_breakdown_matrix(results: dict[str, tuple]) -> BreakdownMatrix:
+    """{scenario_id: (aggregator, labor_rows)} → 키 합집합 기준으로 정렬된 BreakdownMatrix."""
+    breakdowns = []
+    labels: dict = {}
+    for agg, labor_rows in results.values():
+        values, row_labels = build_breakdown(agg, labor_rows)
+        breakdowns.append(values)
+        labels.update(row_labels)
+    keys = tuple(dict.fromkeys(key for values in breakdowns for key in values))
+    return BreakdownMatrix(
+        scenario_ids=tuple(results),
+        keys=keys,
+        labels=labels,
+        vectors=tuple(tuple(values.get(key, 0) for key in keys) for values in breakdowns),
+    )
+
+
+def get_top_drivers_many(matrix: BreakdownMatrix, n: int = 3) -> list[dict]:
+    """시나리오 간 편차(최대−최소)가 큰 항목 상위 n개 (편차 0 제외)."""
+    rows = []
+    for i, key in enumerate(matrix.keys):
+        values = [vector[i] for vector in matrix.vectors]
+        spread = max(values) - min(values)
+        if spread:
+            rows.append(
+                {
+                    "key": key,
+                    "label": matrix.labels.get(key, key),
+                    "values": dict(zip(matrix.scenario_ids, values)),
+                    "spread": spread,
+                }
+            )
+    return heapq.nlargest(n, rows, key=lambda x: x["spread"])
@@ -0,0 +1,128 @@
+"""
+정수 고정소수 반올림 커널.
+
+금액·요율을 (분자, 분모) 정수 쌍으로 표현하고(예: 0.03545 → 3545/100000)
+버림·올림·반올림 나눗셈을 정수 연산만으로 수행한다.
+
+기존 Decimal(str(x)) 경로와 결과가 동일하다.
+  - int:     그대로 (x, 1)
+  - Decimal: 정확한 분수 (Decimal.as_integer_ratio)
+  - float:   repr 십진 표현 기준 (Decimal(str(x))와 같은 값)
+"""
+from decimal import Decimal
+from typing import NamedTuple, Union
+
+Number = Union[int, float, Decimal]
+
+# 이 범위의 정수값 float는 repr과 이진값이 같다
+_FLOAT_EXACT_INT_LIMIT = 2 ** 53
+
+
+def to_ratio(value: Number) -> tuple[int, int]:
+    """숫자 → (분자, 분모) 정수 쌍. 분모는 항상 양수."""
+    if type(value) is int:
+        return value, 1
+    if isinstance(value, float):
+        if value.is_integer() and -_FLOAT_EXACT_INT_LIMIT < value < _FLOAT_EXACT_INT_LIMIT:
+            return int(value), 1
+        return _parse_decimal_text(float.__repr__(value))
+    if isinstance(value, Decimal):
+        return _decimal_ratio(value)
+    if isinstance(value, int):
+        return int(value), 1
+    return _decimal_ratio(Decimal(str(value)))
+
+
+def _decimal_ratio(value: Decimal) -> tuple[int, int]:
+    try:
+        return value.as_integer_ratio()
+    except (ValueError, OverflowError):
+        raise ValueError(f"유한한 숫자가 아닙니다: {value!r}") from None
+
+
+def _parse_decimal_text(text: str) -> tuple[int, int]:
+    """'20.6', '-1.5e-05' 같은 십진 문자열 → (분자, 10^k)."""
+    mantissa, _, exp_text = text.partition("e")
+    int_part, _, frac_part = mantissa.partition(".")
+    try:
+        num = int(int_part + frac_part)
+    except ValueError:
+        raise ValueError(f"유한한 숫자가 아닙니다: {text}") from None
+    scale = len(frac_part) - (int(exp_text) if exp_text else 0)
+    if scale <= 0:
+        return num * 10 ** (-scale), 1
+    return num, 10 ** scale
+
+
+# ---- 정수 나눗셈 커널 (den > 0) ----
+
+def floor_div(num: int, den: int) -> int:
+    """ROUND_FLOOR: 음의 무한대 방향 내림."""
+    return num // den
+
+
+def ceil_div(num: int, den: int) -> int:
+    """ROUND_CEILING: 양의 무한대 방향 올림."""
+    return -((-num) // den)
+
+
+def trunc_div(num: int, den: int) -> int:
+    """ROUND_DOWN: 0 방향 절사 (Excel TRUNC)."""
+    q = abs(num) // den
+    return q if num >= 0 else -q
+
+
+def half_up_div(num: int, den: int) -> int:
+    """ROUND_HALF_UP: 0.5는 0에서 먼 쪽으로 (Excel ROUND)."""
+    q = (2 * abs(num) + den) // (2 * den)
+    return q if num >= 0 else -q
+
+
+def ratio_product(*factors: Number, divisor: Number = 1) -> tuple[int, int]:
+    """factors의 곱 ÷ divisor를 약분 없이 (분자, 양수 분모)로 반환."""
+    num, den = 1, 1
+    for factor in factors:
+        n, d = to_ratio(factor)
+        num *= n
+        den *= d
+    if divisor != 1:
+        n, d = to_ratio(divisor)
+        if n == 0:
+            raise ZeroDivisionError("divisor must not be zero")
+        num *= d
+        den *= n
+        if den < 0:
+            num, den = -num, -den
+    return num, den
+
+
+def mul_floor(*factors: Number, divisor: Number = 1) -> int:
+    """floor(factors의 곱 ÷ divisor). 1원 미만 버림 계산용."""
+    num, den = ratio_product(*factors, divisor=divisor)
+    return num // den
+
+
+def mul_half_up(*factors: Number, divisor: Number = 1) -> int:
+    """ROUND(factors의 곱 ÷ divisor, 0)."""
+    num, den = ratio_product(*factors, divisor=divisor)
+    return half_up_div(num, den)
+
+
+def mul_trunc(*factors: Number, divisor: Number = 1) -> int:
+    """TRUNC(factors의 곱 ÷ divisor, 0)."""
+    num, den = ratio_product(*factors, divisor=divisor)
+    return trunc_div(num, den)
+
+
+class FixedRate(NamedTuple):
+    """요율의 정수 비율 표현. FixedRate.of(Decimal("0.03545")) → 709/20000 (= 3545/100000)."""
+    num: int
+    den: int
+
+    @classmethod
+    def of(cls, *factors: Number, divisor: Number = 1) -> "FixedRate":
+        return cls(*ratio_product(*factors, divisor=divisor))
+
+    def floor(self, amount: int) -> int:
+        """floor(amount × 요율). amount는 정수(원)."""
+        return amount * self.num // self.den
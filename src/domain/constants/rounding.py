@@ -1,19 +1,28 @@
-from decimal import Decimal, ROUND_HALF_UP, ROUND_FLOOR, ROUND_CEILING
+from decimal import Decimal
 from typing import Union
 
+from src.domain.constants.fixed_point import (
+    to_ratio,
+    ceil_div,
+    half_up_div,
+    trunc_div,
+)
+
 Number = Union[int, float, Decimal]
 
 
 def drop_under_1_won(amount: Number) -> int:
     """1원 미만 버림 (정수 원 단위로 내림)."""
-    return int(Decimal(str(amount)).to_integral_value(rounding=ROUND_FLOOR))
+    if type(amount) is int:
+        return amount
+    num, den = to_ratio(amount)
+    return num // den
 
 
 def drop_under_1000_won(amount: Number) -> int:
     """1,000원 미만 버림 (천원 단위로 내림)."""
-    amount_decimal = Decimal(str(amount))
-    thousands = (amount_decimal // Decimal("1000")) * Decimal("1000")
-    return int(thousands)
+    num, den = to_ratio(amount)
+    return trunc_div(num, den * 1000) * 1000
 
 
 def round_half_up(amount: Number, unit: int = 1) -> int:
@@ -21,11 +30,10 @@ def round_half_up(amount: Number, unit: int = 1) -> int:
     if unit <= 0:
         raise ValueError("unit must be a positive integer.")
 
-    amount_decimal = Decimal(str(amount))
-    unit_decimal = Decimal(str(unit))
-    divided = amount_decimal / unit_decimal
-    rounded = divided.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
-    return int(rounded * unit_decimal)
+    num, den = to_ratio(amount)
+    unit_num, unit_den = to_ratio(unit)
+    rounded = half_up_div(num * unit_den, den * unit_num)
+    return trunc_div(rounded * unit_num, unit_den)
 
 
 def round_up(amount: Number, unit: int = 1) -> int:
@@ -33,8 +41,7 @@ def round_up(amount: Number, unit: int = 1) -> int:
     if unit <= 0:
         raise ValueError("unit must be a positive integer.")
 
-    amount_decimal = Decimal(str(amount))
-    unit_decimal = Decimal(str(unit))
-    divided = amount_decimal / unit_decimal
-    rounded = divided.quantize(Decimal("1"), rounding=ROUND_CEILING)
-    return int(rounded * unit_decimal)
+    num, den = to_ratio(amount)
+    unit_num, unit_den = to_ratio(unit)
+    rounded = ceil_div(num * unit_den, den * unit_num)
+    return trunc_div(rounded * unit_num, unit_den)
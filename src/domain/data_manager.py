@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Optional
 
 from src.utils.path_helper import get_data_dir
+from src.domain.wage_store import normalize_job_mapping, normalize_wages_master
 
 
 def _load_json(path: Path) -> dict:
@@ -25,77 +26,29 @@ def _load_json(path: Path) -> dict:
 class DataManager:
     """
     data/wages_master.json: { "2023": {"고급기술자": 293753, ...}, "2024": {...}, ... }
+      (등급값이 {"govt_daily": N, "md_basic": M}이면 md_basic 우선)
     data/job_mapping.json: { "M101": {"title": "...", "grade": "고급기술자", ...}, ... }
     """
 
     def __init__(self, data_dir: Optional[Path] = None):
         self._data_dir = data_dir or get_data_dir()
-        self._job_mapping: dict = {}
-        self._wages_master: dict = {}
+        self._job_mapping: dict[str, str] = {}
+        self._wages_master: dict[int, dict[str, int]] = {}
         self._load()
 
     def _load(self) -> None:
-        self._load_job_mapping()
-        self._load_wages_master()
-
-    def _load_job_mapping(self) -> None:
-        path = self._data_dir / "job_mapping.json"
-        raw = _load_json(path)
-        if isinstance(raw, dict):
-            self._job_mapping = {str(k).strip(): v for k, v in raw.items() if k}
-        else:
-            self._job_mapping = {}
-
-    def _normalize_wage_map(self, d: dict) -> dict[str, int]:
-        """등급명 → 일급(원) 맵으로 정규화."""
-        if not isinstance(d, dict):
-            return {}
-        return {
-            str(k).strip(): int(v) if isinstance(v, (int, float)) else 0
-            for k, v in d.items()
+        # 형식 판별(data 래퍼, 단일 연도, 등급값 int/dict)은 wage_store 공용 정규화 사용
+        self._job_mapping = {
+            code: job.grade
+            for code, job in normalize_job_mapping(_load_json(self._data_dir / "job_mapping.json")).items()
+        }
+        self._wages_master = {
+            year: {grade: entry.rate for grade, entry in grades.items()}
+            for year, grades in normalize_wages_master(_load_json(self._data_dir / "wages_master.json")).items()
         }
-
-    def _load_wages_master(self) -> None:
-        path = self._data_dir / "wages_master.json"
-        raw = _load_json(path)
-        if not isinstance(raw, dict):
-            self._wages_master = {}
-            return
-        self._wages_master = {}
-
-        # 단일 연도 형식: { "year": 2024, "data": { "고급기술자": 293753, ... } }
-        if "year" in raw and "data" in raw and isinstance(raw.get("data"), dict):
-            year = raw.get("year")
-            try:
-                y = int(year)
-                self._wages_master[y] = self._normalize_wage_map(raw["data"])
-            except (TypeError, ValueError):
-                pass
-            return
-
-        # 연도별 형식: { "2023": {...}, "2024": {...} } 또는 "2024": { "year": 2024, "data": {...} }
-        for year_str, grades_dict in raw.items():
-            if not isinstance(grades_dict, dict):
-                continue
-            try:
-                year = int(year_str)
-            except (TypeError, ValueError):
-                continue
-            # 래핑 형식: { "year": 2024, "data": { ... } }
-            if "data" in grades_dict and isinstance(grades_dict.get("data"), dict):
-                self._wages_master[year] = self._normalize_wage_map(grades_dict["data"])
-            else:
-                self._wages_master[year] = self._normalize_wage_map(grades_dict)
 
     def _grade_for_job(self, job_code: str) -> Optional[str]:
-        entry = self._job_mapping.get(str(job_code).strip())
-        if entry is None:
-            return None
-        if isinstance(entry, dict):
-            return (entry.get("grade") or "").strip() or None
-        if isinstance(entry, str):
-            return entry.strip() or None
-        return None
+        return self._job_mapping.get(str(job_code).strip())
 
     def get_wage(self, job_code: str, year: int) -> Optional[int]:
         """
@@ -1,8 +1,12 @@
+import atexit
 import logging
 import os
 import shutil
 import sqlite3
 import sys
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -76,9 +80,187 @@ def get_db_path() -> Path:
     return db_path
 
 
-def get_connection() -> sqlite3.Connection:
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path, timeout=30)
+class PooledConnection(sqlite3.Connection):
+    """
+    스레드별 공용 연결. get_connection()은 이 연결을 감싼 대여 구간(ConnectionScope)을 돌려준다.
+    열린 대여 구간 수만 센다. 마지막 구간이 반납되면 커밋되지 않은 변경을 롤백
+    (기존 '닫으면 미커밋 폐기'와 동일)하고 row_factory를 초기화해 다음 대여자에게 영향을 주지 않는다.
+    실제 종료는 close_all_connections().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._open_scopes = 0
+        self._savepoint_seq = 0
+        self._pool_closed = False
+
+    @property
+    def is_pool_closed(self) -> bool:
+        return self._pool_closed
+
+    def _checkout(self) -> "ConnectionScope":
+        nested = self._open_scopes > 0
+        self._open_scopes += 1
+        return ConnectionScope(self, nested)
+
+    def _next_savepoint(self) -> str:
+        self._savepoint_seq += 1
+        return f"checkout_{self._savepoint_seq}"
+
+    def _return_scope(self) -> None:
+        self._open_scopes = max(self._open_scopes - 1, 0)
+        if self._open_scopes == 0 and not self._pool_closed:
+            if self.in_transaction:
+                super().rollback()
+            self.row_factory = None
+
+    def close(self) -> None:
+        # 대여 구간 없이 직접 연 연결(읽기 전용 등): 미커밋 변경만 정리, 실제 종료는 close_physical()
+        if self._open_scopes == 0 and not self._pool_closed:
+            if self.in_transaction:
+                super().rollback()
+            self.row_factory = None
+
+    def close_physical(self) -> None:
+        if not self._pool_closed:
+            self._pool_closed = True
+            self._open_scopes = 0
+            super().close()
+
+
+_WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+class ConnectionScope:
+    """
+    get_connection() 대여 1건. 나머지 속성·메서드는 공용 연결에 위임하고
+    commit()/rollback()/close()는 이 대여 구간에만 적용된다.
+    - 바깥 대여 (스레드에서 열린 대여가 없을 때): 연결 트랜잭션을 그대로 커밋·롤백
+    - 안쪽 대여 (다른 대여가 열려 있을 때): 트랜잭션 중이거나 쓰기를 시작할 때 자체 SAVEPOINT를 연다.
+      commit()은 그 SAVEPOINT만 확정(RELEASE), rollback()·close()는 그 SAVEPOINT까지만 되돌려
+      바깥 구간의 변경은 건드리지 않는다. 바깥 트랜잭션이 없을 때 연 SAVEPOINT는 확정 시 바로 커밋된다.
+    구간은 안쪽부터 닫는다 (안쪽 구간이 열린 동안 바깥 구간에서 쓴 변경은 안쪽 SAVEPOINT에 포함된다).
+    """
+
+    __slots__ = ("_conn", "_nested", "_savepoint", "_closed")
+
+    def __init__(self, conn: PooledConnection, nested: bool):
+        object.__setattr__(self, "_conn", conn)
+        object.__setattr__(self, "_nested", nested)
+        object.__setattr__(self, "_savepoint", None)
+        object.__setattr__(self, "_closed", False)
+
+    @property
+    def connection(self) -> PooledConnection:
+        """대여한 공용 연결 (연결 단위 캐시 키 등)."""
+        return self._conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name, value) -> None:
+        setattr(self._conn, name, value)
+
+    def __enter__(self) -> "ConnectionScope":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a returned connection.")
+
+    def _enter_scope(self, sql: str | None = None) -> None:
+        """안쪽 대여: 바깥 트랜잭션 중이거나 쓰기 문이면 실행 전에 이 구간의 SAVEPOINT를 연다."""
+        self._check_open()
+        if not self._nested or self._savepoint is not None:
+            return
+        if sql is None or self._conn.in_transaction or sql.lstrip()[:7].upper().startswith(_WRITE_PREFIXES):
+            name = self._conn._next_savepoint()
+            self._conn.execute(f"SAVEPOINT {name}")
+            object.__setattr__(self, "_savepoint", name)
+
+    def execute(self, sql: str, parameters=()):
+        self._enter_scope(sql)
+        return self._conn.execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters):
+        self._enter_scope(sql)
+        return self._conn.executemany(sql, seq_of_parameters)
+
+    def executescript(self, script: str):
+        self._check_open()
+        return self._conn.executescript(script)
+
+    def cursor(self, *args, **kwargs):
+        # 커서로 실행할 문은 알 수 없으므로 안쪽 대여는 미리 SAVEPOINT를 연다
+        self._enter_scope()
+        return self._conn.cursor(*args, **kwargs)
+
+    def _end_savepoint(self, *statements: str) -> None:
+        try:
+            for statement in statements:
+                self._conn.execute(f"{statement} {self._savepoint}")
+        except sqlite3.OperationalError:
+            # 바깥 구간이 트랜잭션 전체를 이미 끝낸 경우 (SAVEPOINT 없음)
+            object.__setattr__(self, "_savepoint", None)
+
+    def commit(self) -> None:
+        self._check_open()
+        if not self._nested:
+            self._conn.commit()
+        elif self._savepoint is not None:
+            self._end_savepoint("RELEASE")
+            object.__setattr__(self, "_savepoint", None)
+
+    def rollback(self) -> None:
+        self._check_open()
+        if not self._nested:
+            self._conn.rollback()
+        elif self._savepoint is not None:
+            self._end_savepoint("ROLLBACK TO")
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        if self._savepoint is not None and not self._conn.is_pool_closed:
+            self._end_savepoint("ROLLBACK TO", "RELEASE")
+        object.__setattr__(self, "_savepoint", None)
+        object.__setattr__(self, "_closed", True)
+        self._conn._return_scope()
+
+
+# 환경변수(COSTCALC_DB_PATH)별 검증 완료 경로 — 쓰기 검사는 프로세스당 1회
+_resolved_db_paths: dict = {}
+_pool_local = threading.local()
+_pool_lock = threading.Lock()
+_all_connections: "weakref.WeakSet[PooledConnection]" = weakref.WeakSet()
+
+
+def _resolved_db_path() -> Path:
+    key = os.environ.get("COSTCALC_DB_PATH")
+    path = _resolved_db_paths.get(key)
+    if path is None:
+        path = _resolved_db_paths[key] = get_db_path()
+    return path
+
+
+def connection_db_file(conn: sqlite3.Connection) -> str | None:
+    """연결의 main DB 파일 경로. 메모리·임시 DB는 연결 간에 공유되지 않으므로 None."""
+    for _, name, path in conn.execute("PRAGMA database_list").fetchall():
+        if name == "main":
+            return path or None
+    return None
+
+
+def _open_connection(db_path: Path) -> PooledConnection:
+    # 스레드 단위로만 대여하지만, 종료 시 다른 스레드에서 닫을 수 있도록 check_same_thread=False
+    conn = sqlite3.connect(db_path, timeout=30, factory=PooledConnection, check_same_thread=False)
     conn.execute("PRAGMA foreign_keys=ON;")
     conn.execute("PRAGMA busy_timeout=5000;")
     conn.execute("PRAGMA synchronous=NORMAL;")
@@ -86,10 +268,77 @@ def get_connection() -> sqlite3.Connection:
         conn.execute("PRAGMA journal_mode=WAL;")
     except sqlite3.OperationalError:
         conn.execute("PRAGMA journal_mode=DELETE;")
+    with _pool_lock:
+        _all_connections.add(conn)
     return conn
 
 
-def get_conn() -> sqlite3.Connection:
+def get_connection() -> ConnectionScope:
+    """
+    현재 스레드의 공용 연결을 대여 (ConnectionScope). 경로 검증·연결·PRAGMA는 스레드(와 DB 경로)당 처음 한 번만 수행.
+    기존처럼 사용 후 close()를 호출하면 반납된다. 예외 시에도 반납되도록 try/finally
+    또는 checkout_connection()으로 감싼다 (반납하지 않은 대여는 마지막 반납 시의 롤백을 막는다).
+    """
+    db_path = _resolved_db_path()
+    pool = getattr(_pool_local, "connections", None)
+    if pool is None:
+        pool = _pool_local.connections = {}
+    conn = pool.get(db_path)
+    if conn is None or conn.is_pool_closed:
+        conn = pool[db_path] = _open_connection(db_path)
+    return conn._checkout()
+
+
+def open_readonly_connection(db_path: Path | str | None = None) -> PooledConnection:
+    """
+    읽기 전용 연결 (mode=ro, query_only). 공용 풀과 별개로 호출자가 소유한다 (작업 프로세스 등).
+    WAL 모드 DB면 다른 연결의 쓰기와 동시에 읽을 수 있다. 종료는 close_all_connections()/close_physical().
+    """
+    path = Path(db_path) if db_path else _resolved_db_path()
+    conn = sqlite3.connect(
+        f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=30,
+        factory=PooledConnection, check_same_thread=False,
+    )
+    conn.execute("PRAGMA busy_timeout=5000;")
+    conn.execute("PRAGMA query_only=ON;")
+    with _pool_lock:
+        _all_connections.add(conn)
+    return conn
+
+
+@contextmanager
+def checkout_connection():
+    """
+    with checkout_connection() as conn: ...
+    정상 종료 시 커밋, 예외 시 롤백 후 반납.
+    """
+    conn = get_connection()
+    try:
+        yield conn
+        if conn.in_transaction:
+            conn.commit()
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def close_all_connections() -> None:
+    """모든 스레드의 공용 연결을 실제로 닫고 경로 캐시를 비운다 (종료·DB 파일 교체 시)."""
+    with _pool_lock:
+        connections = list(_all_connections)
+        _all_connections.clear()
+        _resolved_db_paths.clear()
+    for conn in connections:
+        try:
+            conn.close_physical()
+        except sqlite3.Error as exc:
+            logging.warning("DB connection close failed: %s", exc)
+
+
+def get_conn() -> ConnectionScope:
     return get_connection()
 
 
@@ -139,6 +388,8 @@ def handle_disk_io_error(db_path: Path) -> None:
         integrity = "error"
 
     if integrity != "ok":
+        # 손상 파일을 교체하기 전에 공용 연결을 모두 닫음
+        close_all_connections()
         stamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
         backup_path = db_path.with_suffix(f".corrupt-{stamp}.db")
         if db_path.exists():
@@ -148,3 +399,6 @@ def handle_disk_io_error(db_path: Path) -> None:
 
         conn = get_connection()
         conn.close()
+
+
+atexit.register(close_all_connections)
@@ -0,0 +1,195 @@
+"""
+시나리오 마스터데이터 번들.
+
+calculate_result·RecalcSession·화면 새로고침은 같은 시나리오의 직무·단가·경비 항목·단가표·세부 항목을
+매번 테이블별 쿼리로 다시 읽었다. load_scenario_bundle()은 다섯 테이블을 읽기 트랜잭션 1회로 읽어
+job_code / exp_code 색인과 함께 변경 불가능한 ScenarioBundle로 돌려주고, 결과를 캐시한다.
+
+캐시 재검증
+- 같은 연결: (PRAGMA data_version, total_changes)가 그대로면 쿼리 없이 재사용
+- 그 외: md_scenario_revision의 시나리오 revision(상속 시 기준 시나리오 revision 포함)이 같으면 재사용
+  (md_* 트리거가 행 변경마다 올림)
+- 쓰기 트랜잭션 중에 읽은 번들은 롤백될 수 있으므로 캐시하지 않는다.
+"""
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from ..db import connection_db_file
+from .repo import ExpenseItem, ExpensePrice, ExpenseSubItem, JobRate, JobRole, MasterDataRepo
+
+
+@dataclass(frozen=True)
+class ScenarioBundle:
+    """시나리오 1개의 마스터데이터. 목록은 MasterDataRepo 조회와 같은 정렬 순서."""
+    scenario_id: str
+    revision: Optional[tuple[int, int]]
+    job_roles: tuple[JobRole, ...]
+    job_rates: Mapping[str, JobRate]
+    expense_items: tuple[ExpenseItem, ...]
+    pricebook: tuple[ExpensePrice, ...]
+    sub_items: tuple[ExpenseSubItem, ...]
+    roles_by_code: Mapping[str, JobRole]
+    items_by_exp_code: Mapping[str, ExpenseItem]
+    sub_items_by_exp: Mapping[str, tuple[ExpenseSubItem, ...]]
+    price_map: Mapping[str, int]
+    wage_day_map: Mapping[str, int]
+
+    @classmethod
+    def from_rows(
+        cls,
+        scenario_id: str,
+        revision: Optional[tuple[int, int]],
+        job_roles: list[JobRole],
+        job_rates: dict[str, JobRate],
+        expense_items: list[ExpenseItem],
+        pricebook: list[ExpensePrice],
+        sub_items: list[ExpenseSubItem],
+    ) -> "ScenarioBundle":
+        grouped: dict[str, list[ExpenseSubItem]] = {}
+        for si in sub_items:
+            grouped.setdefault(si.exp_code, []).append(si)
+        # 단가표는 (exp_code, effective_from DESC) 정렬 → exp_code별 첫 행이 최신 단가
+        price_map: dict[str, int] = {}
+        for price in pricebook:
+            if price.exp_code not in price_map:
+                price_map[price.exp_code] = int(price.unit_price)
+        return cls(
+            scenario_id=scenario_id,
+            revision=revision,
+            job_roles=tuple(job_roles),
+            job_rates=MappingProxyType(dict(job_rates)),
+            expense_items=tuple(expense_items),
+            pricebook=tuple(pricebook),
+            sub_items=tuple(sub_items),
+            roles_by_code=MappingProxyType({r.job_code: r for r in job_roles}),
+            items_by_exp_code=MappingProxyType({i.exp_code: i for i in expense_items}),
+            sub_items_by_exp=MappingProxyType({k: tuple(v) for k, v in grouped.items()}),
+            price_map=MappingProxyType(price_map),
+            wage_day_map=MappingProxyType({code: r.wage_day for code, r in job_rates.items()}),
+        )
+
+    def sub_items_map(self) -> dict[str, list]:
+        """exp_code별 세부 항목. 호출측이 가상 행을 추가할 수 있도록 매번 새 dict·list를 만든다."""
+        return {code: list(items) for code, items in self.sub_items_by_exp.items()}
+
+
+_cache_lock = threading.Lock()
+# 캐시별 최대 번들 수 (시나리오가 많아도 최근 사용분만 보관)
+_BUNDLE_CACHE_SIZE = 256
+# 연결별: {scenario_id: ((data_version, total_changes), bundle)}. 약한 참조가 가능한 연결(PooledConnection)만
+_conn_cache: "weakref.WeakKeyDictionary[sqlite3.Connection, OrderedDict]" = weakref.WeakKeyDictionary()
+# DB 파일 공용: {(db 파일 경로, scenario_id): bundle}. revision으로 재검증
+_shared_cache: "OrderedDict[tuple[str, str], ScenarioBundle]" = OrderedDict()
+
+
+def _lru_get(cache: OrderedDict, key):
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: OrderedDict, key, value) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _BUNDLE_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _read_revision(conn: sqlite3.Connection, scenario_id: str) -> Optional[tuple[int, int]]:
+    """
+    시나리오 유효 revision: (자체 revision, 기준 시나리오 revision). 행이 없으면 0 (상속하지 않으면 기준은 0),
+    리비전 테이블이 없는 DB(마이그레이션 전)면 None.
+    상속 관계가 바뀌면 자체 revision이 오르므로 같은 값이 다시 나오지 않는다.
+    """
+    try:
+        row = conn.execute(
+            """
+            SELECT
+              (SELECT revision FROM md_scenario_revision WHERE scenario_id=:sid),
+              (SELECT r.revision FROM md_scenario_base sb
+                 JOIN md_scenario_revision r ON r.scenario_id = sb.base_scenario_id
+               WHERE sb.scenario_id=:sid)
+            """,
+            {"sid": scenario_id},
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return int(row[0] or 0), int(row[1] or 0)
+
+def _change_token(conn: sqlite3.Connection) -> tuple[int, int]:
+    """다른 연결의 커밋(data_version)과 이 연결의 변경(total_changes)을 함께 반영한 토큰."""
+    return conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes
+
+
+def _read_bundle(conn: sqlite3.Connection, scenario_id: str) -> ScenarioBundle:
+    repo = MasterDataRepo(conn)
+    own_txn = not conn.in_transaction
+    if own_txn:
+        # 다섯 테이블을 같은 스냅샷에서 읽기
+        conn.execute("BEGIN")
+    try:
+        return ScenarioBundle.from_rows(
+            scenario_id,
+            _read_revision(conn, scenario_id),
+            repo.get_job_roles(scenario_id),
+            repo.get_job_rates(scenario_id),
+            repo.get_expense_items(scenario_id),
+            repo.get_expense_pricebook(scenario_id),
+            repo.get_expense_sub_items(scenario_id),
+        )
+    finally:
+        if own_txn:
+            conn.execute("COMMIT")
+
+
+def load_scenario_bundle(conn: sqlite3.Connection, scenario_id: str) -> ScenarioBundle:
+    """
+    시나리오 마스터데이터 번들. 변경이 없으면 캐시된 번들을 그대로 돌려준다.
+    같은 연결의 미커밋 변경도 반영된다 (이 경우 캐시하지 않음).
+    """
+    if conn.in_transaction:
+        return _read_bundle(conn, scenario_id)
+
+    token = _change_token(conn)
+    # 공용 연결 대여(ConnectionScope)는 대여마다 다른 객체이므로 빌린 연결 기준으로 캐시
+    cache_conn = getattr(conn, "connection", conn)
+    with _cache_lock:
+        try:
+            per_conn = _conn_cache.get(cache_conn)
+        except TypeError:
+            per_conn = None
+        entry = _lru_get(per_conn, scenario_id) if per_conn else None
+    if entry is not None and entry[0] == token:
+        return entry[1]
+
+    revision = _read_revision(conn, scenario_id)
+    db_file = connection_db_file(conn)
+    shared_key = (db_file, scenario_id) if db_file else None
+    bundle = None
+    if revision is not None:
+        with _cache_lock:
+            candidates = [entry[1] if entry else None, _lru_get(_shared_cache, shared_key) if shared_key else None]
+        bundle = next((b for b in candidates if b is not None and b.revision == revision), None)
+    if bundle is None:
+        bundle = _read_bundle(conn, scenario_id)
+
+    with _cache_lock:
+        try:
+            _lru_put(_conn_cache.setdefault(cache_conn, OrderedDict()), scenario_id, (token, bundle))
+        except TypeError:
+            pass  # 약한 참조를 지원하지 않는 연결(sqlite3.Connection 기본형)
+        if shared_key and bundle.revision is not None:
+            _lru_put(_shared_cache, shared_key, bundle)
+    return bundle
+
+
+def clear_bundle_cache() -> None:
+    with _cache_lock:
+        _conn_cache.clear()
+        _shared_cache.clear()
@@ -3,6 +3,14 @@ from dataclasses import dataclass
 from typing import Optional
 
 from ..db import get_connection
+from .service import (
+    DEFAULT_BASE_SCENARIO,
+    OVERLAY_TABLES,
+    _inherited_rows_filter,
+    base_scenario_id,
+    link_base_scenario,
+)
+from src.utils.tracing import traced
 
 
 @dataclass
@@ -59,7 +67,81 @@ class ExpenseSubItem:
     is_active: int
 
 
+def _overlay_query(table: str, columns: str, key: tuple[str, ...], order_by: str, where: str = "") -> str:
+    """
+    시나리오(:sid) 자체 행 + 상속한 기준 시나리오 행 중 같은 키로 재정의되지 않은 행 (쿼리 1개).
+    scenario_id 컬럼은 조회한 시나리오로 돌려준다.
+    """
+    extra = f" AND {where}" if where else ""
+    return f"""
+        SELECT :sid, {columns}
+        FROM {table} b
+        WHERE (
+            b.scenario_id=:sid
+            OR (
+                b.scenario_id=(SELECT base_scenario_id FROM md_scenario_base WHERE scenario_id=:sid)
+                AND {_inherited_rows_filter(table, key)}
+            )
+        ){extra}
+        ORDER BY {order_by}
+    """
+
+
+_JOB_ROLES_SQL = _overlay_query(
+    "md_job_role", "job_code, job_name, sort_order, is_active", ("job_code",), "sort_order, job_code",
+)
+_JOB_RATES_SQL = _overlay_query(
+    "md_job_rate", "job_code, wage_day, wage_hour, allowance_rate_json", ("job_code",), "job_code",
+)
+_EXPENSE_ITEMS_SQL = _overlay_query(
+    "md_expense_item", "exp_code, exp_name, group_code, sort_order, is_active", ("exp_code",),
+    "sort_order, exp_code",
+)
+_PRICEBOOK_SQL = _overlay_query(
+    "md_expense_pricebook", "exp_code, unit_price, unit, effective_from, effective_to", ("exp_code",),
+    "exp_code, effective_from DESC",
+)
+_SUB_ITEM_COLUMNS = (
+    "exp_code, sub_code, sub_name, spec, unit, quantity, unit_price, amount, remark, sort_order, is_active"
+)
+_SUB_ITEMS_SQL = _overlay_query(
+    "md_expense_sub_item", _SUB_ITEM_COLUMNS, ("exp_code",), "exp_code, sort_order, sub_code",
+)
+_SUB_ITEMS_BY_EXP_SQL = _overlay_query(
+    "md_expense_sub_item", _SUB_ITEM_COLUMNS, ("exp_code",), "sort_order, sub_code", where="b.exp_code=:exp",
+)
+
+
+def _sub_item_values(si: dict) -> tuple:
+    """저장할 세부 항목 값 (sub_code … is_active). 기준 시나리오 행과 비교할 때도 사용."""
+    return (
+        si.get("sub_code", ""),
+        si.get("sub_name", ""),
+        si.get("spec", ""),
+        si.get("unit", "식"),
+        si.get("quantity", 0),
+        si.get("unit_price", 0),
+        si.get("amount", 0),
+        si.get("remark", ""),
+        si.get("sort_order", 0),
+        si.get("is_active", 1),
+    )
+
+
+def _comparable(values: tuple) -> tuple:
+    sub_code, sub_name, spec, unit, quantity, unit_price, amount, remark, sort_order, is_active = values
+    return (
+        int(sort_order or 0), str(sub_code), str(sub_name), str(spec), str(unit),
+        float(quantity or 0), int(unit_price or 0), int(amount or 0), str(remark), int(is_active),
+    )
+
+
 class MasterDataRepo:
+    """
+    시나리오 마스터데이터 조회·저장. 조회는 기준 시나리오 상속(오버레이)을 반영한
+    결과를 돌려준다 (시나리오 자체 행이 같은 키의 기준 시나리오 행을 덮어씀).
+    """
+
     def __init__(self, conn=None):
         self._external = conn is not None
         self._conn = conn or get_connection()
@@ -68,27 +150,14 @@ class MasterDataRepo:
         if not self._external:
             self._conn.close()
 
+    @traced("masterdata.get_job_roles")
     def get_job_roles(self, scenario_id: str) -> list[JobRole]:
-        rows = self._conn.execute(
-            """
-            SELECT scenario_id, job_code, job_name, sort_order, is_active
-            FROM md_job_role
-            WHERE scenario_id=?
-            ORDER BY sort_order, job_code
-            """,
-            (scenario_id,),
-        ).fetchall()
+        rows = self._conn.execute(_JOB_ROLES_SQL, {"sid": scenario_id}).fetchall()
         return [JobRole(*row) for row in rows]
 
+    @traced("masterdata.get_job_rates")
     def get_job_rates(self, scenario_id: str) -> dict[str, JobRate]:
-        rows = self._conn.execute(
-            """
-            SELECT scenario_id, job_code, wage_day, wage_hour, allowance_rate_json
-            FROM md_job_rate
-            WHERE scenario_id=?
-            """,
-            (scenario_id,),
-        ).fetchall()
+        rows = self._conn.execute(_JOB_RATES_SQL, {"sid": scenario_id}).fetchall()
         rates: dict[str, JobRate] = {}
         for row in rows:
             scenario_id, job_code, wage_day, wage_hour, allowance_rate_json = row
@@ -102,140 +171,176 @@ class MasterDataRepo:
             )
         return rates
 
+    @traced("masterdata.get_expense_items")
     def get_expense_items(self, scenario_id: str) -> list[ExpenseItem]:
-        rows = self._conn.execute(
-            """
-            SELECT scenario_id, exp_code, exp_name, group_code, sort_order, is_active
-            FROM md_expense_item
-            WHERE scenario_id=?
-            ORDER BY sort_order, exp_code
-            """,
-            (scenario_id,),
-        ).fetchall()
+        rows = self._conn.execute(_EXPENSE_ITEMS_SQL, {"sid": scenario_id}).fetchall()
         return [ExpenseItem(*row) for row in rows]
 
+    @traced("masterdata.get_expense_pricebook")
     def get_expense_pricebook(self, scenario_id: str) -> list[ExpensePrice]:
-        rows = self._conn.execute(
-            """
-            SELECT scenario_id, exp_code, unit_price, unit, effective_from, effective_to
-            FROM md_expense_pricebook
-            WHERE scenario_id=?
-            ORDER BY exp_code, effective_from DESC
-            """,
-            (scenario_id,),
-        ).fetchall()
+        rows = self._conn.execute(_PRICEBOOK_SQL, {"sid": scenario_id}).fetchall()
         return [ExpensePrice(*row) for row in rows]
 
+    @traced("masterdata.get_expense_sub_items")
     def get_expense_sub_items(self, scenario_id: str, exp_code: str = None) -> list[ExpenseSubItem]:
         if exp_code:
-            rows = self._conn.execute(
-                """
-                SELECT scenario_id, exp_code, sub_code, sub_name, spec, unit,
-                       quantity, unit_price, amount, remark, sort_order, is_active
-                FROM md_expense_sub_item
-                WHERE scenario_id=? AND exp_code=?
-                ORDER BY sort_order, sub_code
-                """,
-                (scenario_id, exp_code),
-            ).fetchall()
+            rows = self._conn.execute(_SUB_ITEMS_BY_EXP_SQL, {"sid": scenario_id, "exp": exp_code}).fetchall()
         else:
-            rows = self._conn.execute(
-                """
-                SELECT scenario_id, exp_code, sub_code, sub_name, spec, unit,
-                       quantity, unit_price, amount, remark, sort_order, is_active
-                FROM md_expense_sub_item
-                WHERE scenario_id=?
-                ORDER BY exp_code, sort_order, sub_code
-                """,
-                (scenario_id,),
-            ).fetchall()
+            rows = self._conn.execute(_SUB_ITEMS_SQL, {"sid": scenario_id}).fetchall()
         return [ExpenseSubItem(*row) for row in rows]
 
     def ensure_job_roles_for_scenario(self, scenario_id: str) -> None:
-        """시나리오에 md_job_role이 없으면 default에서 복사. 불러오기 시 직무 목록이 비어 있지 않도록 함."""
-        existing = self._conn.execute(
-            "SELECT 1 FROM md_job_role WHERE scenario_id=? LIMIT 1",
-            (scenario_id,),
-        ).fetchone()
-        if existing is not None:
-            return
-        self._conn.execute(
-            """
-            INSERT INTO md_job_role (scenario_id, job_code, job_name, sort_order, is_active)
-            SELECT ?, job_code, job_name, sort_order, is_active
-            FROM md_job_role
-            WHERE scenario_id='default'
-            """,
-            (scenario_id,),
-        )
-        self._conn.execute(
-            """
-            INSERT INTO md_job_rate (scenario_id, job_code, wage_day, wage_hour, allowance_rate_json)
-            SELECT ?, job_code, wage_day, wage_hour, allowance_rate_json
-            FROM md_job_rate
-            WHERE scenario_id='default'
-            """,
-            (scenario_id,),
-        )
-        self._conn.commit()
+        """시나리오에 직무 마스터가 없으면 default를 상속하도록 연결. 불러오기 시 직무 목록이 비어 있지 않도록 함."""
+        self._ensure_from_default(scenario_id, ("md_job_role", "md_job_rate"))
 
     def ensure_expense_masterdata_for_scenario(self, scenario_id: str) -> None:
-        """시나리오에 md_expense_item 행이 없으면 default에서 복사한다. (FK 오류 방지)"""
+        """시나리오에 경비 마스터가 없으면 default를 상속하도록 연결한다. (행 복사 없음)"""
+        self._ensure_from_default(scenario_id, ("md_expense_item", "md_expense_pricebook"))
+
+    def _ensure_from_default(self, scenario_id: str, tables: tuple[str, str]) -> None:
+        """
+        tables[0]에 시나리오 행이 없으면 default에서 채운다.
+        마스터데이터가 전혀 없는 시나리오는 default 상속으로 연결하고,
+        다른 테이블에 자체 행만 가진 (이전 전체 복사) 시나리오는 tables 행을 예전처럼 복사한다.
+        """
+        if scenario_id == DEFAULT_BASE_SCENARIO:
+            return
         existing = self._conn.execute(
-            "SELECT 1 FROM md_expense_item WHERE scenario_id=? LIMIT 1",
+            f"SELECT 1 FROM {tables[0]} WHERE scenario_id=? LIMIT 1",
             (scenario_id,),
         ).fetchone()
-        if existing is not None:
+        if existing is not None or base_scenario_id(self._conn, scenario_id) is not None:
             return
-        self._conn.execute(
-            """
-            INSERT INTO md_expense_item (scenario_id, exp_code, exp_name, group_code, sort_order, is_active)
-            SELECT ?, exp_code, exp_name, group_code, sort_order, is_active
-            FROM md_expense_item
-            WHERE scenario_id='default'
-            """,
-            (scenario_id,),
-        )
-        self._conn.execute(
-            """
-            INSERT INTO md_expense_pricebook (scenario_id, exp_code, unit_price, unit, effective_from, effective_to)
-            SELECT ?, exp_code, unit_price, unit, effective_from, effective_to
-            FROM md_expense_pricebook
-            WHERE scenario_id='default'
-            """,
-            (scenario_id,),
+        has_own_rows = any(
+            self._conn.execute(f"SELECT 1 FROM {table} WHERE scenario_id=? LIMIT 1", (scenario_id,)).fetchone()
+            for table, _, _ in OVERLAY_TABLES
         )
+        if not has_own_rows:
+            link_base_scenario(self._conn, scenario_id, DEFAULT_BASE_SCENARIO)
+        else:
+            for table, columns, _ in OVERLAY_TABLES:
+                if table not in tables:
+                    continue
+                column_list = ", ".join(columns)
+                self._conn.execute(
+                    f"""
+                    INSERT INTO {table} (scenario_id, {column_list})
+                    SELECT ?, {column_list}
+                    FROM {table}
+                    WHERE scenario_id=?
+                    """,
+                    (scenario_id, DEFAULT_BASE_SCENARIO),
+                )
         self._conn.commit()
 
-    def upsert_expense_sub_items(self, scenario_id: str, exp_code: str, sub_items: list[dict]) -> None:
-        """경비 세부 항목을 upsert한다."""
-        self._conn.execute(
-            "DELETE FROM md_expense_sub_item WHERE scenario_id=? AND exp_code=?",
-            (scenario_id, exp_code),
-        )
-        for si in sub_items:
-            self._conn.execute(
+    def upsert_expense_sub_items(self, scenario_id: str, exp_code: str, sub_items: list[dict]) -> int:
+        """경비코드 1개의 세부 항목 저장 (save_expense_sub_items 참고). 바뀐 행 수를 돌려준다."""
+        return self.save_expense_sub_items(scenario_id, {exp_code: sub_items})
+
+    @traced("masterdata.save_expense_sub_items")
+    def save_expense_sub_items(self, scenario_id: str, sub_items_by_exp: dict[str, list[dict]]) -> int:
+        """
+        여러 경비코드의 세부 항목 목록을 한 트랜잭션으로 저장한다.
+        저장된 행과 (exp_code, sub_code) 키로 비교해 추가·변경·삭제된 행만 executemany로 기록하고
+        바뀐 행 수(재정의 표시 포함)를 돌려준다. 바뀐 것이 없으면 0 (쓰기 없음).
+        기준 시나리오를 상속하는 시나리오는 목록이 기준 시나리오와 같으면 자체 행을 지워 상속으로 되돌리고,
+        다르면 경비코드 단위 재정의로 저장한다.
+        한 경비코드 목록에 같은 sub_code가 두 번 있으면 아무것도 쓰지 않고 ValueError.
+        """
+        if not sub_items_by_exp:
+            return 0
+        base_id = base_scenario_id(self._conn, scenario_id)
+        base_by_exp: dict[str, list[tuple]] = {}
+        if base_id is not None:
+            for si in self.get_expense_sub_items(base_id):
+                if si.exp_code in sub_items_by_exp:
+                    base_by_exp.setdefault(si.exp_code, []).append(_comparable((
+                        si.sub_code, si.sub_name, si.spec, si.unit, si.quantity, si.unit_price,
+                        si.amount, si.remark, si.sort_order, si.is_active,
+                    )))
+
+        # 목표 상태: 자체 행 {(exp_code, sub_code): 값}, 재정의 표시 경비코드
+        wanted: dict[tuple[str, str], tuple] = {}
+        wanted_markers: set[str] = set()
+        for exp_code, sub_items in sub_items_by_exp.items():
+            rows = [_sub_item_values(si) for si in sub_items]
+            # 같은 키가 두 번 오면 한 행으로 합쳐져 조용히 사라지므로 쓰기 전에 거부
+            sub_codes = [values[0] for values in rows]
+            if len(set(sub_codes)) != len(sub_codes):
+                duplicates = sorted({code for code in sub_codes if sub_codes.count(code) > 1})
+                raise ValueError(f"duplicate sub_code for exp_code {exp_code!r}: {', '.join(duplicates)}")
+            if base_id is not None:
+                if sorted(_comparable(v) for v in rows) == sorted(base_by_exp.get(exp_code, [])):
+                    continue
+                wanted_markers.add(exp_code)
+            for values in rows:
+                wanted[(exp_code, values[0])] = values
+
+        stored: dict[tuple[str, str], tuple] = {}
+        for row in self._conn.execute(
+            f"SELECT {_SUB_ITEM_COLUMNS} FROM md_expense_sub_item WHERE scenario_id=?",
+            (scenario_id,),
+        ):
+            if row[0] in sub_items_by_exp:
+                stored[(row[0], row[1])] = tuple(row[1:])
+        stored_markers = {
+            row[0]
+            for row in self._conn.execute(
+                "SELECT exp_code FROM md_expense_sub_item_override WHERE scenario_id=?",
+                (scenario_id,),
+            )
+            if row[0] in sub_items_by_exp
+        }
+
+        inserts = [(scenario_id, key[0], *values) for key, values in wanted.items() if key not in stored]
+        updates = [
+            (*values[1:], scenario_id, key[0], key[1])
+            for key, values in wanted.items()
+            if key in stored and _comparable(values) != _comparable(stored[key])
+        ]
+        deletes = [(scenario_id, *key) for key in stored if key not in wanted]
+        marker_inserts = [(scenario_id, code) for code in wanted_markers - stored_markers]
+        marker_deletes = [(scenario_id, code) for code in stored_markers - wanted_markers]
+        changed = len(inserts) + len(updates) + len(deletes) + len(marker_inserts) + len(marker_deletes)
+        if not changed:
+            return 0
+
+        try:
+            self._conn.executemany(
+                "DELETE FROM md_expense_sub_item WHERE scenario_id=? AND exp_code=? AND sub_code=?",
+                deletes,
+            )
+            self._conn.executemany(
+                """
+                UPDATE md_expense_sub_item
+                SET sub_name=?, spec=?, unit=?, quantity=?, unit_price=?, amount=?,
+                    remark=?, sort_order=?, is_active=?
+                WHERE scenario_id=? AND exp_code=? AND sub_code=?
+                """,
+                updates,
+            )
+            self._conn.executemany(
                 """
                 INSERT INTO md_expense_sub_item
                   (scenario_id, exp_code, sub_code, sub_name, spec, unit,
                    quantity, unit_price, amount, remark, sort_order, is_active)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    scenario_id, exp_code,
-                    si.get("sub_code", ""),
-                    si.get("sub_name", ""),
-                    si.get("spec", ""),
-                    si.get("unit", "식"),
-                    si.get("quantity", 0),
-                    si.get("unit_price", 0),
-                    si.get("amount", 0),
-                    si.get("remark", ""),
-                    si.get("sort_order", 0),
-                    si.get("is_active", 1),
-                ),
+                inserts,
             )
-        self._conn.commit()
+            self._conn.executemany(
+                "DELETE FROM md_expense_sub_item_override WHERE scenario_id=? AND exp_code=?",
+                marker_deletes,
+            )
+            self._conn.executemany(
+                "INSERT INTO md_expense_sub_item_override (scenario_id, exp_code) VALUES (?, ?)",
+                marker_inserts,
+            )
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+        return changed
 
     def _parse_allowance_json(self, raw: str) -> dict[str, float]:
         try:
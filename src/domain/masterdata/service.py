@@ -3,12 +3,99 @@ from pathlib import Path
 import importlib.resources as resources
 
 
+# 새 시나리오가 상속하는 기본 기준 시나리오
+DEFAULT_BASE_SCENARIO = "default"
+
+# 오버레이 테이블: (테이블, 컬럼, 재정의 키). 시나리오 행이 같은 키의 기준 시나리오 행을 덮어쓴다.
+# 단가표는 경비코드 단위로 이력 전체를, 세부 항목은 경비코드 단위로 목록 전체를 재정의한다.
+# 순서는 FK 순서 (부모 → 자식)
+OVERLAY_TABLES: tuple[tuple[str, tuple[str, ...], tuple[str, ...]], ...] = (
+    ("md_job_role", ("job_code", "job_name", "sort_order", "is_active"), ("job_code",)),
+    ("md_job_rate", ("job_code", "wage_day", "wage_hour", "allowance_rate_json"), ("job_code",)),
+    ("md_expense_item", ("exp_code", "exp_name", "group_code", "sort_order", "is_active"), ("exp_code",)),
+    ("md_expense_pricebook", ("exp_code", "unit_price", "unit", "effective_from", "effective_to"), ("exp_code",)),
+    (
+        "md_expense_sub_item",
+        ("exp_code", "sub_code", "sub_name", "spec", "unit",
+         "quantity", "unit_price", "amount", "remark", "sort_order", "is_active"),
+        ("exp_code",),
+    ),
+)
+
+
+def base_scenario_id(conn: sqlite3.Connection, scenario_id: str) -> str | None:
+    """시나리오가 상속하는 기준 시나리오. 상속하지 않으면(자체 행만 사용) None."""
+    row = conn.execute(
+        "SELECT base_scenario_id FROM md_scenario_base WHERE scenario_id=?",
+        (scenario_id,),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def link_base_scenario(conn: sqlite3.Connection, scenario_id: str, base_id: str) -> None:
+    """scenario_id가 base_id의 마스터데이터를 상속하도록 연결 (행 복사 없음, 커밋은 호출측)."""
+    if scenario_id == base_id:
+        raise ValueError("scenario cannot inherit from itself")
+    if base_scenario_id(conn, base_id) is not None:
+        # 상속은 한 단계만: 기준 시나리오는 자체 행만 가진 시나리오여야 한다
+        raise ValueError("base scenario must not inherit from another scenario")
+    conn.execute(
+        "INSERT OR REPLACE INTO md_scenario_base (scenario_id, base_scenario_id) VALUES (?, ?)",
+        (scenario_id, base_id),
+    )
+
+
+def _inherited_rows_filter(table: str, key: tuple[str, ...]) -> str:
+    """기준 시나리오 행 b 중 시나리오(:sid)가 재정의하지 않은 행 조건."""
+    match = " AND ".join(f"o.{column}=b.{column}" for column in key)
+    condition = f"NOT EXISTS (SELECT 1 FROM {table} o WHERE o.scenario_id=:sid AND {match})"
+    if table == "md_expense_sub_item":
+        condition += (
+            " AND NOT EXISTS (SELECT 1 FROM md_expense_sub_item_override m"
+            " WHERE m.scenario_id=:sid AND m.exp_code=b.exp_code)"
+        )
+    return condition
+
+
+def materialize_overlay(conn: sqlite3.Connection, scenario_id: str) -> None:
+    """
+    상속 중인 기준 시나리오 행을 시나리오 자체 행으로 복사하고 상속을 끊는다 (커밋은 호출측).
+    기준 시나리오를 삭제하기 전에 그 시나리오를 상속한 시나리오에 사용한다.
+    """
+    base_id = base_scenario_id(conn, scenario_id)
+    if base_id is None:
+        return
+    params = {"sid": scenario_id, "base": base_id}
+    for table, columns, key in OVERLAY_TABLES:
+        column_list = ", ".join(columns)
+        conn.execute(
+            f"""
+            INSERT INTO {table} (scenario_id, {column_list})
+            SELECT :sid, {", ".join(f"b.{c}" for c in columns)}
+            FROM {table} b
+            WHERE b.scenario_id=:base AND {_inherited_rows_filter(table, key)}
+            """,
+            params,
+        )
+    conn.execute("DELETE FROM md_expense_sub_item_override WHERE scenario_id=?", (scenario_id,))
+    conn.execute("DELETE FROM md_scenario_base WHERE scenario_id=?", (scenario_id,))
+
+
+def dependent_scenarios(conn: sqlite3.Connection, base_id: str) -> list[str]:
+    rows = conn.execute(
+        "SELECT scenario_id FROM md_scenario_base WHERE base_scenario_id=? ORDER BY scenario_id",
+        (base_id,),
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
 def _scenario_has_masterdata(conn: sqlite3.Connection, scenario_id: str) -> bool:
+    """자체 직무 행이 있거나 기준 시나리오를 상속하면 True."""
     row = conn.execute(
         "SELECT 1 FROM md_job_role WHERE scenario_id=? LIMIT 1",
         (scenario_id,),
     ).fetchone()
-    return row is not None
+    return row is not None or base_scenario_id(conn, scenario_id) is not None
 
 
 def _any_masterdata_exists(conn: sqlite3.Connection) -> bool:
@@ -45,66 +132,52 @@ def apply_seed_if_needed(conn: sqlite3.Connection) -> None:
 
 
 def copy_masterdata(conn: sqlite3.Connection, from_scenario_id: str, to_scenario_id: str) -> None:
+    """
+    to_scenario_id가 from_scenario_id의 마스터데이터를 갖도록 한다 (커밋은 호출측).
+    상속은 기본 기준 시나리오(default)에만 연결한다. from이 default면 행을 복사하지 않고 상속하고,
+    from이 default를 상속하면 default를 상속하고 from이 재정의한 행(변경분)만 복사한다.
+    그 밖의 시나리오는 조회 결과 전체를 자체 행으로 복사해 이후 from 변경이 복제본에 반영되지 않게 한다.
+    """
     if from_scenario_id == to_scenario_id:
         raise ValueError("source and target scenario_id must be different")
 
     if _scenario_has_masterdata(conn, to_scenario_id):
         raise ValueError("target scenario already has master data")
 
+    base_id = base_scenario_id(conn, from_scenario_id)
+    if base_id is None and from_scenario_id == DEFAULT_BASE_SCENARIO:
+        link_base_scenario(conn, to_scenario_id, DEFAULT_BASE_SCENARIO)
+        return
+
+    for table, columns, _ in OVERLAY_TABLES:
+        column_list = ", ".join(columns)
+        conn.execute(
+            f"""
+            INSERT INTO {table} (scenario_id, {column_list})
+            SELECT ?, {column_list}
+            FROM {table}
+            WHERE scenario_id=?
+            """,
+            (to_scenario_id, from_scenario_id),
+        )
+    if base_id is None:
+        return
     conn.execute(
         """
-        INSERT INTO md_job_role (scenario_id, job_code, job_name, sort_order, is_active)
-        SELECT ?, job_code, job_name, sort_order, is_active
-        FROM md_job_role
-        WHERE scenario_id=?
-        """,
-        (to_scenario_id, from_scenario_id),
-    )
-    conn.execute(
-        """
-        INSERT INTO md_job_rate (scenario_id, job_code, wage_day, wage_hour, allowance_rate_json)
-        SELECT ?, job_code, wage_day, wage_hour, allowance_rate_json
-        FROM md_job_rate
-        WHERE scenario_id=?
-        """,
-        (to_scenario_id, from_scenario_id),
-    )
-    conn.execute(
-        """
-        INSERT INTO md_expense_item (scenario_id, exp_code, exp_name, group_code, sort_order, is_active)
-        SELECT ?, exp_code, exp_name, group_code, sort_order, is_active
-        FROM md_expense_item
-        WHERE scenario_id=?
-        """,
-        (to_scenario_id, from_scenario_id),
-    )
-    conn.execute(
-        """
-        INSERT INTO md_expense_pricebook (scenario_id, exp_code, unit_price, unit, effective_from, effective_to)
-        SELECT ?, exp_code, unit_price, unit, effective_from, effective_to
-        FROM md_expense_pricebook
-        WHERE scenario_id=?
-        """,
-        (to_scenario_id, from_scenario_id),
-    )
-    # 경비 세부 항목 복사
-    conn.execute(
-        """
-        INSERT OR IGNORE INTO md_expense_sub_item
-          (scenario_id, exp_code, sub_code, sub_name, spec, unit,
-           quantity, unit_price, amount, remark, sort_order, is_active)
-        SELECT ?, exp_code, sub_code, sub_name, spec, unit,
-               quantity, unit_price, amount, remark, sort_order, is_active
-        FROM md_expense_sub_item
-        WHERE scenario_id=?
+        INSERT INTO md_expense_sub_item_override (scenario_id, exp_code)
+        SELECT ?, exp_code FROM md_expense_sub_item_override WHERE scenario_id=?
         """,
         (to_scenario_id, from_scenario_id),
     )
+    link_base_scenario(conn, to_scenario_id, base_id)
+    if base_id != DEFAULT_BASE_SCENARIO:
+        # 이전 버전에서 default가 아닌 시나리오를 상속한 경우: 상속 행도 자체 행으로 복사
+        materialize_overlay(conn, to_scenario_id)
 
 
 def choose_base_scenario(conn: sqlite3.Connection) -> str | None:
-    if _scenario_has_masterdata(conn, "default"):
-        return "default"
+    if _scenario_has_masterdata(conn, DEFAULT_BASE_SCENARIO):
+        return DEFAULT_BASE_SCENARIO
 
     row = conn.execute(
         """
@@ -0,0 +1,93 @@
+-- 시나리오별 마스터데이터 리비전 (ScenarioBundle 캐시 재검증용)
+-- md_* 테이블의 행이 추가·변경·삭제될 때마다 트리거가 해당 시나리오의 revision을 1 올린다.
+-- 다른 연결·프로세스의 변경도 revision 비교 한 번으로 감지된다.
+
+CREATE TABLE IF NOT EXISTS md_scenario_revision (
+  scenario_id TEXT PRIMARY KEY,
+  revision    INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_md_job_role_rev_ins AFTER INSERT ON md_job_role BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_job_role_rev_upd AFTER UPDATE ON md_job_role BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_job_role_rev_del AFTER DELETE ON md_job_role BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_job_rate_rev_ins AFTER INSERT ON md_job_rate BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_job_rate_rev_upd AFTER UPDATE ON md_job_rate BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_job_rate_rev_del AFTER DELETE ON md_job_rate BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_item_rev_ins AFTER INSERT ON md_expense_item BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_item_rev_upd AFTER UPDATE ON md_expense_item BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_item_rev_del AFTER DELETE ON md_expense_item BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_pricebook_rev_ins AFTER INSERT ON md_expense_pricebook BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_pricebook_rev_upd AFTER UPDATE ON md_expense_pricebook BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_pricebook_rev_del AFTER DELETE ON md_expense_pricebook BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_sub_item_rev_ins AFTER INSERT ON md_expense_sub_item BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_sub_item_rev_upd AFTER UPDATE ON md_expense_sub_item BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_sub_item_rev_del AFTER DELETE ON md_expense_sub_item BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
@@ -0,0 +1,74 @@
+-- scenario_input 정규화: 직무별 노무 입력·경비코드별 입력을 행 단위로 저장
+-- scenario_input은 시나리오 헤더가 된다.
+--   input_json    : labor.job_roles / expenses.items를 뺀 나머지 (비율, 기준년도, 휴일근무 계산값 등)
+--   display_name  : 목록 표시명 (_display_name)
+--   input_version : 0 = 기존 전체 JSON, 1 = 행 테이블 기준
+
+ALTER TABLE scenario_input ADD COLUMN display_name TEXT;
+ALTER TABLE scenario_input ADD COLUMN input_version INTEGER NOT NULL DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS scenario_labor_input (
+  scenario_id       TEXT NOT NULL,
+  job_code          TEXT NOT NULL,
+  headcount         REAL NOT NULL DEFAULT 0,
+  work_days         REAL NOT NULL DEFAULT 0,
+  work_hours        REAL NOT NULL DEFAULT 0,
+  overtime_hours    REAL NOT NULL DEFAULT 0,
+  holiday_work_days REAL NOT NULL DEFAULT 0,
+  sort_order        INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (scenario_id, job_code),
+  FOREIGN KEY (scenario_id) REFERENCES scenario_input(scenario_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS scenario_expense_input (
+  scenario_id  TEXT NOT NULL,
+  exp_code     TEXT NOT NULL,
+  quantity     REAL NOT NULL DEFAULT 0,
+  unit_price   INTEGER NOT NULL DEFAULT 0,
+  sort_order   INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (scenario_id, exp_code),
+  FOREIGN KEY (scenario_id) REFERENCES scenario_input(scenario_id) ON DELETE CASCADE
+);
+
+-- 기존 canonical JSON → 행 (순서는 JSON 키 순서). canonical이 아닌 JSON은 첫 조회 시 정규화·저장된다.
+CREATE TEMP TABLE _canonical_scenario AS
+SELECT scenario_id, input_json FROM scenario_input
+WHERE json_valid(input_json)
+  AND json_type(input_json, '$.labor') = 'object'
+  AND json_type(input_json, '$.expenses') = 'object'
+  AND COALESCE(json_type(input_json, '$.labor.job_roles'), 'object') = 'object'
+  AND COALESCE(json_type(input_json, '$.expenses.items'), 'object') = 'object';
+
+INSERT OR REPLACE INTO scenario_labor_input
+  (scenario_id, job_code, headcount, work_days, work_hours, overtime_hours, holiday_work_days, sort_order)
+SELECT
+  c.scenario_id,
+  j.key,
+  COALESCE(json_extract(j.value, '$.headcount'), 0),
+  COALESCE(json_extract(j.value, '$.work_days'), 0),
+  COALESCE(json_extract(j.value, '$.work_hours'), 0),
+  COALESCE(json_extract(j.value, '$.overtime_hours'), 0),
+  COALESCE(json_extract(j.value, '$.holiday_work_days'), json_extract(j.value, '$.holiday_work_hours'), 0),
+  ROW_NUMBER() OVER (PARTITION BY c.scenario_id ORDER BY j.id) - 1
+FROM _canonical_scenario c, json_each(c.input_json, '$.labor.job_roles') j
+WHERE j.type = 'object';
+
+INSERT OR REPLACE INTO scenario_expense_input (scenario_id, exp_code, quantity, unit_price, sort_order)
+SELECT
+  c.scenario_id,
+  j.key,
+  COALESCE(json_extract(j.value, '$.quantity'), 0),
+  COALESCE(json_extract(j.value, '$.unit_price'), 0),
+  ROW_NUMBER() OVER (PARTITION BY c.scenario_id ORDER BY j.id) - 1
+FROM _canonical_scenario c, json_each(c.input_json, '$.expenses.items') j
+WHERE j.type = 'object';
+
+UPDATE scenario_input SET
+  input_json = json_remove(input_json, '$.labor.job_roles', '$.expenses.items'),
+  input_version = 1
+WHERE scenario_id IN (SELECT scenario_id FROM _canonical_scenario);
+
+UPDATE scenario_input SET display_name = json_extract(input_json, '$._display_name')
+WHERE json_valid(input_json) AND json_type(input_json) = 'object';
+
+DROP TABLE _canonical_scenario;
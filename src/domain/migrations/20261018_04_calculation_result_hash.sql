@@ -0,0 +1,3 @@
+-- 집계 입력 해시 (canonical 입력·마스터데이터 revision·노임단가·설정·계산 버전)
+-- 같은 해시로 다시 집계하면 calculate_result가 저장된 결과를 그대로 돌려준다.
+ALTER TABLE calculation_result ADD COLUMN input_hash TEXT;
@@ -0,0 +1,94 @@
+-- 마스터데이터 오버레이 (copy-on-write)
+-- 새 시나리오는 md_* 행을 통째로 복사하지 않고 기준 시나리오(base)를 상속한다.
+-- 시나리오 자신의 md_* 행은 기준 시나리오 행을 같은 키로 덮어쓰거나 추가한 행만 저장한다.
+-- 기준 시나리오(default 등)의 변경은 상속한 시나리오를 다시 쓰지 않아도 그대로 반영된다.
+
+CREATE TABLE IF NOT EXISTS md_scenario_base (
+  scenario_id      TEXT PRIMARY KEY,
+  base_scenario_id TEXT NOT NULL
+);
+
+-- 경비코드 단위 세부 항목 재정의. 표시가 있으면 그 경비코드의 세부 항목은 기준 시나리오 대신
+-- 시나리오 자신의 행만 사용한다 (행이 0개면 세부 항목을 모두 지운 상태).
+CREATE TABLE IF NOT EXISTS md_expense_sub_item_override (
+  scenario_id TEXT NOT NULL,
+  exp_code    TEXT NOT NULL,
+  PRIMARY KEY (scenario_id, exp_code)
+);
+
+-- 세부 항목 재정의 행은 시나리오 자신의 md_expense_item 행 없이 저장되므로 FK를 뺀 테이블로 교체
+-- (테이블 교체 시 함께 삭제되는 리비전 트리거는 아래에서 다시 만든다)
+CREATE TABLE md_expense_sub_item_new (
+  scenario_id  TEXT    NOT NULL,
+  exp_code     TEXT    NOT NULL,
+  sub_code     TEXT    NOT NULL,
+  sub_name     TEXT    NOT NULL,
+  spec         TEXT    NOT NULL DEFAULT '',
+  unit         TEXT    NOT NULL DEFAULT '식',
+  quantity     REAL    NOT NULL DEFAULT 0,
+  unit_price   INTEGER NOT NULL DEFAULT 0,
+  amount       INTEGER NOT NULL DEFAULT 0,
+  remark       TEXT    NOT NULL DEFAULT '',
+  sort_order   INTEGER NOT NULL DEFAULT 0,
+  is_active    INTEGER NOT NULL DEFAULT 1,
+  PRIMARY KEY (scenario_id, exp_code, sub_code)
+);
+
+INSERT INTO md_expense_sub_item_new
+  (scenario_id, exp_code, sub_code, sub_name, spec, unit,
+   quantity, unit_price, amount, remark, sort_order, is_active)
+SELECT scenario_id, exp_code, sub_code, sub_name, spec, unit,
+       quantity, unit_price, amount, remark, sort_order, is_active
+FROM md_expense_sub_item;
+
+DROP TABLE md_expense_sub_item;
+ALTER TABLE md_expense_sub_item_new RENAME TO md_expense_sub_item;
+
+-- 빠진 FK의 ON DELETE CASCADE 대신: 경비 항목 삭제 시 같은 시나리오의 세부 항목·재정의 표시도 삭제
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_item_del_sub_items AFTER DELETE ON md_expense_item BEGIN
+  DELETE FROM md_expense_sub_item WHERE scenario_id = OLD.scenario_id AND exp_code = OLD.exp_code;
+  DELETE FROM md_expense_sub_item_override WHERE scenario_id = OLD.scenario_id AND exp_code = OLD.exp_code;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_sub_item_rev_ins AFTER INSERT ON md_expense_sub_item BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_sub_item_rev_upd AFTER UPDATE ON md_expense_sub_item BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_sub_item_rev_del AFTER DELETE ON md_expense_sub_item BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+-- 상속 관계·재정의 표시가 바뀌어도 조회 결과가 달라지므로 시나리오 revision을 올린다
+CREATE TRIGGER IF NOT EXISTS trg_md_scenario_base_rev_ins AFTER INSERT ON md_scenario_base BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_scenario_base_rev_upd AFTER UPDATE ON md_scenario_base BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_scenario_base_rev_del AFTER DELETE ON md_scenario_base BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_sub_item_override_rev_ins AFTER INSERT ON md_expense_sub_item_override BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (NEW.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_md_expense_sub_item_override_rev_del AFTER DELETE ON md_expense_sub_item_override BEGIN
+  INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (OLD.scenario_id, 1)
+    ON CONFLICT(scenario_id) DO UPDATE SET revision = revision + 1;
+END;
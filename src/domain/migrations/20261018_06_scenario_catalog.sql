@@ -0,0 +1,105 @@
+-- 시나리오 목록(카탈로그)
+-- 시나리오 관리·비교 화면의 목록·정렬·검색·페이지 조회가 scenario_input 헤더 JSON이나
+-- calculation_result를 읽지 않도록 표시용 값만 따로 보관한다. 트리거로 저장 시 함께 갱신된다.
+--   display_name : 표시명 (_display_name, 없으면 scenario_id). NOCASE라 'abc%' 검색도 색인 사용
+--   wage_year, base_year : 헤더 JSON의 노임단가 기준년도·기준년도
+--   updated_at   : scenario_input.updated_at
+--   grand_total  : 마지막 집계 결과 총액 (집계 전이면 NULL)
+--   headcount    : 직무별 인원 합계
+
+CREATE TABLE IF NOT EXISTS scenario_catalog (
+  scenario_id  TEXT PRIMARY KEY,
+  display_name TEXT NOT NULL COLLATE NOCASE,
+  wage_year    TEXT,
+  base_year    TEXT,
+  updated_at   TEXT NOT NULL DEFAULT (datetime('now')),
+  grand_total  REAL,
+  headcount    REAL NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_scenario_catalog_name ON scenario_catalog(display_name, scenario_id);
+CREATE INDEX IF NOT EXISTS idx_scenario_catalog_updated ON scenario_catalog(updated_at, scenario_id);
+CREATE INDEX IF NOT EXISTS idx_scenario_catalog_total ON scenario_catalog(grand_total, scenario_id);
+CREATE INDEX IF NOT EXISTS idx_scenario_catalog_headcount ON scenario_catalog(headcount, scenario_id);
+CREATE INDEX IF NOT EXISTS idx_scenario_catalog_wage_year ON scenario_catalog(wage_year, display_name, scenario_id);
+
+INSERT OR REPLACE INTO scenario_catalog
+  (scenario_id, display_name, wage_year, base_year, updated_at, grand_total, headcount)
+SELECT
+  s.scenario_id,
+  COALESCE(NULLIF(trim(s.display_name), ''), s.scenario_id),
+  CASE WHEN json_valid(s.input_json) THEN json_extract(s.input_json, '$.wage_year') END,
+  CASE WHEN json_valid(s.input_json) THEN json_extract(s.input_json, '$.base_year') END,
+  COALESCE(s.updated_at, datetime('now')),
+  (SELECT CASE WHEN json_valid(r.result_json) THEN json_extract(r.result_json, '$.aggregator.grand_total') END
+     FROM calculation_result r WHERE r.scenario_id = s.scenario_id),
+  COALESCE((SELECT SUM(l.headcount) FROM scenario_labor_input l WHERE l.scenario_id = s.scenario_id), 0)
+FROM scenario_input s;
+
+-- 헤더 저장(행만 바뀌어도 updated_at 갱신) → 표시명·기준년도·수정 시각
+CREATE TRIGGER IF NOT EXISTS trg_scenario_catalog_input_ins AFTER INSERT ON scenario_input BEGIN
+  INSERT INTO scenario_catalog (scenario_id, display_name, wage_year, base_year, updated_at, grand_total)
+  VALUES (
+    NEW.scenario_id,
+    COALESCE(NULLIF(trim(NEW.display_name), ''), NEW.scenario_id),
+    CASE WHEN json_valid(NEW.input_json) THEN json_extract(NEW.input_json, '$.wage_year') END,
+    CASE WHEN json_valid(NEW.input_json) THEN json_extract(NEW.input_json, '$.base_year') END,
+    COALESCE(NEW.updated_at, datetime('now')),
+    (SELECT CASE WHEN json_valid(r.result_json) THEN json_extract(r.result_json, '$.aggregator.grand_total') END
+       FROM calculation_result r WHERE r.scenario_id = NEW.scenario_id)
+  )
+  ON CONFLICT(scenario_id) DO UPDATE SET
+    display_name=excluded.display_name,
+    wage_year=excluded.wage_year,
+    base_year=excluded.base_year,
+    updated_at=excluded.updated_at;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_scenario_catalog_input_upd AFTER UPDATE ON scenario_input BEGIN
+  UPDATE scenario_catalog SET
+    display_name=COALESCE(NULLIF(trim(NEW.display_name), ''), NEW.scenario_id),
+    wage_year=CASE WHEN json_valid(NEW.input_json) THEN json_extract(NEW.input_json, '$.wage_year') END,
+    base_year=CASE WHEN json_valid(NEW.input_json) THEN json_extract(NEW.input_json, '$.base_year') END,
+    updated_at=COALESCE(NEW.updated_at, datetime('now'))
+  WHERE scenario_id = NEW.scenario_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_scenario_catalog_input_del AFTER DELETE ON scenario_input BEGIN
+  DELETE FROM scenario_catalog WHERE scenario_id = OLD.scenario_id;
+END;
+
+-- 직무 행 변경 → 인원 합계 (시나리오 PK 범위 합계)
+CREATE TRIGGER IF NOT EXISTS trg_scenario_catalog_labor_ins AFTER INSERT ON scenario_labor_input BEGIN
+  UPDATE scenario_catalog SET headcount=(
+    SELECT COALESCE(SUM(headcount), 0) FROM scenario_labor_input WHERE scenario_id = NEW.scenario_id
+  ) WHERE scenario_id = NEW.scenario_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_scenario_catalog_labor_upd AFTER UPDATE OF headcount ON scenario_labor_input BEGIN
+  UPDATE scenario_catalog SET headcount=(
+    SELECT COALESCE(SUM(headcount), 0) FROM scenario_labor_input WHERE scenario_id = NEW.scenario_id
+  ) WHERE scenario_id = NEW.scenario_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_scenario_catalog_labor_del AFTER DELETE ON scenario_labor_input BEGIN
+  UPDATE scenario_catalog SET headcount=(
+    SELECT COALESCE(SUM(headcount), 0) FROM scenario_labor_input WHERE scenario_id = OLD.scenario_id
+  ) WHERE scenario_id = OLD.scenario_id;
+END;
+
+-- 집계 결과 저장·삭제 → 총액
+CREATE TRIGGER IF NOT EXISTS trg_scenario_catalog_result_ins AFTER INSERT ON calculation_result BEGIN
+  UPDATE scenario_catalog SET grand_total=(
+    CASE WHEN json_valid(NEW.result_json) THEN json_extract(NEW.result_json, '$.aggregator.grand_total') END
+  ) WHERE scenario_id = NEW.scenario_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_scenario_catalog_result_upd AFTER UPDATE OF result_json ON calculation_result BEGIN
+  UPDATE scenario_catalog SET grand_total=(
+    CASE WHEN json_valid(NEW.result_json) THEN json_extract(NEW.result_json, '$.aggregator.grand_total') END
+  ) WHERE scenario_id = NEW.scenario_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_scenario_catalog_result_del AFTER DELETE ON calculation_result BEGIN
+  UPDATE scenario_catalog SET grand_total=NULL WHERE scenario_id = OLD.scenario_id;
+END;
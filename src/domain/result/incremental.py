@@ -0,0 +1,195 @@
+"""
+직무 행 단위 증분 노무비 모델.
+
+직무별 인원 테이블에서 셀 하나를 고치면 기존에는 전체 직무를 두 번(_calculate_labor ×2) 다시 계산했다.
+이 모델은 직무별 결과와 합계 벡터를 보관하고, 입력이 바뀐 직무만 다시 계산해
+합계(노무비·보험 7종)에 차이분만 반영한다. 결과는 UI 갱신에 필요한 최소 변경 집합으로 돌려준다.
+
+계산 규칙은 result.service._calculate_labor와 동일하다 (같은 직무 단위 함수를 사용).
+"""
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+
+from src.domain.calculator.labor_result import LaborResult
+from src.domain.result.service import (
+    _build_insurance_by_exp_code,
+    _calculate_role_labor,
+    _insurance_aggregate,
+    _labor_row,
+    _labor_wage_year,
+    load_ui_job_roles_and_rates,
+)
+from src.domain.wage_manager import WageManager, get_wage_manager
+
+
+@dataclass
+class LaborChangeSet:
+    """
+    증분 계산 결과.
+    changed_rows: 행이 바뀐 직무코드 → 새 행 (행이 사라졌으면 None)
+    labor_total: 노무비 합계 (보험료 포함, calculate_result의 labor_total과 같은 기준)
+    role_total: 노무비 상세 행 role_total 합 (UI 자동계산 요약·경비 상세 기준)
+    insurance_changed: 금액이 바뀐 보험 exp_code → 새 금액
+    """
+    changed_rows: dict[str, dict | None] = field(default_factory=dict)
+    labor_total: int = 0
+    role_total: int = 0
+    labor_total_changed: bool = False
+    insurance_changed: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.changed_rows and not self.labor_total_changed and not self.insurance_changed
+
+    @property
+    def expense_affected(self) -> bool:
+        """경비 상세 재계산 필요 여부 (노무비 합계 또는 보험 7종 변경)."""
+        return self.labor_total_changed or bool(self.insurance_changed)
+
+
+class IncrementalLaborModel:
+    """직무별 노무비 결과·합계 보관. update()는 입력이 바뀐 직무만 재계산한다."""
+
+    def __init__(self, job_roles: list, job_rates: dict, wage_year: int | None = None,
+                 roles_from_inputs: bool = False, wage_manager: WageManager | None = None):
+        self._roles = {role.job_code: role for role in job_roles}
+        self._order = [role.job_code for role in job_roles]
+        self._job_rates = dict(job_rates)
+        self._wage_year = _labor_wage_year({"wage_year": wage_year})
+        # DB에 직무가 없어 입력 직무코드로 대체한 경우: 새 직무코드가 들어오면 목록에 추가
+        self._roles_from_inputs = roles_from_inputs
+        self._wage_manager = wage_manager or get_wage_manager()
+        self._wage_signature = self._wage_manager.signature
+        self._inputs: dict[str, dict] = {}
+        self._results: dict[str, LaborResult] = {}
+        self._rows: dict[str, dict] = {}
+        self._sum = LaborResult()
+        self._role_total = 0
+
+    @classmethod
+    def from_scenario(cls, scenario_id: str, conn, job_inputs: dict | None = None,
+                      wage_year: int | None = None) -> "IncrementalLaborModel":
+        """DB의 직무·단가로 모델 생성 후 job_inputs가 있으면 전체 계산."""
+        job_roles, job_rates, roles_from_inputs = load_ui_job_roles_and_rates(
+            job_inputs or {}, scenario_id, conn
+        )
+        model = cls(job_roles, job_rates, wage_year=wage_year, roles_from_inputs=roles_from_inputs)
+        if job_inputs:
+            model.update(job_inputs)
+        return model
+
+    # ---- 조회 ----
+
+    @property
+    def labor_total(self) -> int:
+        return self._sum.total_labor_cost
+
+    @property
+    def role_total(self) -> int:
+        return self._role_total
+
+    def labor_rows(self) -> list[dict]:
+        """직무 순서대로 노무비 상세 행 (계산 없이 보관값 나열)."""
+        rows = self._rows
+        return [rows[code] for code in self._order if code in rows]
+
+    def insurance_by_exp_code(self) -> dict[str, int]:
+        return _build_insurance_by_exp_code(_insurance_aggregate(self._sum))
+
+    # ---- 갱신 ----
+
+    def update(self, job_inputs: dict) -> LaborChangeSet:
+        """
+        UI 전체 입력과 보관 입력을 비교해 바뀐 직무만 재계산.
+        비교는 직무 수만큼 dict 비교, 계산은 바뀐 직무 수만큼만 수행한다.
+        """
+        # 단가/매핑 파일이 바뀌어 재로드됐으면 전체 직무 재계산
+        wages_changed = self._revalidate_wages()
+        changed = [
+            code for code, values in job_inputs.items()
+            if wages_changed or self._inputs.get(code) != values
+        ]
+        removed = [code for code in self._inputs if code not in job_inputs]
+        return self._apply(
+            [(code, job_inputs[code]) for code in changed] + [(code, None) for code in removed]
+        )
+
+    def set_role(self, job_code: str, values: dict | None) -> LaborChangeSet:
+        """직무 1건 입력 변경 (None이면 제거). 재계산은 해당 직무 1건."""
+        if self._revalidate_wages():
+            job_inputs = dict(self._inputs)
+            if values is None:
+                job_inputs.pop(job_code, None)
+            else:
+                job_inputs[job_code] = values
+            return self._apply(
+                [(code, v) for code, v in job_inputs.items()]
+                + [(code, None) for code in self._inputs if code not in job_inputs]
+            )
+        if self._inputs.get(job_code) == values:
+            return self._apply([])
+        return self._apply([(job_code, values)])
+
+    def _apply(self, edits: list) -> LaborChangeSet:
+        before_total = self._sum.total_labor_cost
+        before_role_total = self._role_total
+        before_insurance = self.insurance_by_exp_code()
+        changes = LaborChangeSet()
+
+        for job_code, values in edits:
+            if values is None:
+                self._inputs.pop(job_code, None)
+            else:
+                self._inputs[job_code] = dict(values)
+            role = self._role(job_code, values)
+            old_result = self._results.pop(job_code, None)
+            new_result = None
+            if role is not None:
+                new_result = _calculate_role_labor(
+                    role, values, self._job_rates, self._wage_year, self._wage_manager
+                )
+            # 합계 벡터에 차이분만 반영
+            if old_result is not None:
+                self._sum.add(old_result, -1)
+            if new_result is not None:
+                self._sum.add(new_result)
+                self._results[job_code] = new_result
+
+            old_row = self._rows.pop(job_code, None)
+            new_row = None
+            if new_result is not None:
+                # 직무 1건 컨텍스트이므로 job_lines는 1줄
+                new_row = _labor_row(new_result.job_lines[0], role)
+                self._rows[job_code] = new_row
+            if old_row != new_row:
+                changes.changed_rows[job_code] = new_row
+                self._role_total += (new_row["role_total"] if new_row else 0) - (old_row["role_total"] if old_row else 0)
+
+        changes.labor_total = self._sum.total_labor_cost
+        changes.role_total = self._role_total
+        changes.labor_total_changed = (
+            changes.labor_total != before_total or changes.role_total != before_role_total
+        )
+        after_insurance = self.insurance_by_exp_code()
+        changes.insurance_changed = {
+            exp_code: amount
+            for exp_code, amount in after_insurance.items()
+            if before_insurance.get(exp_code) != amount
+        }
+        return changes
+
+    def _revalidate_wages(self) -> bool:
+        """단가/매핑 파일 stat 확인. 마지막 계산 이후 재로드됐으면 True."""
+        self._wage_manager.refresh_if_stale()
+        if self._wage_manager.signature == self._wage_signature:
+            return False
+        self._wage_signature = self._wage_manager.signature
+        return True
+
+    def _role(self, job_code: str, values: dict | None):
+        role = self._roles.get(job_code)
+        if role is None and self._roles_from_inputs and values is not None:
+            role = SimpleNamespace(job_code=job_code, job_name=job_code, is_active=1)
+            self._roles[job_code] = role
+            self._order.append(job_code)
+        return role
@@ -0,0 +1,178 @@
+"""
+전체 시나리오(현장) 포트폴리오 집계.
+
+노임단가 기준년도·요율이 바뀌면 모든 현장을 다시 집계해야 하는데,
+calculate_result를 시나리오마다 순서대로 부르면 코어 1개만 쓴다.
+aggregate_portfolio()는 시나리오 ID를 샤드로 나눠 프로세스 풀에서 계산하고
+(작업 프로세스마다 읽기 전용 WAL 연결 1개와 미리 읽어 둔 노임단가·설정 캐시를 유지),
+부모 프로세스가 결과 저장을 트랜잭션 1개로 모아 기록한다.
+직무코드별·경비 그룹별 합계(포트폴리오 롤업)도 함께 돌려준다.
+"""
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from src.domain.aggregator import Aggregator, Number
+from src.domain.constants.expense_groups import GROUP_FIXED, GROUP_PASSTHROUGH, GROUP_VARIABLE
+from src.domain.db import connection_db_file, get_connection, open_readonly_connection
+from src.domain.result.service import calculate_result, save_result_snapshots
+from src.domain.scenario_input.service import list_scenarios
+from src.domain.settings_manager import get_full_config
+from src.domain.wage_manager import get_wage_manager
+from src.utils import tracing
+
+# 작업 프로세스 1개당 샤드 수 (계산 시간이 고르지 않은 시나리오 간 부하 분산)
+SHARDS_PER_WORKER = 4
+
+# 작업 프로세스 상태 (_init_worker에서 설정)
+_worker_conn = None
+
+
+@dataclass
+class JobRollup:
+    """직무코드별 포트폴리오 합계."""
+    job_code: str
+    job_name: str = ""
+    headcount: Number = 0
+    total: Number = 0
+    scenario_count: int = 0
+
+
+@dataclass
+class PortfolioResult:
+    """
+    results: scenario_id → calculate_result 형식 결과 (요청 순서)
+    errors: scenario_id → 오류 메시지 (계산 실패)
+    written: 이번에 calculation_result에 기록한 시나리오 수 (입력 해시가 같으면 기록 생략)
+    """
+    results: dict[str, dict] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    job_rollup: dict[str, JobRollup] = field(default_factory=dict)
+    group_rollup: dict[str, Number] = field(default_factory=dict)
+    written: int = 0
+
+    @property
+    def totals(self) -> dict[str, Aggregator]:
+        return {scenario_id: result["aggregator"] for scenario_id, result in self.results.items()}
+
+    @property
+    def grand_total(self) -> Number:
+        return sum(result["aggregator"].grand_total for result in self.results.values())
+
+
+def _init_worker(db_path: str) -> None:
+    """작업 프로세스 시작 시 1회: 읽기 전용 연결과 노임단가·설정 캐시 준비."""
+    global _worker_conn
+    # 계산 경로 안에서 get_connection()을 쓰더라도 같은 DB를 보도록
+    os.environ["COSTCALC_DB_PATH"] = db_path
+    _worker_conn = open_readonly_connection(db_path)
+    # spawn 프로세스는 부모의 측정 설정을 물려받지 않으므로 환경변수로 다시 설정
+    tracing.configure_from_env()
+    get_wage_manager()
+    get_full_config()
+
+
+def _compute_shard(scenario_ids: list[str]) -> list[tuple[str, dict | None, str | None]]:
+    """샤드 계산 (DB 쓰기 없음). 시나리오별 (scenario_id, 결과, 오류)."""
+    return [_compute_one(_worker_conn, scenario_id) for scenario_id in scenario_ids]
+
+
+def _compute_one(conn, scenario_id: str) -> tuple[str, dict | None, str | None]:
+    try:
+        return scenario_id, calculate_result(scenario_id, conn, persist=False), None
+    except Exception as exc:
+        logging.exception("포트폴리오 집계 실패: 시나리오=%s", scenario_id)
+        return scenario_id, None, str(exc)
+
+
+def _shards(scenario_ids: list[str], count: int) -> list[list[str]]:
+    """연속 구간으로 count개 이하 샤드 분할."""
+    count = max(1, min(count, len(scenario_ids)))
+    size, extra = divmod(len(scenario_ids), count)
+    shards, start = [], 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        shards.append(scenario_ids[start:end])
+        start = end
+    return shards
+
+
+def build_rollups(results: dict[str, dict]) -> tuple[dict[str, JobRollup], dict[str, Number]]:
+    """직무코드별(job_breakdown 합계) · 경비 그룹별(집계 금액) 롤업."""
+    jobs: dict[str, JobRollup] = {}
+    groups: dict[str, Number] = {GROUP_FIXED: 0, GROUP_VARIABLE: 0, GROUP_PASSTHROUGH: 0}
+    for result in results.values():
+        seen: set[str] = set()
+        for line in result.get("job_breakdown") or []:
+            job_code = line.get("job_code") or ""
+            rollup = jobs.get(job_code)
+            if rollup is None:
+                rollup = jobs[job_code] = JobRollup(job_code, line.get("job_name") or "")
+            rollup.headcount += line.get("headcount") or 0
+            rollup.total += line.get("total") or 0
+            if job_code not in seen:
+                seen.add(job_code)
+                rollup.scenario_count += 1
+        aggregator = result["aggregator"]
+        groups[GROUP_FIXED] += aggregator.fixed_expense_total
+        groups[GROUP_VARIABLE] += aggregator.variable_expense_total
+        groups[GROUP_PASSTHROUGH] += aggregator.passthrough_expense_total
+    return jobs, groups
+
+
+def aggregate_portfolio(
+    scenario_ids: list[str] | None = None,
+    conn=None,
+    jobs: int | None = None,
+    persist: bool = True,
+) -> PortfolioResult:
+    """
+    여러 시나리오 집계. scenario_ids=None이면 저장된 모든 시나리오.
+    jobs: 작업 프로세스 수 (None = CPU 코어 수, 1 = 현재 프로세스에서 순서대로).
+    persist=True면 바뀐 결과만 트랜잭션 1개로 calculation_result에 기록한다.
+    """
+    external_conn = conn is not None
+    if conn is None:
+        conn = get_connection()
+    try:
+        if scenario_ids is None:
+            scenario_ids = [scenario_id for scenario_id, _ in list_scenarios(conn)]
+        scenario_ids = list(dict.fromkeys(scenario_ids))
+        jobs = jobs or os.cpu_count() or 1
+        db_path = connection_db_file(conn)
+        # 미커밋 변경은 다른 프로세스에서 보이지 않으므로 먼저 커밋된 상태여야 한다
+        if jobs > 1 and len(scenario_ids) > 1 and db_path and not conn.in_transaction:
+            workers = min(jobs, len(scenario_ids))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(db_path,),
+            ) as pool:
+                outcomes = [
+                    item
+                    for shard in pool.map(_compute_shard, _shards(scenario_ids, workers * SHARDS_PER_WORKER))
+                    for item in shard
+                ]
+        else:
+            outcomes = [_compute_one(conn, scenario_id) for scenario_id in scenario_ids]
+
+        portfolio = PortfolioResult()
+        for scenario_id, result, error in outcomes:
+            if error is not None:
+                portfolio.errors[scenario_id] = error
+            else:
+                portfolio.results[scenario_id] = result
+        portfolio.job_rollup, portfolio.group_rollup = build_rollups(portfolio.results)
+        if persist:
+            portfolio.written = save_result_snapshots(conn, portfolio.results)
+        logging.info(
+            "포트폴리오 집계 완료: 시나리오=%d 실패=%d 저장=%d 작업자=%d",
+            len(portfolio.results), len(portfolio.errors), portfolio.written, jobs,
+        )
+        return portfolio
+    finally:
+        if not external_conn:
+            conn.close()
@@ -0,0 +1,244 @@
+"""
+UI 재계산 스케줄러.
+
+직무별 인원·경비입력 편집마다 UI 스레드에서 RecalcSession을 돌리면 계산하는 동안 입력이 멈춘다.
+RecalcScheduler는 UI가 넘긴 입력 스냅샷(RecalcRequest)을 작업 스레드 1개에서 계산하고,
+결과를 dispatch로 UI 스레드에 넘긴다.
+
+- 요청 종류는 우선순위를 가진다: RECALC_FULL(노무비·보험 7종·경비) ⊃ RECALC_EXPENSE(경비상세만).
+  아직 UI에 반영되지 않은 요청의 종류는 다음 요청에 합쳐지므로, 전체 재계산 뒤에 경비 재계산이
+  들어와도 전체 재계산으로 처리된다.
+- 대기 중인 요청은 1개만 유지하고 새 요청이 오면 입력을 최신 스냅샷으로 교체한다.
+- 세대(generation) 번호로 최신 요청의 결과만 반영하고, 그 사이 더 새 요청(또는 편집)이 있었으면 버린다.
+- 결과를 버릴 수 있으므로 세션이 계산한 변경분(labor_changes)이 아니라 UI에 마지막으로 반영한 결과와
+  비교한 변경분(RecalcOutcome.ui_changes)을 전달 시점에 채운다.
+
+세션은 작업 스레드에서만 만들고 사용한다 (RecalcSession은 스레드 안전하지 않음).
+Qt에 의존하지 않으며 dispatch는 UI가 제공한다.
+"""
+import logging
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Callable
+
+from src.domain.db import get_connection
+from src.domain.result.session import RecalcResult, RecalcSession
+from src.utils.tracing import span, traced
+
+# 요청 종류 (값이 클수록 우선, 큰 쪽이 작은 쪽 계산을 포함)
+RECALC_EXPENSE = 1  # 경비입력 수량/단가 변경 → 경비상세만
+RECALC_FULL = 2     # 직무별 인원 변경 → 노무비 → 보험 7종 → 경비입력·경비상세
+
+
+def _call_now(fn: Callable[[], None]) -> None:
+    fn()
+
+
+@dataclass(frozen=True)
+class RecalcRequest:
+    """UI 스레드에서 뜬 입력 스냅샷. 작업 스레드는 위젯 대신 이 값만 읽는다."""
+    kind: int
+    scenario_id: str
+    wage_year: int | None
+    job_inputs: dict
+    user_sub_items: dict[str, list] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class UiChanges:
+    """UI에 마지막으로 반영한 결과 대비 바뀐 부분. 반영한 결과가 없으면 모두 True."""
+    labor_rows: bool = True
+    labor_total: bool = True
+    expenses: bool = True
+
+
+@dataclass(frozen=True)
+class RecalcOutcome:
+    """요청 1건의 계산 결과. kind=RECALC_FULL이면 result, RECALC_EXPENSE면 expense_rows만 채워진다."""
+    request: RecalcRequest
+    generation: int
+    rebuilt: bool
+    expense_items: tuple
+    result: RecalcResult | None = None
+    expense_rows: tuple = ()
+    ui_changes: UiChanges = UiChanges()
+
+    @property
+    def total_headcount(self):
+        return sum(v.get("headcount", 0) for v in self.request.job_inputs.values())
+
+
+class RecalcScheduler:
+    """재계산 요청을 합치고 작업 스레드에서 계산해 최신 결과만 on_result로 전달."""
+
+    def __init__(
+        self,
+        on_result: Callable[[RecalcOutcome], None],
+        on_error: Callable[[RecalcRequest, Exception], None],
+        dispatch: Callable[[Callable[[], None]], None] | None = None,
+        executor: Executor | None = None,
+        connect: Callable[[], object] = get_connection,
+        session_factory: Callable[..., RecalcSession] = RecalcSession,
+    ) -> None:
+        self._on_result = on_result
+        self._on_error = on_error
+        self._dispatch = dispatch or _call_now
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="recalc")
+        self._connect = connect
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._owed_kind = 0  # 아직 UI에 반영되지 않은 요청 종류 중 가장 높은 것
+        self._pending: tuple[RecalcRequest, int] | None = None
+        self._draining = False
+        # UI 스레드 전용: 마지막으로 UI에 반영한 결과 (ui_changes 비교 기준)
+        self._applied: RecalcResult | None = None
+        self._applied_expense_rows: tuple | None = None
+        self._applied_expense_items: tuple | None = None
+        # 세션 무효화 세대: invalidate_session()마다 증가 (_lock 보호)
+        self._session_epoch = 0
+        # 작업 스레드 전용
+        self._session: RecalcSession | None = None
+        self._session_key = None
+        self._session_built_epoch = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def mark_pending(self, kind: int) -> None:
+        """
+        편집 발생 (디바운스 대기 시작). 계산 중인 결과는 더 이상 최신이 아니므로 버리게 하고,
+        종류만 기록해 두었다가 다음 submit에 합친다.
+        """
+        with self._lock:
+            self._generation += 1
+            self._owed_kind = max(self._owed_kind, kind)
+
+    def submit(self, request: RecalcRequest) -> int:
+        """요청 등록 후 세대 번호 반환. 대기 중인 요청이 있으면 최신 스냅샷으로 교체한다."""
+        with self._lock:
+            self._generation += 1
+            self._owed_kind = max(self._owed_kind, request.kind)
+            request = replace(request, kind=self._owed_kind)
+            self._pending = (request, self._generation)
+            start = not self._draining
+            self._draining = True
+        if start:
+            self._executor.submit(self._drain)
+        return self._generation
+
+    def cancel(self) -> None:
+        """
+        대기·계산 중인 요청의 결과를 모두 버린다. 반영되지 않은 종류도 잊는다 (UI 스레드).
+        취소 후에는 집계·불러오기가 위젯을 직접 채우므로 다음 결과는 전부 반영하게 한다.
+        """
+        with self._lock:
+            self._generation += 1
+            self._owed_kind = 0
+            self._pending = None
+        self._forget_applied()
+
+    def invalidate_session(self) -> None:
+        """저장·불러오기·설정 변경 후 호출 (UI 스레드). 다음 계산에서 세션을 새로 만든다."""
+        with self._lock:
+            self._session_epoch += 1
+        self._forget_applied()
+
+    def _forget_applied(self) -> None:
+        self._applied = None
+        self._applied_expense_rows = None
+        self._applied_expense_items = None
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.cancel()
+        self._executor.shutdown(wait=wait)
+
+    def _is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def _drain(self) -> None:
+        # 작업 스레드: 대기 중인 요청이 없어질 때까지 최신 요청만 계산
+        while True:
+            with self._lock:
+                if self._pending is None:
+                    self._draining = False
+                    return
+                request, generation = self._pending
+                self._pending = None
+            try:
+                outcome = self._compute(request, generation)
+            except Exception as exc:
+                logging.exception("재계산 스케줄러: 계산 실패 시나리오=%s", request.scenario_id)
+                self._deliver(generation, lambda exc=exc, request=request: self._on_error(request, exc))
+                continue
+            self._deliver(generation, lambda outcome=outcome: self._on_result(self._mark_applied(outcome)))
+
+    def _deliver(self, generation: int, fn: Callable[[], None]) -> None:
+        """UI 쪽에서 최신 세대일 때만 fn() 호출. 반영되면 밀린 요청 종류를 비운다."""
+        def deliver() -> None:
+            with self._lock:
+                if not self._is_current(generation):
+                    return
+                self._owed_kind = 0
+            fn()
+        self._dispatch(deliver)
+
+    def _mark_applied(self, outcome: RecalcOutcome) -> RecalcOutcome:
+        """
+        UI 스레드: 마지막으로 반영한 결과와 비교해 ui_changes를 채우고 반영 기준을 갱신한다.
+        버려진 결과나 합쳐진 경비 편집이 있어도 실제 화면 상태 기준으로 갱신 여부를 판단한다.
+        """
+        expenses = (
+            outcome.expense_rows != self._applied_expense_rows
+            or outcome.expense_items != self._applied_expense_items
+        )
+        result = outcome.result
+        if result is None:
+            changes = UiChanges(labor_rows=False, labor_total=False, expenses=expenses)
+        else:
+            previous = self._applied
+            changes = UiChanges(
+                labor_rows=previous is None or result.labor_rows != previous.labor_rows,
+                labor_total=previous is None or result.role_total != previous.role_total,
+                expenses=(
+                    expenses
+                    or previous is None
+                    or dict(result.sub_items_by_exp) != dict(previous.sub_items_by_exp)
+                ),
+            )
+            self._applied = result
+        self._applied_expense_rows = outcome.expense_rows
+        self._applied_expense_items = outcome.expense_items
+        return replace(outcome, ui_changes=changes)
+
+    def _session_for(self, scenario_id: str, wage_year) -> tuple[RecalcSession, bool]:
+        key = (scenario_id, wage_year)
+        with self._lock:
+            epoch = self._session_epoch
+        rebuilt = self._session is None or self._session_built_epoch != epoch or self._session_key != key
+        if rebuilt:
+            conn = self._connect()
+            try:
+                with span("recalc_session.build"):
+                    session = self._session_factory(scenario_id, conn, wage_year=wage_year)
+            finally:
+                conn.close()
+            # 새 세션을 만든 뒤에만 최신으로 표시: 생성이 실패하면 다음 계산에서 다시 만들고,
+            # 생성 중 들어온 무효화는 epoch가 달라져 다음 계산에 반영된다
+            self._session = session
+            self._session_key = key
+            self._session_built_epoch = epoch
+        return self._session, rebuilt
+
+    @traced("recalc.compute")
+    def _compute(self, request: RecalcRequest, generation: int) -> RecalcOutcome:
+        session, rebuilt = self._session_for(request.scenario_id, request.wage_year)
+        expense_items = tuple(session.expense_items)
+        if request.kind >= RECALC_FULL:
+            result = session.recalculate(request.job_inputs, user_sub_items=request.user_sub_items)
+            return RecalcOutcome(request, generation, rebuilt, expense_items, result, result.expense_rows)
+        session.labor.update(request.job_inputs)
+        expense_rows = session.expense_rows_for(request.user_sub_items, session.labor.role_total)
+        return RecalcOutcome(request, generation, rebuilt, expense_items, expense_rows=tuple(expense_rows))
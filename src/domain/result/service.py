@@ -1,59 +1,98 @@
+import hashlib
 import json
+from dataclasses import fields
 from decimal import Decimal
+from types import SimpleNamespace
 
 from src.domain.context.calc_context import CalcContext
 from src.domain.calculator.labor import LaborCostCalculator
+from src.domain.calculator.labor_result import LaborResult
 from src.domain.calculator.expense import ExpenseCostCalculator
 from src.domain.aggregator import Aggregator
-from src.domain.masterdata.repo import MasterDataRepo
+from src.domain.masterdata.bundle import ScenarioBundle, load_scenario_bundle
 from src.domain.constants.expense_groups import category_label
 from src.domain.scenario_input.service import get_scenario_input
 from src.domain.db import get_connection
-from src.domain.settings_manager import get_safety_management_rate
-from src.domain.wage_manager import WageManager
+from src.domain.settings_manager import get_full_config, get_safety_management_rate
+from src.domain.wage_manager import WageManager, get_wage_manager
+from src.utils.tracing import span, traced
 
 
 DEFAULT_WEEKLY_HOLIDAY_DAYS = Decimal("4.33")
 DEFAULT_ANNUAL_LEAVE_DAYS = Decimal("1.25")
 
+# 계산식(노무비·경비·집계)을 바꾸면 올린다. 저장된 집계 결과의 입력 해시가 달라져 다시 계산된다.
+CALCULATION_VERSION = "2026.10.1"
 
-def calculate_result(scenario_id: str, conn=None, overhead_rate: float = 0.0, profit_rate: float = 0.0) -> dict:
+
+@traced("calculate_result")
+def calculate_result(
+    scenario_id: str,
+    conn=None,
+    overhead_rate: float = 0.0,
+    profit_rate: float = 0.0,
+    persist: bool = True,
+    use_cache: bool = True,
+) -> dict:
+    """
+    시나리오 집계. 입력 해시가 저장된 결과와 같으면 저장된 결과를 돌려준다.
+    persist=False면 다시 계산하더라도 calculation_result에 기록하지 않는다 (비교 등 읽기 전용).
+    use_cache=False면 저장된 결과를 쓰지 않고 항상 다시 계산한다 (저장 결과 검증용).
+    """
     external_conn = conn is not None
     if conn is None:
         conn = get_connection()
-    canonical = get_scenario_input(scenario_id, conn)
+    try:
+        return _calculate_result(scenario_id, conn, overhead_rate, profit_rate, persist, use_cache)
+    finally:
+        if not external_conn:
+            conn.close()
+
+
+def _calculate_result(
+    scenario_id: str,
+    conn,
+    overhead_rate: float,
+    profit_rate: float,
+    persist: bool,
+    use_cache: bool,
+) -> dict:
+    with span("get_scenario_input"):
+        canonical = get_scenario_input(scenario_id, conn)
     # canonical에 저장된 비율을 파라미터 미지정 시 fallback으로 사용
     if overhead_rate == 0.0 and canonical.get("overhead_rate"):
         overhead_rate = float(canonical["overhead_rate"])
     if profit_rate == 0.0 and canonical.get("profit_rate"):
         profit_rate = float(canonical["profit_rate"])
-    repo = MasterDataRepo(conn)
-    job_roles = repo.get_job_roles(scenario_id)
-    rates_source = repo.get_job_rates(scenario_id)
-    if isinstance(rates_source, dict):
-        rates_iter = rates_source.values()
-    else:
-        rates_iter = rates_source
-    job_rates = {r.job_code: r.wage_day for r in rates_iter}
-    expense_items = repo.get_expense_items(scenario_id)
-    pricebook = repo.get_expense_pricebook(scenario_id)
-
-    # 세부 항목 로드 (exp_code별 그룹핑)
-    all_sub_items = repo.get_expense_sub_items(scenario_id)
-    sub_items_map: dict[str, list] = {}
-    for si in all_sub_items:
-        sub_items_map.setdefault(si.exp_code, []).append(si)
-
-    labor_rows, labor_total, job_breakdown, insurance_aggregate = _calculate_labor(
-        canonical, job_roles, job_rates
-    )
+    with span("load_scenario_bundle"):
+        bundle = load_scenario_bundle(conn, scenario_id)
+    # 입력·마스터데이터·노임단가·설정이 지난 집계와 같으면 저장된 결과 사용 (계산·저장 생략)
+    with span("result_cache_lookup") as lookup:
+        input_hash = calculation_input_hash(canonical, bundle, overhead_rate, profit_rate)
+        cached = _load_result_for_hash(conn, scenario_id, input_hash) if use_cache else None
+        lookup.set(hit=cached is not None)
+    if cached is not None:
+        return cached
+    job_roles = list(bundle.job_roles)
+    job_rates = dict(bundle.wage_day_map)
+    expense_items = list(bundle.expense_items)
+    pricebook = list(bundle.pricebook)
+    # 세부 항목 (exp_code별 그룹핑)
+    sub_items_map = bundle.sub_items_map()
+
+    with span("calculate_labor"):
+        labor_rows, labor_total, job_breakdown, insurance_aggregate = _calculate_labor(
+            canonical, job_roles, job_rates
+        )
     insurance_by_exp_code = _build_insurance_by_exp_code(insurance_aggregate)
-    expense_rows, fixed_total, variable_total, passthrough_total = _calculate_expenses(
-        canonical, expense_items, pricebook, sub_items_map,
-        labor_total=labor_total,
-        insurance_by_exp_code=insurance_by_exp_code,
-        expense_items=expense_items,
-    )
+    with span("calculate_expenses"):
+        expense_rows, fixed_total, variable_total, passthrough_total = _calculate_expenses(
+            canonical, expense_items, pricebook, sub_items_map,
+            labor_total=labor_total,
+            insurance_by_exp_code=insurance_by_exp_code,
+            expense_items=expense_items,
+            price_map=dict(bundle.price_map),
+        )
 
     # Calculate overhead and profit based on rates
     # Overhead base: labor + fixed expenses
@@ -79,13 +118,65 @@ def calculate_result(scenario_id: str, conn=None, overhead_rate: float = 0.0, pr
         "expense_rows": expense_rows,
         "job_breakdown": job_breakdown,
         "insurance_by_exp_code": insurance_by_exp_code,
+        "input_hash": input_hash,
     }
-    _save_result_snapshot(conn, scenario_id, result)
-    if not external_conn:
-        conn.close()
+    if persist:
+        _save_result_snapshot(conn, scenario_id, result)
     return result
 
 
+def calculation_input_hash(
+    canonical: dict,
+    bundle: ScenarioBundle,
+    overhead_rate: float,
+    profit_rate: float,
+) -> str | None:
+    """
+    집계 입력 해시: canonical 입력, 마스터데이터 revision, 노임단가 내용, 설정(요율), 계산 버전.
+    revision을 알 수 없는 DB(리비전 테이블 없음)는 None (캐시하지 않음).
+    """
+    if bundle.revision is None:
+        return None
+    payload = {
+        "version": CALCULATION_VERSION,
+        "scenario_id": bundle.scenario_id,
+        "revision": bundle.revision,
+        "canonical": canonical,
+        "overhead_rate": overhead_rate,
+        "profit_rate": profit_rate,
+        "wages": get_wage_manager().content_hash,
+        "config": get_full_config(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _load_result_for_hash(conn, scenario_id: str, input_hash: str | None) -> dict | None:
+    """저장된 결과의 입력 해시가 같으면 calculate_result 형식으로 돌려준다."""
+    if input_hash is None:
+        return None
+    row = conn.execute(
+        "SELECT result_json FROM calculation_result WHERE scenario_id=? AND input_hash=?",
+        (scenario_id, input_hash),
+    ).fetchone()
+    if row is None:
+        return None
+    try:
+        snapshot = load_result_json(row[0])
+        agg = snapshot["aggregator"]
+        aggregator = Aggregator(**{f.name: agg[f.name] for f in fields(Aggregator)})
+    except (TypeError, ValueError, KeyError):
+        return None
+    return {
+        "aggregator": aggregator,
+        "labor_rows": snapshot.get("labor_rows") or [],
+        "expense_rows": snapshot.get("expense_rows") or [],
+        "job_breakdown": snapshot.get("job_breakdown") or [],
+        "insurance_by_exp_code": snapshot.get("insurance_by_exp_code") or {},
+        "input_hash": input_hash,
+    }
+
+
 # 노무비 인적보험 항목별 키 → 경비코드(exp_code) 매핑
 LABOR_INSURANCE_TO_EXP_CODE = {
     "industrial_accident": "FIX_INS_INDUST",
@@ -100,91 +191,101 @@ LABOR_INSURANCE_TO_EXP_CODE = {
 
 def _calculate_labor(canonical: dict, job_roles: list, job_rates: dict) -> tuple[list[dict], int, list[dict], dict]:
     labor_inputs = canonical.get("labor", {}).get("job_roles", {})
-    total = 0
+    # 직무별 결과 벡터 합산 (총액·보험 7종)
+    labor_sum = LaborResult()
     rows: list[dict] = []
     job_breakdown: list[dict] = []
-    insurance_aggregate: dict[str, int] = {
-        k: 0 for k in LABOR_INSURANCE_TO_EXP_CODE
-    }
-    # 노무비 상세 기본급 계산 시 일급: data/wages_master.json의 md_basic 적용 (있으면), 없으면 DB 단가
-    wage_year = canonical.get("wage_year") or canonical.get("base_year") or 2025
-    wage_year = int(wage_year) if wage_year else 2025
-    wage_manager = WageManager()
+    wage_year = _labor_wage_year(canonical)
+    wage_manager = get_wage_manager()
 
     for role in job_roles:
-        if not role.is_active:
-            continue
-        values = labor_inputs.get(role.job_code)
-        if not isinstance(values, dict):
+        labor_result = _calculate_role_labor(
+            role, labor_inputs.get(role.job_code), job_rates, wage_year, wage_manager
+        )
+        if labor_result is None:
             continue
+        labor_sum.add(labor_result)
+        for line in labor_result.job_lines:
+            rows.append(_labor_row(line, role))
+            job_breakdown.append(_job_breakdown_row(line))
 
-        headcount = Decimal(str(values.get("headcount", 0)))
-        work_days = Decimal(str(values.get("work_days", 0)))
-        work_hours = Decimal(str(values.get("work_hours", 0)))
-        overtime_hours = Decimal(str(values.get("overtime_hours", 0)))
-        holiday_work_days = Decimal(str(values.get("holiday_work_days", values.get("holiday_work_hours", 0))))
-        if headcount == 0:
-            continue
+    return rows, labor_sum.total_labor_cost, job_breakdown, _insurance_aggregate(labor_sum)
+
+
+def _labor_wage_year(canonical: dict) -> int:
+    # 노무비 상세 기본급 계산 시 일급: data/wages_master.json의 md_basic 적용 (있으면), 없으면 DB 단가
+    wage_year = canonical.get("wage_year") or canonical.get("base_year") or 2025
+    return int(wage_year) if wage_year else 2025
+
+
+def _calculate_role_labor(role, values, job_rates: dict, wage_year: int, wage_manager: WageManager) -> LaborResult | None:
+    """직무 1건 노무비. 비활성·입력 없음·인원 0이면 None."""
+    if not role.is_active:
+        return None
+    if not isinstance(values, dict):
+        return None
+
+    headcount = Decimal(str(values.get("headcount", 0)))
+    work_days = Decimal(str(values.get("work_days", 0)))
+    work_hours = Decimal(str(values.get("work_hours", 0)))
+    overtime_hours = Decimal(str(values.get("overtime_hours", 0)))
+    holiday_work_days = Decimal(str(values.get("holiday_work_days", values.get("holiday_work_hours", 0))))
+    if headcount == 0:
+        return None
+
+    md_basic = wage_manager.get_md_basic(role.job_code, wage_year)
+    if md_basic is not None:
+        wage_day = Decimal(md_basic)
+    else:
+        wage_day = Decimal(str(job_rates.get(role.job_code, 0)))
+    context = CalcContext(
+        project_name=role.job_name,
+        year=2025,
+        manpower={role.job_code: headcount},
+        wage_rate={role.job_code: wage_day},
+        monthly_workdays=work_days,
+        daily_work_hours=work_hours,
+        weekly_holiday_days=DEFAULT_WEEKLY_HOLIDAY_DAYS,
+        annual_leave_days=DEFAULT_ANNUAL_LEAVE_DAYS,
+        expenses={},
+        overtime_hours=overtime_hours,
+        holiday_work_days=holiday_work_days,
+    )
+    context.job_name_map = {role.job_code: role.job_name}
+    return LaborCostCalculator(context).calculate()
+
+
+def _labor_row(line, role) -> dict:
+    """노무비 상세 테이블용: role(직무명), headcount, 기본급, 제수당, 보험료, 인건비 소계, 산정 금액"""
+    return {
+        "job_code": line.job_code,
+        "role": line.job_name or role.job_name,
+        "headcount": line.headcount,
+        "base_salary": line.base_salary,
+        "bonus": line.bonus,
+        "allowances": line.allowance,
+        "retirement": line.retirement,
+        "labor_subtotal": line.labor_subtotal,
+        "role_total": line.labor_subtotal or line.total,
+    }
+
+
+def _job_breakdown_row(line) -> dict:
+    return {
+        "job_code": line.job_code,
+        "job_name": line.job_name,
+        "headcount": line.headcount,
+        "work_days": line.work_days,
+        "base_wage": line.base_salary,
+        "allowance": line.allowance,
+        "overtime": line.overtime,
+        "total": line.total,
+    }
 
-        md_basic = wage_manager.get_md_basic(role.job_code, wage_year)
-        if md_basic is not None:
-            wage_day = Decimal(md_basic)
-        else:
-            wage_day = Decimal(str(job_rates.get(role.job_code, 0)))
-        context = CalcContext(
-            project_name=role.job_name,
-            year=2025,
-            manpower={role.job_code: headcount},
-            wage_rate={role.job_code: wage_day},
-            monthly_workdays=work_days,
-            daily_work_hours=work_hours,
-            weekly_holiday_days=DEFAULT_WEEKLY_HOLIDAY_DAYS,
-            annual_leave_days=DEFAULT_ANNUAL_LEAVE_DAYS,
-            expenses={},
-            overtime_hours=overtime_hours,
-            holiday_work_days=holiday_work_days,
-        )
-        context.job_name_map = {role.job_code: role.job_name}
-
-        labor_result = LaborCostCalculator(context).calculate()
-        total += labor_result["total_labor_cost"]
-        ins = labor_result.get("insurance", {})
-        for key in insurance_aggregate:
-            insurance_aggregate[key] += ins.get(key, 0)
-
-        for line in labor_result.get("job_lines", []):
-            # 노무비 상세 테이블용: role(직무명), headcount, 기본급, 제수당, 보험료, 인건비 소계, 산정 금액
-            def _v(obj, key, default=0):
-                if hasattr(obj, key):
-                    return getattr(obj, key, default)
-                return obj.get(key, default) if isinstance(obj, dict) else default
-            rows.append(
-                {
-                    "job_code": _v(line, "job_code", ""),
-                    "role": _v(line, "job_name", "") or role.job_name,
-                    "headcount": int(_v(line, "headcount", 0)),
-                    "base_salary": int(_v(line, "base_salary", 0)),
-                    "bonus": int(_v(line, "bonus", 0)),
-                    "allowances": int(_v(line, "allowances", 0)),
-                    "retirement": int(_v(line, "retirement", 0)),
-                    "labor_subtotal": int(_v(line, "labor_subtotal", 0)),
-                    "role_total": int(_v(line, "role_total", 0) or _v(line, "total", 0)),
-                }
-            )
-            job_breakdown.append(
-                {
-                    "job_code": line.job_code,
-                    "job_name": line.job_name,
-                    "headcount": line.headcount,
-                    "work_days": line.work_days,
-                    "base_wage": line.base_wage,
-                    "allowance": line.allowance,
-                    "overtime": line.overtime,
-                    "total": line.total,
-                }
-            )
-
-    return rows, total, job_breakdown, insurance_aggregate
+
+def _insurance_aggregate(labor_sum: LaborResult) -> dict[str, int]:
+    insurance = labor_sum.insurance_dict()
+    return {key: insurance[key] for key in LABOR_INSURANCE_TO_EXP_CODE}
 
 
 def _build_insurance_by_exp_code(insurance_aggregate: dict) -> dict[str, int]:
@@ -238,10 +339,15 @@ def _calculate_expenses(
     labor_total: int = 0,
     insurance_by_exp_code: dict = None,
     expense_items: list = None,
+    price_map: dict[str, int] = None,
+    safety_rate=None,
 ) -> tuple[list[dict], int, int, int]:
     inputs = canonical.get("expenses", {}).get("items", {})
-    price_map = _price_map(pricebook)
-    safety_rate = get_safety_management_rate()
+    # price_map/safety_rate를 미리 읽어 둔 경우(RecalcSession) 재조회하지 않음
+    if price_map is None:
+        price_map = _price_map(pricebook)
+    if safety_rate is None:
+        safety_rate = get_safety_management_rate()
     sub_items_map = dict(sub_items_map) if sub_items_map else {}
     if insurance_by_exp_code and expense_items is not None:
         _merge_labor_insurance_into_sub_items(
@@ -304,33 +410,51 @@ def get_expense_rows_for_display(
     """현재 경비 세부(sub_items_by_exp)와 노무비 합계로 경비 상세 테이블용 expense_rows 생성.
     직무 변경 시 경비입력과 동일한 보험 7종이 경비 상세에도 반영되도록 호출."""
     canonical = get_scenario_input(scenario_id, conn)
-    repo = MasterDataRepo(conn)
-    expense_items = repo.get_expense_items(scenario_id)
-    pricebook = repo.get_expense_pricebook(scenario_id)
+    bundle = load_scenario_bundle(conn, scenario_id)
+    expense_items = list(bundle.expense_items)
     expense_rows, _, _, _ = _calculate_expenses(
         canonical,
         expense_items,
-        pricebook,
+        list(bundle.pricebook),
         sub_items_map=sub_items_by_exp,
         labor_total=labor_total,
         insurance_by_exp_code=None,
         expense_items=expense_items,
+        price_map=dict(bundle.price_map),
     )
     return expense_rows
 
 
+def calculate_results_readonly(scenario_ids: list[str], conn=None) -> dict[str, dict]:
+    """여러 시나리오 집계 결과 (연결 1개, DB 쓰기 없음). 해시가 맞는 저장 결과는 재사용."""
+    external_conn = conn is not None
+    if conn is None:
+        conn = get_connection()
+    try:
+        return {
+            scenario_id: calculate_result(scenario_id, conn, persist=False)
+            for scenario_id in dict.fromkeys(scenario_ids)
+        }
+    finally:
+        if not external_conn:
+            conn.close()
+
+
 def get_result_snapshot(scenario_id: str, conn=None) -> dict | None:
     external_conn = conn is not None
     if conn is None:
         conn = get_connection()
     try:
         row = conn.execute(
-            "SELECT result_json FROM calculation_result WHERE scenario_id=?",
+            "SELECT result_json, input_hash FROM calculation_result WHERE scenario_id=?",
             (scenario_id,),
         ).fetchone()
         if row is None:
             return None
-        return json.loads(row[0])
+        snapshot = load_result_json(row[0])
+        if row[1]:
+            snapshot["input_hash"] = row[1]
+        return snapshot
     finally:
         if not external_conn:
             conn.close()
@@ -340,15 +464,10 @@ def get_insurance_by_exp_code_for_scenario(scenario_id: str, conn) -> dict[str,
     """시나리오의 직무/인원·단가로 노무비 보험료 7종 금액을 계산해 exp_code별 dict로 반환. (스냅샷 없을 때 경비입력 보험 7종 표시용)"""
     try:
         canonical = get_scenario_input(scenario_id, conn)
-        repo = MasterDataRepo(conn)
-        job_roles = repo.get_job_roles(scenario_id)
-        rates_source = repo.get_job_rates(scenario_id)
-        if isinstance(rates_source, dict):
-            rates_iter = rates_source.values()
-        else:
-            rates_iter = rates_source
-        job_rates = {r.job_code: r.wage_day for r in rates_iter}
-        _, _, _, insurance_aggregate = _calculate_labor(canonical, job_roles, job_rates)
+        bundle = load_scenario_bundle(conn, scenario_id)
+        _, _, _, insurance_aggregate = _calculate_labor(
+            canonical, list(bundle.job_roles), dict(bundle.wage_day_map)
+        )
         return _build_insurance_by_exp_code(insurance_aggregate)
     except Exception:
         return {}
@@ -357,20 +476,7 @@ def get_insurance_by_exp_code_for_scenario(scenario_id: str, conn) -> dict[str,
 def get_insurance_by_exp_code_from_ui(job_inputs: dict, scenario_id: str, conn, wage_year: int = None) -> dict[str, int]:
     """현재 UI의 직무별 입력(job_inputs)과 DB의 job_roles/rates로 보험료 7종 계산. DB 반영 없이 경비입력 탭 갱신용."""
     try:
-        repo = MasterDataRepo(conn)
-        job_roles = repo.get_job_roles(scenario_id)
-        if not job_roles and job_inputs:
-            from types import SimpleNamespace
-            job_roles = [
-                SimpleNamespace(job_code=jc, job_name=jc, is_active=1)
-                for jc in job_inputs
-            ]
-        rates_source = repo.get_job_rates(scenario_id)
-        if isinstance(rates_source, dict):
-            rates_iter = rates_source.values()
-        else:
-            rates_iter = rates_source
-        job_rates = {r.job_code: getattr(r, "wage_day", 0) for r in rates_iter} if rates_source else {}
+        job_roles, job_rates, _ = load_ui_job_roles_and_rates(job_inputs, scenario_id, conn)
         canonical = {"labor": {"job_roles": job_inputs}}
         if wage_year is not None:
             canonical["wage_year"] = wage_year
@@ -383,20 +489,7 @@ def get_insurance_by_exp_code_from_ui(job_inputs: dict, scenario_id: str, conn,
 def get_labor_rows_from_ui(job_inputs: dict, scenario_id: str, conn, wage_year: int = None) -> list[dict]:
     """현재 UI의 직무별 입력(job_inputs)과 DB의 job_roles/rates로 노무비 상세(labor_rows) 계산. DB 반영 없이 노무비 상세 탭 갱신용."""
     try:
-        repo = MasterDataRepo(conn)
-        job_roles = repo.get_job_roles(scenario_id)
-        if not job_roles and job_inputs:
-            from types import SimpleNamespace
-            job_roles = [
-                SimpleNamespace(job_code=jc, job_name=jc, is_active=1)
-                for jc in job_inputs
-            ]
-        rates_source = repo.get_job_rates(scenario_id)
-        if isinstance(rates_source, dict):
-            job_rates = {code: getattr(r, "wage_day", 0) for code, r in rates_source.items()}
-        else:
-            rates_iter = rates_source if rates_source else []
-            job_rates = {getattr(r, "job_code", ""): getattr(r, "wage_day", 0) for r in rates_iter}
+        job_roles, job_rates, _ = load_ui_job_roles_and_rates(job_inputs, scenario_id, conn)
         canonical = {"labor": {"job_roles": job_inputs}}
         if wage_year is not None:
             canonical["wage_year"] = wage_year
@@ -406,7 +499,23 @@ def get_labor_rows_from_ui(job_inputs: dict, scenario_id: str, conn, wage_year:
         return []
 
 
-def _save_result_snapshot(conn, scenario_id: str, result: dict) -> None:
+def load_ui_job_roles_and_rates(job_inputs: dict, scenario_id: str, conn) -> tuple[list, dict, bool]:
+    """UI 계산용 직무 목록·단가. DB에 직무가 없으면 job_inputs의 직무코드로 대체 (세 번째 값 True)."""
+    bundle = load_scenario_bundle(conn, scenario_id)
+    job_roles = list(bundle.job_roles)
+    roles_from_inputs = False
+    if not job_roles and job_inputs:
+        job_roles = [
+            SimpleNamespace(job_code=jc, job_name=jc, is_active=1)
+            for jc in job_inputs
+        ]
+        roles_from_inputs = True
+    job_rates = dict(bundle.wage_day_map)
+    return job_roles, job_rates, roles_from_inputs
+
+
+def _snapshot_payload(result: dict) -> str:
+    """calculate_result 결과 → calculation_result.result_json 문자열."""
     snapshot = {
         "aggregator": {
             "labor_total": result["aggregator"].labor_total,
@@ -422,20 +531,79 @@ def _save_result_snapshot(conn, scenario_id: str, result: dict) -> None:
         "job_breakdown": result["job_breakdown"],
         "insurance_by_exp_code": result.get("insurance_by_exp_code") or {},
     }
-    def _json_default(obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
-
-    payload = json.dumps(snapshot, ensure_ascii=True, default=_json_default)
-    conn.execute(
-        """
-        INSERT INTO calculation_result (scenario_id, result_json, updated_at)
-        VALUES (?, ?, datetime('now'))
-        ON CONFLICT(scenario_id) DO UPDATE SET
-          result_json=excluded.result_json,
-          updated_at=datetime('now')
-        """,
-        (scenario_id, payload),
-    )
+    return dump_result_json(snapshot)
+
+
+# result_json 값 형식 표시: Decimal·tuple은 JSON 기본 변환(float·list)을 거치지 않고 그대로 복원
+_DECIMAL_TAG = "__decimal__"
+_TUPLE_TAG = "__tuple__"
+
+
+def _tag_types(obj):
+    if isinstance(obj, Decimal):
+        return {_DECIMAL_TAG: str(obj)}
+    if isinstance(obj, tuple):
+        return {_TUPLE_TAG: [_tag_types(v) for v in obj]}
+    if isinstance(obj, list):
+        return [_tag_types(v) for v in obj]
+    if isinstance(obj, dict):
+        return {k: _tag_types(v) for k, v in obj.items()}
+    return obj
+
+
+def _restore_types(obj: dict):
+    if len(obj) == 1:
+        if _DECIMAL_TAG in obj:
+            return Decimal(obj[_DECIMAL_TAG])
+        if _TUPLE_TAG in obj:
+            return tuple(obj[_TUPLE_TAG])
+    return obj
+
+
+def dump_result_json(snapshot: dict) -> str:
+    """집계 결과 dict → calculation_result.result_json 문자열 (Decimal·tuple 형식 표시)."""
+    return json.dumps(_tag_types(snapshot), ensure_ascii=True)
+
+
+def load_result_json(text: str) -> dict:
+    """calculation_result.result_json → dict. 저장 전과 같은 형식(Decimal·tuple)으로 복원 (표시 없는 이전 행은 그대로)."""
+    return json.loads(text, object_hook=_restore_types)
+
+
+_UPSERT_RESULT_SQL = """
+    INSERT INTO calculation_result (scenario_id, result_json, input_hash, updated_at)
+    VALUES (?, ?, ?, datetime('now'))
+    ON CONFLICT(scenario_id) DO UPDATE SET
+      result_json=excluded.result_json,
+      input_hash=excluded.input_hash,
+      updated_at=datetime('now')
+"""
+
+
+@traced("save_result_snapshot")
+def _save_result_snapshot(conn, scenario_id: str, result: dict) -> None:
+    conn.execute(_UPSERT_RESULT_SQL, (scenario_id, _snapshot_payload(result), result.get("input_hash")))
     conn.commit()
+
+
+@traced("save_result_snapshots")
+def save_result_snapshots(conn, results: dict[str, dict]) -> int:
+    """
+    여러 시나리오 결과를 트랜잭션 1개로 저장. 저장된 입력 해시와 같은 결과(변경 없음)는 건너뛴다.
+    반환: 기록한 시나리오 수.
+    """
+    stored = dict(conn.execute("SELECT scenario_id, input_hash FROM calculation_result").fetchall())
+    params = [
+        (scenario_id, _snapshot_payload(result), result.get("input_hash"))
+        for scenario_id, result in results.items()
+        if result.get("input_hash") is None or stored.get(scenario_id) != result.get("input_hash")
+    ]
+    if not params:
+        return 0
+    try:
+        conn.executemany(_UPSERT_RESULT_SQL, params)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return len(params)
@@ -0,0 +1,156 @@
+"""
+UI 재계산 세션.
+
+편집 이벤트마다 노무비 행·보험 7종·경비 상세를 각각 다른 서비스 함수로 계산하면
+get_scenario_input, 경비 항목, 단가표, 세부 항목을 매번 다시 조회하게 된다.
+RecalcSession은 시나리오의 기준 데이터를 한 번만 읽어 두고,
+recalculate() 한 번으로 노무비(증분) → 보험 7종 → 경비 세부 병합 → 경비 상세를 계산해
+변경 불가능한 RecalcResult로 돌려준다.
+
+세션은 시나리오·노임단가 기준년도 단위로 만들고, 저장·불러오기·설정 변경 후에는 새로 만든다.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from src.domain.masterdata.bundle import load_scenario_bundle
+from src.domain.masterdata.repo import MasterDataRepo
+from src.domain.result.incremental import IncrementalLaborModel, LaborChangeSet
+from src.domain.result.service import (
+    LABOR_INSURANCE_TO_EXP_CODE,
+    _calculate_expenses,
+    _virtual_sub_item_row,
+    load_ui_job_roles_and_rates,
+)
+from src.domain.scenario_input.service import get_scenario_input
+from src.domain.settings_manager import get_safety_management_rate
+from src.utils.tracing import traced
+
+# 노무비에서 계산되는 인적보험 7종 exp_code
+INSURANCE_EXP_CODES = frozenset(LABOR_INSURANCE_TO_EXP_CODE.values())
+
+
+@dataclass(frozen=True)
+class RecalcResult:
+    """recalculate() 1회 결과. 이전 결과와 비교해 바뀐 행만 갱신할 수 있다."""
+    labor_rows: tuple
+    labor_total: int
+    role_total: int
+    insurance_by_exp_code: Mapping[str, int]
+    sub_items_by_exp: Mapping[str, list]
+    expense_rows: tuple
+    fixed_total: int
+    variable_total: int
+    passthrough_total: int
+    labor_changes: LaborChangeSet
+
+    def changed_labor_codes(self, previous: "RecalcResult | None") -> set[str]:
+        """이전 결과 대비 행이 추가·변경·삭제된 job_code."""
+        return _changed_keys(previous.labor_rows if previous else (), self.labor_rows, "job_code")
+
+    def changed_expense_codes(self, previous: "RecalcResult | None") -> set[str]:
+        """이전 결과 대비 행이 추가·변경·삭제된 exp_code."""
+        return _changed_keys(previous.expense_rows if previous else (), self.expense_rows, "exp_code")
+
+
+def _changed_keys(old_rows, new_rows, key: str) -> set[str]:
+    old = {row.get(key): row for row in old_rows}
+    new = {row.get(key): row for row in new_rows}
+    changed = {k for k, row in new.items() if old.get(k) != row}
+    changed.update(k for k in old if k not in new)
+    return changed
+
+
+class RecalcSession:
+    """시나리오 기준 데이터(경비 항목·단가·세부 항목·입력)를 한 번 읽고 재계산을 반복한다."""
+
+    def __init__(self, scenario_id: str, conn, wage_year: int | None = None):
+        self.scenario_id = scenario_id
+        self.wage_year = wage_year
+        repo = MasterDataRepo(conn)
+        # 새 시나리오면 default 경비 마스터 상속 (기존 UI 자동계산과 동일)
+        repo.ensure_expense_masterdata_for_scenario(scenario_id)
+
+        self._canonical = get_scenario_input(scenario_id, conn)
+        bundle = load_scenario_bundle(conn, scenario_id)
+        self._expense_items = list(bundle.expense_items)
+        self._price_map = dict(bundle.price_map)
+        self._safety_rate = get_safety_management_rate()
+        self._exp_names = {item.exp_code: item.exp_name for item in self._expense_items}
+        self._db_sub_items = bundle.sub_items_map()
+
+        job_roles, job_rates, _ = load_ui_job_roles_and_rates({}, scenario_id, conn)
+        # DB에 직무가 없으면 UI 입력 직무코드로 대체 (load_ui_job_roles_and_rates와 동일 규칙)
+        self.labor = IncrementalLaborModel(
+            job_roles, job_rates, wage_year=wage_year, roles_from_inputs=not job_roles
+        )
+        self._last: RecalcResult | None = None
+
+    @property
+    def expense_items(self) -> list:
+        return self._expense_items
+
+    @property
+    def last_result(self) -> RecalcResult | None:
+        return self._last
+
+    @traced("recalc_session.recalculate")
+    def recalculate(self, job_inputs: dict, user_sub_items: dict[str, list] | None = None) -> RecalcResult:
+        """
+        job_inputs: 직무별 인원 입력 (UI 전체)
+        user_sub_items: 경비입력 탭에서 편집 중인 세부 항목. 보험 7종을 제외한 코드는 DB 값 대신 사용.
+        """
+        changes = self.labor.update(job_inputs)
+        insurance = self.labor.insurance_by_exp_code()
+        sub_items = self._merge_sub_items(insurance, user_sub_items)
+
+        # 경비 상세(안전관리비 기준 노무비)는 기존 UI 자동계산과 같이 노무비 상세 role_total 합 기준
+        expense_rows, fixed_total, variable_total, passthrough_total = self._expenses(
+            sub_items, self.labor.role_total
+        )
+        result = RecalcResult(
+            labor_rows=tuple(self.labor.labor_rows()),
+            labor_total=self.labor.labor_total,
+            role_total=self.labor.role_total,
+            insurance_by_exp_code=MappingProxyType(insurance),
+            sub_items_by_exp=MappingProxyType(sub_items),
+            expense_rows=tuple(expense_rows),
+            fixed_total=fixed_total,
+            variable_total=variable_total,
+            passthrough_total=passthrough_total,
+            labor_changes=changes,
+        )
+        self._last = result
+        return result
+
+    def expense_rows_for(self, sub_items_by_exp: dict[str, list], labor_total: int) -> list[dict]:
+        """노무비는 그대로 두고 경비 세부만 바뀐 경우의 경비 상세 행 (get_expense_rows_for_display와 동일)."""
+        expense_rows, _, _, _ = self._expenses(sub_items_by_exp, labor_total)
+        return expense_rows
+
+    def _expenses(self, sub_items_by_exp: dict[str, list], labor_total: int) -> tuple[list[dict], int, int, int]:
+        return _calculate_expenses(
+            self._canonical,
+            self._expense_items,
+            [],
+            sub_items_map=sub_items_by_exp,
+            labor_total=labor_total,
+            insurance_by_exp_code=None,
+            expense_items=self._expense_items,
+            price_map=self._price_map,
+            safety_rate=self._safety_rate,
+        )
+
+    def _merge_sub_items(self, insurance: dict[str, int], user_sub_items: dict[str, list] | None) -> dict[str, list]:
+        # DB 세부 항목 → 보험 7종은 노무비 계산값 1행 → 그 외 코드는 사용자 편집값 우선
+        merged = dict(self._db_sub_items)
+        if self._expense_items:
+            for exp_code in INSURANCE_EXP_CODES:
+                amount = int(insurance.get(exp_code, 0) or 0)
+                row = _virtual_sub_item_row(exp_code, self._exp_names.get(exp_code, exp_code), amount)
+                merged[exp_code] = [{"exp_code": exp_code, **row}]
+        if user_sub_items:
+            for exp_code, items in user_sub_items.items():
+                if exp_code not in INSURANCE_EXP_CODES and items:
+                    merged[exp_code] = items
+        return merged
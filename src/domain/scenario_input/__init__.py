@@ -8,6 +8,9 @@ from .service import (
     get_scenario_input,
     list_scenario_ids,
     list_scenarios,
+    ScenarioCatalogEntry,
+    list_catalog,
+    count_catalog,
     resolve_scenario_id,
     delete_scenario,
 )
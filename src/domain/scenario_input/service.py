@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from src.domain.masterdata.repo import MasterDataRepo, JobRole, ExpenseItem, ExpensePrice
+from src.domain.masterdata.service import dependent_scenarios, materialize_overlay
 from src.domain.normalization import normalize_job_inputs
 from src.domain.db import get_db_path, handle_disk_io_error
 
@@ -32,6 +33,11 @@ MAX_HOLIDAY_WORK_DAYS = 31.0
 MAX_QUANTITY = 1_000_000_000.0  # 10억
 MAX_UNIT_PRICE = 100_000_000
 
+# scenario_labor_input 값 컬럼 (canonical labor.job_roles.{job_code}의 키와 같은 순서)
+LABOR_INPUT_FIELDS = ("headcount", "work_days", "work_hours", "overtime_hours", "holiday_work_days")
+# scenario_input.input_version: 행 테이블(scenario_labor_input / scenario_expense_input) 기준
+INPUT_VERSION_ROWS = 1
+
 
 def post_scenario_input(
     raw: dict,
@@ -56,21 +62,23 @@ def save_canonical_direct(conn, scenario_id: str, canonical: dict) -> None:
 
 def get_scenario_input(scenario_id: str, conn) -> dict:
     row = conn.execute(
-        "SELECT input_json FROM scenario_input WHERE scenario_id=?",
+        "SELECT input_json, input_version FROM scenario_input WHERE scenario_id=?",
         (scenario_id,),
     ).fetchone()
     if row is None:
         return _empty_canonical()
 
+    input_json, input_version = row
     try:
-        stored = json.loads(row[0])
+        stored = json.loads(input_json)
     except (TypeError, ValueError):
         stored = {}
 
-    if _is_canonical(stored):
-        return stored
+    if input_version == INPUT_VERSION_ROWS and isinstance(stored, dict):
+        return _assemble_canonical(conn, scenario_id, stored)
 
-    canonical = normalize_scenario_input(stored, scenario_id, conn)
+    # 기존 전체 JSON: 정규화 후 행 테이블로 옮긴다
+    canonical = stored if _is_canonical(stored) else normalize_scenario_input(stored, scenario_id, conn)
     _save_canonical(conn, scenario_id, canonical)
     return canonical
 
@@ -83,21 +91,91 @@ def list_scenario_ids(conn) -> list[str]:
 
 
 def list_scenarios(conn) -> list[tuple[str, str]]:
-    """(scenario_id, display_name) 목록. display_name은 input_json의 _display_name, 없으면 scenario_id."""
+    """(scenario_id, display_name) 목록. display_name은 저장 시 _display_name, 없으면 scenario_id."""
     rows = conn.execute(
-        "SELECT scenario_id, input_json FROM scenario_input ORDER BY scenario_id",
+        "SELECT scenario_id, display_name FROM scenario_catalog ORDER BY scenario_id",
     ).fetchall()
-    result = []
-    for scenario_id, input_json in rows:
-        display_name = scenario_id
-        try:
-            data = json.loads(input_json) if input_json else {}
-            if isinstance(data, dict) and data.get("_display_name"):
-                display_name = str(data["_display_name"]).strip() or scenario_id
-        except (TypeError, ValueError):
-            pass
-        result.append((scenario_id, display_name))
-    return result
+    return [(scenario_id, display_name) for scenario_id, display_name in rows]
+
+
+@dataclass(frozen=True)
+class ScenarioCatalogEntry:
+    """시나리오 목록 1행 (scenario_catalog). grand_total은 집계 전이면 None."""
+    scenario_id: str
+    display_name: str
+    wage_year: str | None
+    base_year: str | None
+    updated_at: str
+    grand_total: float | None
+    headcount: float
+
+
+# 정렬 키 → ORDER BY (각각 scenario_catalog 색인 순서와 같음)
+CATALOG_SORT_KEYS = {
+    "name": "display_name, scenario_id",
+    "updated_at": "updated_at, scenario_id",
+    "grand_total": "grand_total, scenario_id",
+    "headcount": "headcount, scenario_id",
+    "wage_year": "wage_year, display_name, scenario_id",
+}
+
+
+def _catalog_where(search: str | None, wage_year: str | None, include_default: bool) -> tuple[str, list]:
+    clauses, params = [], []
+    if search:
+        # 앞부분 일치: NOCASE 컬럼의 LIKE 'abc%'는 이름 색인 범위 조회가 된다
+        escaped = search.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        clauses.append("display_name LIKE ? ESCAPE '\\'")
+        params.append(escaped + "%")
+    if wage_year is not None:
+        clauses.append("wage_year = ?")
+        params.append(str(wage_year))
+    if not include_default:
+        clauses.append("scenario_id <> 'default'")
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def list_catalog(
+    conn,
+    *,
+    search: str | None = None,
+    wage_year: str | None = None,
+    sort: str = "name",
+    descending: bool = False,
+    limit: int | None = None,
+    offset: int = 0,
+    include_default: bool = True,
+) -> list[ScenarioCatalogEntry]:
+    """
+    시나리오 목록 조회 (scenario_catalog 색인 사용, 헤더 JSON을 읽지 않음).
+    search: 표시명 앞부분 일치(대소문자 무시), wage_year: 노임단가 기준년도 일치,
+    sort: CATALOG_SORT_KEYS 중 하나, limit/offset: 페이지.
+    """
+    if sort not in CATALOG_SORT_KEYS:
+        raise ValueError(f"알 수 없는 정렬 키: {sort}")
+    where, params = _catalog_where(search, wage_year, include_default)
+    direction = " DESC" if descending else ""
+    order_by = ", ".join(column + direction for column in CATALOG_SORT_KEYS[sort].split(", "))
+    sql = (
+        "SELECT scenario_id, display_name, wage_year, base_year, updated_at, grand_total, headcount "
+        f"FROM scenario_catalog{where} ORDER BY {order_by}"
+    )
+    if limit is not None:
+        sql += " LIMIT ? OFFSET ?"
+        params += [int(limit), int(offset)]
+    return [ScenarioCatalogEntry(*row) for row in conn.execute(sql, params)]
+
+
+def count_catalog(
+    conn,
+    *,
+    search: str | None = None,
+    wage_year: str | None = None,
+    include_default: bool = True,
+) -> int:
+    """list_catalog와 같은 조건의 전체 행 수 (페이지 수 계산용)."""
+    where, params = _catalog_where(search, wage_year, include_default)
+    return conn.execute(f"SELECT COUNT(*) FROM scenario_catalog{where}", params).fetchone()[0]
 
 
 def resolve_scenario_id(conn, scenario_name: str, sanitize_fn) -> str:
@@ -105,21 +183,18 @@ def resolve_scenario_id(conn, scenario_name: str, sanitize_fn) -> str:
     sid = sanitize_fn(scenario_name) if scenario_name else ""
     if not sid:
         return "default"
-    row = conn.execute(
-        "SELECT 1 FROM scenario_input WHERE scenario_id = ?",
-        (sid,),
-    ).fetchone()
-    if row is not None:
-        return sid
     # 예: "2023설계" -> "2023", 저장된 id는 "2023_" 인 경우
     alt = sid + "_"
-    row2 = conn.execute(
-        "SELECT 1 FROM scenario_input WHERE scenario_id = ?",
-        (alt,),
-    ).fetchone()
-    if row2 is not None:
-        return alt
-    return sid
+    found = {
+        row[0]
+        for row in conn.execute(
+            "SELECT scenario_id FROM scenario_catalog WHERE scenario_id IN (?, ?)",
+            (sid, alt),
+        )
+    }
+    if sid in found or alt not in found:
+        return sid
+    return alt
 
 
 def delete_scenario(scenario_id: str, conn) -> None:
@@ -129,13 +204,21 @@ def delete_scenario(scenario_id: str, conn) -> None:
     # default 시나리오는 삭제 불가
     if scenario_id.strip().lower() == "default":
         raise ValueError("default 시나리오는 삭제할 수 없습니다.")
-    # FK 순서: sub_item → pricebook → expense_item, job_rate → job_role → calculation_result → scenario_input
+    # 이 시나리오를 기준으로 상속한 시나리오는 삭제 전에 상속 행을 자체 행으로 복사
+    for dependent_id in dependent_scenarios(conn, scenario_id):
+        materialize_overlay(conn, dependent_id)
+    # FK 순서: sub_item → pricebook → expense_item, job_rate → job_role → calculation_result
+    #          → 입력 행(labor/expense) → scenario_input
     conn.execute("DELETE FROM md_expense_sub_item WHERE scenario_id=?", (scenario_id,))
+    conn.execute("DELETE FROM md_expense_sub_item_override WHERE scenario_id=?", (scenario_id,))
+    conn.execute("DELETE FROM md_scenario_base WHERE scenario_id=?", (scenario_id,))
     conn.execute("DELETE FROM md_expense_pricebook WHERE scenario_id=?", (scenario_id,))
     conn.execute("DELETE FROM md_expense_item WHERE scenario_id=?", (scenario_id,))
     conn.execute("DELETE FROM md_job_rate WHERE scenario_id=?", (scenario_id,))
     conn.execute("DELETE FROM md_job_role WHERE scenario_id=?", (scenario_id,))
     conn.execute("DELETE FROM calculation_result WHERE scenario_id=?", (scenario_id,))
+    conn.execute("DELETE FROM scenario_labor_input WHERE scenario_id=?", (scenario_id,))
+    conn.execute("DELETE FROM scenario_expense_input WHERE scenario_id=?", (scenario_id,))
     conn.execute("DELETE FROM scenario_input WHERE scenario_id=?", (scenario_id,))
     conn.commit()
     logging.info("시나리오 삭제 완료: %s", scenario_id)
@@ -391,18 +474,117 @@ def _empty_canonical() -> dict:
     }
 
 
+def _split_canonical(canonical: dict) -> tuple[dict, dict, dict]:
+    """canonical → (헤더, {job_code: 행 값}, {exp_code: 행 값}). 행 값의 마지막은 sort_order."""
+    header = dict(canonical)
+    labor = dict(header.get("labor") or {})
+    expenses = dict(header.get("expenses") or {})
+    job_roles = labor.pop("job_roles", None) or {}
+    items = expenses.pop("items", None) or {}
+    header["labor"] = labor
+    header["expenses"] = expenses
+
+    labor_rows = {
+        job_code: tuple(_read_float(values.get(key)) for key in LABOR_INPUT_FIELDS) + (order,)
+        for order, (job_code, values) in enumerate(job_roles.items())
+    }
+    expense_rows = {
+        exp_code: (_read_float(values.get("quantity")), values.get("unit_price", 0), order)
+        for order, (exp_code, values) in enumerate(items.items())
+    }
+    return header, labor_rows, expense_rows
+
+
+def _assemble_canonical(conn, scenario_id: str, header: dict) -> dict:
+    """헤더 + 행 테이블 → canonical. 직무·경비코드 순서는 저장 시 dict 순서."""
+    columns = ", ".join(LABOR_INPUT_FIELDS)
+    job_roles = {
+        row[0]: dict(zip(LABOR_INPUT_FIELDS, row[1:]))
+        for row in conn.execute(
+            f"SELECT job_code, {columns} FROM scenario_labor_input WHERE scenario_id=? ORDER BY sort_order",
+            (scenario_id,),
+        )
+    }
+    items = {
+        exp_code: {"quantity": quantity, "unit_price": unit_price}
+        for exp_code, quantity, unit_price in conn.execute(
+            "SELECT exp_code, quantity, unit_price FROM scenario_expense_input WHERE scenario_id=? ORDER BY sort_order",
+            (scenario_id,),
+        )
+    }
+    canonical = dict(header)
+    labor = canonical.get("labor")
+    canonical["labor"] = {"job_roles": job_roles, **(labor if isinstance(labor, dict) else {})}
+    expenses = canonical.get("expenses")
+    canonical["expenses"] = {"items": items, **(expenses if isinstance(expenses, dict) else {})}
+    return canonical
+
+
+def _stored_rows(conn, sql: str, scenario_id: str) -> dict[str, tuple]:
+    return {row[0]: tuple(row[1:]) for row in conn.execute(sql, (scenario_id,))}
+
+
+def _diff_rows(scenario_id: str, stored: dict[str, tuple], rows: dict[str, tuple]) -> tuple[list, list]:
+    """(삭제 파라미터, upsert 파라미터). 값이 같은 행은 제외."""
+    deleted = [(scenario_id, key) for key in stored if key not in rows]
+    upserted = [(scenario_id, key, *values) for key, values in rows.items() if stored.get(key) != values]
+    return deleted, upserted
+
+
 def _save_canonical(conn, scenario_id: str, canonical: dict) -> None:
-    payload = json.dumps(canonical, ensure_ascii=True)
+    """canonical 저장. 바뀐 헤더·직무 행·경비 행만 기록하고, 바뀐 것이 없으면 쓰지 않는다."""
+    header, labor_rows, expense_rows = _split_canonical(canonical)
+    payload = json.dumps(header, ensure_ascii=True)
+    display_name = canonical.get("_display_name")
+    columns = ", ".join(LABOR_INPUT_FIELDS)
+
+    stored_header = conn.execute(
+        "SELECT input_json, display_name, input_version FROM scenario_input WHERE scenario_id=?",
+        (scenario_id,),
+    ).fetchone()
+    labor_deleted, labor_upserted = _diff_rows(scenario_id, _stored_rows(
+        conn,
+        f"SELECT job_code, {columns}, sort_order FROM scenario_labor_input WHERE scenario_id=?",
+        scenario_id,
+    ), labor_rows)
+    expense_deleted, expense_upserted = _diff_rows(scenario_id, _stored_rows(
+        conn,
+        "SELECT exp_code, quantity, unit_price, sort_order FROM scenario_expense_input WHERE scenario_id=?",
+        scenario_id,
+    ), expense_rows)
+    header_changed = stored_header != (payload, display_name, INPUT_VERSION_ROWS)
+    if not (header_changed or labor_deleted or labor_upserted or expense_deleted or expense_upserted):
+        return
+
     changes_before = conn.total_changes
+    # 헤더는 행 테이블의 FK 대상이므로 먼저 기록 (행만 바뀌어도 updated_at 갱신)
     conn.execute(
         """
-        INSERT INTO scenario_input (scenario_id, input_json, updated_at)
-        VALUES (?, ?, datetime('now'))
+        INSERT INTO scenario_input (scenario_id, input_json, display_name, input_version, updated_at)
+        VALUES (?, ?, ?, ?, datetime('now'))
         ON CONFLICT(scenario_id) DO UPDATE SET
           input_json=excluded.input_json,
+          display_name=excluded.display_name,
+          input_version=excluded.input_version,
           updated_at=datetime('now')
         """,
-        (scenario_id, payload),
+        (scenario_id, payload, display_name, INPUT_VERSION_ROWS),
+    )
+    conn.executemany("DELETE FROM scenario_labor_input WHERE scenario_id=? AND job_code=?", labor_deleted)
+    conn.executemany(
+        f"""
+        INSERT OR REPLACE INTO scenario_labor_input (scenario_id, job_code, {columns}, sort_order)
+        VALUES (?, ?, {", ".join("?" * len(LABOR_INPUT_FIELDS))}, ?)
+        """,
+        labor_upserted,
+    )
+    conn.executemany("DELETE FROM scenario_expense_input WHERE scenario_id=? AND exp_code=?", expense_deleted)
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO scenario_expense_input (scenario_id, exp_code, quantity, unit_price, sort_order)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        expense_upserted,
     )
     try:
         conn.commit()
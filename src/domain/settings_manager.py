@@ -104,12 +104,26 @@ def save(config: dict[str, Any]) -> None:
     # 캐시 갱신 (재귀 방지: load() 호출하지 않고 저장된 config로 직접 갱신)
     _cache.clear()
     _cache.update(config)
+    _bump_revision()
     logging.info("config 저장 완료: %s", path)
 
 
 # 메모리 캐시 (load 한 번만 호출)
 _cache: dict[str, Any] = {}
 
+# 설정 리비전: 저장/재로드 시 증가. 요율 기반 계산 캐시 무효화에 사용.
+_revision = 0
+
+
+def _bump_revision() -> None:
+    global _revision
+    _revision += 1
+
+
+def get_revision() -> int:
+    """설정 리비전 (저장·재로드마다 증가)."""
+    return _revision
+
 
 def _get_cached() -> dict[str, Any]:
     if not _cache:
@@ -120,6 +134,7 @@ def _get_cached() -> dict[str, Any]:
 def reload() -> dict[str, Any]:
     """캐시 무시하고 파일에서 다시 로드."""
     _cache.clear()
+    _bump_revision()
     return load()
 
 
@@ -7,19 +7,42 @@
 두 가지 방식 지원:
   1. decompose_estimation(): M/D기본급을 입력으로 기본급추정표 전체 산출 (순방향)
   2. find_md_basic():        정부고시 일당에서 M/D기본급을 역산 (일급분개 Goal Seek)
+     find_md_basic_batch():  여러 일당을 역산표(IlgupInverseTable) 한 장으로 일괄 역산
 """
-from decimal import Decimal, ROUND_HALF_UP, ROUND_DOWN
-from typing import Optional
+import json
+import math
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional, Sequence
+
+from src.domain.constants.fixed_point import to_ratio, half_up_div, trunc_div
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore
+    _HAS_NUMPY = False
 
 
 def _round0(val) -> int:
     """ROUND(val, 0) — Excel ROUND 방식."""
-    return int(Decimal(str(val)).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+    if type(val) is int:
+        return val
+    return half_up_div(*to_ratio(val))
 
 
 def _trunc0(val) -> int:
     """TRUNC(val, 0) — Excel TRUNC 방식."""
-    return int(Decimal(str(val)).to_integral_value(rounding=ROUND_DOWN))
+    if type(val) is int:
+        return val
+    return trunc_div(*to_ratio(val))
 
 
 def _rd10(val) -> int:
@@ -123,6 +146,233 @@ def decompose_estimation(
     }
 
 
+# ──────────────────────────────────────────────────────────────
+# 1-1. 행렬 계산: 여러 M/D기본급(등급×연도)을 한 번에 산출
+# ──────────────────────────────────────────────────────────────
+
+# 보험 컬럼명 (행렬 컬럼 "ins_<키>") — decompose_estimation()["insurance"] 키와 동일
+ESTIMATION_INSURANCE_KEYS = (
+    "accident", "national", "employ", "health", "longterm", "wage_bond", "asbestos", "total",
+)
+
+ESTIMATION_FIELDS = (
+    "md_basic",
+    "base_salary",
+    "bonus",
+    "hourly_wage",
+    "tongsan_hourly",
+    "tongsan_daily",
+    "annual_leave",
+    "weekly_holiday",
+    "allowance",
+    "retirement",
+    "salary_subtotal",
+) + tuple(f"ins_{key}" for key in ESTIMATION_INSURANCE_KEYS) + (
+    "monthly_total",
+    "daily_rate",
+)
+
+
+def _half_up(x):
+    """
+    _round0과 같은 값 (0 이상, 2^52 미만). float의 최단 repr 반올림과 이진값 반올림은
+    0.5 경계에서 갈리지 않으므로 floor + (소수부 ≥ 0.5)로 Decimal 변환 없이 계산한다.
+    """
+    if _is_ndarray(x):
+        if x.dtype.kind != "f":
+            return x
+        f = np.floor(x)
+        return (f + (x - f >= 0.5)).astype(np.int64)
+    if type(x) is int:
+        return x
+    f = math.floor(x)
+    return f + (x - f >= 0.5)
+
+
+def _trunc(x):
+    """_trunc0과 같은 값 (0 이상)."""
+    if _is_ndarray(x):
+        return np.floor(x).astype(np.int64) if x.dtype.kind == "f" else x
+    return x if type(x) is int else math.floor(x)
+
+
+def _estimation_kernel(md, wd, rates: dict) -> dict:
+    """decompose_estimation 본문과 같은 연산 순서. md·wd·요율은 스칼라 또는 행 단위 배열."""
+    base = _half_up(md * wd)
+    bonus = _half_up(base * 4 / 12)
+    hourly = _half_up(md / 8)
+    tongsan_hourly = _half_up(hourly + bonus / 209)
+    tongsan_daily = tongsan_hourly * 8
+
+    annual = _trunc(tongsan_daily * 15 / 12)
+    weekly = _trunc(tongsan_daily * 52 / 12)
+    allowance = annual + weekly
+
+    retire = _half_up((base + allowance + bonus) / 12)
+    subtotal = base + allowance + bonus + retire
+
+    ins_base_accident = base + allowance + bonus
+    ins_base_others = subtotal
+    accident = _half_up(ins_base_accident * rates["accident"])
+    national = _half_up(ins_base_others * rates["national"])
+    employ = _half_up(ins_base_others * rates["employ"])
+    health = _half_up(ins_base_others * rates["health"])
+    longterm = _half_up(health * rates["longterm"])
+    wage_bond = _half_up(ins_base_others * rates["wage_bond"])
+    asbestos = _half_up(ins_base_others * rates["asbestos"])
+    ins_total = accident + national + employ + health + longterm + wage_bond + asbestos
+
+    monthly_total = subtotal + ins_total
+    return {
+        "md_basic": md,
+        "base_salary": base,
+        "bonus": bonus,
+        "hourly_wage": hourly,
+        "tongsan_hourly": tongsan_hourly,
+        "tongsan_daily": tongsan_daily,
+        "annual_leave": annual,
+        "weekly_holiday": weekly,
+        "allowance": allowance,
+        "retirement": retire,
+        "salary_subtotal": subtotal,
+        "ins_accident": accident,
+        "ins_national": national,
+        "ins_employ": employ,
+        "ins_health": health,
+        "ins_longterm": longterm,
+        "ins_wage_bond": wage_bond,
+        "ins_asbestos": asbestos,
+        "ins_total": ins_total,
+        "monthly_total": monthly_total,
+        "daily_rate": _half_up(monthly_total / wd),
+    }
+
+
+def _effective_rates(insurance_rates: Optional[dict]) -> dict[str, float]:
+    """decompose_estimation과 같은 요율 override 규칙 → float 요율."""
+    rates = dict(DEFAULT_INSURANCE_RATES)
+    if insurance_rates:
+        for k, v in insurance_rates.items():
+            if k in rates and v is not None:
+                rates[k] = Decimal(str(v))
+    return {k: float(v) for k, v in rates.items()}
+
+
+@dataclass
+class EstimationMatrix:
+    """
+    기본급추정표 행렬. columns[컬럼명] = 행별 값 (NumPy 사용 시 int64 배열, 아니면 list[int]).
+    row(i)는 decompose_estimation()과 같은 형식의 dict.
+    """
+    columns: dict
+
+    def __len__(self) -> int:
+        return len(self.columns["md_basic"])
+
+    def row(self, index: int) -> dict:
+        c = self.columns
+        row = {key: int(c[key][index]) for key in ESTIMATION_FIELDS if not key.startswith("ins_")}
+        row["insurance"] = {key: int(c[f"ins_{key}"][index]) for key in ESTIMATION_INSURANCE_KEYS}
+        # decompose_estimation 키 순서 (monthly_total, daily_rate는 보험 뒤)
+        row["monthly_total"] = row.pop("monthly_total")
+        row["daily_rate"] = row.pop("daily_rate")
+        return row
+
+    def rows(self) -> list[dict]:
+        return [self.row(i) for i in range(len(self))]
+
+    def to_records(self):
+        """전 컬럼 int64 구조화 배열 (NumPy 필요)."""
+        if not _HAS_NUMPY:
+            raise RuntimeError("NumPy가 설치되어 있지 않습니다.")
+        out = np.zeros(len(self), dtype=[(key, np.int64) for key in ESTIMATION_FIELDS])
+        for key in ESTIMATION_FIELDS:
+            out[key] = self.columns[key]
+        return out
+
+
+def decompose_estimation_matrix(
+    md_basic: Sequence[int],
+    workdays=Decimal("20.6"),
+    insurance_rates=None,
+    use_numpy: Optional[bool] = None,
+) -> EstimationMatrix:
+    """
+    decompose_estimation의 행렬판. 각 행 결과는 decompose_estimation(md, wd, rates)와 같다.
+
+    Args:
+        md_basic: M/D기본급 배열
+        workdays: 월평균근무일수 (스칼라 또는 행별 배열)
+        insurance_rates: 보험요율 override (dict 하나 또는 행별 dict/None 배열)
+        use_numpy: None이면 NumPy 설치 시 자동 사용
+    """
+    n = len(md_basic)
+    per_row_wd = isinstance(workdays, (list, tuple)) or _is_ndarray(workdays)
+    per_row_rates = isinstance(insurance_rates, (list, tuple))
+    if (per_row_wd and len(workdays) != n) or (per_row_rates and len(insurance_rates) != n):
+        raise ValueError("입력 배열 길이가 서로 다릅니다.")
+    if use_numpy is None:
+        use_numpy = _HAS_NUMPY
+    if use_numpy and not _HAS_NUMPY:
+        raise RuntimeError("NumPy가 설치되어 있지 않습니다.")
+
+    if per_row_rates:
+        row_rates = [_effective_rates(r) for r in insurance_rates]
+    else:
+        shared = _effective_rates(insurance_rates)
+
+    if use_numpy:
+        md = np.fromiter((int(v) for v in md_basic), dtype=np.int64, count=n)
+        if per_row_wd:
+            wd = np.fromiter((float(v) for v in workdays), dtype=np.float64, count=n)
+        else:
+            wd = float(workdays)
+        if per_row_rates:
+            rates = {k: np.array([r[k] for r in row_rates], dtype=np.float64) for k in DEFAULT_INSURANCE_RATES}
+        else:
+            rates = shared
+        out = _estimation_kernel(md, wd, rates)
+        return EstimationMatrix({key: np.asarray(out[key], dtype=np.int64) for key in ESTIMATION_FIELDS})
+
+    columns = {key: [] for key in ESTIMATION_FIELDS}
+    for i, value in enumerate(md_basic):
+        wd = float(workdays[i]) if per_row_wd else float(workdays)
+        out = _estimation_kernel(int(value), wd, row_rates[i] if per_row_rates else shared)
+        for key in ESTIMATION_FIELDS:
+            columns[key].append(out[key])
+    return EstimationMatrix(columns)
+
+
+_estimation_cache: "OrderedDict[tuple, EstimationMatrix]" = OrderedDict()
+_ESTIMATION_CACHE_SIZE = 32
+_estimation_lock = threading.Lock()
+
+
+def cached_estimation_matrix(
+    table_key: str,
+    md_basic: Sequence[int],
+    workdays=Decimal("20.6"),
+    insurance_rates: Optional[dict] = None,
+) -> EstimationMatrix:
+    """
+    (단가표 해시, 근무일수, 요율) 단위 행렬 캐시. 같은 단가표로 다이얼로그를 다시 열면 재계산하지 않는다.
+    table_key는 md_basic 배열 내용을 대표하는 해시여야 한다.
+    """
+    rates_key = tuple(sorted(_effective_rates(insurance_rates).items()))
+    key = (table_key, float(workdays), rates_key)
+    with _estimation_lock:
+        matrix = _estimation_cache.get(key)
+        if matrix is not None:
+            _estimation_cache.move_to_end(key)
+            return matrix
+    matrix = decompose_estimation_matrix(md_basic, workdays, insurance_rates)
+    with _estimation_lock:
+        _estimation_cache[key] = matrix
+        while len(_estimation_cache) > _ESTIMATION_CACHE_SIZE:
+            _estimation_cache.popitem(last=False)
+    return matrix
+
+
 # ──────────────────────────────────────────────────────────────
 # 2. 일급분개 방식: 정부고시 일당 → M/D기본급 역산 (Goal Seek)
 # ──────────────────────────────────────────────────────────────
@@ -184,11 +434,17 @@ def find_md_basic(
         else:
             hi = mid - 1
 
-    # 일급분개의 10원 단위 절사 특성상 정확한 매치가 어려울 수 있음.
-    # 근방 ±10 범위 스캔으로 target에 가장 가까운 M/D를 찾음.
-    best_diff = abs(_decompose_ilgup(best, wd) - target)
+    return _nearest_scan(best, target, lambda md: _decompose_ilgup(md, wd))
+
+
+def _nearest_scan(best: int, target: int, daily_of) -> int:
+    """
+    일급분개의 10원 단위 절사 특성상 정확한 매치가 어려울 수 있음.
+    근방 ±10 범위 스캔으로 target에 가장 가까운 M/D를 찾음 (find_md_basic·일괄 역산 공용).
+    """
+    best_diff = abs(daily_of(best) - target)
     for cand in range(max(1, best - 10), best + 11):
-        d = _decompose_ilgup(cand, wd)
+        d = daily_of(cand)
         diff = abs(d - target)
         if diff < best_diff or (diff == best_diff and d <= target):
             best = cand
@@ -196,10 +452,228 @@ def find_md_basic(
         if d == target:
             best = cand
             break
-
     return best
 
 
+# ──────────────────────────────────────────────────────────────
+# 2-1. 일괄 역산: md 구간 일당표 + 이진탐색 (NumPy 있으면 벡터화)
+# ──────────────────────────────────────────────────────────────
+
+def _rd10_array(values):
+    """_rd10 벡터판. 값이 모두 0 이상이므로 절사(int())와 floor가 같다."""
+    if values.dtype.kind == "f":
+        values = np.trunc(values).astype(np.int64)
+    return values // 10 * 10
+
+
+def _decompose_ilgup_array(md, wd: float):
+    """_decompose_ilgup를 md 배열(int64)에 적용. 연산 순서가 같아 float 반올림까지 동일."""
+    base = _rd10_array(md * wd)
+    bonus = _rd10_array(base * 4 / 12)
+    weekly = _rd10_array(md * 52 / 12)
+    tongsan = _rd10_array((base + weekly + bonus) / 209)
+    annual = _rd10_array(tongsan * 8 * 15 / 12)
+    allowance = weekly + annual
+    retire = _rd10_array((base + allowance + bonus) / 12)
+    subtotal = base + allowance + bonus + retire
+    ins_base = base + allowance + bonus
+    health = _rd10_array(ins_base * 0.03545)
+    ins = (
+        _rd10_array(ins_base * 0.045)
+        + health
+        + _rd10_array(ins_base * 0.009)
+        + _rd10_array(ins_base * 0.0115)
+        + _rd10_array(health * 0.1281)
+        + _rd10_array(ins_base * 0.0006)
+        + _rd10_array(ins_base * 0.00004)
+    )
+    monthly = subtotal + ins
+    return _rd10_array(monthly / wd)
+
+
+class IlgupInverseTable:
+    """
+    근무일수 1개에 대한 일급분개 일당표: values[i] = _decompose_ilgup(md_lo + i, wd).
+
+    일당은 md에 대해 단조 비감소 계단함수이므로 "일당 ≤ target인 최대 md"를
+    이진탐색(searchsorted/bisect) 한 번으로 찾고, find_md_basic과 같은 ±10 스캔을 표에서 수행한다.
+    표가 단조가 아니거나 구간을 벗어나는 target은 None (호출측에서 find_md_basic 사용).
+    """
+
+    def __init__(self, workdays, md_lo: int, values):
+        self.wd = float(workdays)
+        self.md_lo = int(md_lo)
+        self.values = values
+        if _is_ndarray(values):
+            self.monotone = bool((np.diff(values) >= 0).all())
+        else:
+            self.monotone = all(a <= b for a, b in zip(values, values[1:]))
+
+    @classmethod
+    def build(cls, workdays, md_lo: int, md_hi: int, use_numpy: Optional[bool] = None) -> "IlgupInverseTable":
+        """md 구간 [md_lo, md_hi]의 일당표 생성."""
+        wd = float(workdays)
+        md_lo = max(1, int(md_lo))
+        md_hi = max(md_lo, int(md_hi))
+        if use_numpy is None:
+            use_numpy = _HAS_NUMPY
+        if use_numpy and not _HAS_NUMPY:
+            raise RuntimeError("NumPy가 설치되어 있지 않습니다.")
+        if use_numpy:
+            values = _decompose_ilgup_array(np.arange(md_lo, md_hi + 1, dtype=np.int64), wd)
+        else:
+            values = array("q", (_decompose_ilgup(md, wd) for md in range(md_lo, md_hi + 1)))
+        return cls(wd, md_lo, values)
+
+    @property
+    def md_hi(self) -> int:
+        return self.md_lo + len(self.values) - 1
+
+    def covers(self, md_lo: int, md_hi: int) -> bool:
+        return self.md_lo <= md_lo and md_hi <= self.md_hi
+
+    def daily(self, md: int) -> int:
+        return int(self.values[md - self.md_lo])
+
+    def find(self, govt_daily_rate: int) -> Optional[int]:
+        """find_md_basic(govt_daily_rate, wd)와 같은 값. 표로 답할 수 없으면 None."""
+        if not self.monotone:
+            return None
+        target = int(govt_daily_rate)
+        return self._resolve(target, bisect_right(self.values, target))
+
+    def find_many(self, govt_daily_rates: Sequence[int]) -> list[Optional[int]]:
+        """여러 일당을 한 번에 역산. 이진탐색은 NumPy searchsorted로 일괄 수행."""
+        if not _is_ndarray(self.values) or not self.monotone:
+            return [self.find(rate) for rate in govt_daily_rates]
+        targets = np.asarray([int(rate) for rate in govt_daily_rates], dtype=np.int64)
+        counts = np.searchsorted(self.values, targets, side="right")
+        return [self._resolve(target, count) for target, count in zip(targets.tolist(), counts.tolist())]
+
+    def _resolve(self, target: int, count: int) -> Optional[int]:
+        """count = 일당 ≤ target인 md 개수 (표 구간 내). find_md_basic의 이진탐색 결과 → ±10 스캔."""
+        if (count == 0 and self.md_lo > 1) or count == len(self.values):
+            return None
+        # 단조이므로 이진탐색 결과 = 일당 ≤ target인 최대 md (탐색 상한 target, 하한 1 반영)
+        best = max(1, min(self.md_lo + count - 1, target))
+        if max(1, best - 10) < self.md_lo or best + 10 > self.md_hi:
+            return None
+        return _nearest_scan(best, target, self.daily)
+
+    # ---- 저장 (근무일수별 역산표 재사용) ----
+
+    def save(self, path: Path) -> None:
+        """헤더(JSON 1줄) + int64 일당 배열로 저장."""
+        if _is_ndarray(self.values):
+            values = self.values.astype("<i8").tobytes()
+        else:
+            out = array("q", self.values)
+            if sys.byteorder == "big":
+                out.byteswap()
+            values = out.tobytes()
+        header = json.dumps({"workdays": self.wd, "md_lo": self.md_lo, "count": len(self.values)})
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(header.encode("utf-8") + b"\n")
+            f.write(values)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["IlgupInverseTable"]:
+        """save()한 역산표 로드. 없거나 손상됐으면 None."""
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline().decode("utf-8"))
+                raw = f.read()
+            if len(raw) != int(header["count"]) * 8:
+                return None
+            if _HAS_NUMPY:
+                values = np.frombuffer(raw, dtype="<i8").astype(np.int64)
+            else:
+                values = array("q")
+                values.frombytes(raw)
+                if sys.byteorder == "big":
+                    values.byteswap()
+            return cls(header["workdays"], int(header["md_lo"]), values)
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+def _is_ndarray(values) -> bool:
+    return _HAS_NUMPY and isinstance(values, np.ndarray)
+
+
+_inverse_tables: dict[float, IlgupInverseTable] = {}
+_inverse_lock = threading.Lock()
+
+
+def _inverse_table_path(cache_dir: Path, wd: float) -> Path:
+    return Path(cache_dir) / f"ilgup_inverse_{wd:g}.bin"
+
+
+def get_inverse_table(
+    workdays,
+    md_lo: int,
+    md_hi: int,
+    cache_dir: Optional[Path] = None,
+) -> Optional[IlgupInverseTable]:
+    """
+    md 구간을 덮는 근무일수별 역산표 (프로세스 캐시 → cache_dir 파일 → 새로 생성 순).
+    NumPy가 없으면 새로 만들지 않고 저장된 표만 사용 (순수 Python 생성은 개별 역산보다 느림).
+    """
+    wd = float(workdays)
+    with _inverse_lock:
+        table = _inverse_tables.get(wd)
+    if table is not None and table.covers(md_lo, md_hi):
+        return table
+    path = _inverse_table_path(cache_dir, wd) if cache_dir else None
+    if path is not None:
+        loaded = IlgupInverseTable.load(path)
+        if loaded is not None and loaded.wd == wd and loaded.covers(md_lo, md_hi):
+            with _inverse_lock:
+                _inverse_tables[wd] = loaded
+            return loaded
+    if not _HAS_NUMPY:
+        return None
+    # 기존 표 구간과 합쳐 다시 생성 (연도가 추가돼도 표 1장 유지)
+    if table is not None:
+        md_lo, md_hi = min(md_lo, table.md_lo), max(md_hi, table.md_hi)
+    table = IlgupInverseTable.build(wd, md_lo, md_hi)
+    with _inverse_lock:
+        _inverse_tables[wd] = table
+    if path is not None:
+        table.save(path)
+    return table
+
+
+def find_md_basic_batch(
+    govt_daily_rates: Sequence[int],
+    workdays: Decimal = Decimal("20.6"),
+    cache_dir: Optional[Path] = None,
+) -> list[int]:
+    """
+    여러 정부고시 일당을 한 번에 역산 (모든 등급·연도). 결과는 각각 find_md_basic과 같다.
+
+    역산 구간은 최소·최대 일당의 역산값 ±20으로 잡아 일당표 1장으로 처리한다.
+    cache_dir를 주면 근무일수별 역산표를 파일로 저장해 다음 임포트에서 재사용한다.
+    """
+    rates = [int(rate) for rate in govt_daily_rates]
+    if not rates:
+        return []
+    if len(rates) == 1:
+        return [find_md_basic(rates[0], workdays)]
+    # 역산값은 일당에 대해 단조이고 ±10 스캔 폭을 고려해 양끝 ±20
+    md_lo = find_md_basic(min(rates), workdays) - 20
+    md_hi = find_md_basic(max(rates), workdays) + 20
+    table = get_inverse_table(workdays, max(1, md_lo), md_hi, cache_dir)
+    if table is None:
+        return [find_md_basic(rate, workdays) for rate in rates]
+    found = table.find_many(rates)
+    return [md if md is not None else find_md_basic(rate, workdays) for md, rate in zip(found, rates)]
+
+
 # ──────────────────────────────────────────────────────────────
 # 3. 연도별 비교 유틸
 # ──────────────────────────────────────────────────────────────
@@ -222,12 +696,13 @@ def compare_years(
     Returns:
         연도별 decompose_estimation 결과 리스트 (year 키 포함)
     """
+    years = [year for year in sorted(grade_data.keys()) if grade_data[year].get(grade) is not None]
+    matrix = decompose_estimation_matrix(
+        [int(grade_data[year][grade]) for year in years], workdays, insurance_rates
+    )
     results = []
-    for year in sorted(grade_data.keys()):
-        md = grade_data[year].get(grade)
-        if md is None:
-            continue
-        row = decompose_estimation(int(md), workdays, insurance_rates)
+    for i, year in enumerate(years):
+        row = matrix.row(i)
         row["year"] = year
         results.append(row)
     return results
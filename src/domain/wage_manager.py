@@ -6,26 +6,116 @@
 wages_master.json 확장 포맷 지원:
   - 기존: {"등급명": 정부고시일당}
   - 확장: {"등급명": {"govt_daily": 정부고시일당, "md_basic": M/D기본급}}
+
+형식 판별·정규화는 wage_store의 공용 함수를 쓴다.
+파일 파싱 결과는 프로세스 전역 캐시에 두고 (mtime, size)가 바뀔 때만 다시 읽는다.
+계산 경로에서는 get_wage_manager()로 공용 인스턴스를 쓴다 (stat 확인만으로 재검증).
 """
+import hashlib
 import json
 import logging
-import re
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from src.utils.path_helper import get_data_dir
-from src.domain.wage_decomposer import decompose_estimation
+from src.utils.tracing import span, traced
+from src.domain.wage_decomposer import EstimationMatrix, cached_estimation_matrix
+from src.domain.wage_store import WageGrade, load_wage_sources
+from src.domain.calculator.labor_cache import clear_labor_cache
 
 
-def _load_json(path: Path) -> dict:
-    if not path.exists():
-        return {}
+def _file_signature(path: Path) -> Optional[tuple[int, int]]:
+    """파일 변경 판별용 (mtime_ns, size). 없으면 None."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        logging.warning("WageManager: 로드 실패 %s: %s", path, e)
-        return {}
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class _ParsedJsonCache:
+    """경로별 JSON 파싱 결과 캐시. 시그니처(mtime_ns, size)가 같으면 파일을 다시 열지 않는다."""
+
+    def __init__(self):
+        self._entries: dict[Path, tuple[Optional[tuple[int, int]], object]] = {}
+        self._lock = threading.Lock()
+        self.reads = 0  # 실제 파일 읽기 횟수 (진단용)
+
+    def load(self, path: Path):
+        signature = _file_signature(path)
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        data = self._read(path) if signature is not None else {}
+        with self._lock:
+            self._entries[path] = (signature, data)
+        return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _read(self, path: Path):
+        self.reads += 1
+        try:
+            with span("wage_manager.read_json", file=path.name), open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logging.warning("WageManager: 로드 실패 %s: %s", path, e)
+            return {}
+
+
+_json_cache = _ParsedJsonCache()
+
+
+def _load_json(path: Path) -> dict:
+    """캐시된 파싱 결과 (공유 객체이므로 읽기 전용으로 사용)."""
+    return _json_cache.load(path)
+
+
+class WageIndexEntry(NamedTuple):
+    """(직무코드, 연도) 단가 색인 값."""
+    grade: str
+    md_basic: Optional[int]
+    govt_daily: Optional[int]
+
+
+class _WageTables:
+    """
+    한 번 로드한 단가 조회 표 묶음. 만든 뒤에는 바꾸지 않고 (연도별 색인만 처음 조회 시 추가),
+    reload()는 새 묶음을 만든 뒤 참조 하나만 교체하므로 다른 스레드의 조회는 항상 한 묶음만 본다.
+    """
+
+    def __init__(self, sources, wage_files: list[Path], signature: tuple):
+        self.wage_files = wage_files
+        self.signature = signature
+        self.job_mapping: dict[str, str] = {code: job.grade for code, job in sources.job_grades.items()}
+        self.grades_by_year: dict[int, dict[str, WageGrade]] = sources.grades_by_year
+        self.wages_by_year: dict[int, dict[str, int]] = {
+            year: {grade: entry.rate for grade, entry in grades.items()}
+            for year, grades in sources.grades_by_year.items()
+        }
+        # 연도별 {직무코드: WageIndexEntry} (처음 조회 시 연도 단위로 생성)
+        self.index_by_year: dict[int, dict[str, WageIndexEntry]] = {}
+        # 기본급추정표 행렬 입력: (연도, 등급) 순서와 단가, 단가표 해시 (행렬 캐시 키)
+        self.estimation_keys = [
+            (year, grade)
+            for year in sorted(self.wages_by_year)
+            for grade, md in self.wages_by_year[year].items()
+            if md > 0
+        ]
+        self.estimation_index = {key: i for i, key in enumerate(self.estimation_keys)}
+        self.estimation_md = [self.wages_by_year[year][grade] for year, grade in self.estimation_keys]
+        self.table_hash = hashlib.sha1(
+            repr(list(zip(self.estimation_keys, self.estimation_md))).encode("utf-8")
+        ).hexdigest()
+        # 매핑·등급 단가 전체 해시 (집계 결과 캐시 키)
+        self.content_hash = hashlib.sha1(repr((
+            sorted(self.job_mapping.items()),
+            sorted((year, sorted(grades.items())) for year, grades in self.grades_by_year.items()),
+        )).encode("utf-8")).hexdigest()
 
 
 class WageManager:
@@ -36,80 +126,54 @@ class WageManager:
 
     def __init__(self, data_dir: Optional[Path] = None):
         self._data_dir = data_dir or get_data_dir()
-        self._job_mapping: dict[str, str] = {}
-        self._wages_by_year: dict[int, dict[str, int]] = {}
-        self._load_job_mapping()
-        self._scan_wage_years()
+        self._reload_lock = threading.Lock()
+        self._tables = self._load_tables()
 
-    def _load_job_mapping(self) -> None:
-        path = self._data_dir / "job_mapping.json"
-        raw = _load_json(path)
-        if not isinstance(raw, dict):
-            self._job_mapping = {}
-            return
-        self._job_mapping = {}
-        for k, v in raw.items():
-            if not k:
-                continue
-            code = str(k).strip()
-            if isinstance(v, dict):
-                grade = (v.get("grade") or "").strip() if v.get("grade") else None
-            elif isinstance(v, str):
-                grade = v.strip() or None
-            else:
-                grade = None
-            if grade:
-                self._job_mapping[code] = grade
-
-    def _scan_wage_years(self) -> None:
-        self._wages_by_year.clear()
-        # 1) wages_master.json (연도별 키 래핑: {"2023": {...}, "2024": {...}})
-        master_path = self._data_dir / "wages_master.json"
-        master = _load_json(master_path)
-        if isinstance(master, dict):
-            for key, val in master.items():
-                if re.match(r"\d{4}$", str(key)) and isinstance(val, dict):
-                    year = int(key)
-                    self._wages_by_year[year] = self._normalize_wage_data(val)
-        # 2) wages_[year].json (개별 연도 파일 — master보다 우선)
-        for f in self._data_dir.glob("wages_*.json"):
-            m = re.match(r"wages_(\d{4})\.json", f.name)
-            if m:
-                year = int(m.group(1))
-                data = _load_json(f)
-                self._wages_by_year[year] = self._normalize_wage_data(data)
+    @traced("wage_manager.load_sources")
+    def _load_tables(self) -> _WageTables:
+        """원본 정규화(wage_store 공용 규칙). 파싱은 프로세스 캐시(_load_json)를 거친다."""
+        sources = load_wage_sources(self._data_dir, _load_json)
+        wage_files = [path for _, path in sorted(sources.year_files.items())]
+        return _WageTables(sources, wage_files, self._source_signature(wage_files))
+
+    def _source_signature(self, wage_files: list[Path]) -> tuple:
+        """원본 파일 시그니처. 디렉터리 mtime으로 연도 파일 추가·삭제도 감지한다."""
+        paths = [
+            self._data_dir,
+            self._data_dir / "job_mapping.json",
+            self._data_dir / "wages_master.json",
+            *wage_files,
+        ]
+        return tuple(_file_signature(path) for path in paths)
+
+    @property
+    def signature(self) -> tuple:
+        """마지막 로드 시점의 원본 파일 시그니처 (재로드 여부 비교용)."""
+        return self._tables.signature
+
+    @property
+    def content_hash(self) -> str:
+        """직무 매핑·연도별 등급 단가 내용 해시 (원본 파일이 바뀌어 재로드되면 달라진다)."""
+        return self._tables.content_hash
+
+    def is_stale(self) -> bool:
+        tables = self._tables
+        return self._source_signature(tables.wage_files) != tables.signature
+
+    def refresh_if_stale(self) -> bool:
+        """원본 파일이 바뀌었으면 reload(). 재로드했으면 True."""
+        if not self.is_stale():
+            return False
+        with self._reload_lock:
+            # 다른 스레드가 먼저 재로드했으면 생략
+            if not self.is_stale():
+                return False
+            logging.info("WageManager: 단가/매핑 파일 변경 감지, 재로드")
+            self._reload_locked()
+        return True
 
     def _get_wages_for_year(self, year: int) -> dict[str, int]:
-        if year in self._wages_by_year:
-            return self._wages_by_year[year]
-        path = self._data_dir / f"wages_{year}.json"
-        data = _load_json(path)
-        self._wages_by_year[year] = self._normalize_wage_data(data)
-        return self._wages_by_year[year]
-
-    def _normalize_wage_data(self, data) -> dict[str, int]:
-        """단가 JSON을 등급명→일급(원) 맵으로 정규화.
-        지원 형식:
-          - {"등급명": 정부고시일당}                          (기존)
-          - {"등급명": {"govt_daily": N, "md_basic": M}}      (확장)
-          - {"year": ..., "data": {...}}                      (래핑)
-        반환값은 항상 등급명→M/D기본급(인건비계산용) 맵.
-        """
-        if not isinstance(data, dict):
-            return {}
-        if "data" in data and isinstance(data.get("data"), dict):
-            data = data["data"]
-        result = {}
-        for k, v in data.items():
-            grade = str(k).strip()
-            if isinstance(v, dict):
-                # 확장 형식: md_basic 우선, 없으면 govt_daily
-                result[grade] = int(v.get("md_basic") or v.get("govt_daily") or 0)
-            elif isinstance(v, (int, float)):
-                result[grade] = int(v)
-            else:
-                result[grade] = 0
-        return result
+        return self._tables.wages_by_year.get(year, {})
 
     def get_wages_for_year(self, year: int) -> dict[str, int]:
         """해당 연도의 기술등급별 일급(원) 표를 반환. 저장 스냅샷용."""
@@ -123,27 +187,48 @@ class WageManager:
         """
         if not job_code or not year:
             return None
-        grade = self._job_mapping.get(str(job_code).strip())
+        tables = self._tables
+        grade = tables.job_mapping.get(str(job_code).strip())
         if not grade:
             return None
-        wages = self._get_wages_for_year(year)
-        return wages.get(grade)
+        return tables.wages_by_year.get(year, {}).get(grade)
 
     def get_md_basic(self, job_code: str, year: int) -> Optional[int]:
         """
         wages_master.json(또는 wages_{year}.json)에서 해당 직무의 기술등급 md_basic(원/일)만 반환.
         노무비 상세 기본급 계산용. 원본에 md_basic이 없으면 None.
         """
+        entry = self.lookup(job_code, year)
+        return entry.md_basic if entry is not None else None
+
+    def lookup(self, job_code: str, year: int) -> Optional[WageIndexEntry]:
+        """(직무코드, 연도) → (기술등급, md_basic, govt_daily). 매핑에 없는 직무는 None."""
         if not job_code or not year:
             return None
-        grade = self._job_mapping.get(str(job_code).strip())
-        if not grade:
-            return None
-        raw = self.get_raw_grade_data(year)
-        grade_data = raw.get(grade) if isinstance(raw.get(grade), dict) else None
-        if grade_data is not None and grade_data.get("md_basic") is not None:
-            return int(grade_data["md_basic"])
-        return None
+        tables = self._tables
+        index = tables.index_by_year.get(year)
+        if index is None:
+            index = self._build_index(tables, year)
+        return index.get(str(job_code).strip())
+
+    @staticmethod
+    def _build_index(tables: _WageTables, year: int) -> dict[str, WageIndexEntry]:
+        grades = tables.grades_by_year.get(year, {})
+        by_grade: dict[str, WageIndexEntry] = {}
+        index: dict[str, WageIndexEntry] = {}
+        for code, grade in tables.job_mapping.items():
+            entry = by_grade.get(grade)
+            if entry is None:
+                wage = grades.get(grade)
+                if wage is None:
+                    entry = WageIndexEntry(grade, None, None)
+                else:
+                    entry = WageIndexEntry(grade, wage.md_basic, wage.govt_daily)
+                by_grade[grade] = entry
+            index[code] = entry
+        # 완성된 색인만 넣음 (동시에 만들어도 같은 내용이라 나중 것이 덮어써도 무방)
+        tables.index_by_year[year] = index
+        return index
 
     def merge_job_rates_for_year(
         self, job_rates: dict[str, int], job_codes: list[str], year: int
@@ -152,32 +237,56 @@ class WageManager:
         기존 job_rates(DB 등)에 연도별 단가를 병합.
         job_mapping에 있고 해당 연도 단가가 있으면 덮어씀.
         """
+        tables = self._tables
+        wages = tables.wages_by_year.get(year, {})
         out = dict(job_rates)
         for code in job_codes:
-            w = self.get_wage(code, year)
+            grade = tables.job_mapping.get(str(code).strip()) if code else None
+            w = wages.get(grade) if grade else None
             if w is not None and w > 0:
                 out[code] = w
         return out
 
     def list_available_years(self) -> list[int]:
         """wages_*.json 에서 추출한 연도 목록 (내림차순)."""
-        if not self._wages_by_year:
-            self._scan_wage_years()
-        return sorted(self._wages_by_year.keys(), reverse=True)
+        tables = self._tables
+        if not tables.wages_by_year:
+            with self._reload_lock:
+                self._tables = tables = self._load_tables()
+        return sorted(tables.wages_by_year.keys(), reverse=True)
+
+    def estimation_matrix(self) -> EstimationMatrix:
+        """
+        전 연도×등급(단가 > 0) 기본급추정표 행렬. 행 순서는 estimation_keys().
+        단가표 해시 단위로 캐시되어 다이얼로그·비교표를 다시 열어도 재계산하지 않는다.
+        """
+        return self._estimation_matrix(self._tables)
+
+    @staticmethod
+    def _estimation_matrix(tables: _WageTables) -> EstimationMatrix:
+        return cached_estimation_matrix(tables.table_hash, tables.estimation_md)
+
+    def estimation_keys(self) -> list[tuple[int, str]]:
+        """estimation_matrix() 행 순서 (연도, 등급)."""
+        return list(self._tables.estimation_keys)
+
+    def _estimation_row(self, tables: _WageTables, year: int, grade: str) -> Optional[dict]:
+        index = tables.estimation_index.get((year, grade))
+        if index is None:
+            return None
+        return self._estimation_matrix(tables).row(index)
 
     def get_grade_detail(self, grade: str, year: int) -> Optional[dict]:
         """등급명과 연도로 상세 분개 결과(기본급추정표) 반환."""
-        md = self._get_wages_for_year(year).get(grade)
-        if md is None or md == 0:
-            return None
-        return decompose_estimation(md)
+        return self._estimation_row(self._tables, year, grade)
 
     def get_all_grade_details(self, year: int) -> dict[str, dict]:
         """해당 연도의 모든 등급 상세 분개 결과."""
-        wages = self._get_wages_for_year(year)
+        tables = self._tables
+        matrix = self._estimation_matrix(tables)
         return {
-            grade: decompose_estimation(md)
-            for grade, md in wages.items()
+            grade: matrix.row(tables.estimation_index[(year, grade)])
+            for grade, md in tables.wages_by_year.get(year, {}).items()
             if md > 0
         }
 
@@ -186,24 +295,20 @@ class WageManager:
         정부고시 일당은 원본(wages_master 등)의 govt_daily를 사용하고,
         원본에 없을 때만 decompose_estimation의 daily_rate(월합계÷근무일)를 쓴다.
         """
+        tables = self._tables
         results = []
-        for year in sorted(self._wages_by_year.keys()):
-            md = self._wages_by_year[year].get(grade)
-            if md is None or md == 0:
+        for year in sorted(tables.grades_by_year):
+            entry = tables.grades_by_year[year].get(grade)
+            row = self._estimation_row(tables, year, grade)
+            if row is None:
                 continue
-            row = decompose_estimation(md)
             row["year"] = year
-            raw = self.get_raw_grade_data(year)
-            grade_raw = raw.get(grade) if isinstance(raw.get(grade), dict) else None
-            if grade_raw and grade_raw.get("govt_daily") is not None:
-                row["govt_daily"] = int(grade_raw["govt_daily"])
-            else:
-                row["govt_daily"] = row.get("daily_rate")
+            row["govt_daily"] = entry.govt_daily if entry.govt_daily is not None else row.get("daily_rate")
             results.append(row)
         return results
 
     def get_raw_grade_data(self, year: int) -> dict:
-        """연도별 원본 데이터(govt_daily + md_basic) 반환."""
+        """연도별 원본 데이터(govt_daily + md_basic) 반환. 캐시 공유 객체이므로 수정하지 않는다."""
         path = self._data_dir / f"wages_{year}.json"
         if not path.exists():
             path = self._data_dir / "wages_master.json"
@@ -218,15 +323,38 @@ class WageManager:
 
     def list_grades(self, year: Optional[int] = None) -> list[str]:
         """사용 가능한 등급명 목록."""
+        tables = self._tables
         if year:
-            return sorted(self._get_wages_for_year(year).keys())
+            return sorted(tables.wages_by_year.get(year, {}).keys())
         all_grades = set()
-        for wages in self._wages_by_year.values():
+        for wages in tables.wages_by_year.values():
             all_grades.update(wages.keys())
         return sorted(all_grades)
 
     def reload(self) -> None:
-        """job_mapping·연도 목록 재로드."""
-        self._load_job_mapping()
-        self._wages_by_year.clear()
-        self._scan_wage_years()
+        """job_mapping·연도 목록 재로드. 새 표를 다 만든 뒤 한 번에 교체한다."""
+        with self._reload_lock:
+            self._reload_locked()
+
+    def _reload_locked(self) -> None:
+        self._tables = self._load_tables()
+        clear_labor_cache()
+
+
+_shared_managers: dict[Path, WageManager] = {}
+_shared_lock = threading.Lock()
+
+
+def get_wage_manager(data_dir: Optional[Path] = None) -> WageManager:
+    """
+    프로세스 공용 WageManager. 호출 시 원본 파일 stat만 비교해 바뀌었으면 재로드한다.
+    계산 경로(노무비 상세 등)에서 매번 WageManager()를 만들지 않도록 사용.
+    """
+    key = Path(data_dir or get_data_dir())
+    with _shared_lock:
+        manager = _shared_managers.get(key)
+        if manager is None:
+            manager = _shared_managers[key] = WageManager(key)
+            return manager
+    manager.refresh_if_stale()
+    return manager
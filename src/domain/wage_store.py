@@ -0,0 +1,160 @@
+"""
+노임단가 원본(wages_master.json, wages_YYYY.json, job_mapping.json) 정규화.
+
+원본 형식 판별(data 래퍼, 단일 연도 래퍼, 등급값 int/dict)은 이 모듈의 정규화 함수 한 곳에서 하고
+WageManager·DataManager·wage_validation·WageDataImporter가 함께 사용한다.
+(연도, 등급, 직무코드) 조회는 WageManager가 정규화 결과로 만든 메모리 색인을 쓴다.
+"""
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+from src.utils.path_helper import get_data_dir
+
+_YEAR_FILE_RE = re.compile(r"wages_(\d{4})\.json$")
+_YEAR_KEY_RE = re.compile(r"\d{4}$")
+
+
+class WageGrade(NamedTuple):
+    """정규화된 등급 단가. 기존 형식({"등급명": N})의 N은 정부고시일당으로 본다."""
+    govt_daily: Optional[int]
+    md_basic: Optional[int]
+
+    @property
+    def rate(self) -> int:
+        """노무비 계산용 일급: md_basic 우선, 없으면 govt_daily."""
+        return int(self.md_basic or self.govt_daily or 0)
+
+
+class JobGrade(NamedTuple):
+    grade: str
+    title: str
+
+
+def _to_int(value) -> Optional[int]:
+    """숫자 또는 숫자 문자열("165278")을 정수로. 그 밖의 값은 None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            return None
+    return None
+
+
+def normalize_grade_value(value) -> WageGrade:
+    """등급 값 1건 정규화: 정수(정부고시일당) 또는 {"govt_daily": N, "md_basic": M}."""
+    if isinstance(value, dict):
+        return WageGrade(_to_int(value.get("govt_daily")), _to_int(value.get("md_basic")))
+    return WageGrade(_to_int(value), None)
+
+
+def normalize_grade_map(data) -> dict[str, WageGrade]:
+    """
+    연도 1개 분량의 단가 JSON → {등급명: WageGrade}.
+    지원 형식: {"등급명": N}, {"등급명": {"govt_daily": N, "md_basic": M}}, {"year": ..., "data": {...}}
+    """
+    if not isinstance(data, dict):
+        return {}
+    if isinstance(data.get("data"), dict):
+        data = data["data"]
+    out: dict[str, WageGrade] = {}
+    for key, value in data.items():
+        grade = str(key).strip() if key is not None else ""
+        if grade:
+            out[grade] = normalize_grade_value(value)
+    return out
+
+
+def normalize_wages_master(raw) -> dict[int, dict[str, WageGrade]]:
+    """
+    wages_master.json → {연도: {등급명: WageGrade}}.
+    형식: {"2023": {...}, "2024": {"year": 2024, "data": {...}}} 또는 단일 연도 {"year": 2024, "data": {...}}
+    """
+    if not isinstance(raw, dict):
+        return {}
+    if "year" in raw and isinstance(raw.get("data"), dict):
+        try:
+            return {int(raw["year"]): normalize_grade_map(raw["data"])}
+        except (TypeError, ValueError):
+            return {}
+    out: dict[int, dict[str, WageGrade]] = {}
+    for key, value in raw.items():
+        if _YEAR_KEY_RE.match(str(key).strip()) and isinstance(value, dict):
+            out[int(str(key).strip())] = normalize_grade_map(value)
+    return out
+
+
+def normalize_job_mapping(raw) -> dict[str, JobGrade]:
+    """
+    job_mapping.json → {직무코드: JobGrade}. 등급이 없는 항목은 제외.
+    형식: {"M101": {"title": "...", "grade": "고급기술자"}} 또는 {"M101": "고급기술자"}
+    """
+    if not isinstance(raw, dict):
+        return {}
+    out: dict[str, JobGrade] = {}
+    for key, entry in raw.items():
+        code = str(key).strip() if key is not None else ""
+        if not code:
+            continue
+        if isinstance(entry, dict):
+            grade = str(entry.get("grade") or "").strip()
+            title = str(entry.get("title") or "").strip()
+        elif isinstance(entry, str):
+            grade, title = entry.strip(), ""
+        else:
+            continue
+        if grade:
+            out[code] = JobGrade(grade, title or code)
+    return out
+
+
+def _read_json(path: Path):
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        logging.warning("wage_store: 로드 실패 %s: %s", path, e)
+        return {}
+
+
+def list_year_files(data_dir: Path) -> dict[int, Path]:
+    """data/wages_YYYY.json → {연도: 경로}."""
+    out: dict[int, Path] = {}
+    for path in data_dir.glob("wages_*.json"):
+        m = _YEAR_FILE_RE.match(path.name)
+        if m:
+            out[int(m.group(1))] = path
+    return out
+
+
+@dataclass
+class WageSources:
+    """정규화된 노임단가 원본. 연도 파일(wages_YYYY.json)은 같은 연도의 wages_master 값을 대체한다."""
+    job_grades: dict[str, JobGrade] = field(default_factory=dict)
+    grades_by_year: dict[int, dict[str, WageGrade]] = field(default_factory=dict)
+    year_files: dict[int, Path] = field(default_factory=dict)
+
+
+def load_wage_sources(
+    data_dir: Optional[Path] = None,
+    load_json: Callable[[Path], object] = _read_json,
+) -> WageSources:
+    """data 디렉터리의 단가·매핑 JSON 정규화. load_json으로 파싱 캐시를 주입할 수 있다."""
+    data_dir = Path(data_dir or get_data_dir())
+    sources = WageSources(
+        job_grades=normalize_job_mapping(load_json(data_dir / "job_mapping.json")),
+        grades_by_year=normalize_wages_master(load_json(data_dir / "wages_master.json")),
+        year_files=list_year_files(data_dir),
+    )
+    for year, path in sources.year_files.items():
+        sources.grades_by_year[year] = normalize_grade_map(load_json(path))
+    return sources
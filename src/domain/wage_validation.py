@@ -8,6 +8,12 @@ from pathlib import Path
 from typing import Optional
 
 from src.utils.path_helper import get_data_dir
+from src.domain.wage_store import (
+    list_year_files,
+    normalize_grade_map,
+    normalize_job_mapping,
+    normalize_wages_master,
+)
 
 
 @dataclass
@@ -42,25 +48,8 @@ def get_valid_grade_names_from_wages_master(raw: dict) -> set[str]:
           { "year": 2024, "data": { "고급기술자": 293753, ... } }
     """
     names: set[str] = set()
-    if not isinstance(raw, dict):
-        return names
-    # 단일 연도 형식
-    if "year" in raw and "data" in raw and isinstance(raw.get("data"), dict):
-        for k in raw["data"].keys():
-            if k and str(k).strip():
-                names.add(str(k).strip())
-        return names
-    # 연도별 형식
-    for _year_key, grades_dict in raw.items():
-        if not isinstance(grades_dict, dict):
-            continue
-        if "data" in grades_dict and isinstance(grades_dict.get("data"), dict):
-            d = grades_dict["data"]
-        else:
-            d = grades_dict
-        for k in d.keys():
-            if k and str(k).strip():
-                names.add(str(k).strip())
+    for grades in normalize_wages_master(raw).values():
+        names.update(grades)
     return names
 
 
@@ -68,21 +57,9 @@ def get_valid_grade_names_from_wages_year_files(data_dir: Path) -> set[str]:
     """
     data/wages_YYYY.json 파일들에서 모든 기술등급명(키) 집합 반환.
     """
-    import re
     names: set[str] = set()
-    for f in data_dir.glob("wages_*.json"):
-        if not re.match(r"wages_\d{4}\.json", f.name):
-            continue
-        data = _load_json(f)
-        if not isinstance(data, dict):
-            continue
-        if "data" in data and isinstance(data.get("data"), dict):
-            d = data["data"]
-        else:
-            d = data
-        for k in d.keys():
-            if k and str(k).strip():
-                names.add(str(k).strip())
+    for path in list_year_files(data_dir).values():
+        names.update(normalize_grade_map(_load_json(path)))
     return names
 
 
@@ -91,21 +68,7 @@ def get_grade_names_from_job_mapping(raw: dict) -> set[str]:
     job_mapping.json 로드 결과에서 사용된 기술등급(grade) 이름 집합 반환.
     형식: { "M101": {"title": "...", "grade": "고급기술자"}, ... } 또는 { "M101": "고급기술자" }
     """
-    names: set[str] = set()
-    if not isinstance(raw, dict):
-        return names
-    for _code, entry in raw.items():
-        if entry is None:
-            continue
-        if isinstance(entry, dict):
-            grade = (entry.get("grade") or "").strip()
-        elif isinstance(entry, str):
-            grade = (entry or "").strip()
-        else:
-            continue
-        if grade:
-            names.add(grade)
-    return names
+    return {job.grade for job in normalize_job_mapping(raw).values()}
 
 
 def validate_grade_names(
@@ -6,6 +6,7 @@ from src.domain.migration_runner import run_migrations
 from src.domain.db import get_connection
 from src.domain.masterdata.service import apply_seed_if_needed
 from src.utils.path_helper import get_logs_dir
+from src.utils import tracing
 
 try:
     from PyQt6.QtWidgets import QApplication
@@ -35,6 +36,9 @@ def main():
     # 로그 파일 설정 (logs/app.log). 확인 방법은 아래 주석 참고.
     log_path = _setup_file_logging()
     logging.info("앱 시작. 로그 파일: %s", log_path)
+    # COSTCALC_TRACE=1 (로그) 또는 =파일.jsonl → 단계별 소요 시간 기록
+    if tracing.configure_from_env():
+        logging.info("성능 측정 켜짐 (COSTCALC_TRACE)")
 
     run_migrations()
 
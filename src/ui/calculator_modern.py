@@ -13,7 +13,7 @@ except ImportError:
 
 from src.domain.context.calc_context import CalcContext
 from src.domain.calculator.labor import LaborCostCalculator
-from src.domain.wage_manager import WageManager
+from src.domain.wage_manager import get_wage_manager
 
 
 # 기본 근무/수당 상수 (월 환산)
@@ -120,7 +120,7 @@ class CalculatorModernUI:
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
 
-        self._wage_manager = WageManager()
+        self._wage_manager = get_wage_manager()
         years = self._wage_manager.list_available_years()
         self._wage_year = int(years[0]) if years else 2025
 
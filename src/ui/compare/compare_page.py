@@ -14,7 +14,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QPainter, QColor
 from PyQt6.QtPrintSupport import QPrinter
 
-from src.domain.result.service import calculate_result
+from src.domain.result.service import calculate_results_readonly
 from src.domain.compare import build_breakdown, get_top_drivers
 from .scenario_selector import ScenarioSelector
 from .compare_table import CompareTable
@@ -87,8 +87,7 @@ class ComparePage(QWidget):
             QMessageBox.information(self, "비교", "시나리오 A/B를 모두 선택하세요.")
             return
 
-        agg_a, labor_rows_a = self._run_pipeline(self.scenario_a)
-        agg_b, labor_rows_b = self._run_pipeline(self.scenario_b)
+        (agg_a, labor_rows_a), (agg_b, labor_rows_b) = self._run_pipeline(self.scenario_a, self.scenario_b)
 
         values_a, labels_a = build_breakdown(agg_a, labor_rows_a)
         values_b, labels_b = build_breakdown(agg_b, labor_rows_b)
@@ -129,10 +128,14 @@ class ComparePage(QWidget):
             "top_drivers": top_drivers,
         }
 
-    def _run_pipeline(self, payload: dict):
-        scenario_id = payload.get("scenario_id", "default")
-        result = calculate_result(scenario_id, None)
-        return result["aggregator"], result["labor_rows"]
+    def _run_pipeline(self, *payloads: dict) -> list[tuple]:
+        """시나리오별 (aggregator, labor_rows). 읽기 전용: 저장된 결과를 재사용하고 DB에 기록하지 않는다."""
+        scenario_ids = [payload.get("scenario_id", "default") for payload in payloads]
+        results = calculate_results_readonly(scenario_ids)
+        return [
+            (results[scenario_id]["aggregator"], results[scenario_id]["labor_rows"])
+            for scenario_id in scenario_ids
+        ]
 
     def _render_top_drivers(self, drivers: list[dict], a_total: int, b_total: int) -> None:
         total_delta = b_total - a_total
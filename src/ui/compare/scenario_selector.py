@@ -1,7 +1,7 @@
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QComboBox, QPushButton, QMessageBox
 
 from src.domain.db import get_connection
-from src.domain.scenario_input.service import list_scenario_ids, get_scenario_input
+from src.domain.scenario_input.service import get_scenario_input, list_catalog
 
 
 class ScenarioSelector(QWidget):
@@ -37,8 +37,11 @@ class ScenarioSelector(QWidget):
         self.combo.clear()
         conn = get_connection()
         try:
-            for scenario_id in list_scenario_ids(conn):
-                self.combo.addItem(scenario_id, scenario_id)
+            for entry in list_catalog(conn, sort="name"):
+                label = entry.display_name
+                if entry.display_name != entry.scenario_id:
+                    label = f"{entry.display_name} ({entry.scenario_id})"
+                self.combo.addItem(label, entry.scenario_id)
         finally:
             conn.close()
 
@@ -0,0 +1,201 @@
+"""
+노무비 상세·경비 상세 표시 행과 키 기반 증분 갱신 계획 (Qt 비의존).
+
+갱신할 때마다 테이블의 모든 행·아이템을 다시 만드는 대신,
+표시 행을 키(노무비: job_code, 경비: exp_code/sub_code)와 셀 문자열 튜플로 만든 뒤
+이전 표시 행과 비교해 삭제·삽입·변경된 행만 모델에 반영한다.
+연속된 행은 범위 하나로 묶어 beginRemoveRows/beginInsertRows/dataChanged 호출 수를 줄인다.
+"""
+from dataclasses import dataclass
+
+# 행 강조
+EMPHASIS_TOTAL = "total"              # 합계 행 (굵게, 회색 배경)
+EMPHASIS_PASSTHROUGH = "passthrough"  # 대행비 월계·연간합계 (파란 글자)
+
+TOTAL_KEY = ("__total__",)
+
+LABOR_HEADERS = [
+    "직무/직책",
+    "인원",
+    "기본급",
+    "상여금",
+    "제수당",
+    "퇴직급여 충당금",
+    "인건비 소계",
+    "산정 금액",
+]
+EXPENSE_HEADERS = ["구분", "항목명", "월계", "연간합계", "유형"]
+EXPENSE_ACCENT_COLUMNS = frozenset({2, 3})  # 대행비 강조 컬럼 (월계·연간합계)
+
+# 피복비, 식대, 건강검진비, 의약품비 = 1인당 월액 → 월계/연간에 인원수 곱함
+PER_PERSON_EXP_CODES = frozenset({"FIX_WEL_CLOTH", "FIX_WEL_MEAL", "FIX_WEL_CHECKUP", "FIX_WEL_MEDICINE"})
+# 변동경비·대행비: row_total이 연간합계 금액이므로 월계=연간/12, 연간합계=row_total 그대로 표시
+ANNUAL_BASED_TYPES = ("변동경비", "대행비")
+
+
+@dataclass(frozen=True)
+class DetailRow:
+    """표시 행 1개. key가 같고 cells·emphasis도 같으면 다시 그리지 않는다."""
+    key: tuple
+    cells: tuple[str, ...]
+    emphasis: str | None = None
+
+
+@dataclass(frozen=True)
+class KeyedUpdatePlan:
+    """
+    이전 행 → 새 행 반영 순서: removed(내림차순 범위) 삭제 → inserted(오름차순 범위) 삽입 → changed 범위 dataChanged.
+    reset=True면 순서가 바뀌었거나 키가 중복되어 전체 리셋.
+    """
+    removed: tuple[tuple[int, int], ...] = ()
+    inserted: tuple[tuple[int, int], ...] = ()
+    changed: tuple[tuple[int, int], ...] = ()
+    reset: bool = False
+
+    @property
+    def is_noop(self) -> bool:
+        return not (self.removed or self.inserted or self.changed or self.reset)
+
+
+def contiguous_ranges(indices) -> list[tuple[int, int]]:
+    """정렬된 행 번호 → 연속 구간 [(first, last), ...]."""
+    ranges: list[tuple[int, int]] = []
+    for i in indices:
+        if ranges and ranges[-1][1] == i - 1:
+            ranges[-1] = (ranges[-1][0], i)
+        else:
+            ranges.append((i, i))
+    return ranges
+
+
+def plan_keyed_update(old: list[DetailRow], new: list[DetailRow]) -> KeyedUpdatePlan:
+    old_keys = [row.key for row in old]
+    new_keys = [row.key for row in new]
+    old_set, new_set = set(old_keys), set(new_keys)
+    if len(old_set) != len(old_keys) or len(new_set) != len(new_keys):
+        return KeyedUpdatePlan(reset=True)
+    # 남는 행의 상대 순서가 같아야 삭제·삽입만으로 맞출 수 있음
+    if [k for k in old_keys if k in new_set] != [k for k in new_keys if k in old_set]:
+        return KeyedUpdatePlan(reset=True)
+
+    removed = contiguous_ranges(i for i, k in enumerate(old_keys) if k not in new_set)
+    inserted = contiguous_ranges(i for i, k in enumerate(new_keys) if k not in old_set)
+    old_by_key = dict(zip(old_keys, old))
+    changed = contiguous_ranges(
+        i for i, row in enumerate(new)
+        if row.key in old_by_key and old_by_key[row.key] != row
+    )
+    return KeyedUpdatePlan(
+        removed=tuple(reversed(removed)),
+        inserted=tuple(inserted),
+        changed=tuple(changed),
+    )
+
+
+def _safe_int(value, default: int = 0) -> int:
+    """금액/인원 등 숫자 필드 안전 변환 (Decimal/float/None 대비)."""
+    if value is None:
+        return default
+    try:
+        return int(round(float(value)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _fmt_row_total(value) -> str:
+    """행 합계 값을 천 단위 콤마로 표시."""
+    try:
+        n = int(float(str(value).replace(",", "").strip() or 0))
+        return f"{n:,}"
+    except (ValueError, TypeError):
+        return "0"
+
+
+def build_labor_detail_rows(rows: list[dict]) -> list[DetailRow]:
+    """노무비 상세 표시 행 (+ 합계 행). 키는 job_code (없으면 직무명)."""
+    result: list[DetailRow] = []
+    totals = [0] * 7
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        role = str(row.get("role", "") or row.get("job_name", ""))
+        values = (
+            _safe_int(row.get("headcount"), 0),
+            _safe_int(row.get("base_salary"), 0),
+            _safe_int(row.get("bonus"), 0),
+            _safe_int(row.get("allowances") if row.get("allowances") is not None else row.get("allowance"), 0),
+            _safe_int(row.get("retirement"), 0),
+            _safe_int(row.get("labor_subtotal"), 0),
+            _safe_int(row.get("role_total") if row.get("role_total") is not None else row.get("total"), 0),
+        )
+        totals = [t + v for t, v in zip(totals, values)]
+        key = ("job", row.get("job_code") or role)
+        result.append(DetailRow(key, (role, str(values[0]), *(f"{v:,}" for v in values[1:]))))
+
+    # 합계 행 추가 (데이터가 있을 때만)
+    if rows:
+        result.append(DetailRow(
+            TOTAL_KEY,
+            ("합계", str(int(totals[0])), *(f"{int(v):,}" for v in totals[1:])),
+            EMPHASIS_TOTAL,
+        ))
+    return result
+
+
+def build_expense_detail_rows(rows: list[dict], total_headcount: int = 1) -> list[DetailRow]:
+    """경비 상세 표시 행 (+ 합계 행). 키는 (exp_code, sub_code)."""
+    if not rows:
+        return []
+    try:
+        total_headcount = max(0, int(total_headcount))
+    except (TypeError, ValueError):
+        total_headcount = 1
+
+    result: list[DetailRow] = []
+    total_monthly = 0
+    total_annual = 0
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        try:
+            raw_total = str(row.get("row_total", 0)).replace(",", "").strip() or "0"
+            row_total = int(float(raw_total))
+        except (ValueError, TypeError):
+            row_total = 0
+
+        row_type = row.get("type", "")
+        exp_code = row.get("exp_code", "")
+        if row_type in ANNUAL_BASED_TYPES:
+            # 변동경비·대행비: row_total = 연간합계 → 월계 = 연간/12
+            monthly_val = row_total // 12
+            annual_val = row_total
+        elif exp_code in PER_PERSON_EXP_CODES:
+            # 고정경비: row_total = 1인당 월계. 피복비/식대/건강검진비/의약품비는 인원수 곱해서 월계·연간 반영
+            monthly_val = row_total * total_headcount
+            annual_val = row_total * total_headcount * 12
+        else:
+            monthly_val = row_total
+            annual_val = row_total * 12
+
+        type_display = "대납비" if row_type == "대행비" else str(row_type)
+        emphasis = EMPHASIS_PASSTHROUGH if row_type in ("대행비", "Pass-through") else None
+        result.append(DetailRow(
+            ("exp", exp_code, row.get("sub_code", "")),
+            (
+                str(row.get("category", "")),
+                str(row.get("name", "")),
+                _fmt_row_total(monthly_val),
+                _fmt_row_total(annual_val),
+                type_display,
+            ),
+            emphasis,
+        ))
+        total_monthly += monthly_val
+        total_annual += annual_val
+
+    result.append(DetailRow(
+        TOTAL_KEY,
+        ("합계", "", f"{int(total_monthly):,}", f"{int(total_annual):,}", ""),
+        EMPHASIS_TOTAL,
+    ))
+    return result
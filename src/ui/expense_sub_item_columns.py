@@ -0,0 +1,321 @@
+"""
+경비입력(세부 경비 항목) 테이블의 열 저장소와 표시·변환 규칙 (Qt 비의존).
+
+선택한 경비코드 1개의 세부 항목을 열 단위(문자열 리스트, 수량·단가·금액·정렬은 array)로 보관한다.
+수량은 화면 입력 단위(연간 코드는 연간 값)로 보관하고, 저장용 dict로 꺼낼 때 월 단위로 변환한다.
+셀 편집은 해당 셀(과 연동되는 금액·비고)만 바꾸며, 읽을 때 표시 문자열을 다시 파싱하지 않는다.
+ExpenseSubItemTable의 QAbstractTableModel이 이 저장소를 감싼다.
+"""
+from array import array
+
+# 노무비에서 계산되는 인적보험료(세부 경비 입력 불필요)
+EXP_CODES_FROM_LABOR = frozenset({
+    "FIX_INS_INDUST",   # 산재보험료
+    "FIX_INS_PENSION",  # 국민연금
+    "FIX_INS_EMPLOY",   # 고용보험료
+    "FIX_INS_HEALTH",   # 국민건강보험료
+    "FIX_INS_LONGTERM", # 노인장기요양보험료
+    "FIX_INS_WAGE",     # 임금채권보장보험료
+    "FIX_INS_ASBESTOS", # 석면피해구제분담금
+})
+
+# 수량 = 연간 실제 지급수량. 저장·계산 시 입력값÷12 로 월 단위 변환
+EXP_CODES_QUANTITY_ANNUAL = frozenset({
+    "FIX_WEL_CLOTH",    # 피복비 (착/년)
+    "FIX_WEL_CHECKUP",  # 건강검진비 (회/년)
+    "FIX_TRAINING",     # 교육훈련비 (인원 수/년 → ÷12 저장)
+})
+# 수량 = 연간 정수 입력. 저장·계산 시 입력값÷12÷합계인원 (직무별 인원 합계)
+EXP_CODES_QUANTITY_ANNUAL_PER_HEAD = frozenset({"FIX_WEL_MEDICINE"})  # 의약품비 (SET/년)
+# 경비코드별 기본 규격·단위 (표시/저장 시 빈 값일 때 사용)
+EXP_DEFAULT_SPEC_UNIT: dict[str, tuple[str, str]] = {
+    "FIX_WEL_MEDICINE": ("SET", "년"),   # 의약품비
+    "FIX_WEL_CHECKUP": ("회", "년"),     # 건강검진비
+}
+# 수량 컬럼 표시명 "인원 수", 정수 입력, 비고는 파이썬 계산
+EXP_CODES_QUANTITY_HEADCOUNT = frozenset({"FIX_TRAINING", "FIX_TRAVEL"})  # 교육훈련비, 출장여비
+
+# 컬럼 인덱스
+COL_EXP_CODE = 0
+COL_SUB_CODE = 1
+COL_SUB_NAME = 2
+COL_SPEC = 3
+COL_UNIT = 4
+COL_QUANTITY = 5
+COL_UNIT_PRICE = 6
+COL_AMOUNT = 7
+COL_REMARK = 8
+COL_SORT_ORDER = 9
+
+HEADERS = ["경비코드", "세부코드", "항목명", "규격", "단위", "수량", "단가", "금액", "비고", "정렬"]
+
+# 셀 배경색: 읽기 전용 → 회색, 수량/단가 편집 가능 → 연한 파란색
+READONLY_BACKGROUND = "#F0F0F0"
+INPUT_BACKGROUND = "#E8F0FE"
+
+_TEXT_COLUMNS = {
+    COL_EXP_CODE: "exp_codes",
+    COL_SUB_CODE: "sub_codes",
+    COL_SUB_NAME: "sub_names",
+    COL_SPEC: "specs",
+    COL_UNIT: "units",
+    COL_REMARK: "remarks",
+}
+
+
+def _fmt_comma(value: int | float) -> str:
+    """원 단위 값을 콤마 구분 문자열로 표시 (예: 1798000 -> "1,798,000")."""
+    if value is None or (isinstance(value, (int, float)) and value == 0):
+        return "0"
+    return f"{int(round(float(value))):,}"
+
+
+def _parse_comma(text: str) -> int:
+    """콤마 구분 문자열을 원 단위 정수로 변환 (예: "1,798,000" -> 1798000)."""
+    if not text or not str(text).strip():
+        return 0
+    s = str(text).replace(",", "").strip()
+    if not s:
+        return 0
+    try:
+        return int(round(float(s)))
+    except (ValueError, TypeError):
+        return 0
+
+
+def _fmt_quantity_comma(value: int | float) -> str:
+    """수량 값을 소수점 1자리까지 올린 뒤 천 단위 콤마로 표시 (예: 1234.56 -> "1,234.6")."""
+    if value is None:
+        return "0.0"
+    try:
+        x = float(value)
+    except (ValueError, TypeError):
+        return "0.0"
+    if x != x:  # nan
+        return "0.0"
+    x = round(x, 1)
+    return f"{x:,.1f}"
+
+
+def _sub_item_to_dict(si) -> dict:
+    """ExpenseSubItem or dict -> dict."""
+    if hasattr(si, "__dataclass_fields__"):
+        return {
+            "exp_code": getattr(si, "exp_code", ""),
+            "sub_code": getattr(si, "sub_code", ""),
+            "sub_name": getattr(si, "sub_name", ""),
+            "spec": getattr(si, "spec", ""),
+            "unit": getattr(si, "unit", "식"),
+            "quantity": float(getattr(si, "quantity", 0)),
+            "unit_price": int(getattr(si, "unit_price", 0)),
+            "amount": int(getattr(si, "amount", 0)),
+            "remark": getattr(si, "remark", ""),
+            "sort_order": int(getattr(si, "sort_order", 0)),
+            "is_active": int(getattr(si, "is_active", 1)),
+        }
+    if isinstance(si, dict):
+        return {
+            "exp_code": si.get("exp_code", ""),
+            "sub_code": si.get("sub_code", ""),
+            "sub_name": si.get("sub_name", ""),
+            "spec": si.get("spec", ""),
+            "unit": si.get("unit", "식"),
+            "quantity": float(si.get("quantity", 0)),
+            "unit_price": int(si.get("unit_price", 0)),
+            "amount": int(si.get("amount", 0)),
+            "remark": si.get("remark", ""),
+            "sort_order": int(si.get("sort_order", 0)),
+            "is_active": int(si.get("is_active", 1)),
+        }
+    return {}
+
+
+def _headcount_remark(headcount: int) -> str:
+    return f"{headcount}인×1회/년÷12개월"
+
+
+class SubItemColumns:
+    """현재 선택한 경비코드의 세부 항목 열 저장소."""
+
+    def __init__(self) -> None:
+        self.exp_code: str | None = None
+        self.total_headcount: int = 1  # 직무별 인원입력 합계 (의약품비 등 ÷합계인원 시 사용)
+        self.clear()
+
+    def clear(self) -> None:
+        self.exp_codes: list[str] = []
+        self.sub_codes: list[str] = []
+        self.sub_names: list[str] = []
+        self.specs: list[str] = []
+        self.units: list[str] = []
+        self.quantities = array("d")   # 화면 입력 단위, 소수점 1자리
+        self.unit_prices = array("q")
+        self.amounts = array("q")
+        self.remarks: list[str] = []
+        self.sort_orders = array("q")
+
+    def __len__(self) -> int:
+        return len(self.sub_codes)
+
+    # ── 경비코드별 수량 단위 ──
+
+    def _to_input_quantity(self, stored) -> float:
+        """저장값(월 단위) → 화면 입력 단위, 소수점 1자리."""
+        x = float(stored or 0)
+        if self.exp_code in EXP_CODES_QUANTITY_ANNUAL or self.exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
+            x *= 12  # 연간 지급수량 / 인원 수로 표시
+        elif self.exp_code in EXP_CODES_QUANTITY_ANNUAL_PER_HEAD:
+            x *= 12 * max(self.total_headcount, 1)  # 연간 SET = 저장값 × 12 × 합계인원
+        return round(x, 1)
+
+    def _monthly_quantity(self, qty_input: float) -> float:
+        """화면 입력 단위 → 월 단위 (반올림 전)."""
+        if self.exp_code in EXP_CODES_QUANTITY_ANNUAL:
+            return qty_input / 12  # 연간 지급수량 → 월 단위
+        if self.exp_code in EXP_CODES_QUANTITY_ANNUAL_PER_HEAD:
+            return qty_input / 12 / max(self.total_headcount, 1)  # 연간 SET ÷12 ÷합계인원
+        if self.exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
+            return qty_input / 12  # 인원 수(연간) → 월 단위
+        return qty_input
+
+    # ── 행 추가·삭제 ──
+
+    def load(self, exp_code: str | None, rows: list[dict], total_headcount: int | None = None) -> None:
+        """경비코드 1개의 세부 항목 dict 목록으로 열을 다시 채운다."""
+        self.exp_code = exp_code
+        if total_headcount is not None:
+            self.total_headcount = max(int(total_headcount), 1)
+        self.clear()
+        for r in rows:
+            self.insert(len(self), r)
+
+    def insert(self, row: int, r: dict) -> None:
+        """dict 1행 삽입 (없는 키는 기본값, 규격·단위 기본값 적용)."""
+        spec = str(r.get("spec", ""))
+        unit = str(r.get("unit", ""))
+        if self.exp_code in EXP_DEFAULT_SPEC_UNIT:
+            default_spec, default_unit = EXP_DEFAULT_SPEC_UNIT[self.exp_code]
+            spec = spec if spec.strip() else default_spec
+            unit = unit if unit.strip() else default_unit
+        quantity = r.get("quantity", 0)
+        if self.exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
+            remark = _headcount_remark(int(round(float(quantity or 0) * 12)))
+        else:
+            remark = str(r.get("remark", ""))
+        self.exp_codes.insert(row, str(r.get("exp_code", self.exp_code or "")))
+        self.sub_codes.insert(row, str(r.get("sub_code", "")))
+        self.sub_names.insert(row, str(r.get("sub_name", "")))
+        self.specs.insert(row, spec)
+        self.units.insert(row, unit)
+        self.quantities.insert(row, self._to_input_quantity(quantity if quantity != "" else 0))
+        self.unit_prices.insert(row, _parse_comma(_fmt_comma(r.get("unit_price", 0))))
+        self.amounts.insert(row, _parse_comma(_fmt_comma(r.get("amount", 0))))
+        self.remarks.insert(row, remark)
+        self.sort_orders.insert(row, int(float(r.get("sort_order", 0) or 0)))
+
+    def remove(self, row: int) -> None:
+        for name in (*_TEXT_COLUMNS.values(), "quantities", "unit_prices", "amounts", "sort_orders"):
+            del getattr(self, name)[row]
+
+    # ── 셀 ──
+
+    def is_editable(self, row: int, col: int) -> bool:
+        if self.exp_code in EXP_CODES_FROM_LABOR:
+            return False
+        if col in (COL_EXP_CODE, COL_AMOUNT):
+            return False
+        return not (col == COL_REMARK and self.exp_code in EXP_CODES_QUANTITY_HEADCOUNT)
+
+    def background(self, row: int, col: int) -> str | None:
+        if not self.is_editable(row, col):
+            return READONLY_BACKGROUND
+        if col in (COL_QUANTITY, COL_UNIT_PRICE):
+            return INPUT_BACKGROUND
+        return None
+
+    def display(self, row: int, col: int) -> str:
+        if col in _TEXT_COLUMNS:
+            return getattr(self, _TEXT_COLUMNS[col])[row]
+        if col == COL_QUANTITY:
+            return _fmt_quantity_comma(self.quantities[row])
+        if col == COL_UNIT_PRICE:
+            return _fmt_comma(self.unit_prices[row])
+        if col == COL_AMOUNT:
+            return _fmt_comma(self.amounts[row])
+        return str(self.sort_orders[row])
+
+    def set_text(self, row: int, col: int, text: str) -> set[int]:
+        """
+        셀 편집 값 반영. 수량·단가는 금액(과 인원 수 코드의 비고)을 함께 갱신한다.
+        값이 바뀐 열 번호 집합 반환 (입력을 해석할 수 없으면 빈 집합).
+        """
+        text = "" if text is None else str(text)
+        if col in _TEXT_COLUMNS:
+            values = getattr(self, _TEXT_COLUMNS[col])
+            if values[row] == text:
+                return set()
+            values[row] = text
+            return {col}
+        try:
+            if col == COL_QUANTITY:
+                value = round(float(text.replace(",", "").strip() or "0"), 1)  # 소수점 1자리까지
+                target = self.quantities
+            elif col == COL_UNIT_PRICE:
+                value = _parse_comma(text.strip())
+                target = self.unit_prices
+            elif col == COL_SORT_ORDER:
+                value = int(text.replace(",", "").strip() or "0")
+                target = self.sort_orders
+            else:
+                return set()
+        except (ValueError, TypeError):
+            return set()
+        changed = {col} if target[row] != value else set()
+        target[row] = value
+        if col in (COL_QUANTITY, COL_UNIT_PRICE):
+            amount = int(self._monthly_quantity(self.quantities[row]) * self.unit_prices[row])
+            if amount != self.amounts[row]:
+                self.amounts[row] = amount
+                changed.add(COL_AMOUNT)
+        if col == COL_QUANTITY and self.exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
+            remark = _headcount_remark(int(round(value)))
+            if remark != self.remarks[row]:
+                self.remarks[row] = remark
+                changed.add(COL_REMARK)
+        return changed
+
+    # ── 저장용 dict ──
+
+    def row_dict(self, row: int) -> dict:
+        """화면 행 → 저장용 세부 항목 dict (수량은 월 단위)."""
+        qty = self._monthly_quantity(self.quantities[row])
+        # 연간→월 변환 값은 소수 6자리 유지(5→5/12≈0.4167, 복원 시 5로 표시). 그 외는 1자리
+        if self.exp_code in (
+            EXP_CODES_QUANTITY_ANNUAL | EXP_CODES_QUANTITY_ANNUAL_PER_HEAD | EXP_CODES_QUANTITY_HEADCOUNT
+        ):
+            qty = round(qty, 6)
+        else:
+            qty = round(qty, 1)
+        price = self.unit_prices[row]
+        if self.exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
+            remark = _headcount_remark(int(round(qty * 12)))
+        else:
+            remark = self.remarks[row].strip()
+        spec_default, unit_default = EXP_DEFAULT_SPEC_UNIT.get(self.exp_code, ("", "식"))
+        return {
+            "exp_code": self.exp_code or "",
+            "sub_code": self.sub_codes[row].strip(),
+            "sub_name": self.sub_names[row].strip(),
+            "spec": self.specs[row].strip() or spec_default,
+            "unit": self.units[row].strip() or unit_default,
+            "quantity": qty,
+            "unit_price": price,
+            "amount": int(qty * price),
+            "remark": remark,
+            "sort_order": self.sort_orders[row],
+            "is_active": 1,
+        }
+
+    def rows(self) -> list[dict]:
+        """세부코드가 입력된 행만 저장용 dict로 (빈 행은 제외)."""
+        return [self.row_dict(row) for row, code in enumerate(self.sub_codes) if code.strip()]
@@ -4,6 +4,7 @@
 노무비에서 이미 계산되는 인적보험료 7개 항목은 세부 입력 대상에서 제외한다.
 경비코드는 3개 그룹(고정/변동/대행비)으로 구분하여 콤보에 표시한다.
 경비코드 선택 시 해당 코드에 대한 세부 항목이 없으면 default 시나리오 기본 내용을 불러온다.
+테이블은 SubItemColumns(열 저장소)를 감싼 모델/뷰라서 보이는 행만 그리고, 셀 편집은 해당 셀만 바꾼다.
 """
 import logging
 from typing import Callable, Optional
@@ -13,123 +14,119 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QHeaderView,
     QComboBox,
     QPushButton,
     QAbstractItemView,
     QStyledItemDelegate,
 )
-from PyQt6.QtCore import Qt, QRegularExpression, pyqtSignal
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QRegularExpression, pyqtSignal
 from PyQt6.QtGui import QColor, QDoubleValidator, QIntValidator, QRegularExpressionValidator
 
-# 노무비에서 계산되는 인적보험료(세부 경비 입력 불필요)
-EXP_CODES_FROM_LABOR = frozenset({
-    "FIX_INS_INDUST",   # 산재보험료
-    "FIX_INS_PENSION",  # 국민연금
-    "FIX_INS_EMPLOY",   # 고용보험료
-    "FIX_INS_HEALTH",   # 국민건강보험료
-    "FIX_INS_LONGTERM", # 노인장기요양보험료
-    "FIX_INS_WAGE",     # 임금채권보장보험료
-    "FIX_INS_ASBESTOS", # 석면피해구제분담금
-})
-
-# 수량 = 연간 실제 지급수량. 저장·계산 시 입력값÷12 로 월 단위 변환
-EXP_CODES_QUANTITY_ANNUAL = frozenset({
-    "FIX_WEL_CLOTH",    # 피복비 (착/년)
-    "FIX_WEL_CHECKUP",  # 건강검진비 (회/년)
-    "FIX_TRAINING",     # 교육훈련비 (인원 수/년 → ÷12 저장)
-})
-# 수량 = 연간 정수 입력. 저장·계산 시 입력값÷12÷합계인원 (직무별 인원 합계)
-EXP_CODES_QUANTITY_ANNUAL_PER_HEAD = frozenset({"FIX_WEL_MEDICINE"})  # 의약품비 (SET/년)
-# 경비코드별 기본 규격·단위 (표시/저장 시 빈 값일 때 사용)
-EXP_DEFAULT_SPEC_UNIT: dict[str, tuple[str, str]] = {
-    "FIX_WEL_MEDICINE": ("SET", "년"),   # 의약품비
-    "FIX_WEL_CHECKUP": ("회", "년"),     # 건강검진비
-}
-# 수량 컬럼 표시명 "인원 수", 정수 입력, 비고는 파이썬 계산
-EXP_CODES_QUANTITY_HEADCOUNT = frozenset({"FIX_TRAINING", "FIX_TRAVEL"})  # 교육훈련비, 출장여비
-
-# 컬럼 인덱스
-COL_EXP_CODE = 0
-COL_SUB_CODE = 1
-
-
-def _fmt_comma(value: int | float) -> str:
-    """원 단위 값을 콤마 구분 문자열로 표시 (예: 1798000 -> "1,798,000")."""
-    if value is None or (isinstance(value, (int, float)) and value == 0):
-        return "0"
-    return f"{int(round(float(value))):,}"
-
-
-def _parse_comma(text: str) -> int:
-    """콤마 구분 문자열을 원 단위 정수로 변환 (예: "1,798,000" -> 1798000)."""
-    if not text or not str(text).strip():
-        return 0
-    s = str(text).replace(",", "").strip()
-    if not s:
-        return 0
-    try:
-        return int(round(float(s)))
-    except (ValueError, TypeError):
-        return 0
-
-
-def _fmt_quantity_comma(value: int | float) -> str:
-    """수량 값을 소수점 1자리까지 올린 뒤 천 단위 콤마로 표시 (예: 1234.56 -> "1,234.6")."""
-    if value is None:
-        return "0.0"
-    try:
-        x = float(value)
-    except (ValueError, TypeError):
-        return "0.0"
-    if x != x:  # nan
-        return "0.0"
-    x = round(x, 1)
-    return f"{x:,.1f}"
-
-
-COL_SUB_NAME = 2
-COL_SPEC = 3
-COL_UNIT = 4
-COL_QUANTITY = 5
-COL_UNIT_PRICE = 6
-COL_AMOUNT = 7
-COL_REMARK = 8
-COL_SORT_ORDER = 9
-
-
-def _sub_item_to_dict(si) -> dict:
-    """ExpenseSubItem or dict -> dict."""
-    if hasattr(si, "__dataclass_fields__"):
-        return {
-            "exp_code": getattr(si, "exp_code", ""),
-            "sub_code": getattr(si, "sub_code", ""),
-            "sub_name": getattr(si, "sub_name", ""),
-            "spec": getattr(si, "spec", ""),
-            "unit": getattr(si, "unit", "식"),
-            "quantity": float(getattr(si, "quantity", 0)),
-            "unit_price": int(getattr(si, "unit_price", 0)),
-            "amount": int(getattr(si, "amount", 0)),
-            "remark": getattr(si, "remark", ""),
-            "sort_order": int(getattr(si, "sort_order", 0)),
-            "is_active": int(getattr(si, "is_active", 1)),
-        }
-    if isinstance(si, dict):
-        return {
-            "exp_code": si.get("exp_code", ""),
-            "sub_code": si.get("sub_code", ""),
-            "sub_name": si.get("sub_name", ""),
-            "spec": si.get("spec", ""),
-            "unit": si.get("unit", "식"),
-            "quantity": float(si.get("quantity", 0)),
-            "unit_price": int(si.get("unit_price", 0)),
-            "amount": int(si.get("amount", 0)),
-            "remark": si.get("remark", ""),
-            "sort_order": int(si.get("sort_order", 0)),
-            "is_active": int(si.get("is_active", 1)),
-        }
-    return {}
+from .expense_sub_item_columns import (  # noqa: F401  (기존 import 경로 유지)
+    COL_AMOUNT,
+    COL_EXP_CODE,
+    COL_QUANTITY,
+    COL_REMARK,
+    COL_SORT_ORDER,
+    COL_SPEC,
+    COL_SUB_CODE,
+    COL_SUB_NAME,
+    COL_UNIT,
+    COL_UNIT_PRICE,
+    EXP_CODES_FROM_LABOR,
+    EXP_CODES_QUANTITY_ANNUAL,
+    EXP_CODES_QUANTITY_ANNUAL_PER_HEAD,
+    EXP_CODES_QUANTITY_HEADCOUNT,
+    EXP_DEFAULT_SPEC_UNIT,
+    HEADERS,
+    SubItemColumns,
+    _fmt_comma,
+    _fmt_quantity_comma,
+    _parse_comma,
+    _sub_item_to_dict,
+)
+
+
+class ExpenseSubItemTableModel(QAbstractTableModel):
+    """SubItemColumns를 표시·편집하는 모델. 사용자 편집은 cell_edited(row, col)로 알린다."""
+
+    cell_edited = pyqtSignal(int, int)
+
+    def __init__(self, columns: SubItemColumns, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self._headers = list(HEADERS)
+        self._colors: dict[str, QColor] = {}
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self.columns)
+
+    def columnCount(self, parent=QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):  # noqa: N802
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_header(self, col: int, text: str) -> None:
+        if self._headers[col] != text:
+            self._headers[col] = text
+            self.headerDataChanged.emit(Qt.Orientation.Horizontal, col, col)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.columns.display(index.row(), index.column())
+        if role == Qt.ItemDataRole.BackgroundRole:
+            color = self.columns.background(index.row(), index.column())
+            if color is None:
+                return None
+            if color not in self._colors:
+                self._colors[color] = QColor(color)
+            return self._colors[color]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        if self.columns.is_editable(index.row(), index.column()):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):  # noqa: N802
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        row = index.row()
+        changed = self.columns.set_text(row, index.column(), value)
+        if not changed:
+            return True
+        for col in changed:
+            cell = self.index(row, col)
+            self.dataChanged.emit(cell, cell)
+        self.cell_edited.emit(row, index.column())
+        return True
+
+    def reload(self, exp_code: str | None, rows: list[dict], total_headcount: int | None = None) -> None:
+        self.beginResetModel()
+        try:
+            self.columns.load(exp_code, rows, total_headcount)
+        finally:
+            self.endResetModel()
+
+    def insert_row(self, row: int, r: dict) -> None:
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.columns.insert(row, r)
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.columns.remove(row)
+        self.endRemoveRows()
 
 
 class ExpenseSubItemTable(QWidget):
@@ -142,14 +139,14 @@ class ExpenseSubItemTable(QWidget):
 
     def __init__(self):
         super().__init__()
+        self.edit_generation = 0
         self.dirty = False
         self._external_on_change = None
         self._sub_items_by_exp: dict[str, list[dict]] = {}
         self._exp_codes: list[str] = []
-        self._current_exp_code: str | None = None
+        self._columns = SubItemColumns()  # 현재 경비코드·합계인원도 여기에 보관
         self._exp_name_map: dict[str, str] = {}
         self._group_map: dict[str, str] = {}
-        self._total_headcount: int = 1  # 직무별 인원입력 합계 (의약품비 등 ÷합계인원 시 사용)
         self._fetch_default_sub_items: Optional[Callable[[str], list]] = None  # exp_code -> list[dict|ExpenseSubItem]
 
         layout = QVBoxLayout(self)
@@ -170,11 +167,12 @@ class ExpenseSubItemTable(QWidget):
         row.addWidget(self.exp_select_btn)
         layout.addLayout(row)
 
-        self._default_headers = [
-            "경비코드", "세부코드", "항목명", "규격", "단위", "수량", "단가", "금액", "비고", "정렬",
-        ]
-        self.table = QTableWidget(0, 10)
-        self.table.setHorizontalHeaderLabels(self._default_headers)
+        self._default_headers = list(HEADERS)
+        self.model = ExpenseSubItemTableModel(self._columns, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # 행 높이 고정: 수천 행이어도 보이는 행만 배치·그림
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.table.setEditTriggers(
             QAbstractItemView.EditTrigger.DoubleClicked
             | QAbstractItemView.EditTrigger.SelectedClicked
@@ -212,7 +210,7 @@ class ExpenseSubItemTable(QWidget):
         self.table.setItemDelegateForColumn(COL_QUANTITY, self._quantity_float_delegate)
         self.table.setItemDelegateForColumn(COL_UNIT_PRICE, ThousandDelegate(self.table))
         self.table.setItemDelegateForColumn(COL_SORT_ORDER, IntDelegate(self.table))
-        self.table.itemChanged.connect(self._on_item_changed)
+        self.model.cell_edited.connect(self._on_cell_edited)
         layout.addWidget(self.table)
 
         btn_row = QHBoxLayout()
@@ -251,70 +249,44 @@ class ExpenseSubItemTable(QWidget):
     def on_change(self, callback) -> None:
         self._external_on_change = callback
 
-    def _on_item_changed(self, item) -> None:
-        if item.column() in (COL_QUANTITY, COL_UNIT_PRICE):
-            self._update_amount_row(item.row())
-        if item.column() == COL_UNIT_PRICE:
-            # 단가 셀 편집 후 천 단위 콤마 포맷 적용
-            try:
-                price_val = _parse_comma((item.text() or "").strip())
-                if price_val >= 0:
-                    self.table.blockSignals(True)
-                    try:
-                        item.setText(_fmt_comma(price_val))
-                    finally:
-                        self.table.blockSignals(False)
-            except (ValueError, TypeError):
-                pass
-        if item.column() == COL_QUANTITY:
-            try:
-                raw = (item.text() or "").replace(",", "").strip() or "0"
-                qty_num = round(float(raw), 1)  # 소수점 1자리까지
-                self.table.blockSignals(True)
-                try:
-                    if self._current_exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
-                        headcount = int(round(qty_num))
-                        remark_text = f"{headcount}인×1회/년÷12개월"
-                        remark_item = self.table.item(item.row(), COL_REMARK)
-                        if remark_item:
-                            remark_item.setText(remark_text)
-                    # 수량 셀 소수점 1자리·천 단위 콤마로 갱신
-                    item.setText(_fmt_quantity_comma(qty_num))
-                finally:
-                    self.table.blockSignals(False)
-            except (ValueError, TypeError):
-                pass
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    @dirty.setter
+    def dirty(self, value: bool) -> None:
+        # 변경 표시마다 편집 세대 증가 (백그라운드 집계 중 편집 여부 확인용)
+        if value:
+            self.edit_generation += 1
+        self._dirty = value
+
+    @property
+    def _current_exp_code(self) -> str | None:
+        return self._columns.exp_code
+
+    @_current_exp_code.setter
+    def _current_exp_code(self, exp_code: str | None) -> None:
+        self._columns.exp_code = exp_code
+
+    @property
+    def _total_headcount(self) -> int:
+        """직무별 인원입력 합계 (의약품비 등 ÷합계인원 시 사용)."""
+        return self._columns.total_headcount
+
+    @_total_headcount.setter
+    def _total_headcount(self, value: int) -> None:
+        self._columns.total_headcount = value
+
+    def _on_cell_edited(self, row: int, col: int) -> None:
+        # 금액·비고·콤마 포맷은 모델(SubItemColumns.set_text)에서 함께 갱신됨
+        if self.table.signalsBlocked():
+            return
         self.dirty = True
-        if item.column() in (COL_QUANTITY, COL_UNIT_PRICE):
+        if col in (COL_QUANTITY, COL_UNIT_PRICE):
             self.quantity_or_price_changed.emit()
         if self._external_on_change:
             self._external_on_change()
 
-    def _update_amount_row(self, row: int) -> None:
-        qty_item = self.table.item(row, COL_QUANTITY)
-        price_item = self.table.item(row, COL_UNIT_PRICE)
-        amount_item = self.table.item(row, COL_AMOUNT)
-        if amount_item is None:
-            return
-        self.table.blockSignals(True)
-        try:
-            qty_input = float((qty_item.text() or "").replace(",", "").strip() or "0")
-            if self._current_exp_code in EXP_CODES_QUANTITY_ANNUAL:
-                qty_for_calc = qty_input / 12  # 연간 지급수량 → 월 단위로 계산
-            elif self._current_exp_code in EXP_CODES_QUANTITY_ANNUAL_PER_HEAD:
-                qty_for_calc = qty_input / 12 / max(self._total_headcount, 1)  # 연간 SET ÷12 ÷합계인원
-            elif self._current_exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
-                qty_for_calc = qty_input / 12  # 인원 수(연간) → 월 단위로 계산
-            else:
-                qty_for_calc = qty_input
-            price_원 = _parse_comma((price_item.text() or "").strip())
-            amount_원 = int(qty_for_calc * price_원)
-            amount_item.setText(_fmt_comma(amount_원))
-        except (ValueError, TypeError):
-            amount_item.setText("0")
-        finally:
-            self.table.blockSignals(False)
-
     def load_sub_items(
         self,
         sub_items_by_exp: dict[str, list],
@@ -380,15 +352,7 @@ class ExpenseSubItemTable(QWidget):
         self.dirty = False
 
     def _fill_table(self, rows: list[dict]) -> None:
-        self.table.blockSignals(True)
-        try:
-            self.table.setRowCount(0)
-            for r in rows:
-                row_idx = self.table.rowCount()
-                self.table.insertRow(row_idx)
-                self._set_row(row_idx, r)
-        finally:
-            self.table.blockSignals(False)
+        self.model.reload(self._current_exp_code, rows)
         self._ensure_editable()
 
     def _ensure_editable(self) -> None:
@@ -404,83 +368,14 @@ class ExpenseSubItemTable(QWidget):
             | QAbstractItemView.EditTrigger.AnyKeyPressed
         )
 
-    def _set_row(self, row_idx: int, r: dict) -> None:
-        for col, key in [
-            (COL_EXP_CODE, "exp_code"),
-            (COL_SUB_CODE, "sub_code"),
-            (COL_SUB_NAME, "sub_name"),
-            (COL_SPEC, "spec"),
-            (COL_UNIT, "unit"),
-            (COL_QUANTITY, "quantity"),
-            (COL_UNIT_PRICE, "unit_price"),
-            (COL_AMOUNT, "amount"),
-            (COL_REMARK, "remark"),
-            (COL_SORT_ORDER, "sort_order"),
-        ]:
-            # exp_code는 r에 없으면 현재 선택된 경비코드 사용
-            if key == "exp_code":
-                val = r.get(key, self._current_exp_code or "")
-            else:
-                val = r.get(key, 0 if key in ("quantity", "unit_price", "amount", "sort_order") else "")
-
-            if col == COL_UNIT_PRICE or col == COL_AMOUNT:
-                display = _fmt_comma(val)
-            elif col == COL_QUANTITY and self._current_exp_code in EXP_CODES_QUANTITY_ANNUAL:
-                # 연간 지급수량으로 표시 (저장값 × 12), 소수점 1자리
-                x = round(float(val or 0) * 12, 1)
-                display = _fmt_quantity_comma(x)
-            elif col == COL_QUANTITY and self._current_exp_code in EXP_CODES_QUANTITY_ANNUAL_PER_HEAD:
-                # 연간 SET, 표시 = 저장값 × 12 × 합계인원, 소수점 1자리
-                x = round(float(val or 0) * 12 * max(self._total_headcount, 1), 1)
-                display = _fmt_quantity_comma(x)
-            elif col == COL_QUANTITY and self._current_exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
-                # 교육훈련비/출장여비: 인원 수(정수)로 표시, 소수점 1자리 형식
-                display = _fmt_quantity_comma(round(float(val or 0) * 12, 1))
-            elif col == COL_REMARK and self._current_exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
-                # 교육훈련비 비고: 파이썬 계산으로 표시
-                headcount = int(round(float(r.get("quantity", 0) or 0) * 12))
-                display = f"{headcount}인×1회/년÷12개월"
-            elif col == COL_QUANTITY:
-                # 일반 수량: 소수점 1자리, 천 단위 콤마 표시
-                display = _fmt_quantity_comma(round(float(val) if val != "" else 0, 1))
-            elif col == COL_SPEC and self._current_exp_code in EXP_DEFAULT_SPEC_UNIT and not (val or "").strip():
-                display = EXP_DEFAULT_SPEC_UNIT[self._current_exp_code][0]
-            elif col == COL_UNIT and self._current_exp_code in EXP_DEFAULT_SPEC_UNIT and not (val or "").strip():
-                display = EXP_DEFAULT_SPEC_UNIT[self._current_exp_code][1]
-            else:
-                display = str(val)
-            item = QTableWidgetItem(display)
-
-            # 경비코드 컬럼은 항상 읽기 전용
-            if col == COL_EXP_CODE:
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-
-            if col == COL_AMOUNT:
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            if col == COL_REMARK and self._current_exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            if self._current_exp_code in EXP_CODES_FROM_LABOR:
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-
-            # 시각적 구분: 읽기 전용 → 회색, 수량/단가 편집 가능 → 연한 파란색
-            is_readonly = not (item.flags() & Qt.ItemFlag.ItemIsEditable)
-            if is_readonly:
-                item.setBackground(QColor("#F0F0F0"))
-            elif col in (COL_QUANTITY, COL_UNIT_PRICE):
-                item.setBackground(QColor("#E8F0FE"))
-
-            self.table.setItem(row_idx, col, item)
-
     def _update_quantity_header_and_delegate(self) -> None:
         """경비코드에 따라 수량 컬럼 헤더·입력 방식을 변경 (교육훈련비: 인원 수, 정수)."""
-        headers = list(self._default_headers)
         if self._current_exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
-            headers[COL_QUANTITY] = "인원 수"
+            self.model.set_header(COL_QUANTITY, "인원 수")
             self.table.setItemDelegateForColumn(COL_QUANTITY, self._quantity_int_delegate)
         else:
-            headers[COL_QUANTITY] = "수량"
+            self.model.set_header(COL_QUANTITY, self._default_headers[COL_QUANTITY])
             self.table.setItemDelegateForColumn(COL_QUANTITY, self._quantity_float_delegate)
-        self.table.setHorizontalHeaderLabels(headers)
 
     def _on_exp_select_clicked(self) -> None:
         """경비코드 선택 버튼: 현재 콤보 선택을 적용해 해당 경비코드 세부 항목을 테이블에 표시."""
@@ -517,85 +412,30 @@ class ExpenseSubItemTable(QWidget):
     def _save_table_to_current_exp(self) -> None:
         if self._current_exp_code is None:
             return
-        rows = []
-        for row_idx in range(self.table.rowCount()):
-            r = self._get_row(row_idx)
-            if r is None:
-                continue
-            logging.info("[_save_table] row %d: sub_code=%s qty=%s price=%s amount=%s",
-                         row_idx, r.get("sub_code"), r.get("quantity"), r.get("unit_price"), r.get("amount"))
-            # 세부코드가 입력된 행만 저장 (빈 행은 추가되지 않음)
-            if not (r.get("sub_code") or "").strip():
-                continue
-            rows.append(r)
+        # 세부코드가 입력된 행만 저장 (빈 행은 추가되지 않음)
+        rows = self._columns.rows()
         self._sub_items_by_exp[self._current_exp_code] = rows
         logging.info("[_save_table] exp_code=%s → %d rows saved to dict", self._current_exp_code, len(rows))
 
     def _get_row(self, row_idx: int) -> dict | None:
-        def cell(col: int) -> str:
-            it = self.table.item(row_idx, col)
-            return (it.text() or "").strip() if it else ""
-
-        try:
-            qty_input = float(cell(COL_QUANTITY).replace(",", "") or "0")
-            if self._current_exp_code in EXP_CODES_QUANTITY_ANNUAL:
-                qty = qty_input / 12  # 연간 지급수량 → 월 단위로 저장
-            elif self._current_exp_code in EXP_CODES_QUANTITY_ANNUAL_PER_HEAD:
-                qty = qty_input / 12 / max(self._total_headcount, 1)  # 연간 SET ÷12 ÷합계인원
-            elif self._current_exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
-                qty = qty_input / 12  # 인원 수(연간) → 월 단위로 저장
-            else:
-                qty = qty_input
-            # 연간→월 변환 값은 소수 6자리 유지(5→5/12≈0.4167, 복원 시 5로 표시). 그 외는 1자리
-            if self._current_exp_code in (
-                EXP_CODES_QUANTITY_ANNUAL | EXP_CODES_QUANTITY_ANNUAL_PER_HEAD | EXP_CODES_QUANTITY_HEADCOUNT
-            ):
-                qty = round(qty, 6)
-            else:
-                qty = round(qty, 1)
-            price = _parse_comma(cell(COL_UNIT_PRICE))
-            amount = int(qty * price)
-        except (ValueError, TypeError):
-            qty, price, amount = 0, 0, 0
-        if self._current_exp_code in EXP_CODES_QUANTITY_HEADCOUNT:
-            remark = f"{int(round(qty * 12))}인×1회/년÷12개월"
-        else:
-            remark = cell(COL_REMARK)
-        _spec_default, _unit_default = EXP_DEFAULT_SPEC_UNIT.get(self._current_exp_code, ("", "식"))
-        return {
-            "exp_code": self._current_exp_code or "",  # 경비코드 추가
-            "sub_code": cell(COL_SUB_CODE),
-            "sub_name": cell(COL_SUB_NAME),
-            "spec": cell(COL_SPEC) or _spec_default,
-            "unit": cell(COL_UNIT) or _unit_default,
-            "quantity": qty,
-            "unit_price": price,
-            "amount": amount,
-            "remark": remark,
-            "sort_order": int(cell(COL_SORT_ORDER).replace(",", "") or "0"),
-            "is_active": 1,
-        }
+        return self._columns.row_dict(row_idx)
 
     def _add_row(self) -> None:
         if self._current_exp_code is None:
             return
         if self._current_exp_code not in self._sub_items_by_exp:
             self._sub_items_by_exp[self._current_exp_code] = []
-        row_idx = self.table.rowCount()
-        self.table.insertRow(row_idx)
-        row_data: dict = {"sort_order": row_idx + 1}
-        if self._current_exp_code in EXP_DEFAULT_SPEC_UNIT:
-            row_data["spec"], row_data["unit"] = EXP_DEFAULT_SPEC_UNIT[self._current_exp_code]
-        self._set_row(row_idx, row_data)
+        row_idx = self.model.rowCount()
+        self.model.insert_row(row_idx, {"sort_order": row_idx + 1})
         self.dirty = True
         if self._external_on_change:
             self._external_on_change()
 
     def _delete_row(self) -> None:
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0:
             return
-        self.table.removeRow(row)
+        self.model.remove_row(row)
         self.dirty = True
         if self._external_on_change:
             self._external_on_change()
@@ -0,0 +1,181 @@
+"""
+직무별 인원 입력 테이블의 열 저장소 (Qt 비의존).
+
+셀마다 QTableWidgetItem을 두고 읽을 때마다 문자열을 파싱하는 대신,
+직무코드·직무명·직종은 문자열 리스트, 근무일수~인원은 array 열로 보관한다.
+셀 편집 시 한 번만 파싱하므로 job_inputs()는 배열 값을 그대로 읽는다.
+JobRoleTable의 QAbstractTableModel이 이 저장소를 감싼다.
+"""
+import re
+from array import array
+
+COL_JOB_CODE = 0
+COL_JOB_NAME = 1
+COL_GRADE = 2   # 직종 (job_mapping grade, 읽기 전용)
+COL_WORK_DAYS = 3
+COL_WORK_HOURS = 4
+COL_OVERTIME_HOURS = 5
+COL_HOLIDAY_HOURS = 6
+COL_HEADCOUNT = 7
+COL_MAX = 7
+
+HEADERS = ["직무코드", "직무명", "직종", "근무일수", "근무시간", "연장시간", "휴일근로일수", "인원"]
+
+# 직무코드·연장·휴일근로·인원만 수정 가능 (직무명·직종·근무일수·근무시간은 읽기 전용)
+EDITABLE_COLUMNS = frozenset({COL_JOB_CODE, COL_OVERTIME_HOURS, COL_HOLIDAY_HOURS, COL_HEADCOUNT})
+
+# 숫자 열 → job_inputs 키
+_NUMERIC_KEYS = {
+    COL_WORK_DAYS: "work_days",
+    COL_WORK_HOURS: "work_hours",
+    COL_OVERTIME_HOURS: "overtime_hours",
+    COL_HOLIDAY_HOURS: "holiday_work_days",
+    COL_HEADCOUNT: "headcount",
+}
+
+
+def parse_float(text: str) -> float:
+    """셀 입력 문자열 → float (숫자·소수점 외 문자 제거, 실패 시 0.0)."""
+    if not text:
+        return 0.0
+    try:
+        cleaned = re.sub(r"[^0-9.]", "", text)
+        return float(cleaned) if cleaned else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def parse_int(text: str) -> int:
+    """셀 입력 문자열 → int (소수는 버림, 실패 시 0)."""
+    if not text:
+        return 0
+    try:
+        cleaned = re.sub(r"[^0-9.]", "", text)
+        return int(float(cleaned)) if cleaned else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+def format_number(value: float) -> str:
+    """정수 값은 소수점 없이, 그 외는 그대로 표시 (예: 22.0 -> "22", 20.6 -> "20.6")."""
+    value = float(value)
+    return str(int(value)) if value.is_integer() else str(value)
+
+
+class JobRoleColumns:
+    """직무별 입력 행들의 열 단위 저장소."""
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.job_codes: list[str] = []
+        self.job_names: list[str] = []
+        self.grades: list[str] = []
+        self.numbers: dict[int, array] = {
+            col: array("q") if col == COL_HEADCOUNT else array("d") for col in _NUMERIC_KEYS
+        }
+
+    def __len__(self) -> int:
+        return len(self.job_codes)
+
+    def insert(
+        self,
+        row: int,
+        job_code: str = "",
+        job_name: str = "",
+        grade: str = "",
+        work_days: float = 0.0,
+        work_hours: float = 0.0,
+    ) -> None:
+        self.job_codes.insert(row, job_code)
+        self.job_names.insert(row, job_name)
+        self.grades.insert(row, grade)
+        for col, values in self.numbers.items():
+            default = {COL_WORK_DAYS: work_days, COL_WORK_HOURS: work_hours}.get(col, 0)
+            values.insert(row, int(default) if col == COL_HEADCOUNT else float(default))
+
+    def append(self, *args, **kwargs) -> None:
+        self.insert(len(self), *args, **kwargs)
+
+    def remove(self, row: int) -> None:
+        del self.job_codes[row]
+        del self.job_names[row]
+        del self.grades[row]
+        for values in self.numbers.values():
+            del values[row]
+
+    def job_code(self, row: int) -> str:
+        return self.job_codes[row].strip()
+
+    def is_editable(self, col: int) -> bool:
+        return col in EDITABLE_COLUMNS
+
+    def display(self, row: int, col: int) -> str:
+        if col == COL_JOB_CODE:
+            return self.job_codes[row]
+        if col == COL_JOB_NAME:
+            return self.job_names[row]
+        if col == COL_GRADE:
+            return self.grades[row]
+        return format_number(self.numbers[col][row])
+
+    def set_text(self, row: int, col: int, text: str) -> bool:
+        """셀 편집 값 반영 (숫자 열은 여기서 한 번만 파싱). 값이 바뀌었으면 True."""
+        text = "" if text is None else str(text)
+        if col == COL_JOB_CODE:
+            target = self.job_codes
+        elif col == COL_JOB_NAME:
+            target = self.job_names
+        elif col == COL_GRADE:
+            target = self.grades
+        else:
+            target = self.numbers[col]
+            text = parse_int(text.strip()) if col == COL_HEADCOUNT else parse_float(text.strip())
+        if target[row] == text:
+            return False
+        target[row] = text
+        return True
+
+    def row_of(self, job_code: str) -> int:
+        """job_code의 첫 행 번호 (없으면 -1)."""
+        for row, code in enumerate(self.job_codes):
+            if code.strip() == job_code:
+                return row
+        return -1
+
+    def apply_job_inputs(self, job_inputs: dict[str, dict]) -> list[int]:
+        """저장된 직무별 입력을 해당 직무 행에 반영. 저장 데이터가 없는 직무는 유지. 반영한 행 번호 반환."""
+        rows = []
+        for row in range(len(self)):
+            job_code = self.job_code(row)
+            if job_code not in job_inputs:
+                continue
+            values = job_inputs[job_code]
+            for col, key in _NUMERIC_KEYS.items():
+                if col == COL_HOLIDAY_HOURS:
+                    value = values.get("holiday_work_days", values.get("holiday_work_hours", 0))
+                else:
+                    value = values.get(key, 0)
+                self.set_text(row, col, str(value))
+            rows.append(row)
+        return rows
+
+    def job_inputs(self) -> dict[str, dict]:
+        """직무코드가 있는 행의 입력값 (같은 직무코드가 여러 행이면 마지막 행)."""
+        work_days, work_hours, overtime, holiday, headcount = (
+            self.numbers[col] for col in _NUMERIC_KEYS
+        )
+        result = {}
+        for row, code in enumerate(self.job_codes):
+            job_code = code.strip()
+            if not job_code:
+                continue
+            result[job_code] = {
+                "work_days": work_days[row],
+                "work_hours": work_hours[row],
+                "overtime_hours": overtime[row],
+                "holiday_work_days": holiday[row],
+                "headcount": headcount[row],
+            }
+        return result
@@ -1,33 +1,37 @@
 import logging
 import os
-import re
 import traceback
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QHeaderView,
     QAbstractItemView,
     QAbstractItemDelegate,
     QComboBox,
     QLineEdit,
     QStyledItemDelegate,
 )
-from PyQt6.QtCore import Qt, QTimer, QObject, QEvent
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, QObject, QEvent, pyqtSignal
 from PyQt6.QtGui import QDoubleValidator
 
 from src.domain.constants.job_data import get_job_mapping_from_file
-
-COL_JOB_CODE = 0
-COL_JOB_NAME = 1
-COL_GRADE = 2   # 직종 (job_mapping grade, 읽기 전용)
-COL_WORK_DAYS = 3
-COL_WORK_HOURS = 4
-COL_OVERTIME_HOURS = 5
-COL_HOLIDAY_HOURS = 6
-COL_HEADCOUNT = 7
-COL_MAX = 7
+from .job_role_columns import (  # noqa: F401  (기존 import 경로 유지)
+    COL_GRADE,
+    COL_HEADCOUNT,
+    COL_HOLIDAY_HOURS,
+    COL_JOB_CODE,
+    COL_JOB_NAME,
+    COL_MAX,
+    COL_OVERTIME_HOURS,
+    COL_WORK_DAYS,
+    COL_WORK_HOURS,
+    HEADERS,
+    JobRoleColumns,
+    parse_float,
+    parse_int,
+)
 
 _LOG_READY = False
 
@@ -47,7 +51,7 @@ def setup_qtable_debug_log(log_path: str) -> str:
     return log_path
 
 
-def _dump_table_state(tag: str, table: QTableWidget) -> None:
+def _dump_table_state(tag: str, table: QTableView) -> None:
     try:
         vp = table.viewport()
         fw = table.window().focusWidget() if table.window() else None
@@ -73,8 +77,8 @@ def _dump_table_state(tag: str, table: QTableWidget) -> None:
             _to_int_safe(state_val),
             repr(selection_mode),
             _to_int_safe(selection_mode),
-            table.currentRow(),
-            table.currentColumn(),
+            table.currentIndex().row(),
+            table.currentIndex().column(),
             table.signalsBlocked(),
             table.updatesEnabled(),
         )
@@ -92,7 +96,7 @@ def _dump_table_state(tag: str, table: QTableWidget) -> None:
 
 
 class ViewportEventLogger(QObject):
-    def __init__(self, table: QTableWidget, name: str = "table"):
+    def __init__(self, table: QTableView, name: str = "table"):
         super().__init__(table)
         self.table = table
         self.name = name
@@ -120,25 +124,29 @@ class ViewportEventLogger(QObject):
         return False
 
 
-def attach_table_debug_hooks(table: QTableWidget, name: str = "qtable") -> None:
+def attach_table_debug_hooks(table: QTableView, name: str = "qtable") -> None:
     if hasattr(table, "_vp_logger"):
         return
     vp_logger = ViewportEventLogger(table, name=name)
     table.viewport().installEventFilter(vp_logger)
-    table.itemDoubleClicked.connect(
-        lambda it: logging.debug(f"{name} signal: itemDoubleClicked r={it.row()} c={it.column()}")
+    table.doubleClicked.connect(
+        lambda ix: logging.debug(f"{name} signal: doubleClicked r={ix.row()} c={ix.column()}")
     )
-    table.itemClicked.connect(
-        lambda it: logging.debug(f"{name} signal: itemClicked r={it.row()} c={it.column()}")
+    table.clicked.connect(
+        lambda ix: logging.debug(f"{name} signal: clicked r={ix.row()} c={ix.column()}")
     )
-    table.itemActivated.connect(
-        lambda it: logging.debug(f"{name} signal: itemActivated r={it.row()} c={it.column()}")
+    table.activated.connect(
+        lambda ix: logging.debug(f"{name} signal: activated r={ix.row()} c={ix.column()}")
     )
-    table.currentCellChanged.connect(
-        lambda r, c, pr, pc: logging.debug(f"{name} signal: currentCellChanged ({pr},{pc})->({r},{c})")
+    table.selectionModel().currentChanged.connect(
+        lambda cur, prev: logging.debug(
+            f"{name} signal: currentChanged ({prev.row()},{prev.column()})->({cur.row()},{cur.column()})"
+        )
     )
-    table.itemChanged.connect(
-        lambda it: logging.debug(f"{name} signal: itemChanged r={it.row()} c={it.column()} text='{it.text()}'")
+    table.model().dataChanged.connect(
+        lambda tl, br, roles=None: logging.debug(
+            f"{name} signal: dataChanged r={tl.row()} c={tl.column()} text='{tl.data()}'"
+        )
     )
     table.installEventFilter(vp_logger)
     table._vp_logger = vp_logger
@@ -157,7 +165,7 @@ def _to_int_safe(value) -> int | None:
     return None
 
 
-def hook_suspicious_methods(table: QTableWidget, name: str = "qtable") -> None:
+def hook_suspicious_methods(table: QTableView, name: str = "qtable") -> None:
     if hasattr(table, "_suspicious_hooked"):
         return
     orig_set_enabled = table.setEnabled
@@ -186,9 +194,8 @@ def hook_suspicious_methods(table: QTableWidget, name: str = "qtable") -> None:
     table._suspicious_hooked = True
 
 
-def _force_editable_full(table: QTableWidget, tag: str = "force") -> None:
-    if table.columnCount() == 0:
-        table.setColumnCount(2)
+def _force_editable_full(table: QTableView, tag: str = "force") -> None:
+    model = table.model()
     table.setEnabled(True)
     table.setDisabled(False)
     table.viewport().setEnabled(True)
@@ -200,35 +207,22 @@ def _force_editable_full(table: QTableWidget, tag: str = "force") -> None:
         | QAbstractItemView.EditTrigger.EditKeyPressed
         | QAbstractItemView.EditTrigger.AnyKeyPressed
     )
-    if table.rowCount() == 0:
-        table.setRowCount(1)
-    for row in range(table.rowCount()):
-        for col in range(table.columnCount()):
-            item = table.item(row, col)
-            if item is None:
-                table.setItem(row, col, QTableWidgetItem(""))
-            item = table.item(row, col)
-            item.setFlags(
-                Qt.ItemFlag.ItemIsSelectable
-                | Qt.ItemFlag.ItemIsEnabled
-                | Qt.ItemFlag.ItemIsEditable
-            )
+    if model.rowCount() == 0:
+        model.insert_row(0)
     table.setFocus()
-    table.setCurrentCell(0, 0)
-    item00 = table.item(0, 0)
-    flags00 = item00.flags() if item00 is not None else None
+    table.setCurrentIndex(model.index(0, 0))
+    flags00 = model.flags(model.index(0, 0))
     et = table.editTriggers()
     et_int = _to_int_safe(et)
     logging.debug(
-        "[%s] enabled=%s viewport_enabled=%s rows=%s cols=%s editTriggers=%s (%s) item00=%s flags00=%s (%s)",
+        "[%s] enabled=%s viewport_enabled=%s rows=%s cols=%s editTriggers=%s (%s) flags00=%s (%s)",
         tag,
         table.isEnabled(),
         table.viewport().isEnabled(),
-        table.rowCount(),
-        table.columnCount(),
+        model.rowCount(),
+        model.columnCount(),
         repr(et),
         et_int,
-        item00 is not None,
         repr(flags00),
         _to_int_safe(flags00),
     )
@@ -237,7 +231,74 @@ def _force_editable_full(table: QTableWidget, tag: str = "force") -> None:
     QTimer.singleShot(200, lambda: _dump_table_state(f"{tag}:after200ms", table))
 
 
-class JobRoleTableWidget(QTableWidget):
+class JobRoleTableModel(QAbstractTableModel):
+    """JobRoleColumns를 표시·편집하는 모델. 사용자 편집은 cell_edited(row, col)로 알린다."""
+
+    cell_edited = pyqtSignal(int, int)
+
+    EDITABLE_FLAGS = (
+        Qt.ItemFlag.ItemIsSelectable
+        | Qt.ItemFlag.ItemIsEnabled
+        | Qt.ItemFlag.ItemIsEditable
+    )
+    READONLY_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+    def __init__(self, columns: JobRoleColumns, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self.columns)
+
+    def columnCount(self, parent=QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):  # noqa: N802
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.columns.display(index.row(), index.column())
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return self.EDITABLE_FLAGS if self.columns.is_editable(index.column()) else self.READONLY_FLAGS
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):  # noqa: N802
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        if self.columns.set_text(index.row(), index.column(), value):
+            self.dataChanged.emit(index, index)
+            self.cell_edited.emit(index.row(), index.column())
+        return True
+
+    def reload(self, fill) -> None:
+        """fill(columns)로 전체 행을 다시 채운다 (모델 리셋 1회)."""
+        self.beginResetModel()
+        try:
+            self.columns.clear()
+            fill(self.columns)
+        finally:
+            self.endResetModel()
+
+    def insert_row(self, row: int, **values) -> None:
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.columns.insert(row, **values)
+        self.endInsertRows()
+
+    def rows_changed(self, rows: list[int]) -> None:
+        """열 저장소를 직접 바꾼 행들의 표시 갱신."""
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), COL_MAX))
+
+
+class JobRoleTableView(QTableView):
     def closeEditor(self, editor, hint) -> None:
         if editor is not None:
             try:
@@ -251,21 +312,15 @@ class JobRoleTableWidget(QTableWidget):
         index = self.indexAt(event.position().toPoint())
         if not index.isValid():
             return
-        row = index.row()
-        col = index.column()
-        item = self.item(row, col)
-        if item is None:
-            self._ensure_row_items(row)
-            item = self.item(row, col)
-        if item is not None and (item.flags() & Qt.ItemFlag.ItemIsEditable):
-            self.setCurrentCell(row, col)
-            self.editItem(item)
-            logging.debug("JOB_TABLE click edit row=%s col=%s", row, col)
+        if self.model().flags(index) & Qt.ItemFlag.ItemIsEditable:
+            self.setCurrentIndex(index)
+            self.edit(index)
+            logging.debug("JOB_TABLE click edit row=%s col=%s", index.row(), index.column())
 
     def keyPressEvent(self, event) -> None:
         if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-            row = self.currentRow()
-            col = self.currentColumn()
+            row = self.currentIndex().row()
+            col = self.currentIndex().column()
             logging.debug("JOB_TABLE enter at row=%s col=%s", row, col)
 
             if row < 0 or col < 0:
@@ -275,69 +330,40 @@ class JobRoleTableWidget(QTableWidget):
             if editor is not None and editor is not self:
                 self.closeEditor(editor, QAbstractItemDelegate.EndEditHint.SubmitModelCache)
 
+            model = self.model()
             if col < COL_HEADCOUNT:
-                self._ensure_row_items(row)
-                self._set_job_name_readonly(row)
-                self._set_grade_readonly(row)
                 # 입력 가능한 컬럼만 이동: 직무코드(0) → 인원(7)
                 next_col = col + 1
-                while next_col < COL_HEADCOUNT:
-                    it = self.item(row, next_col)
-                    if it is not None and (it.flags() & Qt.ItemFlag.ItemIsEditable):
-                        break
+                while next_col < COL_HEADCOUNT and not (
+                    model.flags(model.index(row, next_col)) & Qt.ItemFlag.ItemIsEditable
+                ):
                     next_col += 1
-                if next_col >= COL_HEADCOUNT:
-                    next_col = COL_HEADCOUNT
-                self.setCurrentCell(row, next_col)
-                self.editItem(self.item(row, next_col))
+                next_col = min(next_col, COL_HEADCOUNT)
+                self._edit_cell(row, next_col)
                 logging.debug("JOB_TABLE move to row=%s col=%s", row, next_col)
                 return
 
             if col == COL_HEADCOUNT:
-                self._ensure_row_items(row)
-                self._set_job_name_readonly(row)
-                self._set_grade_readonly(row)
-                job_code = (self.item(row, COL_JOB_CODE).text() or "").strip()
-                headcount = (self.item(row, COL_HEADCOUNT).text() or "").strip()
-                valid = bool(job_code) and bool(headcount)
+                valid = bool(model.columns.job_code(row))
                 logging.debug("JOB_TABLE row valid=%s", valid)
                 if valid:
                     next_row = row + 1
-                    if next_row >= self.rowCount():
-                        self.insertRow(next_row)
+                    if next_row >= model.rowCount():
+                        model.insert_row(next_row)
                         logging.debug("JOB_TABLE inserted row=%s", next_row)
-                    self._ensure_row_items(next_row)
-                    self._set_job_name_readonly(next_row)
-                    self._set_grade_readonly(next_row)
-                    self.setCurrentCell(next_row, COL_JOB_CODE)
-                    self.editItem(self.item(next_row, COL_JOB_CODE))
+                    self._edit_cell(next_row, COL_JOB_CODE)
                     logging.debug("JOB_TABLE move to row=%s col=%s", next_row, COL_JOB_CODE)
                     return
-                self.setCurrentCell(row, COL_HEADCOUNT)
-                self.editItem(self.item(row, COL_HEADCOUNT))
+                self._edit_cell(row, COL_HEADCOUNT)
                 logging.debug("JOB_TABLE stay on row=%s col=%s", row, COL_HEADCOUNT)
                 return
 
         super().keyPressEvent(event)
 
-    def _ensure_row_items(self, row: int) -> None:
-        for col in range(COL_MAX + 1):
-            if self.item(row, col) is None:
-                self.setItem(row, col, QTableWidgetItem(""))
-
-    def _set_job_name_readonly(self, row: int) -> None:
-        item = self.item(row, COL_JOB_NAME)
-        if item is None:
-            item = QTableWidgetItem("")
-            self.setItem(row, COL_JOB_NAME, item)
-        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-
-    def _set_grade_readonly(self, row: int) -> None:
-        item = self.item(row, COL_GRADE)
-        if item is None:
-            item = QTableWidgetItem("")
-            self.setItem(row, COL_GRADE, item)
-        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+    def _edit_cell(self, row: int, col: int) -> None:
+        index = self.model().index(row, col)
+        self.setCurrentIndex(index)
+        self.edit(index)
 
 
 class FloatItemDelegate(QStyledItemDelegate):
@@ -391,18 +417,12 @@ class JobRoleTable(QWidget):
     """
     직무별 입력 테이블 (표준은 읽기 전용)
     """
-    # 클래스 상수로 플래그 정의
-    EDITABLE_FLAGS = (
-        Qt.ItemFlag.ItemIsSelectable
-        | Qt.ItemFlag.ItemIsEnabled
-        | Qt.ItemFlag.ItemIsEditable
-    )
-    READONLY_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
 
     def __init__(self):
         super().__init__()
         layout = QVBoxLayout(self)
         self._loading = False
+        self.edit_generation = 0
         self.dirty = False
         self._external_on_change = None
         self._available_roles: list[dict] = []
@@ -412,23 +432,16 @@ class JobRoleTable(QWidget):
         title.setStyleSheet("font-weight: bold;")
         layout.addWidget(title)
 
-        self.table = JobRoleTableWidget(0, 8)
+        self._columns = JobRoleColumns()
+        self.model = JobRoleTableModel(self._columns, self)
+        self.table = JobRoleTableView()
+        self.table.setModel(self.model)
+        # 행 높이 고정: 행이 많아도 보이는 행만 배치·그림
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.table.setItemDelegateForColumn(COL_JOB_CODE, JobCodeComboDelegate(self))
         float_delegate = FloatItemDelegate(self.table)
         for col in range(COL_WORK_DAYS, COL_HEADCOUNT + 1):
             self.table.setItemDelegateForColumn(col, float_delegate)
-        self.table.setHorizontalHeaderLabels(
-            [
-                "직무코드",
-                "직무명",
-                "직종",
-                "근무일수",
-                "근무시간",
-                "연장시간",
-                "휴일근로일수",
-                "인원",
-            ]
-        )
         self.table.horizontalHeader().setMinimumSectionSize(80)
         self.table.setColumnWidth(COL_JOB_CODE, 140)
         self.table.setEditTriggers(
@@ -442,7 +455,7 @@ class JobRoleTable(QWidget):
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         attach_table_debug_hooks(self.table, name="job_table")
         hook_suspicious_methods(self.table, name="job_table")
-        self.table.itemChanged.connect(self._handle_item_changed)
+        self.model.cell_edited.connect(self._handle_cell_edited)
         self._force_editable()
         layout.addWidget(self.table)
 
@@ -461,47 +474,19 @@ class JobRoleTable(QWidget):
             self._available_roles = roles
             self._role_name_map = {r["job_code"]: r["job_name"] for r in roles}
             job_mapping = get_job_mapping_from_file()
-            self.table.setRowCount(0)
-            for role in roles:
-                row_idx = self.table.rowCount()
-                self.table.insertRow(row_idx)
-                job_code = role["job_code"]
-                job_name = role["job_name"]
-                grade = (job_mapping.get(job_code) or {}).get("grade", "") if isinstance(job_mapping.get(job_code), dict) else ""
-
-                code_item = QTableWidgetItem(job_code)
-                code_item.setFlags(self.EDITABLE_FLAGS)
-                name_item = QTableWidgetItem(job_name)
-                name_item.setFlags(self.READONLY_FLAGS)
-                grade_item = QTableWidgetItem(grade)
-                grade_item.setFlags(self.READONLY_FLAGS)
-
-                self.table.setItem(row_idx, COL_JOB_CODE, code_item)
-                self.table.setItem(row_idx, COL_JOB_NAME, name_item)
-                self.table.setItem(row_idx, COL_GRADE, grade_item)
-
-                # 근무일수·근무시간만 읽기 전용, 연장·휴일근로·인원은 수정 가능
-                work_days_item = QTableWidgetItem(str(default_work_days))
-                work_days_item.setFlags(self.READONLY_FLAGS)
-                work_hours_item = QTableWidgetItem(str(default_work_hours))
-                work_hours_item.setFlags(self.READONLY_FLAGS)
-                overtime_item = QTableWidgetItem("0")
-                overtime_item.setFlags(self.EDITABLE_FLAGS)
-                holiday_item = QTableWidgetItem("0")
-                holiday_item.setFlags(self.EDITABLE_FLAGS)
-                headcount_item = QTableWidgetItem("0")
-                headcount_item.setFlags(self.EDITABLE_FLAGS)
-
-                self.table.setItem(row_idx, COL_WORK_DAYS, work_days_item)
-                self.table.setItem(row_idx, COL_WORK_HOURS, work_hours_item)
-                self.table.setItem(row_idx, COL_OVERTIME_HOURS, overtime_item)
-                self.table.setItem(row_idx, COL_HOLIDAY_HOURS, holiday_item)
-                self.table.setItem(row_idx, COL_HEADCOUNT, headcount_item)
-
-                self.table._ensure_row_items(row_idx)
-                self.table._set_job_name_readonly(row_idx)
-                self.table._set_grade_readonly(row_idx)
-                self._set_auto_columns_readonly_for_row(row_idx)
+
+            def fill(columns: JobRoleColumns) -> None:
+                for role in roles:
+                    job_code = role["job_code"]
+                    meta = job_mapping.get(job_code)
+                    grade = meta.get("grade", "") if isinstance(meta, dict) else ""
+                    # 근무일수·근무시간은 기본값(읽기 전용), 연장·휴일근로·인원은 0에서 수정
+                    columns.append(
+                        job_code, role["job_name"], grade,
+                        work_days=default_work_days, work_hours=default_work_hours,
+                    )
+
+            self.model.reload(fill)
             self._force_editable()
         finally:
             self.table.blockSignals(False)
@@ -511,101 +496,56 @@ class JobRoleTable(QWidget):
 
     def set_job_inputs(self, job_inputs: dict[str, dict]) -> None:
         self._loading = True
-        self.table.setUpdatesEnabled(False)
-        self.table.blockSignals(True)
         try:
-            for row in range(self.table.rowCount()):
-                job_code = self._get_job_code(row)
-                if job_code not in job_inputs:
-                    continue  # 저장된 데이터 없는 직무는 기본값 유지
-                values = job_inputs[job_code]
-                self.table.item(row, COL_WORK_DAYS).setText(str(values.get("work_days", 0)))
-                self.table.item(row, COL_WORK_HOURS).setText(str(values.get("work_hours", 0)))
-                self.table.item(row, COL_OVERTIME_HOURS).setText(str(values.get("overtime_hours", 0)))
-                self.table.item(row, COL_HOLIDAY_HOURS).setText(str(values.get("holiday_work_days", values.get("holiday_work_hours", 0))))
-                hc = values.get("headcount", 0)
-                self.table.item(row, COL_HEADCOUNT).setText(str(int(hc)) if isinstance(hc, float) and hc == int(hc) else str(hc))
+            # 저장된 데이터 없는 직무는 기본값 유지
+            self.model.rows_changed(self._columns.apply_job_inputs(job_inputs))
             self._force_editable()
         finally:
-            self.table.blockSignals(False)
-            self.table.setUpdatesEnabled(True)
             self._loading = False
 
     def get_job_inputs(self) -> dict[str, dict]:
-        self.table.setCurrentCell(-1, -1)
+        self.table.setCurrentIndex(QModelIndex())
         editor = self.table.focusWidget()
         if editor is not None and editor is not self.table:
             self.table.commitData(editor)
             self.table.closeEditor(editor, QAbstractItemDelegate.EndEditHint.SubmitModelCache)
-        result = {}
-        for row in range(self.table.rowCount()):
-            job_code = self._get_job_code(row)
-            if not job_code:
-                logging.debug("JobRoleTable: empty job_code at row=%s", row)
-                continue
-
-            def safe_get(col: int) -> str:
-                item = self.table.item(row, col)
-                return item.text().strip() if item and item.text() else "0"
-
-            fallback = {
-                "work_days": 0.0,
-                "work_hours": 0.0,
-                "overtime_hours": 0.0,
-                "holiday_work_days": 0.0,
-                "headcount": 0,
-            }
-            try:
-                result[job_code] = {
-                    "work_days": self._to_float(safe_get(COL_WORK_DAYS)),
-                    "work_hours": self._to_float(safe_get(COL_WORK_HOURS)),
-                    "overtime_hours": self._to_float(safe_get(COL_OVERTIME_HOURS)),
-                    "holiday_work_days": self._to_float(safe_get(COL_HOLIDAY_HOURS)),
-                    "headcount": self._to_int(safe_get(COL_HEADCOUNT)),
-                }
-            except Exception as exc:
-                logging.warning("JobRoleTable: extract row %s failed, using fallback: %s", row, exc)
-                result[job_code] = fallback
-
+        # 셀 편집 시 이미 파싱된 열 배열에서 바로 읽음
+        result = self._columns.job_inputs()
         logging.debug("JobRoleTable: total jobs extracted: %s", list(result.keys()))
         return result
 
     def on_change(self, callback) -> None:
         self._external_on_change = callback
 
-    def _handle_item_changed(self, item) -> None:
-        if self._loading:
+    def _handle_cell_edited(self, row: int, col: int) -> None:
+        if self._loading or self.table.signalsBlocked():
             return
-        if item.column() == COL_JOB_CODE:
-            self._sync_name_grade_for_row(item.row())
+        if col == COL_JOB_CODE:
+            self._sync_name_grade_for_row(row)
         self.dirty = True
         if self._external_on_change:
             # Defer so delegate commit and model update are done before 노무비 상세 자동계산
             QTimer.singleShot(0, self._external_on_change)
 
     def _sync_name_grade_for_row(self, row: int) -> None:
-        """직무코드 셀 변경 시 해당 행의 직무명·직종을 동기화 (시그널 차단하여 itemChanged 중복 방지)."""
-        code = (self.table.item(row, COL_JOB_CODE).text() or "").strip() if self.table.item(row, COL_JOB_CODE) else ""
-        name = self._role_name_map.get(code, "")
+        """직무코드 셀 변경 시 해당 행의 직무명·직종을 동기화 (열 저장소 직접 갱신, cell_edited 없음)."""
+        code = self._columns.job_code(row)
         job_mapping = get_job_mapping_from_file()
         meta = job_mapping.get(code) or {}
-        grade = meta.get("grade", "") if isinstance(meta, dict) else ""
-        self.table.blockSignals(True)
-        try:
-            name_item = self.table.item(row, COL_JOB_NAME)
-            if name_item is None:
-                name_item = QTableWidgetItem("")
-                self.table.setItem(row, COL_JOB_NAME, name_item)
-            name_item.setText(name)
-            self.table._set_job_name_readonly(row)
-            grade_item = self.table.item(row, COL_GRADE)
-            if grade_item is None:
-                grade_item = QTableWidgetItem("")
-                self.table.setItem(row, COL_GRADE, grade_item)
-            grade_item.setText(grade)
-            self.table._set_grade_readonly(row)
-        finally:
-            self.table.blockSignals(False)
+        self._columns.set_text(row, COL_JOB_NAME, self._role_name_map.get(code, ""))
+        self._columns.set_text(row, COL_GRADE, meta.get("grade", "") if isinstance(meta, dict) else "")
+        self.model.rows_changed([row])
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    @dirty.setter
+    def dirty(self, value: bool) -> None:
+        # 변경 표시마다 편집 세대 증가 (백그라운드 집계 중 편집 여부 확인용)
+        if value:
+            self.edit_generation += 1
+        self._dirty = value
 
     def is_editing(self) -> bool:
         if self.table.state() == QAbstractItemView.State.EditingState:
@@ -614,79 +554,31 @@ class JobRoleTable(QWidget):
         return editor is not None and editor is not self.table
 
     def add_empty_row(self) -> None:
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table._ensure_row_items(row)
-        code_item = self.table.item(row, COL_JOB_CODE)
-        if code_item is not None:
-            code_item.setFlags(self.EDITABLE_FLAGS)
-        self.table._set_job_name_readonly(row)
-        self.table._set_grade_readonly(row)
         # 근무일수·근무시간만 읽기 전용, 연장·휴일근로·인원은 수정 가능
-        self.table.setItem(row, COL_WORK_DAYS, QTableWidgetItem("22"))
-        self.table.setItem(row, COL_WORK_HOURS, QTableWidgetItem("8"))
-        overtime_item = QTableWidgetItem("0")
-        overtime_item.setFlags(self.EDITABLE_FLAGS)
-        self.table.setItem(row, COL_OVERTIME_HOURS, overtime_item)
-        holiday_item = QTableWidgetItem("0")
-        holiday_item.setFlags(self.EDITABLE_FLAGS)
-        self.table.setItem(row, COL_HOLIDAY_HOURS, holiday_item)
-        self._set_auto_columns_readonly_for_row(row)
-        headcount_item = self.table.item(row, COL_HEADCOUNT)
-        if headcount_item is not None:
-            headcount_item.setFlags(self.EDITABLE_FLAGS)
+        self.model.insert_row(self.model.rowCount(), work_days=22, work_hours=8)
 
     def set_available_roles(self, roles: list[dict]) -> None:
         self._available_roles = roles
         self._role_name_map = {r["job_code"]: r["job_name"] for r in roles}
 
     def _get_job_code(self, row: int) -> str:
-        item = self.table.item(row, COL_JOB_CODE)
-        return (item.text() or "").strip() if item is not None else ""
+        return self._columns.job_code(row)
 
     def _to_float(self, text: str) -> float:
-        if not text:
-            return 0.0
-        try:
-            cleaned = re.sub(r"[^0-9.]", "", text)
-            return float(cleaned) if cleaned else 0.0
-        except (ValueError, TypeError):
-            return 0.0
+        return parse_float(text)
 
     def _to_int(self, text: str) -> int:
-        if not text:
-            return 0
-        try:
-            cleaned = re.sub(r"[^0-9.]", "", text)
-            return int(float(cleaned)) if cleaned else 0
-        except (ValueError, TypeError):
-            return 0
-
-    def _set_auto_columns_readonly_for_row(self, row: int) -> None:
-        """근무일수·근무시간만 읽기 전용. 연장·휴일근로는 수정 가능."""
-        for col in (COL_WORK_DAYS, COL_WORK_HOURS):
-            item = self.table.item(row, col)
-            if item is not None:
-                item.setFlags(self.READONLY_FLAGS)
-
-    def _set_auto_columns_readonly(self) -> None:
-        """모든 행에 대해 근무일수·근무시간만 읽기 전용으로 설정."""
-        for row in range(self.table.rowCount()):
-            self._set_auto_columns_readonly_for_row(row)
+        return parse_int(text)
 
     def _force_editable(self) -> None:
         _force_editable_full(self.table, tag="JOB_TABLE")
-        self._set_auto_columns_readonly()
         self._assert_editable()
 
     def _assert_editable(self) -> None:
-        if self.table.columnCount() <= 0:
+        if self.model.columnCount() <= 0:
             raise RuntimeError("JobRoleTable: columnCount is 0")
-        if self.table.rowCount() <= 0:
+        if self.model.rowCount() <= 0:
             raise RuntimeError("JobRoleTable: rowCount is 0")
         # 직무코드(0)·인원(7)만 편집 가능; 편집 가능 셀인 인원(7)로 검사
-        item = self.table.item(0, COL_HEADCOUNT)
-        if item is None:
-            raise RuntimeError("JobRoleTable: item(0, COL_HEADCOUNT) is None")
-        if not (item.flags() & Qt.ItemFlag.ItemIsEditable):
+        if not (self.model.flags(self.model.index(0, COL_HEADCOUNT)) & Qt.ItemFlag.ItemIsEditable):
             raise RuntimeError("JobRoleTable: item(0, COL_HEADCOUNT) is not editable")
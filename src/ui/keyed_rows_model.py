@@ -0,0 +1,81 @@
+"""
+표시 전용 상세 테이블 모델. DetailRow 목록을 키 기반으로 증분 반영한다.
+"""
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor, QFont
+
+from .detail_rows import EMPHASIS_PASSTHROUGH, EMPHASIS_TOTAL, DetailRow, plan_keyed_update
+
+
+class KeyedRowsModel(QAbstractTableModel):
+    """set_rows()는 삭제·삽입·변경된 행만 모델 시그널로 알린다 (연속 구간은 한 번에)."""
+
+    def __init__(self, headers: list[str], accent_columns=frozenset(), parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._accent_columns = accent_columns
+        self._rows: list[DetailRow] = []
+        self._bold = QFont()
+        self._bold.setBold(True)
+        self._total_background = QColor(240, 240, 240)
+        self._accent = QColor(21, 101, 192)
+
+    @property
+    def rows(self) -> list[DetailRow]:
+        return self._rows
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):  # noqa: N802
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row.cells[index.column()]
+        if row.emphasis == EMPHASIS_TOTAL:
+            if role == Qt.ItemDataRole.FontRole:
+                return self._bold
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self._total_background
+        if (
+            role == Qt.ItemDataRole.ForegroundRole
+            and row.emphasis == EMPHASIS_PASSTHROUGH
+            and index.column() in self._accent_columns
+        ):
+            return self._accent
+        return None
+
+    def flags(self, index):
+        # 표시 전용 (편집 불가)
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+    def set_rows(self, rows: list[DetailRow]) -> None:
+        plan = plan_keyed_update(self._rows, rows)
+        if plan.reset:
+            self.beginResetModel()
+            self._rows = list(rows)
+            self.endResetModel()
+            return
+        for first, last in plan.removed:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        for first, last in plan.inserted:
+            self.beginInsertRows(QModelIndex(), first, last)
+            self._rows[first:first] = rows[first:last + 1]
+            self.endInsertRows()
+        self._rows = list(rows)
+        last_col = len(self._headers) - 1
+        for first, last in plan.changed:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_col))
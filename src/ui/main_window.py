@@ -1,6 +1,7 @@
 import json
 import logging
 import traceback
+from dataclasses import dataclass
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
@@ -18,22 +19,29 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QInputDialog,
 )
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
 from PyQt6.QtGui import QPainter, QAction
 from PyQt6.QtPrintSupport import QPrinter
 
 import os
 from src.domain.db import get_connection, startup_verification
+from src.domain.masterdata.bundle import load_scenario_bundle
 from src.domain.masterdata.repo import MasterDataRepo
 from src.domain.migration_runner import run_migrations
 from src.domain.aggregator import Aggregator
+from src.utils import tracing
+from src.utils.tracing import span, traced
 from src.domain.result.service import (
     calculate_result,
     get_result_snapshot,
-    get_expense_rows_for_display,
     get_insurance_by_exp_code_for_scenario,
-    get_insurance_by_exp_code_from_ui,
-    get_labor_rows_from_ui,
+)
+from src.domain.result.scheduler import (
+    RECALC_EXPENSE,
+    RECALC_FULL,
+    RecalcOutcome,
+    RecalcRequest,
+    RecalcScheduler,
 )
 from src.domain.scenario_input.service import (
     ScenarioInputValidationError,
@@ -110,14 +118,15 @@ def extract_table_rows(table, columns: dict) -> list[dict]:
     rows = []
     if table is None:
         return rows
-    for row in range(table.rowCount()):
+    model = table.model()
+    for row in range(model.rowCount()):
         row_data = {}
         for key, col in columns.items():
-            if col >= table.columnCount():
+            if col >= model.columnCount():
                 row_data[key] = ""
                 continue
-            item = table.item(row, col)
-            row_data[key] = item.text() if item is not None else ""
+            value = model.index(row, col).data()
+            row_data[key] = str(value) if value is not None else ""
         rows.append(row_data)
     return rows
 
@@ -188,6 +197,43 @@ def _load_job_inputs_from_json(scenario_dir: Path, scenario_id: str) -> dict | N
     return labor_inputs if labor_inputs else None
 
 
+@dataclass
+class _PersistPayload:
+    """저장 시 UI에서 수집한 값. 작업 스레드의 DB 반영(_write_persist_payload) 입력."""
+    scenario_id: str
+    scenario_name: str
+    job_role_rows: list[dict]
+    job_inputs: dict
+    memory_sub_items: dict[str, list[dict]]
+    all_memory_sub_items: dict[str, list[dict]]
+    is_loaded_scenario: bool
+    overhead_rate: float
+    profit_rate: float
+    base_year: object
+    wage_year: object
+    wage_half: object
+    holiday_calc: dict
+
+
+def _copy_sub_items(sub_items_by_exp: dict) -> dict[str, list[dict]]:
+    return {k: [dict(si) for si in v] for k, v in sub_items_by_exp.items()}
+
+
+class _UiDispatcher(QObject):
+    """작업 스레드에서 post(fn) → UI 스레드에서 fn() 실행 (queued signal)."""
+    _posted = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._posted.connect(self._run)
+
+    def post(self, fn) -> None:
+        self._posted.emit(fn)
+
+    def _run(self, fn) -> None:
+        fn()
+
+
 class MainWindow(QWidget):
     """
     자동집하시설 원가산정 프로그램 UI
@@ -220,6 +266,10 @@ class MainWindow(QWidget):
         scenario_manager_action.triggered.connect(self._open_scenario_manager)
         tools_menu.addAction(scenario_manager_action)
 
+        trace_summary_action = QAction("성능 측정 요약...", self)
+        trace_summary_action.triggered.connect(self._show_trace_summary)
+        tools_menu.addAction(trace_summary_action)
+
         root_layout.addWidget(menu_bar)
 
         # ── 메인 콘텐츠 ──
@@ -317,12 +367,18 @@ class MainWindow(QWidget):
         self._canonical_at_aggregation = None  # 집계 실행 시 사용한 입력값 (시나리오 저장 시 이 값으로 저장)
         self._role_name_map = {}
         self._dirty = False
-        self._job_role_debounce_timer = QTimer(self)
-        self._job_role_debounce_timer.setSingleShot(True)
-        self._job_role_debounce_timer.timeout.connect(self._do_job_role_changed)
-        self._expense_detail_debounce_timer = QTimer(self)
-        self._expense_detail_debounce_timer.setSingleShot(True)
-        self._expense_detail_debounce_timer.timeout.connect(self._on_expense_quantity_or_price_changed)
+        self._edit_generation = 0  # _set_dirty(True)마다 증가 (백그라운드 집계 중 편집 감지)
+        self._ui_dispatcher = _UiDispatcher(self)
+        # 직무별 인원·경비입력 자동계산: 디바운스 타이머 1개 → 작업 스레드 재계산 → 최신 결과만 반영
+        # (재계산 세션은 스케줄러가 시나리오·노임단가 기준년도별로 보관, 불러오기/저장/설정 변경 시 재생성)
+        self._recalc_scheduler = RecalcScheduler(
+            self._apply_recalc_outcome, self._on_recalc_error, dispatch=self._ui_dispatcher.post
+        )
+        self._pending_recalc_kind = 0
+        self._expense_autosave_pending = False
+        self._recalc_debounce_timer = QTimer(self)
+        self._recalc_debounce_timer.setSingleShot(True)
+        self._recalc_debounce_timer.timeout.connect(self._run_scheduled_recalc)
         self._last_labor_count = -1
         self._last_insurance_count = -1
         self._restoring_snapshot = False  # 불러오기 시 저장된 노무비 상세 복원 직후 자동계산으로 덮어쓰기 방지
@@ -347,7 +403,9 @@ class MainWindow(QWidget):
         if _APP_CONTROLLERS_AVAILABLE:
             self._ctx = ScenarioContext.get()
             self._ctx.subscribe(self._refresh_button_state)
-            self._aggregate_controller = AggregateController(self._ctx, AggregateService())
+            self._aggregate_controller = AggregateController(
+                self._ctx, AggregateService(), dispatch=self._ui_dispatcher.post
+            )
             self._save_controller = SaveController(self._ctx, ScenarioRepository())
         else:
             self._ctx = None
@@ -363,17 +421,26 @@ class MainWindow(QWidget):
     def _open_settings(self) -> None:
         dlg = SettingsDialog(self)
         dlg.exec()
+        # 노임단가·요율이 바뀌었을 수 있으므로 재계산 세션 재생성
+        self._invalidate_recalc_session()
 
     def _open_wage_compare(self) -> None:
         try:
-            from src.domain.wage_manager import WageManager
+            from src.domain.wage_manager import get_wage_manager
             from .wage_compare_dialog import WageCompareDialog
-            wm = WageManager()
+            wm = get_wage_manager()
             dlg = WageCompareDialog(wm, self)
             dlg.exec()
         except Exception as exc:
             QMessageBox.warning(self, "도구", f"노임단가 비교를 열 수 없습니다:\n{exc}")
 
+    def _show_trace_summary(self) -> None:
+        """단계별 소요 시간 p50/p95 (COSTCALC_TRACE로 측정을 켠 세션)."""
+        box = QMessageBox(self)
+        box.setWindowTitle("성능 측정 요약")
+        box.setText(f"<pre>{tracing.format_summary()}</pre>")
+        box.exec()
+
     def _open_scenario_manager(self) -> None:
         """시나리오 관리 대화상자 열기"""
         try:
@@ -454,7 +521,7 @@ class MainWindow(QWidget):
 
     def calculate(self):
         # 예약된 노무비 자동계산이 집계 데이터를 덮어쓰지 않도록 타이머 중단
-        self._job_role_debounce_timer.stop()
+        self._cancel_scheduled_recalc()
 
         if self.job_role_table.is_editing() or self.expense_sub_item_table.table.state() == QAbstractItemView.State.EditingState:
             QMessageBox.information(
@@ -566,19 +633,40 @@ class MainWindow(QWidget):
             self.status_bar.showMessage("집계 실패")
 
     def _run_aggregate_via_controller(self, scenario_id: str, scenario_name: str) -> None:
-        """Step 3: Run aggregate via AggregateController (persist -> aggregate -> update UI)."""
+        """Step 3: Run aggregate via AggregateController (persist -> aggregate -> update UI).
+        UI 값은 여기서 수집하고, DB 반영·집계는 작업 스레드에서 실행한다."""
+        payload = self._collect_persist_payload()
+        if payload is None:
+            QMessageBox.information(self, "집계", "시나리오명을 입력하세요.")
+            return
+        # 저장 대상 입력을 수집한 시점의 편집 상태 (집계 중 편집은 저장되지 않음)
+        edit_token = self._edit_token()
+
         def persist() -> bool:
-            ok, sid, sname = self._persist_ui_to_db()
+            try:
+                ok, sid, _ = self._write_persist_payload(payload)
+            except ScenarioInputValidationError as exc:
+                errors = exc.errors
+                self._ui_dispatcher.post(lambda: self._show_validation_errors(errors))
+                return False
             return ok and bool(sid)
 
+        def on_progress(stage: str) -> None:
+            messages = {"persist": "입력 저장 중...", "aggregate": "집계 계산 중..."}
+            if stage in messages:
+                self.status_bar.showMessage(messages[stage])
+
         def on_success(snapshot: "ResultSnapshot") -> None:
             # 예약된 노무비 자동계산이 집계 결과를 덮어쓰지 않도록 타이머 중단
-            self._job_role_debounce_timer.stop()
+            self._cancel_scheduled_recalc()
             self.last_scenario_name = self._ctx.scenario_name
             self.last_scenario_id = self._ctx.scenario_id
-            self._set_dirty(False)
-            self.job_role_table.dirty = False
-            self.expense_sub_item_table.dirty = False
+            if self._edit_token() == edit_token:
+                self._set_dirty(False)
+                self.job_role_table.dirty = False
+                self.expense_sub_item_table.dirty = False
+            else:
+                logging.info("집계 중 편집이 있어 변경 표시 유지")
 
             # 집계 결과를 먼저 저장 (경비상세 탭 전환 시 사용)
             agg = snapshot.to_dict()["aggregator"]
@@ -624,6 +712,7 @@ class MainWindow(QWidget):
             persist_base_data=persist,
             on_success=on_success,
             on_error=on_error,
+            on_progress=on_progress,
         )
 
     # ── 저장/불러오기 ──
@@ -634,7 +723,7 @@ class MainWindow(QWidget):
     def _save_scenario_impl(self):
         """시나리오별 저장: 집계 실행 후 저장 시 해당 시점의 입력·스냅샷으로 저장. 그 외에는 현재 UI 반영."""
         # 예약된 노무비 자동계산이 저장 데이터를 덮어쓰지 않도록 타이머 중단
-        self._job_role_debounce_timer.stop()
+        self._cancel_scheduled_recalc()
         scenario_name_raw = (self.input_panel.get_values().get("scenario_name") or "").strip()
         scenario_name = (scenario_name_raw or "default").strip()
         scenario_id = self._sanitize_filename(scenario_name_raw or "default")
@@ -686,7 +775,8 @@ class MainWindow(QWidget):
                     for si in sub_list:
                         logging.info("[저장-집계] %s: sub=%s qty=%s price=%s amount=%s",
                                      exp_code, si.get("sub_code"), si.get("quantity"), si.get("unit_price"), si.get("amount"))
-                    repo.upsert_expense_sub_items(scenario_id, exp_code, sub_list)
+                changed = repo.save_expense_sub_items(scenario_id, all_sub)
+                logging.info("[저장-집계] 경비 세부항목 변경 %d행", changed)
             except ScenarioInputValidationError as exc:
                 self._show_validation_errors(exc.errors)
                 return
@@ -805,6 +895,19 @@ class MainWindow(QWidget):
         self.load_scenario()
 
     def load_scenario(self):
+        """불러오는 동안 컨텍스트를 로딩 상태로 두어 집계가 시작되지 않게 한다."""
+        ctx = self._ctx if _APP_CONTROLLERS_AVAILABLE else None
+        if ctx is None or ctx.is_loading:
+            self._load_scenario_impl()
+            return
+        ctx.set_loading(True)
+        try:
+            self._load_scenario_impl()
+        finally:
+            ctx.set_loading(False)
+
+    def _load_scenario_impl(self):
+        self._invalidate_recalc_session()
         # 셀 편집 중이면 편집을 먼저 확정
         commit_table_edit(self.job_role_table.table)
         commit_table_edit(self.expense_sub_item_table.table)
@@ -835,7 +938,7 @@ class MainWindow(QWidget):
             return
 
         # 불러오기 중 예약된 노무비 자동계산이 저장된 스냅샷을 덮어쓰지 않도록 타이머 중단
-        self._job_role_debounce_timer.stop()
+        self._cancel_scheduled_recalc()
 
         # 현재 입력된 직무별 데이터를 임시 저장 (마스터 데이터 새로고침 전)
         current_job_inputs = self.job_role_table.get_job_inputs()
@@ -946,18 +1049,33 @@ class MainWindow(QWidget):
 
     def _persist_ui_to_db(self):
         """현재 UI 입력을 DB에 반영. 성공 시 (True, scenario_id, scenario_name), 실패 시 (False, None, None)."""
+        with span("ui.persist_ui_to_db"):
+            with span("ui.collect_persist_payload"):
+                payload = self._collect_persist_payload()
+            if payload is None:
+                return False, None, None
+            try:
+                return self._write_persist_payload(payload)
+            except ScenarioInputValidationError as exc:
+                self._show_validation_errors(exc.errors)
+                return False, None, None
+
+    def _collect_persist_payload(self) -> "_PersistPayload | None":
+        """저장할 UI 상태 수집 (UI 스레드). DB에는 접근하지 않는다."""
         # 예약된 노무비 자동계산이 저장할 데이터를 덮어쓰지 않도록 타이머 중단
-        self._job_role_debounce_timer.stop()
+        self._cancel_scheduled_recalc()
+        # 직무·단가·경비 세부가 DB에 다시 쓰이므로 재계산 세션은 다음 자동계산 때 새로 만든다
+        self._invalidate_recalc_session()
         commit_table_edit(self.job_role_table.table)
         commit_table_edit(self.expense_sub_item_table.table)
         values = self.input_panel.get_values()
         scenario_name = (values.get("scenario_name") or "").strip() or "default"
         scenario_id = self._sanitize_filename(scenario_name)
         if not scenario_id:
-            return False, None, None
+            return None
         logging.info("[저장] 시나리오 저장 대상 id=%r 이름=%r", scenario_id, scenario_name)
 
-        data = extract_table_rows(
+        job_role_rows = extract_table_rows(
             self.job_role_table.table,
             {
                 "job_code": COL_JOB_CODE,
@@ -970,33 +1088,54 @@ class MainWindow(QWidget):
                 "headcount": COL_HEADCOUNT,
             },
         )
-        logging.info("[저장] 직무행 수 = %s", len(data))
-        save_json(str(self.scenario_dir / f"{scenario_id}_job_roles.json"), data)
+        logging.info("[저장] 직무행 수 = %s", len(job_role_rows))
+        table_rows = self.job_role_table.model.rowCount()
+        job_inputs = self.job_role_table.get_job_inputs()
+        logging.info("[저장] 직무 테이블 행=%d, UI 직무입력=%d건", table_rows, len(job_inputs))
+        if len(job_inputs) > 0:
+            logging.info("[저장] 직무입력 샘플: %s", list(job_inputs.items())[:2])
+        total_headcount = sum(
+            v.get("headcount", 0) for v in job_inputs.values()
+        ) or 1
+        est = self.expense_sub_item_table
+        est._total_headcount = max(int(total_headcount), 1)
+        est._save_table_to_current_exp()
+        year_values = self.base_year_panel.get_values()
+        return _PersistPayload(
+            scenario_id=scenario_id,
+            scenario_name=scenario_name,
+            job_role_rows=job_role_rows,
+            job_inputs=job_inputs,
+            # 작업 스레드에서 읽으므로 행 dict까지 복사
+            memory_sub_items=_copy_sub_items(est._sub_items_by_exp),
+            all_memory_sub_items=_copy_sub_items(est.get_all_sub_items(total_headcount=total_headcount)),
+            is_loaded_scenario=getattr(self, "last_scenario_id", None) == scenario_id,
+            overhead_rate=values.get("overhead_rate", 0.0),
+            profit_rate=values.get("profit_rate", 0.0),
+            base_year=year_values.get("base_year"),
+            wage_year=year_values.get("wage_year"),
+            wage_half=year_values.get("wage_half"),
+            holiday_calc=self.holiday_work_days_panel.get_values(),
+        )
+
+    @traced("persist.write_payload")
+    def _write_persist_payload(self, payload: "_PersistPayload"):
+        """수집한 UI 상태를 DB에 반영 (위젯에 접근하지 않으므로 작업 스레드에서 실행 가능).
+        검증 실패 시 ScenarioInputValidationError."""
+        scenario_id = payload.scenario_id
+        save_json(str(self.scenario_dir / f"{scenario_id}_job_roles.json"), payload.job_role_rows)
 
         conn = get_connection()
         try:
             run_migrations(conn)
             repo = MasterDataRepo(conn)
-            # 새 시나리오: 직무/경비 마스터가 없으면 default에서 복사 → 불러오기 시 저장 데이터 있음
+            # 새 시나리오: 직무/경비 마스터가 없으면 default 상속으로 연결 → 불러오기 시 저장 데이터 있음
             repo.ensure_job_roles_for_scenario(scenario_id)
             repo.ensure_expense_masterdata_for_scenario(scenario_id)
-            table_rows = self.job_role_table.table.rowCount()
-            job_inputs = self.job_role_table.get_job_inputs()
-            logging.info("[저장] 직무 테이블 행=%d, UI 직무입력=%d건", table_rows, len(job_inputs))
-            if len(job_inputs) > 0:
-                logging.info("[저장] 직무입력 샘플: %s", list(job_inputs.items())[:2])
             # 경비 탭: 저장 대상이 현재 불러온 시나리오면 메모리 전체 저장; 아니면 DB 기준으로 현재 경비코드만 반영
-            commit_table_edit(self.expense_sub_item_table.table)
-            total_headcount = sum(
-                v.get("headcount", 0) for v in job_inputs.values()
-            ) or 1
-            est = self.expense_sub_item_table
-            est._total_headcount = max(int(total_headcount), 1)
-            est._save_table_to_current_exp()
-
-            if getattr(self, "last_scenario_id", None) == scenario_id:
+            if payload.is_loaded_scenario:
                 # 방금 불러온 시나리오와 동일 → 수정한 모든 경비코드 반영
-                all_sub = est.get_all_sub_items(total_headcount=total_headcount)
+                all_sub = payload.all_memory_sub_items
             else:
                 # 다른 시나리오 또는 한 번도 불러오지 않음 → DB에 있던 값 유지, 메모리에 있는 모든 경비코드 반영
                 existing_raw = repo.get_expense_sub_items(scenario_id)
@@ -1005,12 +1144,12 @@ class MainWindow(QWidget):
                     existing_by_exp.setdefault(si.exp_code, []).append(_sub_item_to_dict(si))
                 if existing_by_exp:
                     # 메모리에 있는 모든 경비코드의 수정사항을 DB 데이터 위에 덮어쓰기
-                    for mem_code, mem_items in est._sub_items_by_exp.items():
+                    for mem_code, mem_items in payload.memory_sub_items.items():
                         if mem_code not in EXP_CODES_FROM_LABOR and mem_items:
                             existing_by_exp[mem_code] = list(mem_items)
                     all_sub = {k: v for k, v in existing_by_exp.items() if k not in EXP_CODES_FROM_LABOR}
                 else:
-                    all_sub = est.get_all_sub_items(total_headcount=total_headcount)
+                    all_sub = payload.all_memory_sub_items
 
             expense_inputs = {}
             for exp_code, sub_list in all_sub.items():
@@ -1022,42 +1161,32 @@ class MainWindow(QWidget):
                 expense_inputs[exp_code] = {"quantity": total_qty, "unit_price": unit_price}
             logging.info("[저장] 경비 입력 %d개 코드 canonical 반영 (기준: DB 병합)", len(expense_inputs))
             ui_data = {
-                "job_inputs": job_inputs,
+                "job_inputs": payload.job_inputs,
                 "expense_inputs": expense_inputs,
             }
-            input_values = self.input_panel.get_values()
-            overhead_rate = input_values.get("overhead_rate", 0.0)
-            profit_rate = input_values.get("profit_rate", 0.0)
-            year_values = self.base_year_panel.get_values()
-            base_year = year_values.get("base_year")
-            wage_year = year_values.get("wage_year")
-            wage_half = year_values.get("wage_half")
-            holiday_calc = self.holiday_work_days_panel.get_values()
-            payload = build_canonical_input(
+            canonical = build_canonical_input(
                 ui_data["job_inputs"],
                 ui_data["expense_inputs"],
-                overhead_rate=overhead_rate,
-                profit_rate=profit_rate,
-                base_year=base_year,
-                wage_year=wage_year,
-                wage_half=wage_half,
-                holiday_work_days_calc=holiday_calc,
+                overhead_rate=payload.overhead_rate,
+                profit_rate=payload.profit_rate,
+                base_year=payload.base_year,
+                wage_year=payload.wage_year,
+                wage_half=payload.wage_half,
+                holiday_work_days_calc=payload.holiday_calc,
             )
-            payload["_display_name"] = scenario_name  # 재실행 후 목록/불러오기 시 표시명 복원용
+            canonical["_display_name"] = payload.scenario_name  # 재실행 후 목록/불러오기 시 표시명 복원용
             logging.info("[저장] canonical 직무수: %d건, 경비: %d건",
-                        len(payload.get("labor", {}).get("job_roles", {})),
-                        len(payload.get("expenses", {}).get("items", {})))
-            post_scenario_input(payload, scenario_id, conn)
+                        len(canonical.get("labor", {}).get("job_roles", {})),
+                        len(canonical.get("expenses", {}).get("items", {})))
+            post_scenario_input(canonical, scenario_id, conn)
             logging.info("[저장-직접] 경비 세부항목 %d개 코드 DB 저장 시작", len(all_sub))
             for exp_code, sub_list in all_sub.items():
                 for si in sub_list:
                     logging.info("[저장-직접] %s: sub=%s qty=%s price=%s amount=%s",
                                  exp_code, si.get("sub_code"), si.get("quantity"), si.get("unit_price"), si.get("amount"))
-                repo.upsert_expense_sub_items(scenario_id, exp_code, sub_list)
-            return True, scenario_id, scenario_name
-        except ScenarioInputValidationError as exc:
-            self._show_validation_errors(exc.errors)
-            return False, None, None
+            changed = repo.save_expense_sub_items(scenario_id, all_sub)
+            logging.info("[저장-직접] 경비 세부항목 변경 %d행", changed)
+            return True, scenario_id, payload.scenario_name
         finally:
             conn.close()
 
@@ -1120,11 +1249,12 @@ class MainWindow(QWidget):
         commit_table_edit(self.expense_sub_item_table.table)
         _ = self.job_role_table.get_job_inputs()
         conn = get_connection()
-        repo = MasterDataRepo(conn)
         try:
+            repo = MasterDataRepo(conn)
             repo.ensure_expense_masterdata_for_scenario(scenario_id)
-            roles = repo.get_job_roles(scenario_id)
-            items = repo.get_expense_items(scenario_id)
+            bundle = load_scenario_bundle(conn, scenario_id)
+            roles = bundle.job_roles
+            items = bundle.expense_items
             self._role_name_map = {r.job_code: r.job_name for r in roles}
             self.job_role_table.table.blockSignals(True)
             try:
@@ -1487,10 +1617,18 @@ class MainWindow(QWidget):
     def _mark_dirty(self):
         self._set_dirty(True)
 
+    def _edit_token(self) -> tuple[int, int, int]:
+        """현재 편집 상태 토큰. 작업 제출 시 값과 다르면 그 사이 편집이 있었다."""
+        return (
+            self._edit_generation,
+            self.job_role_table.edit_generation,
+            self.expense_sub_item_table.edit_generation,
+        )
+
     def _on_job_role_changed(self):
         """직무별 인원 입력 변경 시 디바운스 후 실제 계산 수행."""
         self._mark_dirty()
-        self._job_role_debounce_timer.start(300)
+        self._schedule_recalc(RECALC_FULL, 300)
 
     def _clear_restoring_snapshot(self) -> None:
         """불러오기 후 일정 시간이 지나면 플래그 해제 (이후 사용자 편집 시 자동계산 정상 동작)."""
@@ -1498,11 +1636,34 @@ class MainWindow(QWidget):
 
     def _debounce_expense_detail_refresh(self) -> None:
         """경비입력 수량/단가 셀 변경 시 디바운스 후 경비상세 자동 재계산."""
-        self._expense_detail_debounce_timer.stop()
-        self._expense_detail_debounce_timer.start(400)
+        self._expense_autosave_pending = True
+        self._schedule_recalc(RECALC_EXPENSE, 400)
+
+    def _schedule_recalc(self, kind: int, delay_ms: int) -> None:
+        """직무·경비 편집을 하나의 디바운스 타이머로 합침. 종류는 우선순위가 높은 쪽(전체 재계산)으로 합쳐진다."""
+        self._pending_recalc_kind = max(self._pending_recalc_kind, kind)
+        # 계산 중인 결과는 이 편집 이전 입력 기준이므로 반영하지 않음
+        self._recalc_scheduler.mark_pending(kind)
+        self._recalc_debounce_timer.start(delay_ms)
+
+    def _cancel_scheduled_recalc(self) -> None:
+        """예약·계산 중인 자동계산 취소 (집계·저장·불러오기 결과를 덮어쓰지 않도록)."""
+        self._recalc_debounce_timer.stop()
+        self._pending_recalc_kind = 0
+        self._expense_autosave_pending = False
+        self._recalc_scheduler.cancel()
+
+    def _run_scheduled_recalc(self) -> None:
+        """디바운스 타임아웃: 경비입력 자동 저장 후 대기 중인 재계산을 한 번에 제출."""
+        kind, self._pending_recalc_kind = self._pending_recalc_kind, 0
+        if self._expense_autosave_pending:
+            self._expense_autosave_pending = False
+            self._on_expense_quantity_or_price_changed()
+        if kind:
+            self._submit_recalc(kind)
 
     def _on_expense_quantity_or_price_changed(self) -> None:
-        """디바운스 타임아웃: 테이블 → 메모리 반영, 경비상세 재계산, 현재 경비코드 DB 자동 저장."""
+        """테이블 → 메모리 반영, 현재 경비코드 DB 자동 저장. 경비상세 재계산은 스케줄러가 수행."""
         logging.info("[경비입력→경비상세] 수량/단가 변경 감지 → 경비상세 자동 재계산 시작")
         commit_table_edit(self.expense_sub_item_table.table)
         total_headcount = sum(
@@ -1510,9 +1671,7 @@ class MainWindow(QWidget):
         ) or 1
         self.expense_sub_item_table._total_headcount = max(int(total_headcount), 1)
         self.expense_sub_item_table._save_table_to_current_exp()
-        self._refresh_expense_detail_from_input()
         self._save_current_expense_only(silent=True)
-        logging.info("[경비입력→경비상세] 경비상세 자동 재계산 완료")
 
     def _on_expense_edit_applied(self) -> None:
         """경비입력 수정 버튼 클릭 시: 상태 메시지 + 경비상세 탭 재계산."""
@@ -1523,180 +1682,159 @@ class MainWindow(QWidget):
 
     def _refresh_expense_detail_from_input(self) -> None:
         """현재 경비입력(_sub_items_by_exp) 기준으로 경비상세 탭만 재계산해 갱신. DB/직무 변경 없음."""
-        commit_table_edit(self.expense_sub_item_table.table)
-        values = self.input_panel.get_values()
-        scenario_name = (values.get("scenario_name") or "").strip() or "default"
-        scenario_id = self._sanitize_filename(scenario_name)
-        if not scenario_id:
-            scenario_id = "default"
-        est = self.expense_sub_item_table
-        if not est._sub_items_by_exp:
-            return
-        try:
-            conn = get_connection()
-            try:
-                job_inputs = self.job_role_table.get_job_inputs()
-                year_values = self.base_year_panel.get_values()
-                wage_year = year_values.get("wage_year")
-                labor_rows = get_labor_rows_from_ui(
-                    job_inputs, scenario_id, conn, wage_year=wage_year
-                )
-                labor_total = sum(
-                    int(r.get("role_total", 0)) for r in labor_rows if isinstance(r, dict)
-                )
-                expense_rows = get_expense_rows_for_display(
-                    scenario_id, conn, est._sub_items_by_exp, labor_total
-                )
-                total_headcount = sum(
-                    v.get("headcount", 0) for v in job_inputs.values()
-                ) or 1
-                self.last_expense_rows = expense_rows
-                self.expense_detail.update_rows(expense_rows, total_headcount=total_headcount)
-                self.expense_detail.update()
-            finally:
-                conn.close()
-        except Exception as exc:
-            logging.exception("경비상세 재계산 중 오류: %s", exc)
+        self._submit_recalc(RECALC_EXPENSE)
 
     def _do_job_role_changed(self):
         """직무별 인원 입력이 변경되면 보험료를 자동 계산하여 경비입력에 반영. DB 반영 없이 현재 UI 기준으로만 계산."""
-        if getattr(self, "_restoring_snapshot", False):
+        with span("ui.job_role_changed"):
+            self._submit_recalc(RECALC_FULL)
+
+    def _submit_recalc(self, kind: int) -> None:
+        """UI 입력 스냅샷을 떠서 재계산 스케줄러에 제출 (UI 스레드). 결과는 _apply_recalc_outcome에서 반영."""
+        if kind >= RECALC_FULL and getattr(self, "_restoring_snapshot", False):
             # 플래그를 여기서 해제하지 않음 → 400ms 타이머가 해제 (보호 기간 내 중복 호출 방지)
+            self._recalc_scheduler.cancel()
             return
         values = self.input_panel.get_values()
-        scenario_name = values.get("scenario_name") or "default"
-
-        scenario_id = self._sanitize_filename(scenario_name)
-
-        if not scenario_id:
-            scenario_id = "default"
+        scenario_name = (values.get("scenario_name") or "").strip() or "default"
+        scenario_id = self._sanitize_filename(scenario_name) or "default"
 
         commit_table_edit(self.job_role_table.table)
         job_inputs = self.job_role_table.get_job_inputs()
-
         # 기준년도 패널에서 노임단가 기준년도 읽기 (시나리오별 올바른 임금 기준 적용)
-        year_values = self.base_year_panel.get_values()
-        wage_year = year_values.get("wage_year")
+        wage_year = self.base_year_panel.get_values().get("wage_year")
 
-        try:
-            conn = get_connection()
-            try:
-                # 노무비 상세 계산 및 표시
-                labor_rows = get_labor_rows_from_ui(job_inputs, scenario_id, conn, wage_year=wage_year)
-                # ISSUE-008 수정: 집계 결과가 있을 때는 빈 데이터로 덮어쓰지 않음
-                if labor_rows or not self.last_labor_rows:
-                    self.last_labor_rows = labor_rows
-                    display_rows = labor_rows
-                else:
-                    # 빈 데이터면 기존 집계 결과 유지
-                    display_rows = self.last_labor_rows
-                self.labor_detail.update_rows(display_rows)
-                self.labor_detail.update()
-                n_labor = len(display_rows)
-                if n_labor != self._last_labor_count:
-                    logging.info("노무비 상세 자동계산 완료: %s개 직무 반영", n_labor)
-                    self._last_labor_count = n_labor
-
-                labor_total = sum(
-                    int(r.get("role_total", 0)) for r in labor_rows if isinstance(r, dict)
-                )
-                aggregator = Aggregator(
-                    labor_total, 0, 0, 0, 0, 0
-                )
-                self.last_aggregator = aggregator
-                self.summary_panel.update_summary(aggregator, pdf_grand_total=0)
-                self.summary_panel.update()
-                self.donut_chart.update_aggregator(aggregator)
-                self._refresh_button_state()
-
-                # 직무별 인원 → 노무비 보험료 7종 → 경비입력 경비코드(보험 7종) 자동 매핑
-                labor_insurance = get_insurance_by_exp_code_from_ui(job_inputs, scenario_id, conn, wage_year=wage_year) or {}
-                n_ins = len(labor_insurance)
-                if n_ins != self._last_insurance_count:
-                    logging.info("보험료 자동계산 완료: %s개 항목 반영", n_ins)
-                    self._last_insurance_count = n_ins
-
-                # 경비 항목 정보 가져오기 (새 시나리오면 default에서 경비코드 복사)
-                repo = MasterDataRepo(conn)
-                repo.ensure_expense_masterdata_for_scenario(scenario_id)
-                items = repo.get_expense_items(scenario_id)
-                expense_items_for_sub = [
-                    {
-                        "exp_code": i.exp_code,
-                        "exp_name": i.exp_name,
-                        "group_code": i.group_code,
-                        "sort_order": i.sort_order,
-                    }
-                    for i in items
-                ]
+        # 사용자 편집 중인 비보험 항목 보존: 현재 테이블 편집 내용을 먼저 in-memory에 저장
+        est = self.expense_sub_item_table
+        commit_table_edit(est.table)
+        est._save_table_to_current_exp()
+        if kind < RECALC_FULL and not est._sub_items_by_exp:
+            return
+        self._recalc_scheduler.submit(RecalcRequest(
+            kind=kind,
+            scenario_id=scenario_id,
+            wage_year=wage_year,
+            job_inputs=job_inputs,
+            user_sub_items=_copy_sub_items(est._sub_items_by_exp),
+        ))
+
+    @traced("ui.apply_recalc_outcome")
+    def _apply_recalc_outcome(self, outcome: RecalcOutcome) -> None:
+        """스케줄러의 최신 계산 결과를 위젯에 반영 (UI 스레드)."""
+        total_headcount = outcome.total_headcount
+        if outcome.result is None:
+            # 경비상세만 재계산
+            expense_rows = list(outcome.expense_rows)
+            self.last_expense_rows = expense_rows
+            self.expense_detail.update_rows(expense_rows, total_headcount=total_headcount or 1)
+            self.expense_detail.update()
+            logging.info("[경비입력→경비상세] 경비상세 자동 재계산 완료")
+            return
 
-                # 총 인원 수 계산
-                total_headcount = sum(
-                    v.get("headcount", 0) for v in job_inputs.values()
-                )
+        result = outcome.result
+        rebuilt = outcome.rebuilt
+        # 세션 계산 기준이 아니라 마지막으로 화면에 반영한 결과 대비 변경분
+        # (버려진 결과·합쳐진 경비 편집이 있어도 위젯이 최신 결과를 보이도록)
+        changes = outcome.ui_changes
+
+        # 노무비 상세 계산 및 표시
+        if rebuilt or changes.labor_rows:
+            labor_rows = list(result.labor_rows)
+            # ISSUE-008 수정: 집계 결과가 있을 때는 빈 데이터로 덮어쓰지 않음
+            if labor_rows or not self.last_labor_rows:
+                self.last_labor_rows = labor_rows
+                display_rows = labor_rows
+            else:
+                # 빈 데이터면 기존 집계 결과 유지
+                display_rows = self.last_labor_rows
+            self.labor_detail.update_rows(display_rows)
+            self.labor_detail.update()
+            n_labor = len(display_rows)
+            if n_labor != self._last_labor_count:
+                logging.info("노무비 상세 자동계산 완료: %s개 직무 반영", n_labor)
+                self._last_labor_count = n_labor
+
+        # 자동계산 요약은 노무비 상세 role_total 합 기준
+        labor_total = result.role_total
+        if rebuilt or changes.labor_total or self.last_aggregator is None:
+            aggregator = Aggregator(
+                labor_total, 0, 0, 0, 0, 0
+            )
+            self.last_aggregator = aggregator
+            self.summary_panel.update_summary(aggregator, pdf_grand_total=0)
+            self.summary_panel.update()
+            self.donut_chart.update_aggregator(aggregator)
+        self._refresh_button_state()
 
-                # 사용자 편집 중인 비보험 항목 보존: 보험 7종만 DB 재계산으로 갱신
-                est = self.expense_sub_item_table
+        if not (rebuilt or changes.expenses):
+            # 화면의 경비 세부·경비상세와 같음 (보험 7종·노무비 합계·경비 편집 변화 없음) → 경비입력/경비상세 재구성 생략
+            self.status_bar.showMessage(f"✓ 노무비 자동계산 완료 (인원: {total_headcount}명)", 3000)
+            self._sync_holiday_headcount()
+            return
+
+        # 직무별 인원 → 노무비 보험료 7종 → 경비입력 경비코드(보험 7종) 자동 매핑
+        n_ins = len(result.insurance_by_exp_code)
+        if n_ins != self._last_insurance_count:
+            logging.info("보험료 자동계산 완료: %s개 항목 반영", n_ins)
+            self._last_insurance_count = n_ins
 
-                # 현재 테이블 편집 내용을 먼저 in-memory에 저장
-                commit_table_edit(est.table)
-                est._save_table_to_current_exp()
-                user_edits = dict(est._sub_items_by_exp)
+        expense_items_for_sub = [
+            {
+                "exp_code": i.exp_code,
+                "exp_name": i.exp_name,
+                "group_code": i.group_code,
+                "sort_order": i.sort_order,
+            }
+            for i in outcome.expense_items
+        ]
+        sub_items_by_exp = dict(result.sub_items_by_exp)
 
-                # DB에서 세부 항목 재구성 (보험 7종 포함)
-                sub_items_by_exp = build_sub_items_by_exp(
-                    repo, scenario_id,
-                    labor_insurance_by_exp_code=labor_insurance,
-                    expense_items=expense_items_for_sub,
+        # 경비입력 탭이 보일 때만 테이블 UI 갱신, 아닐 때도 in-memory 데이터는 업데이트
+        est = self.expense_sub_item_table
+        if self.tabs.currentIndex() == self.tabs.indexOf(est):
+            est.table.blockSignals(True)
+            try:
+                est.load_sub_items(
+                    sub_items_by_exp, expense_items_for_sub, total_headcount=total_headcount
                 )
+            finally:
+                est.table.blockSignals(False)
+        else:
+            # 다른 탭에 있을 때: in-memory 데이터만 갱신 (보험 7종 반영 + 사용자 편집 보존)
+            est._sub_items_by_exp = {
+                exp_code: [_sub_item_to_dict(si) for si in items]
+                for exp_code, items in sub_items_by_exp.items()
+            }
 
-                # 사용자 편집 병합: 비보험 코드는 사용자 편집값 유지
-                for code, items in user_edits.items():
-                    if code not in EXP_CODES_FROM_LABOR and items:
-                        sub_items_by_exp[code] = items
-
-                # 경비입력 탭이 보일 때만 테이블 UI 갱신, 아닐 때도 in-memory 데이터는 업데이트
-                if self.tabs.currentIndex() == self.tabs.indexOf(self.expense_sub_item_table):
-                    est.table.blockSignals(True)
-                    try:
-                        est.load_sub_items(
-                            sub_items_by_exp, expense_items_for_sub, total_headcount=total_headcount
-                        )
-                    finally:
-                        est.table.blockSignals(False)
-                else:
-                    # 다른 탭에 있을 때: in-memory 데이터만 갱신 (보험 7종 반영 + 사용자 편집 보존)
-                    est._sub_items_by_exp = {
-                        exp_code: [_sub_item_to_dict(si) for si in items]
-                        for exp_code, items in sub_items_by_exp.items()
-                    }
+        # 경비 상세에도 보험 7종 포함해 반영
+        expense_rows = list(result.expense_rows)
+        self.last_expense_rows = expense_rows
+        self.expense_detail.update_rows(expense_rows, total_headcount=total_headcount)
+        self.expense_detail.update()
 
-                # 경비 상세에도 보험 7종 포함해 반영
-                expense_rows = get_expense_rows_for_display(
-                    scenario_id, conn, sub_items_by_exp, labor_total
-                )
-                self.last_expense_rows = expense_rows
-                self.expense_detail.update_rows(expense_rows, total_headcount=total_headcount)
-                self.expense_detail.update()
+        self.status_bar.showMessage(f"✓ 노무비 자동계산 완료 (인원: {total_headcount}명)", 3000)
 
-                self.status_bar.showMessage(f"✓ 노무비 자동계산 완료 (인원: {total_headcount}명)", 3000)
+        # 휴일근무일수 탭: 관리소장 제외 인원 자동 반영
+        self._sync_holiday_headcount()
 
-                # 휴일근무일수 탭: 관리소장 제외 인원 자동 반영
-                self._sync_holiday_headcount()
+    def _on_recalc_error(self, request: RecalcRequest, exc: Exception) -> None:
+        if request.kind < RECALC_FULL:
+            # 경비상세 재계산 오류는 로그만 (스케줄러에서 기록)
+            return
+        error_msg = f"노무비 자동계산 중 오류: {str(exc)}"
+        self.status_bar.showMessage(f"⚠ {error_msg}", 5000)
+        QMessageBox.warning(
+            self,
+            "자동계산 오류",
+            f"{error_msg}\n\n자세한 내용은 로그를 확인하세요."
+        )
 
-            finally:
-                conn.close()
-        except Exception as exc:
-            error_msg = f"노무비 자동계산 중 오류: {str(exc)}"
-            logging.exception(error_msg)
-            self.status_bar.showMessage(f"⚠ {error_msg}", 5000)
-            QMessageBox.warning(
-                self,
-                "자동계산 오류",
-                f"{error_msg}\n\n자세한 내용은 로그를 확인하세요."
-            )
+    def _invalidate_recalc_session(self) -> None:
+        self._recalc_scheduler.invalidate_session()
 
     def _set_dirty(self, value: bool):
+        if value:
+            self._edit_generation += 1
         self._dirty = value
         # 타이틀에 더티 마커 표시
         if value:
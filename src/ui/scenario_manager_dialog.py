@@ -1,7 +1,7 @@
 """
 시나리오 관리 대화상자
 
-저장된 모든 시나리오를 목록으로 표시하고,
+저장된 모든 시나리오를 목록으로 표시하고 (표시명 검색·정렬·페이지),
 선택한 시나리오를 삭제할 수 있습니다.
 """
 
@@ -14,12 +14,26 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QListWidgetItem,
     QLabel,
+    QLineEdit,
+    QComboBox,
     QMessageBox,
 )
 from PyQt6.QtCore import Qt
 
 from src.domain.db import get_connection
-from src.domain.scenario_input.service import list_scenario_ids, delete_scenario
+from src.domain.scenario_input.service import count_catalog, delete_scenario, list_catalog
+
+# 한 페이지에 표시할 시나리오 수
+PAGE_SIZE = 200
+
+# (표시 이름, 정렬 키, 내림차순)
+SORT_OPTIONS = (
+    ("이름순", "name", False),
+    ("최근 수정순", "updated_at", True),
+    ("총액 큰 순", "grand_total", True),
+    ("인원 많은 순", "headcount", True),
+    ("노임 기준년도순", "wage_year", False),
+)
 
 
 class ScenarioManagerDialog(QDialog):
@@ -31,6 +45,7 @@ class ScenarioManagerDialog(QDialog):
         self.setModal(True)
         self.resize(500, 400)
         self.deleted_scenarios = []  # 삭제된 시나리오 목록
+        self._page = 0
 
         self._setup_ui()
         self._load_scenarios()
@@ -44,14 +59,36 @@ class ScenarioManagerDialog(QDialog):
         info_label.setStyleSheet("font-weight: bold; margin-bottom: 10px;")
         layout.addWidget(info_label)
 
+        # 검색·정렬
+        filter_layout = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("표시명 검색 (앞부분 일치)")
+        self.search_edit.textChanged.connect(self._reload_first_page)
+        self.sort_combo = QComboBox()
+        for label, _, _ in SORT_OPTIONS:
+            self.sort_combo.addItem(label)
+        self.sort_combo.currentIndexChanged.connect(self._reload_first_page)
+        filter_layout.addWidget(self.search_edit, 1)
+        filter_layout.addWidget(self.sort_combo)
+        layout.addLayout(filter_layout)
+
         # 시나리오 목록
         self.scenario_list = QListWidget()
         self.scenario_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
         layout.addWidget(self.scenario_list)
 
-        # 정보 레이블
+        # 정보 레이블·페이지 이동
+        page_layout = QHBoxLayout()
         self.count_label = QLabel("총 0개의 시나리오")
-        layout.addWidget(self.count_label)
+        self.prev_button = QPushButton("◀ 이전")
+        self.prev_button.clicked.connect(lambda: self._change_page(-1))
+        self.next_button = QPushButton("다음 ▶")
+        self.next_button.clicked.connect(lambda: self._change_page(1))
+        page_layout.addWidget(self.count_label)
+        page_layout.addStretch()
+        page_layout.addWidget(self.prev_button)
+        page_layout.addWidget(self.next_button)
+        layout.addLayout(page_layout)
 
         # 버튼 영역
         button_layout = QHBoxLayout()
@@ -73,30 +110,55 @@ class ScenarioManagerDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def _reload_first_page(self, *_):
+        self._page = 0
+        self._load_scenarios()
+
+    def _change_page(self, step: int):
+        self._page = max(0, self._page + step)
+        self._load_scenarios()
+
     def _load_scenarios(self):
-        """데이터베이스에서 시나리오 목록 불러오기"""
+        """데이터베이스에서 시나리오 목록 불러오기 (현재 검색어·정렬·페이지)"""
         self.scenario_list.clear()
+        search = self.search_edit.text().strip() or None
+        _, sort_key, descending = SORT_OPTIONS[max(0, self.sort_combo.currentIndex())]
 
         try:
             conn = get_connection()
             try:
-                scenario_ids = list_scenario_ids(conn)
+                # default 시나리오 제외 (삭제 불가능)
+                total = count_catalog(conn, search=search, include_default=False)
+                last_page = max(0, (total - 1) // PAGE_SIZE)
+                self._page = min(self._page, last_page)
+                entries = list_catalog(
+                    conn,
+                    search=search,
+                    sort=sort_key,
+                    descending=descending,
+                    limit=PAGE_SIZE,
+                    offset=self._page * PAGE_SIZE,
+                    include_default=False,
+                )
             finally:
                 conn.close()
 
-            # default 시나리오 제외 (삭제 불가능)
-            scenario_ids = [sid for sid in scenario_ids if sid.lower() != "default"]
-
-            # 목록에 추가
-            for scenario_id in scenario_ids:
-                item = QListWidgetItem(scenario_id)
+            # 목록에 추가 (삭제에는 scenario_id 사용)
+            for entry in entries:
+                item = QListWidgetItem(self._format_entry(entry))
+                item.setData(Qt.ItemDataRole.UserRole, entry.scenario_id)
                 self.scenario_list.addItem(item)
 
-            # 카운트 업데이트
-            self.count_label.setText(f"총 {len(scenario_ids)}개의 시나리오 (default 제외)")
+            # 카운트·페이지 업데이트
+            text = f"총 {total}개의 시나리오 (default 제외)"
+            if total > PAGE_SIZE:
+                text += f" · {self._page + 1}/{last_page + 1} 페이지"
+            self.count_label.setText(text)
+            self.prev_button.setEnabled(self._page > 0)
+            self.next_button.setEnabled(self._page < last_page)
 
             # 시나리오가 없으면 삭제 버튼 비활성화
-            self.delete_button.setEnabled(len(scenario_ids) > 0)
+            self.delete_button.setEnabled(len(entries) > 0)
 
         except Exception as e:
             logging.exception("시나리오 목록 로드 실패")
@@ -106,6 +168,18 @@ class ScenarioManagerDialog(QDialog):
                 f"시나리오 목록을 불러오는 중 오류가 발생했습니다.\n{e}"
             )
 
+    @staticmethod
+    def _format_entry(entry) -> str:
+        """목록 표시: 표시명 (ID) · 노임 기준년도 · 인원 · 총액 · 수정 시각"""
+        parts = [entry.display_name if entry.display_name == entry.scenario_id
+                 else f"{entry.display_name} ({entry.scenario_id})"]
+        if entry.wage_year:
+            parts.append(f"{entry.wage_year}년 노임")
+        parts.append(f"{entry.headcount:g}명")
+        parts.append(f"{entry.grand_total:,.0f}원" if entry.grand_total is not None else "미집계")
+        parts.append(entry.updated_at)
+        return " · ".join(parts)
+
     def _delete_selected(self):
         """선택된 시나리오 삭제"""
         selected_items = self.scenario_list.selectedItems()
@@ -119,7 +193,7 @@ class ScenarioManagerDialog(QDialog):
             return
 
         # 선택된 시나리오 ID 추출
-        scenario_ids = [item.text() for item in selected_items]
+        scenario_ids = [item.data(Qt.ItemDataRole.UserRole) for item in selected_items]
 
         # 확인 대화상자
         count = len(scenario_ids)
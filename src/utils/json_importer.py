@@ -7,6 +7,14 @@ from pathlib import Path
 from typing import Dict, Any
 import sqlite3
 
+from src.domain.masterdata.service import materialize_overlay
+from src.domain.wage_store import (
+    JobGrade,
+    WageGrade,
+    normalize_job_mapping,
+    normalize_wages_master,
+)
+
 
 class WageDataImporter:
     """연도별 노임단가 JSON 데이터를 데이터베이스로 임포트"""
@@ -29,15 +37,15 @@ class WageDataImporter:
             job_mapping_json_path: 직무 매핑 JSON 파일 경로
             target_year: 임포트할 연도 (기본: 2025)
         """
-        # 1. JSON 파일 로드
-        wages_master = self._load_json(wages_json_path)
-        job_mapping = self._load_json(job_mapping_json_path)
+        # 1. JSON 파일 로드 (형식 판별·정규화는 wage_store 공용 규칙)
+        wages_master = normalize_wages_master(self._load_json(wages_json_path))
+        job_mapping = normalize_job_mapping(self._load_json(job_mapping_json_path))
         
-        if target_year not in wages_master:
+        try:
+            wages_for_year = wages_master[int(target_year)]
+        except (KeyError, ValueError):
             raise ValueError(f"연도 {target_year}의 노임단가 데이터가 없습니다.")
         
-        wages_for_year = wages_master[target_year]
-        
         # 2. 시나리오 ID 생성 (연도 기반)
         scenario_id = f"year_{target_year}"
         
@@ -58,13 +66,16 @@ class WageDataImporter:
     def _import_job_roles(
         self, 
         scenario_id: str, 
-        job_mapping: Dict[str, Any],
-        wages_for_year: Dict[str, int]
+        job_mapping: Dict[str, JobGrade],
+        wages_for_year: Dict[str, WageGrade]
     ) -> None:
         """직무 정보 및 노임단가를 데이터베이스에 저장"""
         
         cursor = self.conn.cursor()
         
+        # 기준 시나리오를 상속 중이면 자체 행으로 풀어 둔 뒤 직무 목록 전체를 교체
+        materialize_overlay(self.conn, scenario_id)
+
         # 기존 데이터 삭제 (시나리오 단위)
         cursor.execute("DELETE FROM md_job_rate WHERE scenario_id = ?", (scenario_id,))
         cursor.execute("DELETE FROM md_job_role WHERE scenario_id = ?", (scenario_id,))
@@ -72,15 +83,15 @@ class WageDataImporter:
         sort_order = 0
         
         for job_code, job_info in job_mapping.items():
-            grade = job_info["grade"]
-            title = job_info["title"]
+            grade = job_info.grade
+            title = job_info.title
             
             # 해당 등급의 노임단가 조회
             if grade not in wages_for_year:
                 self.logger.warning(f"⚠️ {job_code} ({grade})의 노임단가 정보 없음. 건너뜀.")
                 continue
             
-            wage_day = wages_for_year[grade]
+            wage_day = wages_for_year[grade].rate  # md_basic 우선, 없으면 정부고시일당
             wage_hour = int(wage_day / 8)  # 시간급 = 일급 ÷ 8시간
             
             # md_job_role 삽입
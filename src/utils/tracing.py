@@ -0,0 +1,258 @@
+"""
+단계별 소요 시간 측정 (중첩 span, perf_counter_ns).
+
+    with span("calculate_labor"):
+        ...
+
+    @traced("calculate_result")
+    def calculate_result(...): ...
+
+꺼져 있으면(기본) span()은 공용 no-op 객체를 돌려주고 traced는 원 함수를 바로 호출하므로
+전역 플래그 확인 한 번 외의 비용이 없다.
+켜면 스레드별로 span을 중첩해 기록하고, 가장 바깥 span(동작 1회)이 끝날 때
+단계별 시간을 구조화 레코드 1개로 로그('app.trace')와 JSONL 파일(지정 시)에 남긴다.
+단계별 소요 시간은 세션 동안 누적해 stage_summary()/format_summary()로 p50·p95를 본다.
+
+환경변수 COSTCALC_TRACE: 1/true/log → 로그만, 그 밖의 값 → JSONL 파일 경로 (configure_from_env).
+"""
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from src.logging_config import log_with_data
+
+# 단계별 보관 표본 수 (오래된 것부터 버림)
+MAX_SAMPLES_PER_STAGE = 5000
+
+_logger = logging.getLogger("app.trace")
+_enabled = False
+_jsonl_path: Path | None = None
+_local = threading.local()
+_lock = threading.Lock()
+_samples: dict[str, deque] = {}
+_atexit_registered = False
+
+
+class _NoopSpan:
+    """측정이 꺼져 있을 때의 span (공용 객체 1개)."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Span:
+    """측정 구간 1개. 같은 스레드에서 열린 span 안에서 열면 자식으로 기록된다."""
+    __slots__ = ("name", "attrs", "start_ns", "duration_ns", "children")
+
+    def __init__(self, name: str, attrs: dict | None = None):
+        self.name = name
+        self.attrs = attrs or {}
+        self.start_ns = 0
+        self.duration_ns = 0
+        self.children: list[Span] = []
+
+    def set(self, **attrs) -> None:
+        """레코드에 남길 속성 추가 (시나리오 ID, 행 수 등)."""
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        if stack:
+            stack[-1].children.append(self)
+        stack.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration_ns = time.perf_counter_ns() - self.start_ns
+        stack = _local.stack
+        stack.pop()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        with _lock:
+            samples = _samples.get(self.name)
+            if samples is None:
+                samples = _samples[self.name] = deque(maxlen=MAX_SAMPLES_PER_STAGE)
+            samples.append(self.duration_ns)
+        if not stack:
+            _emit(self)
+        return False
+
+
+def span(name: str, **attrs):
+    """with span("단계"): ... — 꺼져 있으면 no-op."""
+    if not _enabled:
+        return _NOOP
+    return Span(name, attrs)
+
+
+def traced(name: str | None = None):
+    """함수 전체를 span으로 감싸는 데코레이터. name 생략 시 함수 qualname."""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with Span(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _ms(ns: int) -> float:
+    return round(ns / 1_000_000, 3)
+
+
+def _flatten(root: Span) -> list[dict]:
+    """깊이 우선 span 목록 (루트 시작 기준 오프셋)."""
+    rows: list[dict] = []
+
+    def visit(node: Span, depth: int) -> None:
+        row = {
+            "name": node.name,
+            "depth": depth,
+            "offset_ms": _ms(node.start_ns - root.start_ns),
+            "duration_ms": _ms(node.duration_ns),
+        }
+        if node.attrs:
+            row["attrs"] = node.attrs
+        rows.append(row)
+        for child in node.children:
+            visit(child, depth + 1)
+
+    visit(root, 0)
+    return rows
+
+
+def _emit(root: Span) -> None:
+    """동작 1회(가장 바깥 span) 레코드를 로그·JSONL로 기록."""
+    record = {
+        "ts": datetime.now().isoformat(timespec="milliseconds"),
+        "action": root.name,
+        "thread": threading.current_thread().name,
+        "pid": os.getpid(),
+        "duration_ms": _ms(root.duration_ns),
+        "spans": _flatten(root),
+    }
+    log_with_data(_logger, logging.INFO, f"trace {root.name} {record['duration_ms']}ms", record)
+    path = _jsonl_path
+    if path is not None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        try:
+            with _lock, open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as exc:
+            logging.warning("trace JSONL 기록 실패 %s: %s", path, exc)
+
+
+@dataclass(frozen=True)
+class StageStats:
+    name: str
+    count: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    total_ms: float
+
+
+def _percentile(sorted_ns: list[int], pct: float) -> int:
+    """최근접 순위 백분위수."""
+    rank = max(1, -(-len(sorted_ns) * pct // 100))
+    return sorted_ns[int(rank) - 1]
+
+
+def stage_summary() -> list[StageStats]:
+    """세션 동안의 단계별 통계 (총 소요 시간 내림차순)."""
+    with _lock:
+        snapshot = {name: sorted(samples) for name, samples in _samples.items() if samples}
+    stats = [
+        StageStats(
+            name=name,
+            count=len(values),
+            p50_ms=_ms(_percentile(values, 50)),
+            p95_ms=_ms(_percentile(values, 95)),
+            max_ms=_ms(values[-1]),
+            total_ms=_ms(sum(values)),
+        )
+        for name, values in snapshot.items()
+    ]
+    stats.sort(key=lambda s: s.total_ms, reverse=True)
+    return stats
+
+
+def format_summary() -> str:
+    """단계별 p50/p95 표 (고정폭 텍스트)."""
+    stats = stage_summary()
+    if not stats:
+        return "측정된 단계가 없습니다." if _enabled else "성능 측정이 꺼져 있습니다 (COSTCALC_TRACE)."
+    width = max(len("단계"), *(len(s.name) for s in stats))
+    lines = [f"{'단계':<{width}}  {'횟수':>6}  {'p50(ms)':>10}  {'p95(ms)':>10}  {'최대(ms)':>10}  {'합계(ms)':>12}"]
+    for s in stats:
+        lines.append(
+            f"{s.name:<{width}}  {s.count:>6}  {s.p50_ms:>10.3f}  {s.p95_ms:>10.3f}  {s.max_ms:>10.3f}  {s.total_ms:>12.3f}"
+        )
+    return "\n".join(lines)
+
+
+def _log_summary_at_exit() -> None:
+    if _enabled and _samples:
+        _logger.info("trace 단계별 요약\n%s", format_summary())
+
+
+def enable(jsonl_path: str | Path | None = None) -> None:
+    """측정 시작. jsonl_path를 주면 동작별 레코드를 한 줄씩 추가 기록한다."""
+    global _enabled, _jsonl_path, _atexit_registered
+    _jsonl_path = Path(jsonl_path) if jsonl_path else None
+    if _jsonl_path is not None:
+        _jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+    _enabled = True
+    if not _atexit_registered:
+        atexit.register(_log_summary_at_exit)
+        _atexit_registered = True
+
+
+def disable() -> None:
+    global _enabled, _jsonl_path
+    _enabled = False
+    _jsonl_path = None
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    """누적 통계 비우기."""
+    with _lock:
+        _samples.clear()
+
+
+def configure_from_env() -> bool:
+    """COSTCALC_TRACE 환경변수로 측정 설정. 켜졌으면 True."""
+    value = (os.environ.get("COSTCALC_TRACE") or "").strip()
+    if not value or value.lower() in ("0", "false", "off"):
+        return False
+    enable(None if value.lower() in ("1", "true", "on", "log") else value)
+    return True
@@ -0,0 +1,132 @@
+"""
+AggregateController background runs (no PyQt, no DB).
+Callbacks go through a queue that the test drains, standing in for the UI thread.
+"""
+import queue
+import threading
+
+import pytest
+
+from app.controllers.aggregate_controller import AggregateController
+from app.controllers.context import ScenarioContext
+from app.domain.models import ResultSnapshot
+
+
+def _snapshot(total):
+    return ResultSnapshot(total, 0, 0, 0, 0, 0, [], [], [], {})
+
+
+class FakeService:
+    def __init__(self):
+        self.calls = []
+
+    def aggregate(self, scenario_id):
+        self.calls.append(scenario_id)
+        return _snapshot(len(self.calls))
+
+
+@pytest.fixture
+def ui_queue():
+    return queue.Queue()
+
+
+@pytest.fixture
+def controller(ui_queue):
+    ctrl = AggregateController(ScenarioContext(), FakeService(), dispatch=ui_queue.put)
+    yield ctrl
+    ctrl._executor.shutdown(wait=True)
+
+
+def _drain(ctrl, ui_queue):
+    ctrl._executor.submit(lambda: None).result(timeout=5)  # 대기 중 작업 완료
+    while not ui_queue.empty():
+        ui_queue.get_nowait()()
+
+
+def _recorder():
+    events = []
+    return events, dict(
+        on_success=lambda snap: events.append(("success", snap.labor_total)),
+        on_error=lambda msg: events.append(("error", msg)),
+        on_progress=lambda stage: events.append(("progress", stage)),
+    )
+
+
+def test_runs_off_thread_and_reports_stages(controller, ui_queue):
+    threads = []
+    events, callbacks = _recorder()
+    controller.run("s1", "시나리오1", lambda: threads.append(threading.current_thread()) or True, **callbacks)
+    _drain(controller, ui_queue)
+
+    assert threads[0] is not threading.current_thread()
+    assert events == [
+        ("progress", "persist"), ("progress", "aggregate"), ("progress", "done"), ("success", 1),
+    ]
+    assert controller._ctx.scenario_id == "s1"
+    assert controller._ctx.result_snapshot.labor_total == 1
+    assert not controller._ctx.is_loading
+
+
+def test_newer_run_supersedes_stale(controller, ui_queue):
+    release = threading.Event()
+    stale_events, stale_callbacks = _recorder()
+    controller.run("old", "old", lambda: release.wait(5), **stale_callbacks)
+    events, callbacks = _recorder()
+    controller.run("new", "new", lambda: True, **callbacks)
+    release.set()
+    _drain(controller, ui_queue)
+
+    # 대체된 작업은 persist 이후 중단되고 콜백도 호출되지 않음
+    assert stale_events == []
+    assert controller._service.calls == ["new"]
+    assert events[-1] == ("success", 1)
+    assert controller._ctx.scenario_id == "new"
+
+
+def test_cancel_and_persist_failure(controller, ui_queue):
+    release = threading.Event()
+    events, callbacks = _recorder()
+    controller.run("s1", "s1", lambda: release.wait(5), **callbacks)
+    controller.cancel()
+    release.set()
+    _drain(controller, ui_queue)
+    assert events == []
+    assert controller._service.calls == []
+    assert not controller._ctx.is_loading
+
+    events, callbacks = _recorder()
+    controller.run("s2", "s2", lambda: False, **callbacks)
+    _drain(controller, ui_queue)
+    assert events == [("progress", "persist"), ("error", "입력 데이터 저장에 실패했습니다.")]
+
+
+def test_edit_during_run_keeps_dirty(controller, ui_queue):
+    ctx = controller._ctx
+    ctx.set_dirty(True)
+    controller.run("s1", "s1", lambda: True, **_recorder()[1])
+    ctx.set_dirty(True)  # 집계 중 편집
+    _drain(controller, ui_queue)
+    assert ctx.is_dirty
+
+    controller.run("s1", "s1", lambda: True, **_recorder()[1])
+    _drain(controller, ui_queue)
+    assert not ctx.is_dirty
+
+
+def test_refused_while_loading_and_loading_released_on_ui_side(controller, ui_queue):
+    ctx = controller._ctx
+    ctx.set_loading(True)  # 시나리오 불러오는 중
+    events, callbacks = _recorder()
+    assert controller.run("s1", "s1", lambda: True, **callbacks) is None
+    assert events == [("error", "편집 중에는 집계할 수 없습니다.")]
+    ctx.set_loading(False)
+
+    loading_threads = []
+    set_loading = ctx.set_loading
+    ctx.set_loading = lambda value: loading_threads.append(threading.current_thread()) or set_loading(value)
+    controller.run("s1", "s1", lambda: True, **_recorder()[1])
+    controller._executor.submit(lambda: None).result(timeout=5)
+    assert ctx.is_loading  # 작업 스레드는 로딩 표시를 직접 끄지 않음
+    _drain(controller, ui_queue)
+    assert not ctx.is_loading
+    assert set(loading_threads) == {threading.current_thread()}
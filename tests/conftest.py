@@ -1,7 +1,40 @@
 # pytest configuration and fixtures
+import sqlite3
+
 import pytest
 from decimal import Decimal
 from src.domain.context.calc_context import CalcContext
+from src.domain.db import close_all_connections
+from src.domain.masterdata.bundle import clear_bundle_cache
+from src.domain.masterdata.service import apply_seed_if_needed
+from src.domain.migration_runner import run_migrations
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """임시 DB 파일 (COSTCALC_DB_PATH) - 마이그레이션·초기 마스터 데이터 적용, 공용 연결·번들 캐시 초기화"""
+    path = tmp_path / "app.db"
+    monkeypatch.setenv("COSTCALC_DB_PATH", str(path))
+    close_all_connections()
+    connection = sqlite3.connect(path)
+    try:
+        run_migrations(connection)
+        apply_seed_if_needed(connection)
+        connection.commit()
+    finally:
+        connection.close()
+    clear_bundle_cache()
+    yield path
+    close_all_connections()
+    clear_bundle_cache()
+
+
+@pytest.fixture
+def conn(db_path):
+    """db_path에 연결한 sqlite3 연결 (테스트 종료 시 닫음)"""
+    connection = sqlite3.connect(db_path)
+    yield connection
+    connection.close()
 
 
 @pytest.fixture
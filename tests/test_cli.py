@@ -0,0 +1,92 @@
+"""
+헤드리스 배치 CLI 검증
+- aggregate: 여러/전체 시나리오 집계·저장, JSON/CSV 요약
+- verify: 저장 결과와 재계산 비교 (변조 시 mismatch, 종료 코드 1)
+- --jobs 프로세스 풀 결과가 단일 프로세스와 같음, PyQt를 import하지 않음
+"""
+import csv
+import json
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+from src import cli
+from src.domain.masterdata.service import copy_masterdata
+from src.domain.scenario_input.service import post_scenario_input
+
+
+@pytest.fixture
+def db_path(db_path):
+    conn = sqlite3.connect(db_path)
+    copy_masterdata(conn, "default", "S2")
+    conn.commit()
+    job_code = conn.execute(
+        "SELECT job_code FROM md_job_role WHERE scenario_id='default' ORDER BY sort_order LIMIT 1"
+    ).fetchone()[0]
+    for scenario_id, headcount in (("default", 2), ("S2", 3)):
+        post_scenario_input({
+            "labor": {"job_roles": {job_code: {"headcount": headcount, "work_days": 20.6, "work_hours": 8}}},
+            "expenses": {"items": {}},
+            "overhead_rate": 10.0,
+            "profit_rate": 5.0,
+        }, scenario_id, conn)
+    conn.close()
+    return db_path
+
+
+def _run(tmp_path, *argv):
+    output = tmp_path / "out.json"
+    code = cli.main([*argv, "--output", str(output)])
+    return code, json.loads(output.read_text(encoding="utf-8"))
+
+
+def test_aggregate_and_verify(db_path, tmp_path):
+    code, records = _run(tmp_path, "aggregate", "S2", "default", "NOPE")
+    assert code == 1  # 없는 ID
+    assert [(r["scenario_id"], r["status"]) for r in records] == [
+        ("S2", "ok"), ("default", "ok"), ("NOPE", "unknown"),
+    ]
+    assert records[0]["labor_total"] > records[1]["labor_total"] > 0
+    assert all(r["grand_total"] >= r["labor_total"] for r in records[:2])
+
+    code, verified = _run(tmp_path, "verify", "--all")
+    assert code == 0
+    assert [r["status"] for r in verified] == ["ok", "ok"]
+
+    conn = sqlite3.connect(db_path)
+    row = conn.execute("SELECT result_json FROM calculation_result WHERE scenario_id='S2'").fetchone()
+    snapshot = json.loads(row[0])
+    snapshot["aggregator"]["labor_total"] += 1
+    conn.execute("UPDATE calculation_result SET result_json=? WHERE scenario_id='S2'", (json.dumps(snapshot),))
+    conn.commit()
+    conn.close()
+
+    code, verified = _run(tmp_path, "verify", "--all")
+    assert code == 1
+    by_id = {r["scenario_id"]: r for r in verified}
+    assert by_id["S2"]["status"] == "mismatch" and "labor_total" in by_id["S2"]["detail"]
+    assert by_id["default"]["status"] == "ok"
+
+
+def test_csv_and_process_pool_match_serial(db_path, tmp_path):
+    code, serial = _run(tmp_path, "aggregate", "--all", "--no-persist")
+    assert code == 0
+    code, pooled = _run(tmp_path, "aggregate", "--all", "--no-persist", "--jobs", "2")
+    assert code == 0 and pooled == serial
+
+    output = tmp_path / "out.csv"
+    assert cli.main(["aggregate", "--all", "--format", "csv", "--output", str(output)]) == 0
+    with open(output, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["scenario_id"] for r in rows] == ["S2", "default"]
+    assert int(rows[0]["grand_total"]) == serial[0]["grand_total"]
+
+
+def test_cli_does_not_import_qt():
+    code = (
+        "import sys, src.cli; "
+        "sys.exit(any(m.split('.')[0] in ('PyQt5', 'PyQt6') for m in sys.modules))"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
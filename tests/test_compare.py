@@ -0,0 +1,74 @@
+"""
+시나리오 비교 검증
+- get_top_drivers (힙 top-k)가 전체 정렬 결과와 같은지
+- N개 시나리오 비교 벡터 정렬 (키 합집합, 없는 키는 0)
+- 읽기 전용 집계는 calculation_result에 기록하지 않음
+"""
+import random
+from types import SimpleNamespace
+
+from src.domain.compare import (
+    TOTAL_LABELS,
+    build_breakdown_matrix,
+    get_top_drivers,
+    get_top_drivers_many,
+)
+from src.domain.result.service import calculate_result, calculate_results_readonly
+from src.domain.scenario_input.service import post_scenario_input
+
+
+def _agg(**values):
+    return SimpleNamespace(**{key: values.get(key, 0) for key in TOTAL_LABELS})
+
+
+def test_top_drivers_match_full_sort():
+    rng = random.Random(5)
+    for _ in range(200):
+        keys = [f"k{i}" for i in range(rng.randint(0, 30))]
+        a = {k: rng.randint(-5, 5) * 1000 for k in keys if rng.random() < 0.8}
+        b = {k: rng.randint(-5, 5) * 1000 for k in keys if rng.random() < 0.8}
+        n = rng.randint(1, 6)
+        drivers = get_top_drivers(a, b, {}, n)
+
+        expected = sorted(
+            (abs(b.get(k, 0) - a.get(k, 0)) for k in set(a) | set(b) if b.get(k, 0) != a.get(k, 0)),
+            reverse=True,
+        )[:n]
+        assert [d["abs_delta"] for d in drivers] == expected
+        assert all(d["delta"] == d["b"] - d["a"] for d in drivers)
+
+
+def test_breakdown_matrix_aligned():
+    results = {
+        "A": (_agg(labor_total=100, profit=5), [{"job_code": "J1", "role": "소장", "role_total": 60}]),
+        "B": (_agg(labor_total=130, profit=5), [{"job_code": "J2", "role": "기사", "role_total": 80}]),
+        "C": (_agg(labor_total=90, profit=7), []),
+    }
+    matrix = build_breakdown_matrix(results)
+    assert matrix.keys == (*TOTAL_LABELS, "labor.job.J1", "labor.job.J2")
+    assert matrix.column("labor.job.J1") == (60, 0, 0)
+    assert matrix.values_of("B")["labor.job.J2"] == 80
+    assert matrix.deltas(base=0)[1][0] == 30
+
+    top = get_top_drivers_many(matrix, 2)
+    assert [d["key"] for d in top] == ["labor.job.J2", "labor.job.J1"]
+    assert top[0]["values"] == {"A": 0, "B": 80, "C": 0}
+
+
+def test_readonly_results_do_not_write(conn):
+    job_code = conn.execute(
+        "SELECT job_code FROM md_job_role WHERE scenario_id='default' ORDER BY sort_order LIMIT 1"
+    ).fetchone()[0]
+    post_scenario_input({
+        "labor": {"job_roles": {job_code: {"headcount": 1, "work_days": 20.6, "work_hours": 8}}},
+        "expenses": {"items": {}},
+    }, "default", conn)
+
+    before = conn.total_changes
+    results = calculate_results_readonly(["default", "default"], conn)
+    assert list(results) == ["default"]
+    assert conn.total_changes == before
+    assert conn.execute("SELECT COUNT(*) FROM calculation_result").fetchone()[0] == 0
+
+    stored = calculate_result("default", conn)
+    assert results["default"]["aggregator"] == stored["aggregator"]
@@ -0,0 +1,165 @@
+"""
+스레드별 공용 DB 연결 검증
+- 같은 스레드는 같은 연결을 재사용하고 경로 검증(쓰기 테스트)은 한 번만
+- close()는 반납: 그 대여 구간의 미커밋 변경 롤백
+- 중첩 대여는 자체 SAVEPOINT 구간: 안쪽 커밋·롤백·반납이 바깥 변경에 영향 없음
+  (바깥 구간이 안쪽 대여 뒤에 쓰기를 시작한 경우 포함), 바깥 트랜잭션이 없으면 안쪽 커밋은 바로 확정
+- 집계 중 예외가 나도 대여가 반납되어 이후 반납 시 롤백이 동작
+- 스레드마다 별도 연결, close_all_connections()로 실제 종료
+"""
+import sqlite3
+import threading
+
+import pytest
+
+from src.domain import db
+
+
+# 공용 연결은 테스트마다 새 임시 DB로 (conftest의 db_path가 전후로 close_all_connections)
+pytestmark = pytest.mark.usefixtures("db_path")
+
+
+def test_same_thread_reuses_connection(monkeypatch):
+    first = db.get_connection().connection
+    first.close()
+
+    calls = []
+    monkeypatch.setattr(db, "_ensure_writable_dir", lambda path: calls.append(path))
+    for _ in range(50):
+        conn = db.get_connection()
+        assert conn.connection is first
+        conn.execute("SELECT 1")
+        conn.close()
+    assert calls == []
+
+
+def test_last_close_rolls_back_uncommitted():
+    conn = db.get_connection()
+    conn.execute("CREATE TABLE t (v INTEGER)")
+    conn.commit()
+
+    inner = db.get_connection()
+    inner.execute("INSERT INTO t VALUES (1)")
+    inner.close()
+    # 바깥 대여가 남아 있어도 안쪽 구간의 미커밋 변경은 반납 시 롤백
+    assert not conn.in_transaction
+    conn.close()
+
+    with db.checkout_connection() as c:
+        assert c.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        c.execute("INSERT INTO t VALUES (2)")
+    with pytest.raises(RuntimeError):
+        with db.checkout_connection() as c:
+            c.execute("INSERT INTO t VALUES (3)")
+            raise RuntimeError
+    with db.checkout_connection() as c:
+        assert c.execute("SELECT v FROM t").fetchall() == [(2,)]
+
+
+def _values(conn):
+    return [v for (v,) in conn.execute("SELECT v FROM t ORDER BY v")]
+
+
+def test_nested_checkout_has_own_scope(db_path):
+    with db.checkout_connection() as c:
+        c.execute("CREATE TABLE t (v INTEGER)")
+
+    outer = db.get_connection()
+    outer.execute("INSERT INTO t VALUES (1)")
+
+    # 안쪽 롤백은 안쪽 변경만 취소
+    inner = db.get_connection()
+    inner.execute("INSERT INTO t VALUES (2)")
+    inner.rollback()
+    inner.execute("INSERT INTO t VALUES (3)")
+    # 안쪽 커밋은 바깥 변경을 확정하지 않음
+    inner.commit()
+    inner.close()
+    assert _values(outer) == [1, 3]
+    other = sqlite3.connect(db_path)
+    assert _values(other) == []
+
+    with pytest.raises(RuntimeError):
+        with db.checkout_connection() as c:
+            c.execute("INSERT INTO t VALUES (4)")
+            raise RuntimeError
+    assert _values(outer) == [1, 3]
+
+    outer.commit()
+    outer.close()
+    assert _values(other) == [1, 3]
+    other.close()
+
+
+def test_inner_scope_leaves_outer_pending_writes(db_path):
+    with db.checkout_connection() as c:
+        c.execute("CREATE TABLE t (v INTEGER)")
+    other = sqlite3.connect(db_path)
+
+    # 안쪽 대여 시점에는 바깥 트랜잭션이 없고, 바깥 구간이 그 뒤에 쓰기 시작
+    outer = db.get_connection()
+    inner = db.get_connection()
+    outer.execute("INSERT INTO t VALUES (1)")
+    inner.execute("INSERT INTO t VALUES (2)")
+    inner.rollback()
+    inner.close()
+    assert _values(outer) == [1]
+
+    # 안쪽 구간의 미커밋 변경은 반납 시 안쪽만 롤백
+    inner = db.get_connection()
+    inner.execute("INSERT INTO t VALUES (3)")
+    inner.close()
+    assert outer.in_transaction and _values(outer) == [1]
+    assert _values(other) == []
+    outer.commit()
+    outer.close()
+    assert _values(other) == [1]
+
+    # 바깥 트랜잭션이 없으면 안쪽 커밋은 바로 확정되어 바깥 롤백과 무관
+    outer = db.get_connection()
+    inner = db.get_connection()
+    inner.execute("INSERT INTO t VALUES (4)")
+    inner.commit()
+    inner.close()
+    assert _values(other) == [1, 4]
+    outer.rollback()
+    outer.close()
+    assert _values(other) == [1, 4]
+    other.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        inner.execute("SELECT 1")
+
+
+def test_failed_calculation_returns_borrow(monkeypatch):
+    from src.domain.result import service
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(service, "get_scenario_input", fail)
+    with pytest.raises(RuntimeError):
+        service.calculate_result("default")
+
+    conn = db.get_connection()
+    conn.row_factory = sqlite3.Row
+    conn.close()
+    # 예외로 대여가 남았다면 마지막 반납이 아니어서 row_factory가 초기화되지 않았을 것
+    assert conn.row_factory is None
+
+
+def test_connection_per_thread_and_close_all():
+    main = db.get_connection().connection
+    main.close()
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(db.get_connection().connection))
+    thread.start()
+    thread.join()
+    assert seen[0] is not main
+
+    db.close_all_connections()
+    assert main.is_pool_closed
+    reopened = db.get_connection()
+    assert reopened.connection is not main
+    reopened.execute("SELECT 1")
+    reopened.close()
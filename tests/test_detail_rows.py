@@ -0,0 +1,92 @@
+"""
+노무비·경비 상세 키 기반 증분 갱신 검증 (PyQt 없음)
+- 계획(삭제→삽입)을 적용하면 새 행 목록과 같아지고, 변경 구간은 실제로 달라진 행만 포함
+- 순서가 바뀌거나 키가 중복되면 전체 리셋
+- 표시 문자열·합계 행 규칙
+"""
+import random
+
+from src.ui.detail_rows import (
+    EMPHASIS_PASSTHROUGH,
+    EMPHASIS_TOTAL,
+    TOTAL_KEY,
+    DetailRow,
+    build_expense_detail_rows,
+    build_labor_detail_rows,
+    contiguous_ranges,
+    plan_keyed_update,
+)
+
+
+def _apply(old, new, plan):
+    rows = list(old)
+    for first, last in plan.removed:
+        del rows[first:last + 1]
+    for first, last in plan.inserted:
+        rows[first:first] = new[first:last + 1]
+    return rows
+
+
+def test_contiguous_ranges():
+    assert contiguous_ranges([]) == []
+    assert contiguous_ranges([0, 1, 2, 5, 7, 8]) == [(0, 2), (5, 5), (7, 8)]
+
+
+def test_plan_matches_new_rows():
+    rng = random.Random(7)
+    for _ in range(300):
+        universe = [f"J{i}" for i in range(12)]
+        old_keys = [k for k in universe if rng.random() < 0.6]
+        new_keys = [k for k in universe if rng.random() < 0.6]
+        old = [DetailRow((k,), (k, str(rng.randint(0, 2)))) for k in old_keys]
+        new = [DetailRow((k,), (k, str(rng.randint(0, 2)))) for k in new_keys]
+        plan = plan_keyed_update(old, new)
+        assert not plan.reset
+
+        applied = _apply(old, new, plan)
+        assert [r.key for r in applied] == [(k,) for k in new_keys]
+        old_by_key = {r.key: r for r in old}
+        changed = {i for first, last in plan.changed for i in range(first, last + 1)}
+        assert changed == {
+            i for i, r in enumerate(new) if r.key in old_by_key and old_by_key[r.key] != r
+        }
+
+
+def test_plan_reset_and_noop():
+    a, b = DetailRow(("a",), ("1",)), DetailRow(("b",), ("2",))
+    assert plan_keyed_update([a, b], [b, a]).reset
+    assert plan_keyed_update([a], [a, a]).reset
+    assert plan_keyed_update([a, b], [a, b]).is_noop
+
+
+def test_labor_rows_keyed_by_job_code():
+    rows = [
+        {"job_code": "J1", "role": "소장", "headcount": 1, "base_salary": 3_000_000.4, "role_total": 4_000_000},
+        {"job_code": "J2", "role": "기사", "headcount": 2.0, "allowance": 1234, "total": 5_000_000},
+    ]
+    display = build_labor_detail_rows(rows)
+    assert [r.key for r in display] == [("job", "J1"), ("job", "J2"), TOTAL_KEY]
+    assert display[0].cells == ("소장", "1", "3,000,000", "0", "0", "0", "0", "4,000,000")
+    assert display[1].cells[4] == "1,234"
+    assert display[-1].cells == ("합계", "3", "3,000,000", "0", "1,234", "0", "0", "9,000,000")
+    assert display[-1].emphasis == EMPHASIS_TOTAL
+
+    # 한 직무만 바뀌면 그 행과 합계 행만 변경
+    rows[1] = {**rows[1], "headcount": 3}
+    plan = plan_keyed_update(display, build_labor_detail_rows(rows))
+    assert plan.changed == ((1, 2),) and not plan.inserted and not plan.removed
+    assert build_labor_detail_rows([]) == []
+
+
+def test_expense_rows_monthly_annual():
+    rows = [
+        {"exp_code": "FIX_WEL_MEAL", "category": "FIX", "name": "식대", "row_total": "100,000", "type": "고정경비"},
+        {"exp_code": "VAR_X", "category": "VAR", "name": "변동", "row_total": "1200", "type": "변동경비"},
+        {"exp_code": "PASS_X", "category": "PASS", "name": "대행", "row_total": "2400", "type": "대행비"},
+    ]
+    display = build_expense_detail_rows(rows, total_headcount=3)
+    assert display[0].cells == ("FIX", "식대", "300,000", "3,600,000", "고정경비")
+    assert display[1].cells[2:4] == ("100", "1,200")
+    assert display[2].cells[4] == "대납비" and display[2].emphasis == EMPHASIS_PASSTHROUGH
+    assert display[-1].cells == ("합계", "", "300,300", "3,603,600", "")
+    assert build_expense_detail_rows([], 3) == []
@@ -0,0 +1,86 @@
+"""
+경비 세부 항목 일괄 저장 검증
+- 저장된 행과 같은 목록을 다시 저장하면 쓰기 없음 (변경 0행, revision 그대로)
+- (exp_code, sub_code) 키 기준으로 추가·변경·삭제된 행만 반영, 여러 경비코드를 한 번에 저장
+- 상속 시나리오: 재정의 표시 추가·삭제도 변경으로 집계
+- 같은 sub_code가 중복되면 쓰기 전에 거부
+"""
+import pytest
+
+from src.domain.masterdata.bundle import _read_revision
+from src.domain.masterdata.repo import MasterDataRepo
+from src.domain.masterdata.service import copy_masterdata
+
+
+def _sheet(repo, scenario_id):
+    sheet: dict[str, list[dict]] = {}
+    for si in repo.get_expense_sub_items(scenario_id):
+        sheet.setdefault(si.exp_code, []).append(
+            {k: v for k, v in vars(si).items() if k not in ("scenario_id", "exp_code")}
+        )
+    return sheet
+
+
+def _count(conn, scenario_id):
+    return conn.execute(
+        "SELECT COUNT(*) FROM md_expense_sub_item WHERE scenario_id=?", (scenario_id,)
+    ).fetchone()[0]
+
+
+def test_unchanged_sheet_is_noop(conn):
+    repo = MasterDataRepo(conn)
+    sheet = _sheet(repo, "default")
+    assert len(sheet) > 1
+    revision = _read_revision(conn, "default")
+    changes = conn.total_changes
+
+    assert repo.save_expense_sub_items("default", sheet) == 0
+    assert conn.total_changes == changes
+    assert _read_revision(conn, "default") == revision
+
+
+def test_keyed_diff_across_exp_codes(conn):
+    repo = MasterDataRepo(conn)
+    sheet = _sheet(repo, "default")
+    first, second = list(sheet)[:2]
+    before = _count(conn, "default")
+
+    sheet[first][0] = dict(sheet[first][0], amount=sheet[first][0]["amount"] + 1)
+    removed = sheet[second].pop()
+    sheet[second].append(dict(removed, sub_code="NEW-1", sub_name="추가"))
+
+    assert repo.save_expense_sub_items("default", sheet) == 3
+    assert _count(conn, "default") == before
+    assert _sheet(repo, "default") == {
+        code: sorted(items, key=lambda si: (si["sort_order"], si["sub_code"])) for code, items in sheet.items()
+    }
+    assert repo.save_expense_sub_items("default", sheet) == 0
+
+
+def test_inheriting_scenario_counts_override_markers(conn):
+    copy_masterdata(conn, "default", "S2")
+    conn.commit()
+    repo = MasterDataRepo(conn)
+    sheet = _sheet(repo, "S2")
+    exp_code = next(iter(sheet))
+
+    assert repo.save_expense_sub_items("S2", sheet) == 0
+    assert repo.save_expense_sub_items("S2", {exp_code: []}) == 1
+    assert repo.get_expense_sub_items("S2", exp_code) == []
+    # 기준 시나리오와 같은 목록으로 되돌리면 재정의 표시만 삭제
+    assert repo.save_expense_sub_items("S2", {exp_code: sheet[exp_code]}) == 1
+    assert _count(conn, "S2") == 0
+
+
+def test_duplicate_sub_code_rejected_before_write(conn):
+    repo = MasterDataRepo(conn)
+    sheet = _sheet(repo, "default")
+    first, second = list(sheet)[:2]
+    sheet[first][0] = dict(sheet[first][0], amount=sheet[first][0]["amount"] + 1)
+    sheet[second].append(dict(sheet[second][0], sub_name="중복"))
+    changes = conn.total_changes
+
+    with pytest.raises(ValueError, match=sheet[second][0]["sub_code"]):
+        repo.save_expense_sub_items("default", sheet)
+    assert conn.total_changes == changes
+    assert not conn.in_transaction
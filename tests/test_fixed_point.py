@@ -0,0 +1,125 @@
+"""
+정수 고정소수 반올림 커널 검증
+- 기존 Decimal(str(x)) 구현과 무작위 입력 전체에서 결과가 완전히 같은지 확인
+"""
+import random
+from decimal import Decimal, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_UP
+
+import pytest
+
+from src.domain.constants import fixed_point
+from src.domain.constants.rounding import (
+    drop_under_1_won,
+    drop_under_1000_won,
+    round_half_up,
+    round_up,
+)
+from src.domain.wage_decomposer import _round0, _trunc0
+
+
+# ----- 기존 Decimal 구현 (기준값) -----
+
+def _ref_drop_under_1_won(amount):
+    return int(Decimal(str(amount)).to_integral_value(rounding=ROUND_FLOOR))
+
+
+def _ref_drop_under_1000_won(amount):
+    return int((Decimal(str(amount)) // Decimal("1000")) * Decimal("1000"))
+
+
+def _ref_round(amount, unit, rounding):
+    unit_decimal = Decimal(str(unit))
+    divided = Decimal(str(amount)) / unit_decimal
+    return int(divided.quantize(Decimal("1"), rounding=rounding) * unit_decimal)
+
+
+def _ref_trunc0(val):
+    return int(Decimal(str(val)).to_integral_value(rounding=ROUND_DOWN))
+
+
+def _ref_round0(val):
+    return int(Decimal(str(val)).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def _corpus(n: int = 5000, seed: int = 20260302) -> list:
+    rng = random.Random(seed)
+    values = [0, 1, -1, 0.5, -0.5, 2.5, -2.5, 999.999, 1000, -1000, 1500.5, -1500.5,
+              0.1 + 0.2, 4120000 * 0.03545, Decimal("0.00004"), Decimal("-12.50"), Decimal("1E+3")]
+    for _ in range(n):
+        kind = rng.randrange(5)
+        if kind == 0:
+            values.append(rng.randint(-10**12, 10**12))
+        elif kind == 1:
+            values.append(round(rng.uniform(-1e7, 1e7), rng.randint(0, 6)))
+        elif kind == 2:
+            values.append(rng.uniform(-1e9, 1e9))
+        elif kind == 3:
+            values.append(rng.randint(0, 10**9) * rng.choice([0.009, 0.045, 0.0115, 0.03545, 0.1281, 0.0006, 0.00004]))
+        else:
+            digits = rng.randint(0, 8)
+            values.append(Decimal(rng.randint(-10**12, 10**12)).scaleb(-digits))
+    return values
+
+
+CORPUS = _corpus()
+
+
+class TestRoundingMatchesDecimal:
+    """rounding.py 함수 = 기존 Decimal 구현"""
+
+    def test_drop_under_1_won(self):
+        for value in CORPUS:
+            assert drop_under_1_won(value) == _ref_drop_under_1_won(value), value
+
+    def test_drop_under_1000_won(self):
+        for value in CORPUS:
+            assert drop_under_1000_won(value) == _ref_drop_under_1000_won(value), value
+
+    @pytest.mark.parametrize("unit", [1, 10, 100, 1000])
+    def test_round_half_up(self, unit):
+        for value in CORPUS:
+            assert round_half_up(value, unit) == _ref_round(value, unit, ROUND_HALF_UP), value
+
+    @pytest.mark.parametrize("unit", [1, 10, 100, 1000])
+    def test_round_up(self, unit):
+        for value in CORPUS:
+            assert round_up(value, unit) == _ref_round(value, unit, ROUND_CEILING), value
+
+    def test_invalid_unit(self):
+        with pytest.raises(ValueError):
+            round_half_up(100, 0)
+        with pytest.raises(ValueError):
+            round_up(100, -10)
+
+
+class TestDecomposerRounding:
+    """wage_decomposer ROUND/TRUNC = 기존 Decimal 구현"""
+
+    def test_round0_and_trunc0(self):
+        for value in CORPUS:
+            assert _round0(value) == _ref_round0(value), value
+            assert _trunc0(value) == _ref_trunc0(value), value
+
+
+class TestFixedRate:
+    """요율을 정수 비율로 표현 (0.03545 → 3545/100000)"""
+
+    def test_rate_as_scaled_integer(self):
+        num, den = fixed_point.to_ratio(Decimal("0.03545"))
+        assert num * 100000 == 3545 * den
+        assert fixed_point.to_ratio(0.00004) == (4, 100000)
+        assert fixed_point.to_ratio(1.5e16) == (15000000000000000, 1)
+
+    def test_mul_floor_matches_decimal_product(self):
+        rng = random.Random(11)
+        for _ in range(2000):
+            amount = rng.randint(0, 10**8)
+            rate = rng.choice(["0.009", "0.045", "0.0115", "0.03545", "0.1281", "0.0006", "0.00004"])
+            expected = _ref_drop_under_1_won(Decimal(amount) * Decimal(rate))
+            assert fixed_point.mul_floor(amount, Decimal(rate)) == expected
+
+    def test_non_finite_rejected(self):
+        with pytest.raises(ValueError):
+            fixed_point.to_ratio(float("inf"))
+        with pytest.raises(ValueError):
+            fixed_point.to_ratio(Decimal("NaN"))
@@ -0,0 +1,79 @@
+"""
+직무 행 단위 증분 노무비 모델 검증
+- 임의 편집을 반복해도 전체 재계산(_calculate_labor)과 행·합계·보험 7종이 같은지 확인
+- 바뀐 직무만 변경 집합에 포함되는지 확인
+"""
+import random
+from types import SimpleNamespace
+
+from src.domain.result.incremental import IncrementalLaborModel
+from src.domain.result.service import _build_insurance_by_exp_code, _calculate_labor
+
+
+CODES = [f"J{i:02d}" for i in range(12)]
+ROLES = [SimpleNamespace(job_code=code, job_name=f"직무{code}", is_active=code != "J05") for code in CODES]
+RATES = {code: 100000 + 7919 * i for i, code in enumerate(CODES)}
+
+
+def _random_values(rng: random.Random) -> dict:
+    return {
+        "headcount": rng.choice([0, 1, 2, 3, 5]),
+        "work_days": rng.choice([20.6, 22.0, 19.75]),
+        "work_hours": rng.choice([8.0, 7.5]),
+        "overtime_hours": rng.choice([0.0, 2.5, 10.0]),
+        "holiday_work_days": rng.choice([0.0, 1.5]),
+    }
+
+
+def _full(job_inputs: dict):
+    canonical = {"labor": {"job_roles": job_inputs}, "wage_year": 2025}
+    rows, total, _, insurance = _calculate_labor(canonical, ROLES, RATES)
+    return rows, total, _build_insurance_by_exp_code(insurance)
+
+
+class TestIncrementalLaborModel:
+    def test_random_edits_match_full_recalculation(self):
+        rng = random.Random(5)
+        job_inputs = {code: _random_values(rng) for code in CODES}
+        model = IncrementalLaborModel(ROLES, RATES, wage_year=2025)
+        model.update(job_inputs)
+
+        for _ in range(60):
+            job_inputs = {code: dict(values) for code, values in job_inputs.items()}
+            code = rng.choice(CODES)
+            if rng.random() < 0.1:
+                job_inputs.pop(code, None)
+            else:
+                job_inputs[code] = _random_values(rng)
+            changes = model.update(job_inputs)
+
+            rows, total, insurance = _full(job_inputs)
+            assert model.labor_rows() == rows
+            assert model.labor_total == total == changes.labor_total
+            assert model.role_total == sum(row["role_total"] for row in rows) == changes.role_total
+            assert model.insurance_by_exp_code() == insurance
+            assert set(changes.changed_rows) <= {code}
+
+    def test_only_edited_role_in_change_set(self):
+        job_inputs = {code: {"headcount": 1, "work_days": 20.6, "work_hours": 8} for code in CODES}
+        model = IncrementalLaborModel(ROLES, RATES, wage_year=2025)
+        model.update(job_inputs)
+
+        assert model.update(job_inputs).is_empty
+
+        changes = model.set_role("J03", {"headcount": 2, "work_days": 20.6, "work_hours": 8})
+        assert list(changes.changed_rows) == ["J03"]
+        assert changes.changed_rows["J03"]["headcount"] == 2
+        assert changes.labor_total_changed
+        assert changes.expense_affected
+        assert set(changes.insurance_changed) <= set(model.insurance_by_exp_code())
+
+    def test_inactive_and_zero_headcount_have_no_row(self):
+        model = IncrementalLaborModel(ROLES, RATES, wage_year=2025)
+        changes = model.update({
+            "J05": {"headcount": 3, "work_days": 20.6, "work_hours": 8},
+            "J06": {"headcount": 0, "work_days": 20.6, "work_hours": 8},
+        })
+        assert changes.is_empty
+        assert model.labor_rows() == []
+        assert model.labor_total == 0
@@ -0,0 +1,110 @@
+"""
+노무비 일괄 계산 엔진 검증
+- LaborCostCalculator(Decimal 경로)와 원 단위까지 일치하는지 무작위 입력으로 확인
+"""
+import random
+from decimal import Decimal
+
+import pytest
+
+from src.domain.calculator.labor import LaborCostCalculator
+from src.domain.calculator.labor_batch import LaborBatchCalculator, LABOR_BATCH_FIELDS
+from src.domain.context.calc_context import CalcContext
+
+
+def _decimal_path(md, work_days, work_hours, overtime_hours, holiday_work_days, headcount) -> dict:
+    """result.service._calculate_labor와 같은 방식으로 직무 1건 계산."""
+    context = CalcContext(
+        project_name="batch",
+        year=2025,
+        manpower={"JOB": Decimal(str(headcount))},
+        wage_rate={"JOB": Decimal(md)},
+        monthly_workdays=Decimal(str(work_days)),
+        daily_work_hours=Decimal(str(work_hours)),
+        weekly_holiday_days=Decimal("4.33"),
+        annual_leave_days=Decimal("1.25"),
+        expenses={},
+        overtime_hours=Decimal(str(overtime_hours)),
+        holiday_work_days=Decimal(str(holiday_work_days)),
+    )
+    return LaborCostCalculator(context).calculate()
+
+
+def _random_rows(n: int, seed: int = 20260301) -> list[tuple]:
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        rows.append(
+            (
+                rng.randint(50_000, 400_000),
+                rng.choice([20.6, 22.0, 21.5, 0.0, 30.4, 15.25]),
+                rng.choice([8.0, 7.5, 0.0, 4.0, 9.25]),
+                rng.choice([0.0, 10.0, 12.5, 52.0, 0.75]),
+                rng.choice([0.0, 1.0, 2.5, 4.33, 10.0]),
+                rng.choice([1.0, 2.0, 3.0, 12.0, 1.5]),
+            )
+        )
+    return rows
+
+
+def _expected(decimal_result: dict) -> dict:
+    return {
+        "base_salary": decimal_result["base_salary"],
+        "bonus": decimal_result["bonus"],
+        "weekly_allowance": decimal_result["weekly_allowance"],
+        "annual_leave_allowance": decimal_result["annual_leave_allowance"],
+        "overtime_pay": decimal_result["allowances"]["overtime_pay"],
+        "holiday_work_pay": decimal_result["allowances"]["holiday_work_pay"],
+        "allowance": decimal_result["allowance"],
+        "retirement": decimal_result["retirement"],
+        "labor_subtotal": decimal_result["labor_subtotal"],
+        "industrial_accident": decimal_result["industrial_accident"],
+        "national_pension": decimal_result["national_pension"],
+        "employment_insurance": decimal_result["employment_insurance"],
+        "health_insurance": decimal_result["health_insurance"],
+        "long_term_care": decimal_result["long_term_care"],
+        "wage_bond": decimal_result["wage_bond"],
+        "asbestos_relief": decimal_result["asbestos_relief"],
+        "insurance_total": decimal_result["insurance_total"],
+        "total_labor_cost": decimal_result["total_labor_cost"],
+    }
+
+
+class TestLaborBatchMatchesDecimal:
+    """일괄 계산 결과 = 직무별 Decimal 계산 결과"""
+
+    def test_random_corpus_python_path(self):
+        rows = _random_rows(400)
+        result = LaborBatchCalculator().calculate(*zip(*rows), use_numpy=False)
+
+        for i, row in enumerate(rows):
+            assert result.row(i) == _expected(_decimal_path(*row)), row
+
+    def test_numpy_path_matches_python_path(self):
+        np = pytest.importorskip("numpy")
+        rows = _random_rows(400, seed=7)
+        columns = [np.asarray(col) for col in zip(*rows)]
+        fast = LaborBatchCalculator().calculate(*columns, use_numpy=True)
+        slow = LaborBatchCalculator().calculate(*zip(*rows), use_numpy=False)
+
+        for key in LABOR_BATCH_FIELDS:
+            assert [int(v) for v in fast.totals[key]] == slow.totals[key]
+
+    def test_group_totals_per_scenario(self):
+        rows = _random_rows(30, seed=3)
+        groups = [i % 3 for i in range(len(rows))]
+        result = LaborBatchCalculator().calculate(*zip(*rows), use_numpy=False)
+
+        by_group = result.group_totals(groups)
+        assert sum(by_group.values()) == result.sum()
+        for g in range(3):
+            expected = sum(
+                _decimal_path(*row)["total_labor_cost"]
+                for row, grp in zip(rows, groups)
+                if grp == g
+            )
+            assert by_group[g] == expected
+
+    def test_rejects_inputs_beyond_four_decimals(self):
+        with pytest.raises(ValueError):
+            LaborBatchCalculator().calculate([200000], [20.12345], [8], [0], [0], [1], use_numpy=False)
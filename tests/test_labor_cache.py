@@ -0,0 +1,78 @@
+"""
+1인 기준 노무비 캐시 검증
+- 같은 일급·근무조건은 한 번만 계산하고 인원수 배수만 적용
+- 설정 리비전 변경 시 무효화
+"""
+from decimal import Decimal
+
+import pytest
+
+from src.domain import settings_manager
+from src.domain.calculator.labor import LaborCostCalculator
+from src.domain.calculator.labor_cache import PerPersonLaborCache
+from src.domain.context.calc_context import CalcContext
+
+
+def _context(manpower: dict, wage_rate: dict) -> CalcContext:
+    return CalcContext(
+        project_name="캐시 테스트",
+        year=2025,
+        manpower=manpower,
+        wage_rate=wage_rate,
+        monthly_workdays=Decimal("20.6"),
+        daily_work_hours=Decimal("8"),
+        weekly_holiday_days=Decimal("4.33"),
+        annual_leave_days=Decimal("1.25"),
+        expenses={},
+    )
+
+
+@pytest.fixture
+def same_grade_context():
+    """직무 3개가 같은 일급(같은 기술등급)"""
+    return _context(
+        {"J1": Decimal("1"), "J2": Decimal("2"), "J3": Decimal("3")},
+        {"J1": Decimal("200000"), "J2": Decimal("200000"), "J3": Decimal("200000")},
+    )
+
+
+class TestPerPersonLaborCache:
+    def test_same_wage_computed_once(self, same_grade_context):
+        cache = PerPersonLaborCache(maxsize=16)
+        result = LaborCostCalculator(same_grade_context, cache=cache).calculate()
+
+        stats = cache.stats()
+        assert stats.misses == 1
+        assert stats.hits == 2
+        uncached = LaborCostCalculator(same_grade_context, cache=None).calculate()
+        assert result["total_labor_cost"] == uncached["total_labor_cost"]
+        assert [line.total for line in result["job_lines"]] == [
+            line.total for line in uncached["job_lines"]
+        ]
+
+    def test_cache_reused_across_calculations(self, same_grade_context):
+        cache = PerPersonLaborCache(maxsize=16)
+        LaborCostCalculator(same_grade_context, cache=cache).calculate()
+        LaborCostCalculator(same_grade_context, cache=cache).calculate()
+        assert cache.stats().misses == 1
+        assert cache.stats().hits == 5
+
+    def test_single_person_result_is_a_copy(self, basic_calc_context):
+        cache = PerPersonLaborCache(maxsize=16)
+        first = LaborCostCalculator(basic_calc_context, cache=cache).calculate()
+        first["insurance"]["health"] = -1
+        second = LaborCostCalculator(basic_calc_context, cache=cache).calculate()
+        assert second["insurance"]["health"] > 0
+
+    def test_lru_bound(self):
+        cache = PerPersonLaborCache(maxsize=2)
+        for wage in ("100000", "150000", "200000"):
+            LaborCostCalculator(_context({"J": Decimal("2")}, {"J": Decimal(wage)}), cache=cache).calculate()
+        assert cache.stats().size == 2
+
+    def test_settings_revision_invalidates(self, same_grade_context, monkeypatch):
+        cache = PerPersonLaborCache(maxsize=16)
+        LaborCostCalculator(same_grade_context, cache=cache).calculate()
+        monkeypatch.setattr(settings_manager, "_revision", settings_manager.get_revision() + 1)
+        LaborCostCalculator(same_grade_context, cache=cache).calculate()
+        assert cache.stats().misses == 2
@@ -0,0 +1,62 @@
+"""
+LaborResult 벡터 결과 검증
+- 기존 dict 키·중첩 dict 형태 호환
+- add/scale 벡터 연산
+"""
+import json
+
+from src.domain.calculator.labor import LaborCostCalculator
+from src.domain.calculator.labor_result import LABOR_RESULT_FIELDS, LaborResult
+
+
+def _vector(start: int) -> LaborResult:
+    return LaborResult(list(range(start, start + len(LABOR_RESULT_FIELDS))))
+
+
+class TestLaborResultMapping:
+    def test_legacy_keys(self, basic_calc_context):
+        result = LaborCostCalculator(basic_calc_context, cache=None).calculate()
+        assert list(result.keys()) == [
+            "base_salary", "weekly_allowance", "annual_leave_allowance", "allowance",
+            "bonus", "retirement", "labor_subtotal",
+            "industrial_accident", "national_pension", "employment_insurance",
+            "health_insurance", "long_term_care", "wage_bond", "asbestos_relief",
+            "insurance_total", "total_labor_cost", "allowances",
+            "bonus_monthly", "retirement_reserve", "insurance", "job_lines",
+        ]
+        assert result["bonus_monthly"] == result["bonus"]
+        assert result["retirement_reserve"] == result["retirement"]
+        assert result["insurance"]["employment"] == result["employment_insurance"]
+        assert result["allowances"]["total"] == result["allowance"]
+        assert result.get("missing", 0) == 0
+
+    def test_to_dict_is_json_serializable(self, basic_calc_context):
+        result = LaborCostCalculator(basic_calc_context, cache=None).calculate()
+        payload = json.loads(json.dumps(result.to_dict()))
+        assert payload["total_labor_cost"] == result["total_labor_cost"]
+        assert payload["insurance"] == dict(result["insurance"])
+        assert "job_lines" not in payload
+
+
+class TestLaborResultVector:
+    def test_add_and_scale(self):
+        a, b = _vector(1), _vector(100)
+        total = LaborResult().add(a).add(b, 3)
+        for name in LABOR_RESULT_FIELDS:
+            assert getattr(total, name) == getattr(a, name) + 3 * getattr(b, name)
+        assert (a * 2).total_labor_cost == a.total_labor_cost * 2
+        assert (a + b).base_salary == a.base_salary + b.base_salary
+
+    def test_views_follow_in_place_add(self):
+        acc = _vector(0)
+        before = acc["insurance"]["total"]
+        acc.add(_vector(1))
+        assert acc["insurance"]["total"] == before + _vector(1).insurance_total
+
+    def test_multi_role_equals_sum_of_scaled_roles(self, multi_role_context):
+        result = LaborCostCalculator(multi_role_context, cache=None).calculate()
+        assert sum(line.total for line in result.job_lines) == result.total_labor_cost
+        assert sum(line.base_salary for line in result.job_lines) == result.base_salary
+        line = result.job_lines[0]
+        assert line.base_wage == line.base_salary
+        assert line.role_total == line.labor_subtotal
@@ -0,0 +1,211 @@
+"""
+마스터데이터 오버레이(copy-on-write) 검증
+- 새 시나리오는 md_* 행을 복사하지 않고 default를 상속 (조회 결과는 default와 같음)
+- default 변경이 상속한 시나리오에 바로 반영되고 번들 캐시도 갱신됨
+- 세부 항목 재정의(빈 목록 포함)와 기준 시나리오와 같은 목록 저장 시 상속 복귀
+- 기준 시나리오 삭제 전 상속 행을 자체 행으로 복사, 상속 시나리오 복제는 변경분만 복사
+- default가 아닌 시나리오 복제는 자체 행으로 복사 (복제 후 원본 변경이 복제본에 반영되지 않음)
+- 경비 항목 삭제 시 같은 시나리오의 세부 항목·재정의 표시도 삭제
+"""
+import pytest
+
+from src.domain.masterdata.bundle import clear_bundle_cache, load_scenario_bundle
+from src.domain.masterdata.repo import MasterDataRepo
+from src.domain.masterdata.service import (
+    OVERLAY_TABLES,
+    base_scenario_id,
+    copy_masterdata,
+    link_base_scenario,
+)
+from src.domain.scenario_input.service import delete_scenario
+
+
+def _own_rows(conn, scenario_id):
+    return sum(
+        conn.execute(f"SELECT COUNT(*) FROM {table} WHERE scenario_id=?", (scenario_id,)).fetchone()[0]
+        for table, _, _ in OVERLAY_TABLES
+    )
+
+
+def _snapshot(repo, scenario_id):
+    """scenario_id를 뺀 조회 결과 (시나리오 간 비교용)."""
+    def strip(rows):
+        return [tuple(v for k, v in vars(row).items() if k != "scenario_id") for row in rows]
+    return (
+        strip(repo.get_job_roles(scenario_id)),
+        strip(repo.get_job_rates(scenario_id).values()),
+        strip(repo.get_expense_items(scenario_id)),
+        strip(repo.get_expense_pricebook(scenario_id)),
+        strip(repo.get_expense_sub_items(scenario_id)),
+    )
+
+
+def _exp_with_sub_items(conn):
+    return conn.execute(
+        "SELECT exp_code FROM md_expense_sub_item WHERE scenario_id='default' ORDER BY exp_code LIMIT 1"
+    ).fetchone()[0]
+
+
+def test_new_scenario_inherits_without_copy(conn):
+    copy_masterdata(conn, "default", "S2")
+    conn.commit()
+    repo = MasterDataRepo(conn)
+
+    assert _own_rows(conn, "S2") == 0
+    assert base_scenario_id(conn, "S2") == "default"
+    assert _snapshot(repo, "S2") == _snapshot(repo, "default")
+    assert {r.scenario_id for r in repo.get_job_roles("S2")} == {"S2"}
+
+    # 이미 상속 중이면 다시 연결하지 않음
+    repo.ensure_expense_masterdata_for_scenario("S2")
+    assert _own_rows(conn, "S2") == 0
+    with pytest.raises(ValueError):
+        copy_masterdata(conn, "default", "S2")
+
+
+def test_ensure_links_empty_scenario_to_default(conn):
+    repo = MasterDataRepo(conn)
+    repo.ensure_job_roles_for_scenario("NEW")
+    repo.ensure_expense_masterdata_for_scenario("NEW")
+
+    assert base_scenario_id(conn, "NEW") == "default"
+    assert _own_rows(conn, "NEW") == 0
+    assert _snapshot(repo, "NEW") == _snapshot(repo, "default")
+
+
+def test_base_change_propagates_and_invalidates_bundle(conn):
+    copy_masterdata(conn, "default", "S2")
+    conn.commit()
+    before = load_scenario_bundle(conn, "S2")
+    job_code = before.job_roles[0].job_code
+
+    conn.execute("UPDATE md_job_role SET job_name='변경' WHERE scenario_id='default' AND job_code=?", (job_code,))
+    conn.commit()
+    clear_bundle_cache()  # 다른 연결·프로세스처럼 revision으로만 재검증
+    after = load_scenario_bundle(conn, "S2")
+
+    assert after.revision != before.revision
+    assert after.roles_by_code[job_code].job_name == "변경"
+
+
+def test_sub_item_override_and_revert(conn):
+    copy_masterdata(conn, "default", "S2")
+    conn.commit()
+    repo = MasterDataRepo(conn)
+    exp_code = _exp_with_sub_items(conn)
+    base_items = repo.get_expense_sub_items("default", exp_code)
+    as_dicts = [
+        {k: v for k, v in vars(si).items() if k not in ("scenario_id", "exp_code")} for si in base_items
+    ]
+
+    # 빈 목록도 재정의 (세부 항목 모두 삭제)
+    repo.upsert_expense_sub_items("S2", exp_code, [])
+    assert repo.get_expense_sub_items("S2", exp_code) == []
+    assert len(repo.get_expense_sub_items("default", exp_code)) == len(base_items)
+
+    changed = [dict(as_dicts[0], sub_name="현장 전용", amount=1)]
+    repo.upsert_expense_sub_items("S2", exp_code, changed)
+    assert [si.sub_name for si in repo.get_expense_sub_items("S2", exp_code)] == ["현장 전용"]
+
+    # 기준 시나리오와 같은 목록이면 자체 행을 지우고 상속으로 복귀
+    repo.upsert_expense_sub_items("S2", exp_code, as_dicts)
+    assert _own_rows(conn, "S2") == 0
+    assert conn.execute("SELECT COUNT(*) FROM md_expense_sub_item_override").fetchone()[0] == 0
+    assert len(repo.get_expense_sub_items("S2", exp_code)) == len(base_items)
+
+
+def _add_root_scenario(conn, scenario_id):
+    """default 행을 복사한 자체 행만 가진 시나리오."""
+    for table, columns, _ in OVERLAY_TABLES:
+        column_list = ", ".join(columns)
+        conn.execute(
+            f"INSERT INTO {table} (scenario_id, {column_list}) SELECT ?, {column_list} "
+            f"FROM {table} WHERE scenario_id='default'",
+            (scenario_id,),
+        )
+
+
+def test_delete_base_materializes_dependents(conn):
+    # 자체 행을 가진 기준 시나리오 P와 그것을 상속한 C (이전 버전에서 만든 상속)
+    _add_root_scenario(conn, "P")
+    link_base_scenario(conn, "C", "P")
+    conn.commit()
+    repo = MasterDataRepo(conn)
+    expected = _snapshot(repo, "C")
+
+    delete_scenario("P", conn)
+
+    assert base_scenario_id(conn, "C") is None
+    assert _own_rows(conn, "P") == 0
+    assert _own_rows(conn, "C") > 0
+    assert _snapshot(repo, "C") == expected
+
+
+def test_clone_of_overlay_copies_only_delta(conn):
+    copy_masterdata(conn, "default", "S2")
+    conn.commit()
+    repo = MasterDataRepo(conn)
+    exp_code = _exp_with_sub_items(conn)
+    repo.upsert_expense_sub_items("S2", exp_code, [])
+
+    copy_masterdata(conn, "S2", "S3")
+    conn.commit()
+
+    assert base_scenario_id(conn, "S3") == "default"
+    assert _own_rows(conn, "S3") == _own_rows(conn, "S2") == 0
+    assert _snapshot(repo, "S3") == _snapshot(repo, "S2")
+    assert repo.get_expense_sub_items("S3", exp_code) == []
+
+
+def test_clone_is_independent_of_later_source_edits(conn):
+    _add_root_scenario(conn, "P")
+    copy_masterdata(conn, "default", "S2")
+    repo = MasterDataRepo(conn)
+    exp_code = _exp_with_sub_items(conn)
+    repo.upsert_expense_sub_items("S2", exp_code, [])
+    copy_masterdata(conn, "P", "PC")
+    copy_masterdata(conn, "S2", "S3")
+    conn.commit()
+    assert base_scenario_id(conn, "PC") is None
+    expected = {sid: _snapshot(repo, sid) for sid in ("PC", "S3")}
+
+    # 복제 후 원본 변경
+    job_code = repo.get_job_roles("P")[0].job_code
+    conn.execute("UPDATE md_job_role SET job_name='변경' WHERE scenario_id='P' AND job_code=?", (job_code,))
+    repo.upsert_expense_sub_items("P", exp_code, [])
+    repo.upsert_expense_sub_items("S2", exp_code, [
+        {k: v for k, v in vars(si).items() if k not in ("scenario_id", "exp_code")}
+        for si in repo.get_expense_sub_items("default", exp_code)[:1]
+    ])
+    conn.commit()
+
+    assert {sid: _snapshot(repo, sid) for sid in ("PC", "S3")} == expected
+
+
+def test_deleting_expense_item_removes_its_sub_items(conn):
+    copy_masterdata(conn, "default", "S2")
+    repo = MasterDataRepo(conn)
+    exp_code = _exp_with_sub_items(conn)
+    # S2: 자체 경비 항목 행 + 세부 항목 재정의
+    columns = [r[1] for r in conn.execute("PRAGMA table_info(md_expense_item)") if r[1] != "scenario_id"]
+    conn.execute(
+        f"INSERT INTO md_expense_item (scenario_id, {', '.join(columns)}) SELECT 'S2', {', '.join(columns)} "
+        "FROM md_expense_item WHERE scenario_id='default' AND exp_code=?",
+        (exp_code,),
+    )
+    repo.upsert_expense_sub_items("S2", exp_code, [dict(sub_code="S-1", sub_name="현장 전용", amount=1)])
+    conn.commit()
+
+    def counts(scenario_id):
+        return [
+            conn.execute(f"SELECT COUNT(*) FROM {table} WHERE scenario_id=? AND exp_code=?",
+                         (scenario_id, exp_code)).fetchone()[0]
+            for table in ("md_expense_sub_item", "md_expense_sub_item_override")
+        ]
+
+    assert counts("S2") == [1, 1] and counts("default")[0] > 0
+    conn.execute("DELETE FROM md_expense_item WHERE scenario_id='S2' AND exp_code=?", (exp_code,))
+    assert counts("S2") == [0, 0] and counts("default")[0] > 0
+    conn.execute("DELETE FROM md_expense_item WHERE scenario_id='default' AND exp_code=?", (exp_code,))
+    assert counts("default") == [0, 0]
+    assert repo.get_expense_sub_items("S2", exp_code) == []
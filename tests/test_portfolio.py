@@ -0,0 +1,88 @@
+"""
+포트폴리오 집계 검증
+- 프로세스 풀(읽기 전용 연결) 결과가 현재 프로세스 순차 계산과 같음
+- 결과 저장은 바뀐 시나리오만, 한 번에 기록 (다시 실행하면 기록 0건)
+- 직무코드별·경비 그룹별 롤업이 시나리오 합계와 일치
+"""
+import sqlite3
+
+import pytest
+
+from src.domain.constants.expense_groups import GROUP_FIXED, GROUP_PASSTHROUGH, GROUP_VARIABLE
+from src.domain.db import open_readonly_connection
+from src.domain.masterdata.service import copy_masterdata
+from src.domain.result.portfolio import _shards, aggregate_portfolio
+from src.domain.result.service import get_result_snapshot
+from src.domain.scenario_input.service import post_scenario_input
+
+SCENARIOS = {"default": 2, "S2": 3, "S3": 1}
+
+
+@pytest.fixture
+def conn(conn):
+    for scenario_id in SCENARIOS:
+        if scenario_id != "default":
+            copy_masterdata(conn, "default", scenario_id)
+    conn.commit()
+    job_codes = [r[0] for r in conn.execute(
+        "SELECT job_code FROM md_job_role WHERE scenario_id='default' ORDER BY sort_order LIMIT 2"
+    )]
+    for scenario_id, headcount in SCENARIOS.items():
+        post_scenario_input({
+            "labor": {"job_roles": {
+                code: {"headcount": headcount, "work_days": 20.6, "work_hours": 8} for code in job_codes
+            }},
+            "expenses": {"items": {}},
+            "overhead_rate": 10.0,
+            "profit_rate": 5.0,
+        }, scenario_id, conn)
+    return conn
+
+
+def test_shards_cover_ids_in_order():
+    ids = [f"S{i}" for i in range(10)]
+    shards = _shards(ids, 4)
+    assert len(shards) == 4 and [len(s) for s in shards] == [3, 3, 2, 2]
+    assert [sid for shard in shards for sid in shard] == ids
+    assert _shards(ids[:2], 8) == [["S0"], ["S1"]]
+
+
+def test_pool_matches_serial_and_batches_writes(conn):
+    serial = aggregate_portfolio(conn=conn, jobs=1, persist=False)
+    assert not serial.errors and serial.written == 0
+    assert list(serial.results) == ["S2", "S3", "default"]
+    assert get_result_snapshot("S2", conn) is None
+
+    pooled = aggregate_portfolio(conn=conn, jobs=2)
+    assert pooled.totals == serial.totals
+    assert pooled.written == 3
+    assert get_result_snapshot("S2", conn)["aggregator"]["grand_total"] == serial.totals["S2"].grand_total
+
+    # 입력 해시가 같으면 다시 기록하지 않음
+    assert aggregate_portfolio(conn=conn, jobs=1).written == 0
+    unknown = aggregate_portfolio(["S2", "S2"], conn=conn, jobs=1)
+    assert list(unknown.results) == ["S2"]
+
+
+def test_rollups_sum_to_totals(conn):
+    portfolio = aggregate_portfolio(conn=conn, jobs=1, persist=False)
+    totals = portfolio.totals.values()
+    assert sum(r.total for r in portfolio.job_rollup.values()) > 0
+    assert all(r.scenario_count == 3 for r in portfolio.job_rollup.values())
+    assert sum(r.headcount for r in portfolio.job_rollup.values()) == 2 * sum(SCENARIOS.values())
+    assert portfolio.group_rollup == {
+        GROUP_FIXED: sum(t.fixed_expense_total for t in totals),
+        GROUP_VARIABLE: sum(t.variable_expense_total for t in totals),
+        GROUP_PASSTHROUGH: sum(t.passthrough_expense_total for t in totals),
+    }
+    assert portfolio.grand_total == sum(t.grand_total for t in totals)
+
+
+def test_readonly_connection_rejects_writes(conn, db_path):
+    reader = open_readonly_connection(db_path)
+    try:
+        assert reader.execute("SELECT COUNT(*) FROM scenario_input").fetchone()[0] == 3
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("DELETE FROM scenario_input")
+    finally:
+        reader.close_physical()
@@ -0,0 +1,237 @@
+"""
+RecalcScheduler 검증 (PyQt 없음)
+- 작업 스레드에서 계산하고 결과는 dispatch(테스트 큐)로 전달
+- 더 새 요청·편집이 있으면 이전 결과는 버림
+- 경비 재계산 요청은 반영되지 않은 전체 재계산 요청에 합쳐짐
+- ui_changes는 UI에 마지막으로 반영한 결과 기준 (버려진 결과가 있어도 다음 결과가 화면을 갱신)
+- 실제 DB 결과는 RecalcSession 직접 계산과 동일
+"""
+import queue
+import threading
+
+import pytest
+
+from src.domain.result.scheduler import (
+    RECALC_EXPENSE,
+    RECALC_FULL,
+    RecalcRequest,
+    RecalcScheduler,
+    UiChanges,
+)
+from src.domain.result.session import RecalcSession
+
+
+class _Conn:
+    def close(self):
+        pass
+
+
+class FakeLabor:
+    role_total = 0
+
+    def update(self, job_inputs):
+        self.role_total = sum(v["headcount"] for v in job_inputs.values())
+
+
+class FakeSession:
+    created = []
+
+    def __init__(self, scenario_id, conn, wage_year=None):
+        self.labor = FakeLabor()
+        self.expense_items = []
+        self.threads = []
+        self.gate = None
+        FakeSession.created.append(self)
+
+    def recalculate(self, job_inputs, user_sub_items=None):
+        self.threads.append(threading.current_thread())
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.labor.update(job_inputs)
+        return _FakeResult(self.labor.role_total, user_sub_items or {})
+
+    def expense_rows_for(self, sub_items_by_exp, labor_total):
+        return [{"exp_code": k, "labor_total": labor_total} for k in sub_items_by_exp]
+
+
+class _FakeResult:
+    def __init__(self, role_total, user_sub_items):
+        self.role_total = role_total
+        self.labor_rows = ({"job_code": "J1", "role_total": role_total},)
+        self.sub_items_by_exp = dict(user_sub_items)
+        self.expense_rows = tuple({"exp_code": k, "items": len(v)} for k, v in user_sub_items.items())
+
+
+def _request(kind, headcount, scenario_id="s1"):
+    return RecalcRequest(kind, scenario_id, None, {"J1": {"headcount": headcount}}, {"E1": [{}]})
+
+
+@pytest.fixture
+def harness():
+    FakeSession.created = []
+    ui = queue.Queue()
+    results, errors = [], []
+    scheduler = RecalcScheduler(
+        results.append,
+        lambda request, exc: errors.append((request.kind, str(exc))),
+        dispatch=ui.put,
+        connect=_Conn,
+        session_factory=FakeSession,
+    )
+
+    def drain():
+        scheduler._executor.submit(lambda: None).result(timeout=5)
+        while not ui.empty():
+            ui.get_nowait()()
+
+    yield scheduler, drain, results, errors
+    scheduler.shutdown()
+
+
+def test_computes_off_thread_and_reuses_session(harness):
+    scheduler, drain, results, _ = harness
+    scheduler.submit(_request(RECALC_FULL, 2))
+    drain()
+    scheduler.submit(_request(RECALC_EXPENSE, 3))
+    drain()
+
+    assert [r.rebuilt for r in results] == [True, False]
+    assert results[0].result.role_total == 2
+    assert results[1].result is None
+    assert results[1].expense_rows == ({"exp_code": "E1", "labor_total": 3},)
+    session = FakeSession.created[0]
+    assert session.threads[0] is not threading.current_thread()
+    assert len(FakeSession.created) == 1
+
+    scheduler.invalidate_session()
+    scheduler.submit(_request(RECALC_EXPENSE, 3))
+    drain()
+    assert results[-1].rebuilt and len(FakeSession.created) == 2
+
+
+def test_failed_session_build_keeps_session_stale(harness, monkeypatch):
+    scheduler, drain, results, errors = harness
+    scheduler.submit(_request(RECALC_FULL, 2))
+    drain()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("build failed")
+
+    scheduler.invalidate_session()
+    monkeypatch.setattr(scheduler, "_session_factory", fail)
+    scheduler.submit(_request(RECALC_FULL, 3))
+    drain()
+    assert errors == [(RECALC_FULL, "build failed")]
+
+    # 실패 후에도 이전(무효화된) 세션을 재사용하지 않고 다시 만든다
+    monkeypatch.setattr(scheduler, "_session_factory", FakeSession)
+    scheduler.submit(_request(RECALC_FULL, 4))
+    drain()
+    assert results[-1].rebuilt and len(FakeSession.created) == 2
+
+
+def test_stale_result_dropped_and_kind_coalesced(harness):
+    scheduler, drain, results, _ = harness
+    scheduler.submit(_request(RECALC_EXPENSE, 1))
+    drain()
+    gate = threading.Event()
+    FakeSession.created[0].gate = gate
+
+    # 전체 재계산 진행 중 경비 편집 → 전체 결과는 버리고, 경비 요청은 전체 재계산으로 승격
+    scheduler.submit(_request(RECALC_FULL, 5))
+    scheduler.mark_pending(RECALC_EXPENSE)
+    scheduler.submit(_request(RECALC_EXPENSE, 7))
+    gate.set()
+    drain()
+
+    assert len(results) == 2
+    assert results[-1].request.kind == RECALC_FULL
+    assert results[-1].result.role_total == 7
+
+    # 반영 후에는 다시 경비 요청만 처리
+    scheduler.submit(_request(RECALC_EXPENSE, 7))
+    drain()
+    assert results[-1].request.kind == RECALC_EXPENSE
+
+
+def test_ui_changes_follow_applied_not_computed(harness):
+    scheduler, drain, results, _ = harness
+    scheduler.submit(_request(RECALC_FULL, 2))
+    drain()
+    assert results[-1].ui_changes == UiChanges()
+    gate = threading.Event()
+    FakeSession.created[0].gate = gate
+
+    # 5명 결과를 계산했지만 편집으로 버려짐 → 같은 입력의 다음 결과가 화면(2명 기준)을 갱신해야 함
+    scheduler.submit(_request(RECALC_FULL, 5))
+    scheduler.mark_pending(RECALC_FULL)
+    scheduler.submit(_request(RECALC_FULL, 5))
+    gate.set()
+    drain()
+    assert len(results) == 2
+    assert results[-1].result.role_total == 5
+    assert results[-1].ui_changes.labor_rows and results[-1].ui_changes.labor_total
+
+    # 같은 결과를 다시 반영하면 바뀐 것 없음
+    scheduler.submit(_request(RECALC_FULL, 5))
+    drain()
+    assert results[-1].ui_changes == UiChanges(False, False, False)
+
+    # 노무비는 그대로, 전체 재계산에 합쳐진 경비 편집 → 경비는 갱신
+    scheduler.mark_pending(RECALC_EXPENSE)
+    scheduler.submit(RecalcRequest(
+        RECALC_EXPENSE, "s1", None, {"J1": {"headcount": 5}}, {"E1": [{}], "E2": [{}]},
+    ))
+    drain()
+    assert results[-1].request.kind == RECALC_EXPENSE
+    assert results[-1].ui_changes == UiChanges(False, False, True)
+    scheduler.mark_pending(RECALC_FULL)
+    scheduler.mark_pending(RECALC_EXPENSE)
+    scheduler.submit(RecalcRequest(
+        RECALC_EXPENSE, "s1", None, {"J1": {"headcount": 5}}, {"E1": [{}, {}]},
+    ))
+    drain()
+    assert results[-1].request.kind == RECALC_FULL
+    assert results[-1].ui_changes == UiChanges(False, False, True)
+
+    # 취소(집계·불러오기가 화면을 채움) 후에는 전부 다시 반영
+    scheduler.cancel()
+    scheduler.submit(RecalcRequest(
+        RECALC_FULL, "s1", None, {"J1": {"headcount": 5}}, {"E1": [{}, {}]},
+    ))
+    drain()
+    assert results[-1].ui_changes == UiChanges()
+
+
+def test_cancel_and_error(harness):
+    scheduler, drain, results, errors = harness
+    scheduler.submit(_request(RECALC_FULL, 1))
+    scheduler.cancel()
+    drain()
+    assert results == []
+
+    scheduler.submit(RecalcRequest(RECALC_FULL, "s1", None, {"J1": {}}))
+    drain()
+    assert errors == [(RECALC_FULL, "'headcount'")]
+    assert results == []
+
+
+def test_matches_session_on_real_db(conn):
+    job_code = conn.execute(
+        "SELECT job_code FROM md_job_role WHERE scenario_id='default' ORDER BY sort_order LIMIT 1"
+    ).fetchone()[0]
+    job_inputs = {job_code: {"headcount": 2, "work_days": 20.6, "work_hours": 8}}
+
+    ui = queue.Queue()
+    results = []
+    scheduler = RecalcScheduler(results.append, lambda request, exc: None, dispatch=ui.put)
+    scheduler.submit(RecalcRequest(RECALC_FULL, "default", None, job_inputs))
+    scheduler._executor.submit(lambda: None).result(timeout=10)
+    ui.get_nowait()()
+    scheduler.shutdown()
+
+    expected = RecalcSession("default", conn, wage_year=None).recalculate(job_inputs, user_sub_items={})
+    outcome = results[0]
+    assert outcome.result.labor_rows == expected.labor_rows
+    assert outcome.result.expense_rows == expected.expense_rows
+    assert outcome.total_headcount == 2
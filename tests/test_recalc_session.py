@@ -0,0 +1,66 @@
+"""
+RecalcSession 검증
+- 기존 서비스 함수 3종(노무비 행 / 보험 7종 / 경비 상세)과 결과가 같은지
+- 세션 생성 후에는 DB를 다시 읽지 않는지 (연결을 닫아도 재계산 가능)
+"""
+import pytest
+
+from src.domain.masterdata.repo import MasterDataRepo
+from src.domain.result.service import (
+    get_expense_rows_for_display,
+    get_insurance_by_exp_code_from_ui,
+    get_labor_rows_from_ui,
+)
+from src.domain.result.session import RecalcSession
+
+
+@pytest.fixture
+def job_inputs(conn):
+    roles = MasterDataRepo(conn).get_job_roles("default")
+    return {
+        role.job_code: {"headcount": i % 3 + 1, "work_days": 20.6, "work_hours": 8, "overtime_hours": i % 2 * 4}
+        for i, role in enumerate(roles[:6])
+    }
+
+
+def test_matches_separate_service_calls(conn, job_inputs):
+    session = RecalcSession("default", conn, wage_year=2025)
+    result = session.recalculate(job_inputs)
+
+    assert list(result.labor_rows) == get_labor_rows_from_ui(job_inputs, "default", conn, wage_year=2025)
+    assert dict(result.insurance_by_exp_code) == get_insurance_by_exp_code_from_ui(
+        job_inputs, "default", conn, wage_year=2025
+    )
+    assert list(result.expense_rows) == get_expense_rows_for_display(
+        "default", conn, dict(result.sub_items_by_exp), result.role_total
+    )
+    assert result.role_total == sum(row["role_total"] for row in result.labor_rows)
+    assert result.labor_total > result.role_total  # 보험료 포함
+
+
+def test_recalculate_does_not_touch_db(conn, job_inputs):
+    session = RecalcSession("default", conn, wage_year=2025)
+    first = session.recalculate(job_inputs)
+    conn.close()
+
+    edited = {code: dict(values) for code, values in job_inputs.items()}
+    code = next(iter(edited))
+    edited[code]["headcount"] += 1
+    second = session.recalculate(edited)
+
+    assert second.changed_labor_codes(first) == {code}
+    assert second.labor_total > first.labor_total
+    assert second.changed_expense_codes(first)
+    with pytest.raises(TypeError):
+        second.insurance_by_exp_code["FIX_INS_INDUST"] = 0
+
+
+def test_user_edits_kept_except_insurance(conn, job_inputs):
+    session = RecalcSession("default", conn, wage_year=2025)
+    user_rows = [{"sub_code": "X", "sub_name": "사용자", "quantity": 1, "unit_price": 1234, "amount": 1234}]
+    result = session.recalculate(
+        job_inputs,
+        user_sub_items={"FIX_INS_INDUST": user_rows, "FIX_SAFETY": user_rows},
+    )
+    assert result.sub_items_by_exp["FIX_SAFETY"] == user_rows
+    assert result.sub_items_by_exp["FIX_INS_INDUST"][0]["amount"] == result.insurance_by_exp_code["FIX_INS_INDUST"]
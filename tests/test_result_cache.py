@@ -0,0 +1,101 @@
+"""
+집계 결과 입력 해시 캐시 검증
+- 입력·마스터데이터·설정·계산 버전이 같으면 계산·DB 쓰기 없이 저장된 결과 반환
+- 어느 하나라도 바뀌면 다시 계산
+- 저장된 결과는 계산 직후와 같은 값·형식(Decimal·tuple 포함)으로 반환
+"""
+from decimal import Decimal
+
+import pytest
+
+from app.domain.models import ResultSnapshot
+from src.domain.result import service
+from src.domain.result.service import calculate_result, dump_result_json, get_result_snapshot, load_result_json
+from src.domain.scenario_input.service import get_scenario_input, post_scenario_input
+
+
+@pytest.fixture
+def conn(conn):
+    job_code = conn.execute(
+        "SELECT job_code FROM md_job_role WHERE scenario_id='default' ORDER BY sort_order LIMIT 1"
+    ).fetchone()[0]
+    post_scenario_input({
+        "labor": {"job_roles": {job_code: {"headcount": 2, "work_days": 20.6, "work_hours": 8}}},
+        "expenses": {"items": {}},
+        "overhead_rate": 10.0,
+        "profit_rate": 5.0,
+    }, "default", conn)
+    return conn
+
+
+@pytest.fixture
+def computations(monkeypatch):
+    calls = []
+    original = service._calculate_labor
+
+    def counting(*args):
+        calls.append(1)
+        return original(*args)
+
+    monkeypatch.setattr(service, "_calculate_labor", counting)
+    return calls
+
+
+def _typed(obj):
+    """값과 형식을 함께 비교 (1 == 1.0 == Decimal(1), [1] != (1,))."""
+    if isinstance(obj, dict):
+        return {k: _typed(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj), [_typed(v) for v in obj]
+    return type(obj), obj
+
+
+def test_hit_skips_computation_and_write(conn, computations):
+    first = calculate_result("default", conn)
+    assert first["input_hash"] and len(computations) == 1
+
+    before = conn.total_changes
+    second = calculate_result("default", conn)
+    assert len(computations) == 1
+    assert conn.total_changes == before
+    assert _typed(second) == _typed(first)
+    assert ResultSnapshot.from_result_dict(second).hash == get_result_snapshot("default", conn)["input_hash"]
+
+
+def test_changes_invalidate(conn, computations, monkeypatch):
+    calculate_result("default", conn)
+
+    # 입력 변경
+    canonical = get_scenario_input("default", conn)
+    job_code = next(iter(canonical["labor"]["job_roles"]))
+    canonical["labor"]["job_roles"][job_code]["headcount"] = 3.0
+    post_scenario_input(canonical, "default", conn)
+    calculate_result("default", conn)
+    assert len(computations) == 2
+
+    # 마스터데이터 변경 (revision)
+    conn.execute("UPDATE md_job_rate SET wage_day = wage_day + 1 WHERE scenario_id='default'")
+    conn.commit()
+    calculate_result("default", conn)
+    assert len(computations) == 3
+
+    # 파라미터·설정·계산 버전 변경
+    calculate_result("default", conn, overhead_rate=12.0)
+    config = service.get_full_config()
+    monkeypatch.setattr(service, "get_full_config", lambda: {**config, "safety": {"rate": 0.1}})
+    calculate_result("default", conn, overhead_rate=12.0)
+    monkeypatch.setattr(service, "CALCULATION_VERSION", "test")
+    calculate_result("default", conn, overhead_rate=12.0)
+    assert len(computations) == 6
+    calculate_result("default", conn, overhead_rate=12.0)
+    assert len(computations) == 6
+
+
+def test_result_json_restores_decimal_and_tuple():
+    snapshot = {
+        "labor_rows": [{"headcount": Decimal("1.5"), "span": (1, Decimal("0.1")), "work_days": 20.6}],
+        "insurance_by_exp_code": {"FIX_INS_HEALTH": 10},
+    }
+    assert _typed(load_result_json(dump_result_json(snapshot))) == _typed(snapshot)
+    # 형식 표시 없이 저장된 이전 결과는 그대로 읽음
+    assert load_result_json('{"labor_rows": [{"headcount": 1.5}]}') == {"labor_rows": [{"headcount": 1.5}]}
@@ -0,0 +1,130 @@
+"""
+시나리오 마스터데이터 번들 검증
+- 번들 목록·색인이 MasterDataRepo 조회와 같은지
+- 변경이 없으면 다시 읽지 않음 (같은 연결·다른 연결 모두)
+- 같은 연결의 쓰기, 다른 연결의 커밋 후에는 새로 읽음
+- 캐시는 최근 사용한 번들만 정해진 수까지 보관
+- 상속 시나리오 revision은 (자체, 기준) 쌍이라 값이 커져도 서로 섞이지 않음
+"""
+import sqlite3
+
+import pytest
+
+from src.domain.db import PooledConnection
+from src.domain.masterdata import bundle as bundle_module
+from src.domain.masterdata.bundle import _read_revision, load_scenario_bundle
+from src.domain.masterdata.repo import MasterDataRepo
+from src.domain.masterdata.service import copy_masterdata
+
+
+def _connect(path):
+    return sqlite3.connect(path, factory=PooledConnection)
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    calls = []
+    original = bundle_module._read_bundle
+
+    def counting(conn, scenario_id):
+        calls.append(scenario_id)
+        return original(conn, scenario_id)
+
+    monkeypatch.setattr(bundle_module, "_read_bundle", counting)
+    return calls
+
+
+def test_bundle_matches_repo(db_path):
+    conn = _connect(db_path)
+    repo = MasterDataRepo(conn)
+    bundle = load_scenario_bundle(conn, "default")
+
+    assert list(bundle.job_roles) == repo.get_job_roles("default")
+    assert dict(bundle.job_rates) == repo.get_job_rates("default")
+    assert list(bundle.expense_items) == repo.get_expense_items("default")
+    assert list(bundle.pricebook) == repo.get_expense_pricebook("default")
+    assert list(bundle.sub_items) == repo.get_expense_sub_items("default")
+    for item in bundle.expense_items:
+        assert bundle.items_by_exp_code[item.exp_code] is item
+        assert list(bundle.sub_items_by_exp.get(item.exp_code, ())) == \
+            repo.get_expense_sub_items("default", item.exp_code)
+    # sub_items_map()은 호출마다 새 list
+    first = bundle.sub_items_map()
+    for items in first.values():
+        items.append("virtual")
+    assert "virtual" not in sum(bundle.sub_items_map().values(), [])
+    conn.close()
+
+
+def test_cached_until_changed(db_path, reads):
+    conn = _connect(db_path)
+    first = load_scenario_bundle(conn, "default")
+    assert load_scenario_bundle(conn, "default") is first
+
+    # 다른 시나리오 변경은 revision 비교 후 재사용
+    conn.execute(
+        "INSERT INTO md_job_role (scenario_id, job_code, job_name, sort_order, is_active) "
+        "SELECT 'other', job_code, job_name, sort_order, is_active FROM md_job_role WHERE scenario_id='default'"
+    )
+    conn.commit()
+    assert load_scenario_bundle(conn, "default") is first
+
+    # 다른 연결도 revision이 같으면 공용 캐시 재사용
+    other = _connect(db_path)
+    assert load_scenario_bundle(other, "default") is first
+    assert reads == ["default"]
+
+    conn.execute("UPDATE md_job_role SET job_name='변경' WHERE scenario_id='default' AND sort_order=1")
+    # 쓰기 트랜잭션 중에는 미커밋 값을 읽되 캐시하지 않음
+    assert load_scenario_bundle(conn, "default").job_roles[0].job_name == "변경"
+    conn.rollback()
+    assert load_scenario_bundle(conn, "default") is first
+
+    # 다른 연결의 커밋은 data_version·revision으로 감지
+    other.execute("UPDATE md_job_role SET job_name='변경' WHERE scenario_id='default' AND sort_order=1")
+    other.commit()
+    reloaded = load_scenario_bundle(conn, "default")
+    assert reloaded is not first
+    assert reloaded.roles_by_code[first.job_roles[0].job_code].job_name == "변경"
+    assert reloaded.revision > first.revision
+    conn.close()
+    other.close()
+
+
+def test_cache_keeps_recent_bundles_only(db_path, reads, monkeypatch):
+    monkeypatch.setattr(bundle_module, "_BUNDLE_CACHE_SIZE", 2)
+    conn = _connect(db_path)
+    for scenario_id in ("S1", "S2"):
+        copy_masterdata(conn, "default", scenario_id)
+    conn.commit()
+
+    for scenario_id in ("default", "S1", "default", "S2"):
+        load_scenario_bundle(conn, scenario_id)
+    # 캐시마다 가장 오래 쓰이지 않은 번들부터 빠짐 (연결 캐시 재사용은 공용 캐시를 거치지 않음)
+    assert list(bundle_module._conn_cache[conn]) == ["default", "S2"]
+    assert [key[1] for key in bundle_module._shared_cache] == ["S1", "S2"]
+    # 연결 캐시에서 빠진 S1은 공용 캐시에서 다시 가져옴
+    load_scenario_bundle(conn, "S1")
+    assert reads == ["default", "S1", "S2"]
+    conn.close()
+
+
+def _set_revision(conn, scenario_id, revision):
+    conn.execute(
+        "INSERT INTO md_scenario_revision (scenario_id, revision) VALUES (?, ?) "
+        "ON CONFLICT(scenario_id) DO UPDATE SET revision=excluded.revision",
+        (scenario_id, revision),
+    )
+
+
+def test_revision_pair_does_not_overflow(conn):
+    copy_masterdata(conn, "default", "S1")
+    _set_revision(conn, "S1", 1)
+    _set_revision(conn, "default", 0)
+    before = _read_revision(conn, "S1")
+
+    # 정수 하나로 합치면 (1, 0)과 (0, 2**32)가 같은 값이 된다
+    _set_revision(conn, "S1", 0)
+    _set_revision(conn, "default", 2**32)
+    after = _read_revision(conn, "S1")
+    assert (before, after) == ((1, 0), (0, 2**32))
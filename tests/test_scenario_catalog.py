@@ -0,0 +1,100 @@
+"""
+시나리오 카탈로그 검증
+- 저장·집계·삭제 시 scenario_catalog가 트리거로 함께 갱신 (표시명, 기준년도, 인원 합계, 총액)
+- 목록 검색(앞부분 일치)·정렬·페이지, resolve_scenario_id
+- 목록 조회가 색인을 사용
+"""
+import pytest
+
+from src.domain.masterdata.service import copy_masterdata
+from src.domain.result.service import calculate_result
+from src.domain.scenario_input.service import (
+    count_catalog,
+    delete_scenario,
+    list_catalog,
+    list_scenarios,
+    post_scenario_input,
+    resolve_scenario_id,
+)
+
+
+def _job_codes(conn):
+    return [r[0] for r in conn.execute(
+        "SELECT job_code FROM md_job_role WHERE scenario_id='default' ORDER BY sort_order LIMIT 2"
+    )]
+
+
+def _save(conn, scenario_id, name, headcount, wage_year="2025"):
+    return post_scenario_input({
+        "labor": {"job_roles": {
+            code: {"headcount": headcount, "work_days": 20.6, "work_hours": 8} for code in _job_codes(conn)
+        }},
+        "expenses": {"items": {}},
+        "overhead_rate": 10.0,
+        "profit_rate": 5.0,
+        "wage_year": wage_year,
+        "base_year": "2026",
+        "_display_name": name,
+    }, scenario_id, conn)
+
+
+def test_catalog_follows_saves_results_and_deletes(conn):
+    _save(conn, "default", "기본", 1)
+    _save(conn, "site_a", "  ", 2)
+    [entry] = list_catalog(conn, search="site")
+    assert (entry.display_name, entry.wage_year, entry.base_year) == ("site_a", "2025", "2026")
+    assert entry.headcount == 4.0 and entry.grand_total is None
+
+    copy_masterdata(conn, "default", "site_a")
+    saved = _save(conn, "site_a", "A현장", 3)
+    result = calculate_result("site_a", conn)
+    [entry] = list_catalog(conn, search="a현")
+    assert entry.scenario_id == "site_a" and entry.headcount == 6.0
+    assert entry.grand_total == result["aggregator"].grand_total > 0
+
+    saved["labor"]["job_roles"].popitem()
+    post_scenario_input(saved, "site_a", conn)
+    assert list_catalog(conn, search="A현장")[0].headcount == 3.0
+
+    assert dict(list_scenarios(conn)) == {"default": "기본", "site_a": "A현장"}
+    delete_scenario("site_a", conn)
+    assert [e.scenario_id for e in list_catalog(conn)] == ["default"]
+
+
+def test_sort_page_and_filter(conn):
+    for i, headcount in enumerate([3, 1, 2, 5, 4]):
+        _save(conn, f"s{i}", f"현장{i}", headcount, wage_year="2024" if i % 2 else "2025")
+
+    by_headcount = [e.scenario_id for e in list_catalog(conn, sort="headcount", descending=True)]
+    assert by_headcount == ["s3", "s4", "s0", "s2", "s1"]
+    pages = [
+        [e.scenario_id for e in list_catalog(conn, sort="name", limit=2, offset=offset)]
+        for offset in (0, 2, 4)
+    ]
+    assert pages == [["s0", "s1"], ["s2", "s3"], ["s4"]]
+    assert [e.scenario_id for e in list_catalog(conn, wage_year=2024)] == ["s1", "s3"]
+    assert count_catalog(conn, search="현장") == 5
+    assert count_catalog(conn, search="%") == 0
+    with pytest.raises(ValueError):
+        list_catalog(conn, sort="input_json")
+
+
+def test_listing_uses_indexes(conn):
+    plans = [
+        " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+        for sql, params in (
+            ("SELECT * FROM scenario_catalog WHERE display_name LIKE ? ESCAPE '\\' "
+             "ORDER BY display_name, scenario_id LIMIT 10", ("현장%",)),
+            ("SELECT * FROM scenario_catalog ORDER BY updated_at DESC, scenario_id DESC LIMIT 10", ()),
+            ("SELECT * FROM scenario_catalog WHERE wage_year = ? "
+             "ORDER BY wage_year, display_name, scenario_id", ("2025",)),
+        )
+    ]
+    assert all("USING INDEX" in plan and "TEMP B-TREE" not in plan for plan in plans)
+
+
+def test_resolve_scenario_id_uses_catalog(conn):
+    _save(conn, "2023_", "2023설계", 1)
+    assert resolve_scenario_id(conn, "2023설계", lambda name: "2023") == "2023_"
+    assert resolve_scenario_id(conn, "새 시나리오", lambda name: "new") == "new"
+    assert resolve_scenario_id(conn, "", lambda name: name) == "default"
@@ -0,0 +1,98 @@
+"""
+scenario_input 행 단위 저장 검증
+- 기존 전체 JSON(input_json)이 마이그레이션으로 직무·경비 행으로 옮겨지는지
+- get_scenario_input / post_scenario_input이 같은 canonical dict를 돌려주는지
+- 저장 시 바뀐 행만 기록
+"""
+import json
+import sqlite3
+
+from src.domain import migration_runner
+from src.domain.migration_runner import run_migrations
+from src.domain.scenario_input.service import (
+    delete_scenario,
+    get_scenario_input,
+    list_scenarios,
+    post_scenario_input,
+)
+
+ROWS_MIGRATION = "20261018_03_scenario_input_rows.sql"
+
+LEGACY = {
+    "labor": {"job_roles": {
+        "M102": {"headcount": 2.0, "work_days": 20.6, "work_hours": 8.0, "overtime_hours": 0.0,
+                 "holiday_work_days": 1.5},
+        "M101": {"headcount": 1.0, "work_days": 20.6, "work_hours": 8.0, "overtime_hours": 3.0,
+                 "holiday_work_hours": 2.0},
+    }},
+    "expenses": {"items": {"FIX_RENT": {"quantity": 12.0, "unit_price": 150000}}},
+    "overhead_rate": 10.0,
+    "_display_name": "2024 설계",
+    "holiday_work_days_calc": {"year": 2024, "public_holidays_by_month": [1, 2]},
+}
+
+
+def test_legacy_blobs_migrated(tmp_path, monkeypatch):
+    connection = sqlite3.connect(tmp_path / "legacy.db")
+    all_files = migration_runner._list_migration_files()
+    monkeypatch.setattr(
+        migration_runner, "_list_migration_files",
+        lambda: [path for path in all_files if path.name < ROWS_MIGRATION],
+    )
+    run_migrations(connection)
+    connection.executemany(
+        "INSERT INTO scenario_input (scenario_id, input_json) VALUES (?, ?)",
+        [("legacy", json.dumps(LEGACY, ensure_ascii=True)), ("broken", "not json")],
+    )
+    connection.commit()
+
+    monkeypatch.setattr(migration_runner, "_list_migration_files", lambda: all_files)
+    run_migrations(connection)
+
+    rows = connection.execute(
+        "SELECT job_code, headcount, holiday_work_days, sort_order FROM scenario_labor_input "
+        "WHERE scenario_id='legacy' ORDER BY sort_order"
+    ).fetchall()
+    assert rows == [("M102", 2.0, 1.5, 0), ("M101", 1.0, 2.0, 1)]
+    canonical = get_scenario_input("legacy", connection)
+    assert list(canonical["labor"]["job_roles"]) == ["M102", "M101"]
+    assert canonical["labor"]["job_roles"]["M101"]["holiday_work_days"] == 2.0
+    assert canonical["expenses"]["items"] == LEGACY["expenses"]["items"]
+    assert canonical["holiday_work_days_calc"] == LEGACY["holiday_work_days_calc"]
+    assert dict(list_scenarios(connection)) == {"legacy": "2024 설계", "broken": "broken"}
+    # canonical이 아닌 값은 첫 조회 때 정규화 후 행 기준으로 저장
+    assert get_scenario_input("broken", connection) == {"labor": {"job_roles": {}}, "expenses": {"items": {}}}
+    assert connection.execute(
+        "SELECT input_version FROM scenario_input WHERE scenario_id='broken'"
+    ).fetchone()[0] == 1
+    connection.close()
+
+
+def test_round_trip_and_row_level_save(conn):
+    saved = post_scenario_input(LEGACY, "s1", conn)
+    assert get_scenario_input("s1", conn) == saved
+    assert list(get_scenario_input("s1", conn)) == list(saved)
+
+    # 변경이 없으면 쓰지 않음
+    before = conn.total_changes
+    post_scenario_input(saved, "s1", conn)
+    assert conn.total_changes == before
+
+    # 인원 1건 변경·경비 1건 삭제 → 헤더(updated_at) + 직무 행 1건 + 경비 행 1건
+    # (+ 트리거의 scenario_catalog 갱신 2건: 헤더, 인원 합계)
+    changed = json.loads(json.dumps(saved))
+    changed["labor"]["job_roles"]["M101"]["headcount"] = 4.0
+    del changed["expenses"]["items"]["FIX_RENT"]
+    post_scenario_input(changed, "s1", conn)
+    assert conn.total_changes - before == 3 + 2
+    assert get_scenario_input("s1", conn) == changed
+
+    # 여러 시나리오 SQL 집계
+    post_scenario_input(LEGACY, "s2", conn)
+    totals = dict(conn.execute(
+        "SELECT scenario_id, SUM(headcount) FROM scenario_labor_input GROUP BY scenario_id"
+    ).fetchall())
+    assert totals == {"s1": 6.0, "s2": 3.0}
+
+    delete_scenario("s2", conn)
+    assert conn.execute("SELECT COUNT(*) FROM scenario_labor_input WHERE scenario_id='s2'").fetchone()[0] == 0
@@ -0,0 +1,95 @@
+"""
+직무별 인원·경비입력 테이블 열 저장소 검증 (PyQt 없음)
+- 셀 편집은 해당 셀(과 연동 금액·비고)만 바꾸고, 읽기는 배열 값을 그대로 사용
+- 저장용 dict 변환은 기존 테이블 규칙(연간 수량 ÷12, 합계인원, 기본 규격·단위)과 동일
+"""
+from array import array
+
+from src.ui.expense_sub_item_columns import (
+    COL_AMOUNT,
+    COL_QUANTITY,
+    COL_REMARK,
+    COL_SUB_CODE,
+    COL_UNIT_PRICE,
+    SubItemColumns,
+)
+from src.ui.job_role_columns import (
+    COL_HEADCOUNT,
+    COL_JOB_CODE,
+    COL_OVERTIME_HOURS,
+    COL_WORK_DAYS,
+    JobRoleColumns,
+)
+
+
+def test_job_role_columns_edit_and_read():
+    columns = JobRoleColumns()
+    for i in range(3):
+        columns.append(f"J{i}", f"직무{i}", "", work_days=20.6, work_hours=8)
+    assert isinstance(columns.numbers[COL_HEADCOUNT], array)
+
+    assert columns.set_text(1, COL_HEADCOUNT, "3.7")
+    assert not columns.set_text(1, COL_HEADCOUNT, "3")
+    assert columns.set_text(1, COL_OVERTIME_HOURS, "1,5.5")
+    assert columns.display(0, COL_WORK_DAYS) == "20.6"
+    assert columns.display(1, COL_HEADCOUNT) == "3"
+    assert not columns.is_editable(COL_WORK_DAYS) and columns.is_editable(COL_HEADCOUNT)
+
+    columns.set_text(2, COL_JOB_CODE, " ")
+    inputs = columns.job_inputs()
+    assert list(inputs) == ["J0", "J1"]
+    assert inputs["J1"] == {
+        "work_days": 20.6, "work_hours": 8.0, "overtime_hours": 15.5,
+        "holiday_work_days": 0.0, "headcount": 3,
+    }
+
+    rows = columns.apply_job_inputs({"J0": {"headcount": 2.0, "work_days": 21, "holiday_work_hours": 1}})
+    assert rows == [0]
+    assert columns.job_inputs()["J0"]["headcount"] == 2
+    assert columns.job_inputs()["J0"]["holiday_work_days"] == 1.0
+    assert columns.job_inputs()["J0"]["work_hours"] == 0.0
+
+
+def test_sub_item_roundtrip_by_quantity_unit():
+    columns = SubItemColumns()
+
+    # 연간 지급수량: 저장값×12로 표시, 저장 시 ÷12 (소수 6자리)
+    columns.load("FIX_WEL_CLOTH", [{"sub_code": "A", "quantity": 5 / 12, "unit_price": 1200, "amount": 500}])
+    assert columns.display(0, COL_QUANTITY) == "5.0"
+    assert columns.display(0, COL_UNIT_PRICE) == "1,200"
+    assert columns.rows()[0]["quantity"] == 0.416667
+    assert columns.rows()[0]["unit"] == "식"
+
+    # 합계인원 기준 연간 SET: 기본 규격·단위 적용, 저장 시점 합계인원으로 변환
+    columns.load("FIX_WEL_MEDICINE", [{"sub_code": "M", "quantity": 1 / 12 / 4, "unit_price": 100}], total_headcount=4)
+    assert columns.display(0, COL_QUANTITY) == "1.0"
+    columns.total_headcount = 2
+    row = columns.rows()[0]
+    assert (row["spec"], row["unit"], row["quantity"]) == ("SET", "년", round(1 / 12 / 2, 6))
+
+    # 인원 수: 비고는 계산값, 읽기 전용
+    columns.load("FIX_TRAINING", [{"sub_code": "T", "quantity": 0.5, "remark": "x"}])
+    assert columns.display(0, COL_REMARK) == "6인×1회/년÷12개월"
+    assert not columns.is_editable(0, COL_REMARK)
+
+    # 노무비 보험 7종은 전부 읽기 전용
+    columns.load("FIX_INS_HEALTH", [{"sub_code": "FIX_INS_HEALTH", "quantity": 1}])
+    assert not columns.is_editable(0, COL_QUANTITY)
+
+
+def test_sub_item_edit_updates_linked_cells_only():
+    columns = SubItemColumns()
+    columns.load("FIX_TRAINING", [{"sub_code": "T", "quantity": 0, "unit_price": 0}])
+
+    assert columns.set_text(0, COL_UNIT_PRICE, "120,000") == {COL_UNIT_PRICE}
+    assert columns.set_text(0, COL_QUANTITY, "3") == {COL_QUANTITY, COL_AMOUNT, COL_REMARK}
+    assert columns.display(0, COL_AMOUNT) == "30,000"
+    assert columns.set_text(0, COL_QUANTITY, "abc") == set()
+
+    columns.insert(1, {"sort_order": 2})
+    assert columns.display(1, 0) == "FIX_TRAINING"
+    assert [r["sub_code"] for r in columns.rows()] == ["T"]  # 세부코드 없는 행 제외
+    columns.set_text(1, COL_SUB_CODE, " B ")
+    assert [r["sub_code"] for r in columns.rows()] == ["T", "B"]
+    columns.remove(0)
+    assert len(columns) == 1 and columns.rows()[0]["sort_order"] == 2
@@ -0,0 +1,84 @@
+"""
+단계별 소요 시간 측정 검증
+- 꺼져 있으면 no-op (통계·레코드 없음)
+- 켜면 중첩 span이 동작 1회 레코드(JSONL)로 기록되고 단계별 p50/p95 집계
+- calculate_result 단계 span 기록
+"""
+import json
+
+import pytest
+
+from src.domain.result.service import calculate_result
+from src.utils import tracing
+from src.utils.tracing import span, traced
+
+
+@pytest.fixture(autouse=True)
+def clean_tracing():
+    tracing.disable()
+    tracing.reset()
+    yield
+    tracing.disable()
+    tracing.reset()
+
+
+def test_disabled_is_noop():
+    @traced("stage")
+    def work(x):
+        return x * 2
+
+    with span("outer") as s:
+        s.set(a=1)
+        assert work(2) == 4
+    assert tracing.stage_summary() == []
+
+
+def test_nested_spans_written_as_one_record(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    tracing.enable(path)
+
+    @traced("inner")
+    def inner():
+        return 1
+
+    for _ in range(3):
+        with span("action", scenario="S1"):
+            inner()
+            with span("second"):
+                inner()
+    with pytest.raises(ValueError):
+        with span("failing"):
+            raise ValueError
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [r["action"] for r in records] == ["action"] * 3 + ["failing"]
+    spans = records[0]["spans"]
+    assert [(s["name"], s["depth"]) for s in spans] == [
+        ("action", 0), ("inner", 1), ("second", 1), ("inner", 2),
+    ]
+    assert spans[0]["attrs"] == {"scenario": "S1"}
+    assert records[-1]["spans"][0]["attrs"] == {"error": "ValueError"}
+
+    stats = {s.name: s for s in tracing.stage_summary()}
+    assert stats["inner"].count == 6 and stats["action"].count == 3
+    assert stats["action"].p50_ms <= stats["action"].p95_ms <= stats["action"].max_ms
+    assert "inner" in tracing.format_summary()
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert tracing._percentile(values, 50) == 50
+    assert tracing._percentile(values, 95) == 95
+    assert tracing._percentile([7], 95) == 7
+
+
+def test_calculate_result_stages(conn):
+    tracing.enable()
+    calculate_result("default", conn)
+    calculate_result("default", conn)
+    stats = {s.name: s.count for s in tracing.stage_summary()}
+    assert stats["calculate_result"] == 2
+    assert stats["get_scenario_input"] == 2 and stats["result_cache_lookup"] == 2
+    # 두 번째는 저장된 결과 사용 → 계산·저장 단계 1회
+    assert stats["calculate_labor"] == 1 and stats["save_result_snapshot"] == 1
+    assert stats["masterdata.get_job_roles"] >= 1
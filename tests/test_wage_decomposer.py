@@ -0,0 +1,72 @@
+"""
+기본급추정표·일급분개 역산 검증
+- decompose_estimation_matrix 행이 decompose_estimation과 같은지 (행별 근무일수·요율 포함)
+- find_md_basic_batch / IlgupInverseTable 결과가 개별 find_md_basic과 같은지
+- 근무일수별 역산표 저장·재사용
+"""
+import random
+from decimal import Decimal
+
+import pytest
+
+from src.domain import wage_decomposer as wd_module
+from src.domain.wage_decomposer import (
+    IlgupInverseTable,
+    decompose_estimation,
+    decompose_estimation_matrix,
+    find_md_basic,
+    find_md_basic_batch,
+)
+
+HAS_NUMPY = wd_module._HAS_NUMPY
+
+
+@pytest.fixture(autouse=True)
+def _clear_tables():
+    wd_module._inverse_tables.clear()
+    yield
+    wd_module._inverse_tables.clear()
+
+
+@pytest.mark.parametrize("use_numpy", [False, pytest.param(True, marks=pytest.mark.skipif(
+    not HAS_NUMPY, reason="NumPy 미설치"))])
+def test_estimation_matrix_matches_scalar(use_numpy):
+    rng = random.Random(7)
+    md_basic = [rng.randint(0, 500000) for _ in range(300)] + [165278, 82100]
+    workdays = [rng.choice([Decimal("20.6"), Decimal("21"), 19.75, Decimal("22.5")]) for _ in md_basic]
+    rates = [rng.choice([None, {"health": "0.0709"}, {"longterm": Decimal("0.1295"), "national": 0.0475}])
+             for _ in md_basic]
+
+    matrix = decompose_estimation_matrix(md_basic, workdays, rates, use_numpy=use_numpy)
+    assert matrix.rows() == [decompose_estimation(*args) for args in zip(md_basic, workdays, rates)]
+
+    shared = decompose_estimation_matrix(md_basic, Decimal("20.6"), {"accident": 0.0095}, use_numpy=use_numpy)
+    assert shared.row(5) == decompose_estimation(md_basic[5], Decimal("20.6"), {"accident": 0.0095})
+
+
+@pytest.mark.parametrize("workdays", [Decimal("20.6"), Decimal("21"), Decimal("19.75")])
+def test_batch_matches_scalar(workdays):
+    rng = random.Random(3)
+    rates = [rng.randint(80000, 450000) for _ in range(40)] + [82100, 178000, 412000, 0, 7]
+    assert find_md_basic_batch(rates, workdays) == [find_md_basic(rate, workdays) for rate in rates]
+
+
+def test_pure_python_table_matches_scalar():
+    table = IlgupInverseTable.build(20.6, 100000, 101000, use_numpy=False)
+    assert table.monotone
+    for target in range(table.daily(100020), table.daily(100980), 7):
+        assert table.find(target) == find_md_basic(target)
+    # 표 구간 밖은 None (호출측에서 개별 역산)
+    assert table.find(412000) is None
+
+
+def test_saved_table_reused(tmp_path, monkeypatch):
+    rates = [211000, 240000, 285000]
+    md_lo = find_md_basic(min(rates)) - 20
+    md_hi = find_md_basic(max(rates)) + 20
+    IlgupInverseTable.build(20.6, md_lo, md_hi, use_numpy=False).save(tmp_path / "ilgup_inverse_20.6.bin")
+
+    # NumPy 없이도 저장된 표로 일괄 역산
+    monkeypatch.setattr(wd_module, "_HAS_NUMPY", False)
+    assert find_md_basic_batch(rates, cache_dir=tmp_path) == [find_md_basic(rate) for rate in rates]
+    assert wd_module._inverse_tables[20.6].md_lo == md_lo
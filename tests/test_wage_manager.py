@@ -0,0 +1,115 @@
+"""
+공용 WageManager 캐시 검증
+- 워밍업 후 조회는 파일을 다시 읽지 않음
+- 원본 파일 mtime/size가 바뀌면 재로드
+- 등급 상세·연도 비교는 캐시된 기본급추정표 행렬에서 산출
+- 재로드는 조회 표 묶음을 한 번에 교체 (동시 조회가 섞인 상태를 보지 않음)
+"""
+import json
+import os
+import threading
+
+from src.domain import wage_manager as wm_module
+from src.domain.wage_decomposer import decompose_estimation
+from src.domain.wage_manager import WageIndexEntry, get_wage_manager
+
+
+def _write(path, data, mtime_ns=None):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _data_dir(tmp_path):
+    _write(tmp_path / "job_mapping.json", {"J1": {"grade": "고급기술자"}, "J2": "중급기술자"})
+    _write(tmp_path / "wages_master.json", {
+        "2025": {
+            "고급기술자": {"govt_daily": 318000, "md_basic": 165278},
+            "중급기술자": {"govt_daily": 250000},
+        },
+    })
+    return tmp_path
+
+
+def test_lookup_index(tmp_path):
+    manager = get_wage_manager(_data_dir(tmp_path))
+    assert manager.lookup("J1", 2025) == WageIndexEntry("고급기술자", 165278, 318000)
+    assert manager.get_md_basic("J1", 2025) == 165278
+    # md_basic 없는 등급은 None (DB 단가 사용)
+    assert manager.get_md_basic("J2", 2025) is None
+    assert manager.lookup("UNKNOWN", 2025) is None
+
+
+def test_no_file_reads_after_warmup(tmp_path):
+    data_dir = _data_dir(tmp_path)
+    manager = get_wage_manager(data_dir)
+    manager.get_md_basic("J1", 2025)
+    reads = wm_module._json_cache.reads
+    for _ in range(100):
+        assert get_wage_manager(data_dir) is manager
+        manager.get_md_basic("J1", 2025)
+        manager.get_md_basic("J2", 2025)
+    assert wm_module._json_cache.reads == reads
+
+
+def test_reload_on_file_change(tmp_path):
+    data_dir = _data_dir(tmp_path)
+    manager = get_wage_manager(data_dir)
+    assert manager.get_md_basic("J1", 2025) == 165278
+
+    master = data_dir / "wages_master.json"
+    _write(master, {"2025": {"고급기술자": {"govt_daily": 330000, "md_basic": 170000}}},
+           mtime_ns=master.stat().st_mtime_ns + 1_000_000_000)
+    assert get_wage_manager(data_dir).get_md_basic("J1", 2025) == 170000
+
+    # 연도 파일 추가 (디렉터리 mtime 변화로 감지)
+    _write(data_dir / "wages_2026.json", {"고급기술자": {"md_basic": 180000}})
+    os.utime(data_dir, ns=(data_dir.stat().st_mtime_ns + 1_000_000_000,) * 2)
+    assert 2026 in get_wage_manager(data_dir).list_available_years()
+    assert manager.get_md_basic("J1", 2026) == 180000
+
+
+def test_grade_details_from_cached_matrix(tmp_path):
+    manager = get_wage_manager(_data_dir(tmp_path))
+    assert manager.get_grade_detail("고급기술자", 2025) == decompose_estimation(165278)
+    assert manager.get_all_grade_details(2025) == {
+        "고급기술자": decompose_estimation(165278),
+        "중급기술자": decompose_estimation(250000),
+    }
+    rows = manager.compare_grades_by_year("고급기술자")
+    assert [row["govt_daily"] for row in rows] == [318000]
+    # 같은 단가표면 행렬을 다시 계산하지 않음
+    assert manager.estimation_matrix() is manager.estimation_matrix()
+
+
+def test_reload_swaps_tables_atomically(tmp_path, monkeypatch):
+    # 버전마다 직무 등급과 등급 단가가 함께 바뀜: 섞여 보이면 등급은 있는데 단가가 없음
+    versions = []
+    for name, grade, md in (("a", "A등급", 100000), ("b", "B등급", 200000)):
+        data_dir = tmp_path / name
+        data_dir.mkdir()
+        _write(data_dir / "job_mapping.json", {"J1": grade})
+        _write(data_dir / "wages_master.json", {"2025": {grade: {"govt_daily": md * 2, "md_basic": md}}})
+        versions.append(wm_module.load_wage_sources(data_dir, wm_module._load_json))
+    manager = wm_module.WageManager(tmp_path / "a")
+
+    turn = iter(range(10_000))
+    monkeypatch.setattr(wm_module, "load_wage_sources", lambda *args: versions[next(turn) % 2])
+    seen = set()
+    stop = threading.Event()
+
+    def read():
+        while not stop.is_set():
+            seen.add((manager.lookup("J1", 2025), manager.get_wage("J1", 2025) is not None))
+
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    for thread in readers:
+        thread.start()
+    for _ in range(300):
+        manager.reload()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert {entry.md_basic for entry, _ in seen} <= {100000, 200000}
+    assert all(has_wage for _, has_wage in seen)
@@ -0,0 +1,87 @@
+"""
+노임단가 원본 정규화 검증
+- 형식별(data 래퍼, 단일 연도, int/dict 등급값) 공용 정규화
+- WageManager 조회가 정규화 결과(연도 파일이 같은 연도 master 값 대체)를 사용
+- DataManager·wage_validation이 같은 규칙 사용
+"""
+import json
+
+import pytest
+
+from src.domain.data_manager import DataManager
+from src.domain.wage_manager import WageManager
+from src.domain.wage_store import (
+    WageGrade,
+    load_wage_sources,
+    normalize_grade_map,
+    normalize_job_mapping,
+    normalize_wages_master,
+)
+from src.domain.wage_validation import validate_wage_data
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    _write(tmp_path / "job_mapping.json", {
+        "J1": {"title": "소장", "grade": "고급기술자"},
+        "J2": "중급기술자",
+        "J3": {"title": "등급없음"},
+    })
+    _write(tmp_path / "wages_master.json", {
+        "2024": {"고급기술자": 300000, "중급기술자": 250000},
+        "2025": {"year": 2025, "data": {
+            "고급기술자": {"govt_daily": 318000, "md_basic": 165278},
+            "중급기술자": {"govt_daily": 260000},
+        }},
+    })
+    # 연도 파일은 같은 연도의 master 값을 대체
+    _write(tmp_path / "wages_2026.json", {"고급기술자": {"govt_daily": 330000, "md_basic": 171000}})
+    return tmp_path
+
+
+def test_normalization_formats():
+    assert normalize_grade_map({"data": {" 고급기술자 ": 300000}}) == {"고급기술자": WageGrade(300000, None)}
+    assert normalize_grade_map({"A": {"md_basic": 1}})["A"].rate == 1
+    # 숫자 문자열도 정수로 (이전 int() 변환과 동일)
+    assert normalize_grade_map({"A": {"govt_daily": "318000", "md_basic": " 165278 "}})["A"] == \
+        WageGrade(318000, 165278)
+    assert normalize_grade_map({"A": "300000", "B": {"md_basic": "미정"}}) == {
+        "A": WageGrade(300000, None), "B": WageGrade(None, None),
+    }
+    assert normalize_wages_master({"year": 2024, "data": {"A": 5}}) == {2024: {"A": WageGrade(5, None)}}
+    assert normalize_job_mapping({"J1": "A", "J2": {"grade": ""}, "J3": {"grade": "B"}}) == {
+        "J1": ("A", "J1"), "J3": ("B", "J3"),
+    }
+
+
+def test_wage_manager_uses_normalized_sources(data_dir):
+    sources = load_wage_sources(data_dir)
+    manager = WageManager(data_dir)
+
+    assert sorted(sources.grades_by_year) == [2024, 2025, 2026]
+    assert manager.list_available_years() == [2026, 2025, 2024]
+    for year, grades in sources.grades_by_year.items():
+        for code, job in sources.job_grades.items():
+            entry = grades.get(job.grade)
+            assert manager.get_wage(code, year) == (entry.rate if entry else None)
+            assert manager.get_md_basic(code, year) == (entry.md_basic if entry else None)
+    assert manager.get_wage("J3", 2025) is None
+    assert manager.get_wage("J1", 2026) == 171000
+    assert manager.merge_job_rates_for_year({"J3": 1}, ["J1", "J2", "J3"], 2026) == {"J3": 1, "J1": 171000}
+    assert [row["govt_daily"] for row in manager.compare_grades_by_year("고급기술자")] == [300000, 318000, 330000]
+
+
+def test_data_manager_and_validation_share_rules(data_dir):
+    manager = DataManager(data_dir)
+    # 확장 형식은 md_basic 우선 (없으면 govt_daily)
+    assert manager.get_wage("J1", 2025) == 165278
+    assert manager.get_wage("J2", 2025) == 260000
+    assert manager.list_available_years() == [2025, 2024]
+
+    result = validate_wage_data(data_dir)
+    assert result.valid
+    assert result.grades_in_mapping == {"고급기술자", "중급기술자"}